@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Codec Validation & Benchmark
+
+1. Validates the generated codec (g2_proto.py) byte-for-byte against the
+   packets the examples build today: authentication, teleprompter
+   (display config, init, content pages, marker, sync) and Even AI
+   (CTRL enter/exit, ASK, REPLY). It also checks that decode -> encode
+   round-trips every one of those payloads.
+2. Benchmarks payload encode/decode throughput of the generated codec,
+   the hand-rolled builders, and (if installed) the protobuf runtime.
+
+Usage:
+    python bench_codec.py               # validate + benchmark
+    python bench_codec.py --validate    # validation only (exit 1 on mismatch)
+
+Requirements:
+    pip install bleak                   # the example modules import it
+    pip install protobuf                # optional, for the runtime comparison
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "teleprompter"))
+sys.path.insert(0, os.path.join(HERE, "..", "even-ai"))
+
+import g2_proto as pb
+from frames import build_packet, fields
+
+import even_ai
+import teleprompter
+
+try:
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+except ImportError:
+    descriptor_pb2 = None
+
+TIMESTAMP = 1767225600
+TEXTS = ["", "What is 2 + 2?", "Ünïcødé → 日本語 ✓", "x" * 127, "The answer is " + "forty-two " * 18]
+
+# The hand-rolled display config blob has "10 0D 0F" in region 3: 0x0F is not
+# a valid tag (wire type 7). The codec encodes param1=1933 ("10 8D 0F"), the
+# only reading that keeps the region length; that one byte is expected to differ.
+CONFIG_TYPO = (0x0D, 0x8D)
+
+
+def display_config_payload(msg_id: int) -> bytes:
+    regions = [
+        pb.encode_display_region(2, 10000, 1191.0, 0.0, 0, 0),
+        pb.encode_display_region(3, 1933, 1130.0, 0.0, 0, 0),
+        pb.encode_display_region(4, 0, 68.0, 0.0, 0, 0),
+        pb.encode_display_region(5, 0, 73.0, 81.0, 0, 0),
+        pb.encode_display_region(6, 0, 99.0, 98.0, 0, 0),
+    ]
+    settings = pb.encode_display_settings(enabled=1, regions=regions, field3=0)
+    return pb.encode_display_config(type=2, msg_id=msg_id, settings=settings)
+
+
+def teleprompter_init_payload(msg_id: int, total_lines: int, manual_mode: bool) -> bytes:
+    display = pb.encode_teleprompter_display_settings(
+        1, 0, 0, 267, max(1, (total_lines * 2665) // 140), 230, 1294, 5, 0 if manual_mode else 1)
+    init = pb.encode_teleprompter_init(script_index=1, display=display)
+    return pb.encode_teleprompter_message(type=1, msg_id=msg_id, init=init)
+
+
+def content_page_payload(msg_id: int, page_num: int, text: str) -> bytes:
+    content = pb.encode_teleprompter_content(page_num, 10, ("\n" + text).encode("utf-8"))
+    return pb.encode_teleprompter_message(type=3, msg_id=msg_id, content=content)
+
+
+def ask_payload(magic: int, text: str) -> bytes:
+    return pb.encode_even_ai_message(command_id=pb.ASK, magic_random=magic,
+                                     ask_info=pb.encode_even_ai_text(0, 0, 0, text))
+
+
+def reply_payload(magic: int, text: str) -> bytes:
+    return pb.encode_even_ai_message(command_id=pb.REPLY, magic_random=magic,
+                                     reply_info=pb.encode_even_ai_text(0, 0, 0, text))
+
+
+def auth_payloads() -> list:
+    """(seq, svc_hi, svc_lo, payload) for the 7-packet authentication."""
+    def capability(msg_id):
+        return pb.encode_auth_request(type=4, msg_id=msg_id, data=pb.encode_auth_data(1, 4))
+
+    def ack(msg_id, value):
+        return pb.encode_auth_request(type=5, msg_id=msg_id, ack=pb.encode_auth_ack(value))
+
+    def time_sync(msg_id):
+        return pb.encode_time_sync_request(type=0x80, msg_id=msg_id,
+                                           sync=pb.encode_time_sync_data(TIMESTAMP, -24))
+
+    return [
+        (1, 0x80, 0x00, capability(0x0C)), (2, 0x80, 0x20, ack(0x0E, 2)),
+        (3, 0x80, 0x20, time_sync(0x0F)), (4, 0x80, 0x00, capability(0x10)),
+        (5, 0x80, 0x00, capability(0x11)), (6, 0x80, 0x20, ack(0x12, 1)),
+        (7, 0x80, 0x20, time_sync(0x13)),
+    ]
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+def validation_cases():
+    """Yield (name, hand-rolled packet, codec packet, decoder) triples."""
+    teleprompter.time = types.SimpleNamespace(time=lambda: TIMESTAMP)
+    decoders = {1: pb.decode_auth_request, 3: pb.decode_time_sync_request, 7: pb.decode_time_sync_request}
+    for expected, (seq, hi, lo, payload) in zip(teleprompter.build_auth_packets(), auth_payloads()):
+        yield f"auth #{seq}", expected, build_packet(seq, hi, lo, payload), \
+            decoders.get(seq, pb.decode_auth_request)
+
+    for msg_id in (0x00, 0x14, 0x7F, 0x80, 0x3FFF):
+        yield f"display_config msg_id={msg_id}", teleprompter.build_display_config(0x10, msg_id), \
+            build_packet(0x10, 0x0E, 0x20, display_config_payload(msg_id)), None
+        for lines in (1, 10, 140, 2000):
+            for manual in (True, False):
+                yield f"teleprompter_init lines={lines} manual={manual}", \
+                    teleprompter.build_teleprompter_init(0x11, msg_id, lines, manual), \
+                    build_packet(0x11, 0x06, 0x20, teleprompter_init_payload(msg_id, lines, manual)), \
+                    pb.decode_teleprompter_message
+        for page in (0, 1, 200):
+            for text in TEXTS:
+                yield f"content_page page={page} len={len(text)}", \
+                    teleprompter.build_content_page(0x12, msg_id, page, text), \
+                    build_packet(0x12, 0x06, 0x20, content_page_payload(msg_id, page, text)), \
+                    pb.decode_teleprompter_message
+        yield "marker", teleprompter.build_marker(0x13, msg_id), build_packet(
+            0x13, 0x06, 0x20, pb.encode_teleprompter_message(
+                type=255, msg_id=msg_id, marker=pb.encode_teleprompter_marker(0, 6))), \
+            pb.decode_teleprompter_message
+        yield "sync", teleprompter.build_sync(0x14, msg_id), build_packet(
+            0x14, 0x80, 0x00, pb.encode_sync_message(type=0x0E, msg_id=msg_id, data=b"")), \
+            pb.decode_sync_message
+
+    for magic in (1, 42, 127):
+        for name, builder, status in (("ctrl_enter", even_ai.build_ctrl_enter, 2),
+                                      ("ctrl_exit", even_ai.build_ctrl_exit, 3)):
+            yield name, builder(0x08, magic), build_packet(0x08, 0x07, 0x20, pb.encode_even_ai_message(
+                command_id=pb.CTRL, magic_random=magic, ctrl=pb.encode_even_ai_control(status))), \
+                pb.decode_even_ai_message
+        for text in TEXTS:
+            yield f"ask len={len(text)}", even_ai.build_ask(0x09, magic, text), \
+                build_packet(0x09, 0x07, 0x20, ask_payload(magic, text)), pb.decode_even_ai_message
+            yield f"reply len={len(text)}", even_ai.build_reply(0x0A, magic, text), \
+                build_packet(0x0A, 0x07, 0x20, reply_payload(magic, text)), pb.decode_even_ai_message
+
+
+def validate(runtime=None) -> bool:
+    checked = failures = 0
+    for name, expected, actual, decoder in validation_cases():
+        checked += 1
+        if name.startswith("display_config"):
+            # Same bytes except the known typo (and therefore the CRC)
+            diff = [i for i in range(len(expected) - 2) if expected[i] != actual[i]]
+            ok = (len(expected) == len(actual) and len(diff) == 1
+                  and (expected[diff[0]], actual[diff[0]]) == CONFIG_TYPO)
+        else:
+            ok = expected == actual
+            payload = expected[8:-2]
+            if ok and decoder is not None and decoder(payload).encode() != payload:
+                ok = False
+                name += " (round-trip)"
+            if ok and runtime is not None and decoder is not None:
+                message = runtime[decoder(payload).__class__.__name__]()
+                message.ParseFromString(payload)
+                if message.SerializeToString() != payload:
+                    ok = False
+                    name += " (protobuf runtime)"
+        if not ok:
+            failures += 1
+            print(f"  MISMATCH {name}\n    expected {expected.hex()}\n    codec    {actual.hex()}")
+
+    print(f"Validated {checked} packets against the example builders: "
+          f"{checked - failures} match, {failures} mismatch")
+    print("  (display_config: identical except the malformed 0x0D/0x8D byte noted in this file)")
+    return failures == 0
+
+
+# =============================================================================
+# Protobuf Runtime
+# =============================================================================
+
+RUNTIME_TYPES = {
+    "uint32": "TYPE_UINT32", "uint64": "TYPE_UINT64", "int32": "TYPE_INT32", "int64": "TYPE_INT64",
+    "bool": "TYPE_BOOL", "enum": "TYPE_INT32", "string": "TYPE_STRING", "bytes": "TYPE_BYTES",
+    "float": "TYPE_FLOAT", "double": "TYPE_DOUBLE", "fixed32": "TYPE_FIXED32",
+    "sfixed32": "TYPE_SFIXED32", "fixed64": "TYPE_FIXED64", "sfixed64": "TYPE_SFIXED64",
+}
+
+
+def runtime_classes():
+    """
+    Build protobuf runtime message classes from g2_proto.SCHEMA (no protoc needed).
+
+    Declared proto2/optional so set-to-zero fields are serialized, matching
+    the wire format the glasses use. Returns None if protobuf is not installed.
+    """
+    if descriptor_pb2 is None:
+        return None
+    fdp = descriptor_pb2.FileDescriptorProto(name="g2_protocol_bench.proto", package="even.g2",
+                                             syntax="proto2")
+    field_proto = descriptor_pb2.FieldDescriptorProto
+    for name, schema_fields in pb.SCHEMA.items():
+        message = fdp.message_type.add(name=name)
+        for field_name, number, type_name, repeated in schema_fields:
+            field = message.field.add(name=field_name, number=number,
+                                      label=field_proto.LABEL_REPEATED if repeated
+                                      else field_proto.LABEL_OPTIONAL)
+            if type_name in pb.SCHEMA:
+                field.type = field_proto.TYPE_MESSAGE
+                field.type_name = f".even.g2.{type_name}"
+            else:
+                field.type = getattr(field_proto, RUNTIME_TYPES[type_name])
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(fdp)
+    return {name: message_factory.GetMessageClass(pool.FindMessageTypeByName(f"even.g2.{name}"))
+            for name in pb.SCHEMA}
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def rate(func) -> float:
+    """Calls per second."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=number))
+    return number / best
+
+
+def benchmark(runtime=None):
+    # Hand-rolled builders without framing, so all columns measure payload encoding
+    even_ai.build_packet = lambda seq, hi, lo, payload: payload
+    teleprompter.build_packet = lambda seq, hi, lo, payload: payload
+
+    question = "What is the capital of France?"
+    answer = "The capital of France is Paris, which is also its largest city. " * 3
+    page = "\n".join(["Twenty-five characters!!!"] * 10)
+    ask = ask_payload(42, question)
+    content = content_page_payload(7, 3, page)
+
+    rows = [
+        ("encode ASK", lambda: even_ai.build_ask(0, 42, question), lambda: ask_payload(42, question)),
+        ("encode REPLY (~200 B)", lambda: even_ai.build_reply(0, 42, answer), lambda: reply_payload(42, answer)),
+        ("encode content page", lambda: teleprompter.build_content_page(0, 7, 3, page),
+         lambda: content_page_payload(7, 3, page)),
+        ("encode teleprompter init", lambda: teleprompter.build_teleprompter_init(0, 7, 140, True),
+         lambda: teleprompter_init_payload(7, 140, True)),
+        # The repo's existing decoding approach: walk fields into dicts
+        ("decode ASK", lambda: fields(fields(ask)[5])[4].decode("utf-8"),
+         lambda: pb.decode_even_ai_message(ask).ask_info.text),
+        ("decode content page", lambda: fields(fields(content)[5])[3],
+         lambda: pb.decode_teleprompter_message(content).content.text),
+    ]
+
+    runtime_rows = {}
+    if runtime is not None:
+        EvenAIMessage, EvenAIText = runtime["EvenAIMessage"], runtime["EvenAIText"]
+        TeleprompterMessage = runtime["TeleprompterMessage"]
+        Content, Init = runtime["TeleprompterContent"], runtime["TeleprompterInit"]
+        Display = runtime["TeleprompterDisplaySettings"]
+        page_bytes = ("\n" + page).encode("utf-8")
+        runtime_rows = {
+            "encode ASK": lambda: EvenAIMessage(command_id=3, magic_random=42, ask_info=EvenAIText(
+                cmd_cnt=0, stream_enable=0, text_mode=0, text=question)).SerializeToString(),
+            "encode REPLY (~200 B)": lambda: EvenAIMessage(command_id=5, magic_random=42, reply_info=EvenAIText(
+                cmd_cnt=0, stream_enable=0, text_mode=0, text=answer)).SerializeToString(),
+            "encode content page": lambda: TeleprompterMessage(type=3, msg_id=7, content=Content(
+                page_number=3, line_count=10, text=page_bytes)).SerializeToString(),
+            "encode teleprompter init": lambda: TeleprompterMessage(type=1, msg_id=7, init=Init(
+                script_index=1, display=Display(field1=1, field2=0, field3=0, display_width=267,
+                                                content_height=2665, line_height=230, viewport_height=1294,
+                                                font_size=5, scroll_mode=0))).SerializeToString(),
+            "decode ASK": lambda: EvenAIMessage.FromString(ask).ask_info.text,
+            "decode content page": lambda: TeleprompterMessage.FromString(content).content.text,
+        }
+
+    print(f"\n{'operation':<26} {'hand-rolled':>12} {'generated':>12} {'protobuf':>12}   (ops/s)")
+    for name, hand, generated in rows:
+        hand_rate, gen_rate = rate(hand), rate(generated)
+        runtime_rate = f"{rate(runtime_rows[name]):>12,.0f}" if name in runtime_rows else f"{'-':>12}"
+        print(f"{name:<26} {hand_rate:>12,.0f} {gen_rate:>12,.0f} {runtime_rate}   "
+              f"x{gen_rate / hand_rate:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate and benchmark the generated G2 codec')
+    parser.add_argument('--validate', action='store_true', help='Validation only')
+    args = parser.parse_args()
+
+    runtime = runtime_classes()
+    if runtime is None:
+        print("protobuf not installed - skipping the runtime comparison")
+    else:
+        from google.protobuf.internal import api_implementation
+        print(f"protobuf runtime: {api_implementation.Type()}")
+
+    if not validate(runtime):
+        sys.exit(1)
+    if not args.validate:
+        benchmark(runtime)
+
+
+if __name__ == "__main__":
+    main()
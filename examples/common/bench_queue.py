@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Write Queue Benchmark
+
+Runs the same mixed load against G2Emulator twice, once with every
+producer writing on its own (ad hoc) and once through one WriteQueue:
+
+    - control:     a heartbeat (0x80-20) every 250 ms
+    - interactive: an Even AI reply (0x07-20) every 100 ms
+    - bulk:        a teleprompter upload (0x06-20 content pages), written
+                   the ad hoc way in gathered batches, and a task list sync
+                   (0x0C-20, multi-packet TaskSync messages)
+
+The emulated controller holds tx_buffers writes; a write that arrives
+while they are all waiting is lost. For each class the benchmark reports
+the latency from issuing a message until it is written, and how many
+messages reached the glasses. With the queue it also prints the queueing
+delay and backpressure per class.
+
+Usage:
+    python bench_queue.py
+    python bench_queue.py --pages 600 --batch 50 --tx-buffers 4 --link-ms 5
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+import g2_proto as pb
+from emulator import G2Emulator
+from frames import FrameWriter, build_packet, build_packets, encode_varint
+from gestures import LatencyHistogram
+from write_queue import BULK, CONTROL, INTERACTIVE, PRIORITY_NAMES, WriteQueue
+
+HEARTBEAT_INTERVAL = 0.25
+REPLY_INTERVAL = 0.1
+TASK_MESSAGES = 20
+TASKS_PER_MESSAGE = 40
+
+
+def heartbeat(seq: int, msg_id: int) -> bytes:
+    return build_packet(seq, 0x80, 0x20, bytes([0x08, 0x0E, 0x10]) + encode_varint(msg_id) + bytes([0x6A, 0x00]))
+
+
+def ai_packet(seq: int, magic: int, command: int, **kwargs) -> bytes:
+    return build_packet(seq, 0x07, 0x20, pb.encode_even_ai_message(command_id=command, magic_random=magic, **kwargs))
+
+
+def reply(seq: int, magic: int, text: str) -> bytes:
+    return ai_packet(seq, magic, pb.REPLY, reply_info=pb.encode_even_ai_text(0, 0, 0, text))
+
+
+def page(seq: int, msg_id: int, number: int) -> bytes:
+    text = f"\nPage {number}: " + "the quick brown fox jumps over the lazy dog " * 4
+    content = pb.encode_teleprompter_content(number, 10, text.encode())
+    return build_packet(seq, 0x06, 0x20, pb.encode_teleprompter_message(type=3, msg_id=msg_id, content=content))
+
+
+def task_sync(seq: int, number: int, max_payload: int) -> List[bytes]:
+    first = number * TASKS_PER_MESSAGE
+    items = [pb.encode_task_item(first + i + 1, f"Task {first + i + 1}: review the sprint plan", None,
+                                 first + i + 1) for i in range(TASKS_PER_MESSAGE)]
+    sync = pb.encode_task_sync(number + 1, number == 0 or None, items, [], TASK_MESSAGES * TASKS_PER_MESSAGE)
+    return build_packets(seq, 0x0C, 0x20, pb.encode_tasks_message(1, number + 1, sync), max_payload)
+
+
+class Load:
+    """The producers, writing through send(packets, priority)."""
+
+    def __init__(self, args, send, batch_send):
+        self.args = args
+        self.send = send                # await send(packets, priority)
+        self.batch_send = batch_send    # await batch_send(list of single packets), bulk
+        self.latency = [LatencyHistogram() for _ in PRIORITY_NAMES]
+        self.issued = [0] * len(PRIORITY_NAMES)
+        self.done = asyncio.Event()
+        self.seq = 0
+
+    def next_seq(self) -> int:
+        self.seq = (self.seq + 1) & 0xFF
+        return self.seq
+
+    async def timed(self, packets, priority: int):
+        started = time.monotonic()
+        self.issued[priority] += 1
+        await self.send(packets, priority)
+        self.latency[priority].record(time.monotonic() - started)
+
+    async def heartbeats(self):
+        msg_id = 0
+        while not self.done.is_set():
+            msg_id += 1
+            await self.timed(heartbeat(self.next_seq(), msg_id), CONTROL)
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    async def replies(self):
+        magic = 0
+        while not self.done.is_set():
+            magic = magic % 0x7F + 1
+            await self.timed(reply(self.next_seq(), magic, f"Answer {self.issued[INTERACTIVE] + 1}"), INTERACTIVE)
+            await asyncio.sleep(REPLY_INTERVAL)
+
+    async def upload(self):
+        for start in range(0, self.args.pages, self.args.batch):
+            batch = [page(self.next_seq(), n + 1, n + 1) for n in range(start, min(start + self.args.batch,
+                                                                                     self.args.pages))]
+            started = time.monotonic()
+            self.issued[BULK] += len(batch)
+            await self.batch_send(batch)
+            for _ in batch:
+                self.latency[BULK].record(time.monotonic() - started)
+
+    async def tasks(self, max_payload: int):
+        for number in range(TASK_MESSAGES):
+            await self.timed(task_sync(self.next_seq(), number, max_payload), BULK)
+
+    async def run(self, max_payload: int):
+        background = [asyncio.create_task(self.heartbeats()), asyncio.create_task(self.replies())]
+        await asyncio.gather(self.upload(), self.tasks(max_payload))
+        self.done.set()
+        await asyncio.gather(*background)
+
+
+async def run_mode(args, queued: bool) -> Dict:
+    glasses = G2Emulator(write_latency=args.link_ms / 1000, tx_buffers=args.tx_buffers)
+    writer = FrameWriter(glasses)
+    await writer.write(ai_packet(0, 1, pb.CTRL, ctrl=pb.encode_even_ai_control(2)))    # enter AI mode
+
+    if queued:
+        queue = WriteQueue(glasses, depth=args.depth, writer=writer)
+
+        async def send(packets, priority):
+            await queue.send(packets, priority)
+
+        async def batch_send(packets):
+            futures = [await queue.put(packet, BULK) for packet in packets]
+            await asyncio.gather(*futures)
+    else:
+        queue = None
+
+        async def send(packets, priority):
+            for packet in [packets] if isinstance(packets, bytes) else packets:
+                await writer.write(packet)
+
+        async def batch_send(packets):
+            await asyncio.gather(*(writer.write(packet) for packet in packets))
+
+    load = Load(args, send, batch_send)
+    started = time.monotonic()
+    await load.run(writer.max_payload)
+    if queue is not None:
+        await queue.close()
+    received = [glasses.services[0x8020], len([d for d in glasses.displayed if d[1] == "reply"]),
+                glasses.services[0x0620] + glasses.services[0x0C20]]
+    return {"load": load, "queue": queue, "glasses": glasses, "received": received,
+            "seconds": time.monotonic() - started}
+
+
+def report(name: str, result: Dict):
+    load, glasses = result["load"], result["glasses"]
+    print(f"\n{name}: {result['seconds']:.2f} s, {glasses.overruns} writes lost to controller overruns")
+    print(f"  {'class':<12} {'sent':>6} {'arrived':>8} {'mean ms':>8} {'p95 ms':>7} {'max ms':>7}")
+    for priority, label in enumerate(PRIORITY_NAMES):
+        latency = load.latency[priority]
+        print(f"  {label:<12} {load.issued[priority]:>6} {result['received'][priority]:>8} "
+              f"{latency.mean_ms:>8.1f} {latency.percentile(0.95):>7.0f} {latency.max_ms:>7.0f}")
+    queue = result["queue"]
+    if queue is not None:
+        print(f"  queueing delay and backpressure (depth {queue.depth} per class):")
+        for label, stats in queue.stats().items():
+            print(f"  {label:<12} mean {stats['delay_mean_ms']:>6.1f} ms, p95 {stats['delay_p95_ms']:>5.0f} ms, "
+                  f"max depth {stats['max_depth']:>3}, {stats['blocked']:>4} puts blocked "
+                  f"({stats['blocked_s']:.2f} s)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Priority write queue vs ad hoc writes (emulator)')
+    parser.add_argument('--pages', type=int, default=300, help='Teleprompter pages to upload')
+    parser.add_argument('--batch', type=int, default=25, help='Pages the ad hoc uploader writes at once')
+    parser.add_argument('--tx-buffers', type=int, default=8, help='Emulated controller write buffers')
+    parser.add_argument('--depth', type=int, default=16, help='Queue depth per priority class')
+    parser.add_argument('--link-ms', type=float, default=7.5, help='Emulated time per write')
+    args = parser.parse_args()
+
+    print(f"{args.pages} teleprompter pages in batches of {args.batch}, {TASK_MESSAGES} TaskSync messages, "
+          f"a heartbeat every {HEARTBEAT_INTERVAL * 1000:.0f} ms and a reply every {REPLY_INTERVAL * 1000:.0f} ms; "
+          f"{args.link_ms:g} ms per write, {args.tx_buffers} controller buffers")
+    report("Ad hoc", await run_mode(args, queued=False))
+    queued = await run_mode(args, queued=True)
+    report("WriteQueue", queued)
+    if queued["glasses"].overruns or queued["received"][2] != queued["load"].issued[BULK]:
+        raise AssertionError("Writes were lost with the queue")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted")
@@ -0,0 +1,184 @@
+"""
+btsnoop Capture Files
+
+Reads and writes Android-style btsnoop HCI logs (btsnoop_hci.log, see
+CONTRIBUTING.md) and extracts ATT writes/notifications from them:
+
+    for att in iter_att(read_records("captures/session.log")):
+        att.timestamp, att.direction, att.handle, att.value
+
+G2Emulator.save_btsnoop() writes the same format, so analysis tools can be
+exercised without glasses.
+"""
+
+import struct
+from typing import BinaryIO, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+MAGIC = b"btsnoop\x00"
+VERSION = 1
+DATALINK_HCI = 1001         # Un-encapsulated HCI
+DATALINK_H4 = 1002          # HCI UART (H4) - what Android writes
+DATALINKS = (DATALINK_HCI, DATALINK_H4)
+FILE_HEADER = struct.Struct(">8sII")
+RECORD_HEADER = struct.Struct(">IIIIq")
+
+# Microseconds from 0000-01-01 (btsnoop epoch) to 1970-01-01
+EPOCH_DELTA_US = 0x00DCDDB30F2F8000
+
+FLAG_RECEIVED = 0x01        # controller -> host (glasses -> phone)
+FLAG_COMMAND = 0x02         # command/event rather than ACL data
+
+H4_ACL = 0x02
+L2CAP_CID_ATT = 0x0004
+
+ATT_WRITE_REQ = 0x12
+ATT_WRITE_CMD = 0x52
+ATT_NOTIFY = 0x1B
+ATT_INDICATE = 0x1D
+ATT_VALUE_OPCODES = (ATT_WRITE_REQ, ATT_WRITE_CMD, ATT_NOTIFY, ATT_INDICATE)
+
+# Typical ATT handles (docs/ble-uuids.md); they can differ per connection
+HANDLE_CHARS = {0x0842: "5401", 0x0844: "5402", 0x0864: "6402"}
+
+
+class CaptureError(Exception):
+    """The file is not a usable btsnoop capture."""
+
+
+class Record(NamedTuple):
+    index: int
+    timestamp: float        # Unix seconds
+    flags: int
+    data: bytes
+
+
+class AttValue(NamedTuple):
+    record: int
+    timestamp: float
+    direction: str          # "tx" = phone -> glasses, "rx" = glasses -> phone
+    opcode: int
+    handle: int
+    value: bytes
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def _damage_hint(data: bytes) -> str:
+    """Explain a bad header when it looks like a text/UTF-8 round trip."""
+    sample = data[:65536]
+    high = sum(1 for b in sample if b >= 0x80) / max(1, len(sample))
+    if high < 0.05:
+        return (f" - only {high:.1%} of bytes are >= 0x80; the file looks like it went through"
+                f" a text/UTF-8 conversion that dropped most of them")
+    return ""
+
+
+def read_records(source, strict: bool = True) -> Iterator[Record]:
+    """
+    Yield records from a btsnoop file (path, bytes or binary file).
+
+    Raises CaptureError for a bad header. A truncated last record ends the
+    iteration quietly unless strict is set.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    elif hasattr(source, "read"):
+        data = source.read()
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+
+    if len(data) < FILE_HEADER.size:
+        raise CaptureError("File too short for a btsnoop header")
+    magic, version, datalink = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise CaptureError("Not a btsnoop file (bad magic)" + _damage_hint(data))
+    if version != VERSION or datalink not in DATALINKS:
+        raise CaptureError(f"Unsupported btsnoop version {version} / datalink {datalink:#x}"
+                           + _damage_hint(data))
+
+    offset = FILE_HEADER.size
+    index = 0
+    end = len(data)
+    while offset + RECORD_HEADER.size <= end:
+        orig_len, incl_len, flags, _drops, ts = RECORD_HEADER.unpack_from(data, offset)
+        offset += RECORD_HEADER.size
+        if incl_len > orig_len or offset + incl_len > end:
+            if strict:
+                raise CaptureError(f"Record {index} is truncated or corrupt at offset {offset}")
+            return
+        body = data[offset:offset + incl_len]
+        offset += incl_len
+        if datalink == DATALINK_HCI and not flags & FLAG_COMMAND:
+            body = bytes([H4_ACL]) + body
+        yield Record(index, (ts - EPOCH_DELTA_US) / 1e6, flags, body)
+        index += 1
+
+
+def iter_att(records: Iterable[Record]) -> Iterator[AttValue]:
+    """Yield ATT writes, notifications and indications, reassembling fragmented ACL."""
+    partial: Dict[Tuple[int, int], Tuple[Record, bytearray, int]] = {}
+
+    for record in records:
+        data = record.data
+        if len(data) < 5 or data[0] != H4_ACL:
+            continue
+        handle_flags, acl_len = struct.unpack_from("<HH", data, 1)
+        conn = handle_flags & 0x0FFF
+        boundary = (handle_flags >> 12) & 0x03
+        chunk = data[5:5 + acl_len]
+        key = (conn, record.flags & FLAG_RECEIVED)
+
+        if boundary == 0x01:        # continuation
+            if key not in partial:
+                continue
+            first, buf, total = partial[key]
+            buf += chunk
+        else:                       # start of an L2CAP frame
+            if len(chunk) < 4:
+                continue
+            total = struct.unpack_from("<H", chunk)[0] + 4
+            first, buf = record, bytearray(chunk)
+        if len(buf) < total:
+            partial[key] = (first, buf, total)
+            continue
+        partial.pop(key, None)
+
+        l2cap_len, cid = struct.unpack_from("<HH", buf)
+        if cid != L2CAP_CID_ATT or len(buf) < 7:
+            continue
+        opcode = buf[4]
+        if opcode not in ATT_VALUE_OPCODES:
+            continue
+        att_handle = struct.unpack_from("<H", buf, 5)[0]
+        direction = "rx" if first.flags & FLAG_RECEIVED else "tx"
+        yield AttValue(first.index, first.timestamp, direction, opcode, att_handle,
+                       bytes(buf[7:4 + l2cap_len]))
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+class BtsnoopWriter:
+    """Write ATT traffic as an H4 btsnoop log (single connection)."""
+
+    def __init__(self, f: BinaryIO, conn_handle: int = 0x0040):
+        self.f = f
+        self.conn_handle = conn_handle
+        f.write(FILE_HEADER.pack(MAGIC, VERSION, DATALINK_H4))
+
+    def write_record(self, timestamp: float, flags: int, data: bytes):
+        ts = int(round(timestamp * 1e6)) + EPOCH_DELTA_US
+        self.f.write(RECORD_HEADER.pack(len(data), len(data), flags, 0, ts) + data)
+
+    def write_att(self, timestamp: float, direction: str, handle: int, value: bytes,
+                  opcode: Optional[int] = None):
+        if opcode is None:
+            opcode = ATT_NOTIFY if direction == "rx" else ATT_WRITE_CMD
+        att = bytes([opcode]) + struct.pack("<H", handle) + value
+        l2cap = struct.pack("<HH", len(att), L2CAP_CID_ATT) + att
+        acl = bytes([H4_ACL]) + struct.pack("<HH", self.conn_handle | 0x2000, len(l2cap)) + l2cap
+        self.write_record(timestamp, FLAG_RECEIVED if direction == "rx" else 0, acl)
@@ -0,0 +1,307 @@
+"""
+Nordic Secure DFU Client
+
+Pushes one firmware image (init packet + binary) over the Secure DFU
+service of an nRF5 bootloader:
+
+    dfu = DfuClient(client, prn=8)          # a BleakClient connected to the bootloader
+    await dfu.start()
+    result = await dfu.update(init_packet, firmware, progress=print)
+
+Both images go through the same object cycle on the control point:
+
+    SELECT type          -> max object size, offset and CRC-32 already on the target
+    CREATE type, size       (data objects: one flash page, usually 4 KB)
+    write the object to the packet characteristic, in chunks of up to MTU - 3
+    CALC_CHECKSUM        -> offset + CRC-32 of everything received, compared locally
+    EXECUTE                 (the init packet is validated, a data object written to flash)
+
+With PRN (packet receipt notification) set to n, the target reports offset
+and CRC after every n packets and the client waits for it before sending
+more; that paces the link to the target's flash and catches a lost packet
+within n packets instead of at the end of the object. PRN 0 turns it off.
+
+update() resumes: SELECT tells how much of the image the target already
+has; if its CRC matches, sending continues from there (an unfinished
+object is completed, a finished one executed unless the target already
+did, which it answers with "not permitted"). A data object that fails
+its checksum is created and sent again, up to max_retries times.
+
+CRCs are standard CRC-32 (zlib), cumulative from the start of the image,
+not the CRC32C of the glasses' file service.
+
+NOTE: These are the Secure DFU UUIDs of the nRF5 SDK bootloader. The G2's
+DFU traffic has not been captured; docs/firmware-protocol.md lists the
+legacy DFU UUIDs, which the .dat init packets (dfu-cc.proto) do not fit.
+"""
+
+import asyncio
+import struct
+import time
+import zlib
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from frames import ATT_OVERHEAD, LINK_ERRORS, MTU_STEPS, reported_mtu
+
+DFU_SERVICE = "0000fe59-0000-1000-8000-00805f9b34fb"
+DFU_CONTROL_POINT = "8ec90001-f315-4f60-9fb8-838830daea50"
+DFU_PACKET = "8ec90002-f315-4f60-9fb8-838830daea50"
+
+OP_CREATE = 0x01
+OP_SET_PRN = 0x02
+OP_CALC_CHECKSUM = 0x03
+OP_EXECUTE = 0x04
+OP_SELECT = 0x06
+OP_MTU_GET = 0x07
+OP_ABORT = 0x0C
+OP_RESPONSE = 0x60
+
+OBJ_COMMAND = 0x01
+OBJ_DATA = 0x02
+
+RES_SUCCESS = 0x01
+RES_OP_NOT_SUPPORTED = 0x02
+RES_INVALID_PARAMETER = 0x03
+RES_INSUFFICIENT_RESOURCES = 0x04
+RES_INVALID_OBJECT = 0x05
+RES_UNSUPPORTED_TYPE = 0x07
+RES_NOT_PERMITTED = 0x08
+RES_OPERATION_FAILED = 0x0A
+RES_EXTENDED_ERROR = 0x0B
+
+RESULTS = {
+    RES_SUCCESS: "success", RES_OP_NOT_SUPPORTED: "operation not supported",
+    RES_INVALID_PARAMETER: "invalid parameter", RES_INSUFFICIENT_RESOURCES: "insufficient resources",
+    RES_INVALID_OBJECT: "invalid object", RES_UNSUPPORTED_TYPE: "unsupported type",
+    RES_NOT_PERMITTED: "operation not permitted", RES_OPERATION_FAILED: "operation failed",
+    RES_EXTENDED_ERROR: "extended error",
+}
+
+
+class DfuError(Exception):
+    """The target answered with an error, or its CRC/offset did not match."""
+
+    def __init__(self, message: str, opcode: int = 0, result: int = 0):
+        super().__init__(message)
+        self.opcode = opcode
+        self.result = result
+
+
+class DfuResult(NamedTuple):
+    bytes: int              # init packet + firmware
+    sent: int               # bytes written to the packet characteristic, including resends
+    resumed: int            # firmware bytes the target already had
+    objects: int            # data objects sent and executed
+    retries: int
+    packets: int
+    receipts: int           # PRN notifications
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+class DfuClient:
+    """
+    Secure DFU over one BLE connection.
+
+    client is a connected BleakClient (or anything with its write_gatt_char /
+    start_notify surface, such as emulator.DfuEmulator). chunk defaults to
+    the largest write the reported MTU allows; if the link rejects a packet,
+    the object is sent again with the chunk of the next smaller MTU in
+    frames.MTU_STEPS. clock() times the update.
+    """
+
+    def __init__(self, client, prn: int = 12, chunk: Optional[int] = None, timeout: float = 10.0,
+                 max_retries: int = 3, clock: Callable[[], float] = time.perf_counter):
+        self.client = client
+        self.prn = prn
+        self.chunk = chunk or reported_mtu(client) - ATT_OVERHEAD
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.clock = clock
+        self._responses: asyncio.Queue = asyncio.Queue()
+        self._receipts: asyncio.Queue = asyncio.Queue()
+        self._expect_receipts = False
+
+        self.sent = 0
+        self.objects = 0
+        self.packets = 0
+        self.receipts = 0
+        self.retries = 0
+        self.shrinks = 0
+
+    async def start(self):
+        await self.client.start_notify(DFU_CONTROL_POINT, self._on_notify)
+
+    async def stop(self):
+        await self.client.stop_notify(DFU_CONTROL_POINT)
+
+    def _on_notify(self, _, data: bytearray):
+        # PRN receipts have the shape of a CALC_CHECKSUM response; they only arrive while streaming
+        if self._expect_receipts and len(data) == 11 and data[:3] == b"\x60\x03\x01":
+            self._receipts.put_nowait(bytes(data[3:]))
+        else:
+            self._responses.put_nowait(bytes(data))
+
+    # -------------------------------------------------------------------------
+    # Control point
+    # -------------------------------------------------------------------------
+
+    async def _request(self, opcode: int, params: bytes = b"") -> bytes:
+        """Write a control point request and return the response parameters."""
+        await self.client.write_gatt_char(DFU_CONTROL_POINT, bytes([opcode]) + params, response=True)
+        while True:
+            data = await asyncio.wait_for(self._responses.get(), self.timeout)
+            if len(data) >= 3 and data[0] == OP_RESPONSE and data[1] == opcode:
+                break
+        if data[2] != RES_SUCCESS:
+            extended = data[2] == RES_EXTENDED_ERROR and len(data) > 3
+            detail = f", extended error 0x{data[3]:02X}" if extended else ""
+            raise DfuError(f"Opcode 0x{opcode:02X}: {RESULTS.get(data[2], hex(data[2]))}{detail}",
+                           opcode, data[2])
+        return data[3:]
+
+    async def select(self, obj_type: int) -> Tuple[int, int, int]:
+        """(max object size, offset, CRC-32) of the object type on the target."""
+        return struct.unpack("<III", await self._request(OP_SELECT, bytes([obj_type])))
+
+    async def create(self, obj_type: int, size: int):
+        await self._request(OP_CREATE, struct.pack("<BI", obj_type, size))
+
+    async def set_prn(self, prn: int):
+        await self._request(OP_SET_PRN, struct.pack("<H", prn))
+
+    async def checksum(self) -> Tuple[int, int]:
+        """(offset, CRC-32) of everything the target received."""
+        return struct.unpack("<II", await self._request(OP_CALC_CHECKSUM))
+
+    async def execute(self):
+        await self._request(OP_EXECUTE)
+
+    # -------------------------------------------------------------------------
+    # Transfer
+    # -------------------------------------------------------------------------
+
+    async def _write_object(self, image: bytes, start: int, end: int, crc: int) -> int:
+        """Write image[start:end] in chunks, checking PRN receipts; returns the running CRC."""
+        view = memoryview(image)
+        unacknowledged = 0
+        while not self._receipts.empty():           # left over from a failed attempt
+            self._receipts.get_nowait()
+        self._expect_receipts = self.prn > 0
+        try:
+            for pos in range(start, end, self.chunk):
+                data = view[pos:min(pos + self.chunk, end)]
+                try:
+                    await self.client.write_gatt_char(DFU_PACKET, data, response=False)
+                except LINK_ERRORS:
+                    raise
+                except Exception as e:
+                    self._shrink(e)
+                crc = zlib.crc32(data, crc)
+                self.packets += 1
+                self.sent += len(data)
+                unacknowledged += 1
+                if unacknowledged == self.prn:
+                    receipt = await asyncio.wait_for(self._receipts.get(), self.timeout)
+                    self.receipts += 1
+                    unacknowledged = 0
+                    self._check(receipt, pos + len(data), crc)
+        finally:
+            self._expect_receipts = False
+        return crc
+
+    def _shrink(self, error: Exception):
+        """A rejected packet write: retry the object with the chunk of the next smaller MTU."""
+        smaller = [mtu - ATT_OVERHEAD for mtu in MTU_STEPS if mtu - ATT_OVERHEAD < self.chunk]
+        if not smaller:
+            raise error
+        self.chunk = smaller[0]
+        self.shrinks += 1
+        raise DfuError(f"Packet write failed ({error}); chunk reduced to {self.chunk}",
+                       OP_CALC_CHECKSUM, RES_OPERATION_FAILED)
+
+    @staticmethod
+    def _check(reply: bytes, offset: int, crc: int):
+        got_offset, got_crc = struct.unpack("<II", reply)
+        if got_offset != offset or got_crc != crc:
+            raise DfuError(f"Target has offset {got_offset} CRC {got_crc:08X}, expected {offset} {crc:08X}",
+                           OP_CALC_CHECKSUM, RES_OPERATION_FAILED)
+
+    async def send_init(self, init: bytes):
+        """Send and execute the init packet, unless the target already holds it."""
+        max_size, offset, crc = await self.select(OBJ_COMMAND)
+        if len(init) > max_size:
+            raise DfuError(f"Init packet of {len(init)} bytes exceeds {max_size}", OP_SELECT,
+                           RES_INSUFFICIENT_RESOURCES)
+        if offset != len(init) or crc != zlib.crc32(init):
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self.create(OBJ_COMMAND, len(init))
+                    crc = await self._write_object(init, 0, len(init), 0)
+                    self._check(struct.pack("<II", *await self.checksum()), len(init), crc)
+                    break
+                except DfuError as e:
+                    if e.opcode != OP_CALC_CHECKSUM or attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+        await self.execute()
+
+    async def send_firmware(self, firmware: bytes, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """Send the firmware in data objects; returns the number of bytes resumed."""
+        if not firmware:
+            raise ValueError("Empty firmware image")
+        max_size, offset, crc = await self.select(OBJ_DATA)
+        if offset > len(firmware) or crc != zlib.crc32(firmware[:offset]):
+            offset, crc = 0, 0              # not this image: start over, CREATE discards it
+        resumed = offset
+
+        if offset and (offset % max_size == 0 or offset == len(firmware)):
+            # A complete object. If the target already executed it (and maybe created
+            # the next one), it answers EXECUTE with "not permitted"; carry on from there.
+            try:
+                await self.execute()
+            except DfuError as e:
+                if e.opcode != OP_EXECUTE or e.result != RES_NOT_PERMITTED:
+                    raise
+            start = offset
+        else:
+            start = offset - offset % max_size
+        start_crc = zlib.crc32(firmware[:start])
+
+        while start < len(firmware):
+            end = min(start + max_size, len(firmware))
+            for attempt in range(self.max_retries + 1):
+                try:
+                    if offset == start:
+                        await self.create(OBJ_DATA, end - start)
+                    crc = await self._write_object(firmware, offset, end, crc)
+                    self._check(struct.pack("<II", *await self.checksum()), end, crc)
+                    break
+                except DfuError as e:
+                    if e.opcode != OP_CALC_CHECKSUM or attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    offset, crc = start, start_crc
+            await self.execute()
+            self.objects += 1
+            start = offset = end
+            start_crc = crc
+            if progress:
+                progress(end, len(firmware))
+        return resumed
+
+    async def update(self, init: bytes, firmware: bytes,
+                     progress: Optional[Callable[[int, int], None]] = None) -> DfuResult:
+        """Push one image: PRN, init packet, then the firmware."""
+        started = self.clock()
+        before = (self.sent, self.objects, self.retries, self.packets, self.receipts)
+        await self.set_prn(self.prn)
+        await self.send_init(init)
+        resumed = await self.send_firmware(firmware, progress)
+        after = (self.sent, self.objects, self.retries, self.packets, self.receipts)
+        sent, objects, retries, packets, receipts = (a - b for a, b in zip(after, before))
+        return DfuResult(len(init) + len(firmware), sent, resumed, objects, retries, packets, receipts,
+                         self.clock() - started)
@@ -0,0 +1,662 @@
+"""
+G2 Device Emulator
+
+In-process stand-in for one connected G2 arm, shaped like a connected
+bleak.BleakClient (write_gatt_char / start_notify / stop_notify / mtu_size).
+Examples and benchmarks can run end-to-end without glasses:
+
+    glasses = G2Emulator()
+    await glasses.start_notify(CHAR_NOTIFY, on_notify)
+    await glasses.write_gatt_char(CHAR_WRITE, packet, response=False)
+    glasses.displayed   # [(t, "ask"/"reply", text), ...]
+    await glasses.stream_render(100)    # 6402 rendering frames
+
+The link is modelled with a fixed per-write latency plus an optional byte
+rate, so timing numbers are comparable between runs rather than realistic.
+Writes larger than the negotiated MTU allows are rejected, like a real
+controller would; link_mtu can make that smaller than the mtu_size
+reported to the writer. With tx_buffers set, writes that arrive while
+that many are already waiting for the link are dropped (overruns), the
+way a controller's buffers overflow under write-without-response. All
+traffic can be saved as a btsnoop log for the capture tools
+(save_btsnoop).
+
+R1Emulator does the same for the R1 ring's notifications (see ring.py), and
+DfuEmulator stands in for the Secure DFU bootloader (see dfu.py).
+"""
+
+import asyncio
+import hashlib
+import os
+import struct
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import g2_proto as pb
+from btsnoop import BtsnoopWriter
+from dfu import (
+    DFU_CONTROL_POINT, DFU_PACKET, OBJ_COMMAND, OBJ_DATA, OP_CALC_CHECKSUM, OP_CREATE, OP_EXECUTE,
+    OP_RESPONSE, OP_SELECT, OP_SET_PRN, RES_EXTENDED_ERROR, RES_INSUFFICIENT_RESOURCES, RES_NOT_PERMITTED,
+    RES_OP_NOT_SUPPORTED, RES_SUCCESS, RES_UNSUPPORTED_TYPE,
+)
+from frames import (
+    ATT_OVERHEAD, CHAR_FILE_NOTIFY, CHAR_FILE_WRITE, CHAR_NOTIFY, CHAR_RENDER_NOTIFY, CHAR_RENDER_WRITE,
+    CHAR_WRITE, TYPE_RESPONSE, Frame, FrameDecoder, build_packet, encode_varint, fields,
+)
+
+
+AI_CTRL = 1
+AI_ASK = 3
+AI_REPLY = 5
+AI_STATUS_ENTER = 2
+AI_STATUS_EXIT = 3
+
+# ATT handles used in saved captures: 5401/5402/6402 as observed
+# (docs/ble-uuids.md), the others are placeholders
+CHAR_HANDLES = {
+    CHAR_WRITE: 0x0842, CHAR_NOTIFY: 0x0844,
+    CHAR_RENDER_WRITE: 0x0862, CHAR_RENDER_NOTIFY: 0x0864,
+    CHAR_FILE_WRITE: 0x0882, CHAR_FILE_NOTIFY: 0x0884,
+}
+
+
+class G2Emulator:
+    """Simulated G2 arm that decodes content-channel writes and answers notifications."""
+
+    def __init__(self, name: str = "Even G2_R_EMU", mtu: int = 512,
+                 write_latency: float = 0.0075, bytes_per_sec: Optional[float] = None,
+                 sleep_after: Optional[float] = None, wake_delay: float = 0.0,
+                 link_mtu: Optional[int] = None, tx_buffers: Optional[int] = None):
+        self.name = name
+        self.address = "00:00:00:00:00:00"
+        self.is_connected = True
+        self.mtu_size = mtu
+        self.link_mtu = link_mtu or mtu     # what the link carries, if a stack misreports mtu_size
+        self.write_latency = write_latency
+        self.bytes_per_sec = bytes_per_sec
+        self.sleep_after = sleep_after
+        self.wake_delay = wake_delay
+        self.tx_buffers = tx_buffers
+
+        self._callbacks: Dict[str, Callable] = {}
+        self._handlers: Dict[int, List[Callable[[Frame], None]]] = {}
+        self._decoders: Dict[str, FrameDecoder] = {}
+        self._link = asyncio.Lock()
+        self._waiting = 0
+        self._seq = 0
+        self._gesture_count = 0
+        self._render_seq = 0
+        self._last_write = time.monotonic()
+
+        self.frames: List[Tuple[float, str, Frame]] = []
+        self.raw_writes: List[Tuple[float, str, bytes]] = []
+        self.traffic: List[Tuple[float, str, str, bytes]] = []   # (t, "tx"/"rx", char, data)
+        self._clock_offset = time.time() - time.monotonic()
+        self.services = Counter()
+        self.bytes_written = 0
+        self.wakeups = 0
+        self.rejected = 0
+        self.overruns = 0
+
+        # Even AI card state
+        self.ai_mode = False
+        self.question: Optional[str] = None
+        self.answer: Optional[str] = None
+        self.displayed: List[Tuple[float, str, str]] = []
+        self.ignored_ai = 0
+        self.on_frame(0x0720, self._handle_even_ai)
+
+        # Dashboard (0x07-20, DashboardMessage type 10): widget type -> content
+        self.dashboard: Dict[int, bytes] = {}
+        self.on_frame(0x0720, self._handle_dashboard)
+
+        # Conversate (0x0B-20 / 0x11-20): final caption lines, and the live partial
+        self.captions: List[str] = []
+        self.caption_live = ""
+        self.on_frame(0x0B20, self._handle_conversate)
+        self.on_frame(0x1120, self._handle_conversate)
+
+        # Tasks (0x0C-20, TaskSync): id -> (title, done, order, due)
+        self.tasks: Dict[int, Tuple[str, bool, int, int]] = {}
+        self.task_version = 0
+        self.on_frame(0x0C20, self._handle_tasks)
+
+        # Navigation (0x08-20): last step shown, by NavigationStep field name
+        self.navigation: Dict[str, object] = {}
+        self.on_frame(0x0820, self._handle_navigation)
+
+    # -------------------------------------------------------------------------
+    # BleakClient surface
+    # -------------------------------------------------------------------------
+
+    async def connect(self):
+        self.is_connected = True
+        return True
+
+    async def disconnect(self):
+        self.is_connected = False
+        return True
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.disconnect()
+
+    async def start_notify(self, char_specifier, callback: Callable):
+        self._callbacks[str(char_specifier)] = callback
+
+    async def stop_notify(self, char_specifier):
+        self._callbacks.pop(str(char_specifier), None)
+
+    async def write_gatt_char(self, char_specifier, data, response: bool = False):
+        if not self.is_connected:
+            raise ConnectionError(f"{self.name} is not connected")
+        data = bytes(data)
+        if len(data) > self.link_mtu - ATT_OVERHEAD:
+            self.rejected += 1
+            raise ValueError(f"Write of {len(data)} bytes exceeds MTU {self.link_mtu} "
+                             f"({self.link_mtu - ATT_OVERHEAD} byte ATT payload)")
+
+        if self.tx_buffers is not None and self._waiting >= self.tx_buffers:
+            self.overruns += 1          # no buffer free: a write without response is lost
+            return
+
+        # One write on the air at a time
+        self._waiting += 1
+        try:
+            async with self._link:
+                now = time.monotonic()
+                delay = self.write_latency
+                if self.bytes_per_sec:
+                    delay += len(data) / self.bytes_per_sec
+                if self.sleep_after is not None and now - self._last_write > self.sleep_after:
+                    self.wakeups += 1
+                    delay += self.wake_delay
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._last_write = time.monotonic()
+        finally:
+            self._waiting -= 1
+
+        char = str(char_specifier)
+        self.bytes_written += len(data)
+        self.raw_writes.append((self._last_write, char, data))
+        self.traffic.append((self._last_write, "tx", char, data))
+
+        frame = self._decoders.setdefault(char, FrameDecoder()).feed(data)
+        if frame is None:
+            return
+        self.frames.append((self._last_write, char, frame))
+        self.services[frame.service] += 1
+        for handler in self._handlers.get(frame.service, ()):
+            handler(frame)
+
+    # -------------------------------------------------------------------------
+    # Emulator hooks
+    # -------------------------------------------------------------------------
+
+    def on_frame(self, service: int, handler: Callable[[Frame], None]):
+        """Call handler(frame) for every complete frame written to a service."""
+        self._handlers.setdefault(service, []).append(handler)
+
+    def frames_for(self, service: int) -> List[Frame]:
+        return [frame for _, _, frame in self.frames if frame.service == service]
+
+    def notify(self, data: bytes, char: str = CHAR_NOTIFY):
+        """Deliver a notification to the subscribed callback (like bleak, on the loop)."""
+        self.traffic.append((time.monotonic(), "rx", char, bytes(data)))
+        callback = self._callbacks.get(char)
+        if callback is not None:
+            callback(char, bytearray(data))
+
+    def send(self, svc_hi: int, svc_lo: int, payload: bytes, char: str = CHAR_NOTIFY):
+        """Notify a glasses -> phone packet."""
+        self._seq = (self._seq + 1) & 0xFF
+        self.notify(build_packet(self._seq, svc_hi, svc_lo, payload, pkt_type=TYPE_RESPONSE), char)
+
+    def save_btsnoop(self, path: str):
+        """Write all traffic so far as a btsnoop log (ATT write commands / notifications)."""
+        with open(path, "wb") as f:
+            writer = BtsnoopWriter(f)
+            for t, direction, char, data in self.traffic:
+                writer.write_att(t + self._clock_offset, direction, CHAR_HANDLES.get(char, 0x0900), data)
+
+    # -------------------------------------------------------------------------
+    # Even AI (0x07-20)
+    # -------------------------------------------------------------------------
+
+    def _handle_even_ai(self, frame: Frame):
+        msg = fields(frame.payload)
+        command = msg.get(1)
+        if command == AI_CTRL:
+            status = fields(msg.get(3, b"")).get(1)
+            if status in (AI_STATUS_ENTER, AI_STATUS_EXIT):
+                self.ai_mode = status == AI_STATUS_ENTER
+                self.send_ai_status(status)
+            return
+
+        if command not in (AI_ASK, AI_REPLY):
+            return
+        if not self.ai_mode:
+            # The glasses ignore ASK/REPLY outside AI mode
+            self.ignored_ai += 1
+            return
+
+        info = fields(msg.get(5 if command == AI_ASK else 7, b""))
+        text = bytes(info.get(4, b"")).decode("utf-8", errors="replace")
+        if command == AI_ASK:
+            self.question = text
+            self.displayed.append((time.monotonic(), "ask", text))
+        else:
+            self.answer = text
+            self.displayed.append((time.monotonic(), "reply", text))
+
+    def send_ai_status(self, status: int, magic: int = 1):
+        """Even AI CTRL status event (1=WAKE_UP, 2=ENTER, 3=EXIT) on 0x07-00."""
+        self.send(0x07, 0x00, bytes([0x08, 0x01, 0x10]) + encode_varint(magic) +
+                  bytes([0x1A, 0x02, 0x08, status]))
+
+    def send_vad(self, status: int, magic: int = 1):
+        """Even AI VAD_INFO event (1=START, 2=END, 3=TIMEOUT) on 0x07-00."""
+        self.send(0x07, 0x00, bytes([0x08, 0x02, 0x10]) + encode_varint(magic) +
+                  bytes([0x22, 0x02, 0x08, status]))
+
+    def exit_ai(self):
+        """Simulate the wearer leaving Even AI on the glasses."""
+        self.ai_mode = False
+        self.send_ai_status(AI_STATUS_EXIT)
+
+    def _handle_dashboard(self, frame: Frame):
+        msg = fields(frame.payload)
+        widget = msg.get(3)
+        if msg.get(1) != 10 or not isinstance(widget, bytes):
+            return
+        widget = fields(widget)
+        self.dashboard[widget.get(1, 0)] = bytes(widget.get(2, b""))
+
+    # -------------------------------------------------------------------------
+    # Conversate (0x0B-20)
+    # -------------------------------------------------------------------------
+
+    def _handle_conversate(self, frame: Frame):
+        transcript = fields(frame.payload).get(7)
+        if not isinstance(transcript, bytes):
+            return
+        transcript = fields(transcript)
+        text = bytes(transcript.get(1, b"")).decode("utf-8", errors="replace")
+        if transcript.get(2):
+            self.captions.extend(text.split("\n"))
+            self.caption_live = ""
+        else:
+            self.caption_live = text
+
+    # -------------------------------------------------------------------------
+    # Tasks (0x0C-20)
+    # -------------------------------------------------------------------------
+
+    def _handle_tasks(self, frame: Frame):
+        sync = pb.decode_tasks_message(frame.payload).sync
+        if sync is None:
+            return
+        if sync.full:
+            self.tasks.clear()
+        for item in sync.upsert:
+            self.tasks[item.id] = (item.title or "", bool(item.done), item.order or 0, item.due or 0)
+        for task_id in sync.removed:
+            self.tasks.pop(task_id, None)
+        self.task_version = sync.version or 0
+
+    # -------------------------------------------------------------------------
+    # Navigation (0x08-20)
+    # -------------------------------------------------------------------------
+
+    NAVIGATION_FIELDS = {2: "distance", 3: "instruction", 4: "time_remaining",
+                         5: "total_distance", 6: "eta", 7: "speed", 8: "icon"}
+
+    def _handle_navigation(self, frame: Frame):
+        step = fields(frame.payload).get(5)
+        if not isinstance(step, bytes):
+            return
+        self.navigation = {
+            name: value.decode("utf-8", errors="replace") if isinstance(value, bytes) else value
+            for number, value in fields(step).items()
+            for name in (self.NAVIGATION_FIELDS.get(number),) if name
+        }
+
+    # -------------------------------------------------------------------------
+    # Gestures (0x01-01, 0x0D-01)
+    # -------------------------------------------------------------------------
+
+    def _gesture_frame(self, gesture: bytes):
+        stamp = 0x80 | (int(time.monotonic() * 1000) & 0x3F7F)
+        status = bytes([0x08]) + encode_varint(stamp) + bytes([0x12, len(gesture)]) + gesture
+        self.send(0x01, 0x01, bytes([0x08, 0x01, 0x32, len(status)]) + status)
+
+    def swipe(self, direction: int = 1):
+        """Swipe forward (1) or backward (2) on the temple."""
+        self._gesture_count = (self._gesture_count + 1) & 0x7F
+        event = bytes([0x08, direction, 0x10, self._gesture_count])
+        self._gesture_frame(bytes([0x08, 0x01, 0x12, len(event)]) + event)
+
+    def tap(self):
+        """Single tap (double taps look identical on the wire)."""
+        self._gesture_count = (self._gesture_count + 1) & 0x7F
+        event = bytes([0x10, self._gesture_count])
+        self._gesture_frame(bytes([0x08, 0x01, 0x12, len(event)]) + event)
+
+    def long_press(self):
+        """Long press on 0x0D-01."""
+        self.send(0x0D, 0x01, bytes([0x08, 0x01, 0x1A, 0x04, 0x08, 0x01, 0x10, 0x03]))
+
+    # -------------------------------------------------------------------------
+    # Rendering channel (6402)
+    # -------------------------------------------------------------------------
+
+    def send_render(self, offset: int = 0, skip: int = 0, size: int = 205):
+        """
+        Notify one 6402 frame shaped like captures/Untitled.txt: random body,
+        00 + int16 LE offset, sequence byte. skip advances the sequence as if
+        frames were lost.
+        """
+        self._render_seq = (self._render_seq + 1 + skip) & 0xFF
+        trailer = bytes([0x00]) + (offset & 0xFFFF).to_bytes(2, "little") + bytes([self._render_seq])
+        self.notify(os.urandom(size - len(trailer)) + trailer, CHAR_RENDER_NOTIFY)
+
+    async def stream_render(self, count: int, rate: float = 11.5, drop_every: int = 0):
+        """Send count 6402 frames at rate frames/s, losing one in every drop_every."""
+        interval = 1 / rate if rate else 0
+        for i in range(count):
+            skip = 1 if drop_every and i and i % drop_every == 0 else 0
+            self.send_render(skip=skip)
+            await asyncio.sleep(interval)
+
+
+# =============================================================================
+# R1 Ring
+# =============================================================================
+
+class R1Emulator:
+    """Simulated R1 ring: notifies gestures, state, battery and RingDataPackage payloads."""
+
+    NOTIFY = "bae80013-4f05-4503-8e65-3af1f7329d1f"
+
+    def __init__(self, name: str = "Even R1_EMU"):
+        self.name = name
+        self.is_connected = True
+        self._callbacks: Dict[str, Callable] = {}
+        self._magic = 0
+        self.notified = 0
+
+    async def connect(self):
+        self.is_connected = True
+        return True
+
+    async def disconnect(self):
+        self.is_connected = False
+        return True
+
+    async def start_notify(self, char_specifier, callback: Callable):
+        self._callbacks[str(char_specifier)] = callback
+
+    async def stop_notify(self, char_specifier):
+        self._callbacks.pop(str(char_specifier), None)
+
+    def notify(self, data: bytes):
+        self.notified += 1
+        callback = self._callbacks.get(self.NOTIFY)
+        if callback is not None:
+            callback(self.NOTIFY, bytearray(data))
+
+    def hold(self):
+        self.notify(b"\xff\x03\x20")
+
+    def tap(self, double: bool = False):
+        self.notify(bytes([0xFF, 0x04, 0x02 if double else 0x01]))
+
+    def swipe(self, direction: int = 1):
+        self.notify(bytes([0xFF, 0x05, direction]))
+
+    def set_state(self, ready: bool):
+        self.notify(bytes([1 if ready else 0]))
+
+    def battery(self, percent: int):
+        self.notify(bytes([percent, 0x00]))
+
+    def raw_data(self, **readings):
+        """Notify a RingDataPackage with RingRawData fields, e.g. raw_data(hr=62, hr_timestamp=t)."""
+        self._magic = (self._magic + 1) & 0x7F
+        self.notify(pb.encode_ring_data_package(pb.RING_RAW_DATA, self._magic,
+                                                raw_data=pb.encode_ring_raw_data(**readings)))
+
+
+class DfuEmulator:
+    """
+    Simulated nRF5 Secure DFU bootloader (see dfu.py), on a virtual clock.
+
+    Nothing sleeps: every operation advances self.now by the time it would
+    take, so a whole update runs in well under a second of real time and
+    DfuClient(clock=target.clock) reports the simulated duration.
+
+    Link: packet writes share connection events, packets_per_event per
+    interval. A control point request and its response take two intervals,
+    and so does a PRN receipt, which the client waits for.
+
+    Flash: received packets wait in `buffers` RAM buffers for flash writes
+    at flash_rate; a packet arriving with every buffer busy is dropped (the
+    SDK logs "unable to allocate buffer" and the CRC check fails later).
+    CREATE erases the object's pages and EXECUTE waits for pending writes.
+    PRN counts packet writes, dropped or not.
+
+    validate(init) -> (firmware size, SHA-256) decodes the init packet on
+    EXECUTE; without it, sizes and hashes are not checked. State survives
+    disconnect(), like the bootloader's settings page, so updates resume.
+    """
+
+    MAX_COMMAND = 512
+
+    def __init__(self, name: str = "DfuTarg_EMU", mtu: int = 247, interval: float = 0.0075,
+                 packets_per_event: int = 4, object_size: int = 4096, buffers: int = 8,
+                 flash_rate: float = 97_000, page_erase: float = 0.085, page_size: int = 4096,
+                 validate: Optional[Callable[[bytes], Tuple[int, bytes]]] = None,
+                 disconnect_at: Optional[int] = None, link_mtu: Optional[int] = None):
+        self.name = name
+        self.is_connected = True
+        self.mtu_size = mtu
+        self.link_mtu = link_mtu or mtu
+        self.interval = interval
+        self.packets_per_event = packets_per_event
+        self.object_size = object_size
+        self.buffers = buffers
+        self.flash_rate = flash_rate
+        self.page_erase = page_erase
+        self.page_size = page_size
+        self.validate = validate
+        self.disconnect_at = disconnect_at
+
+        self.now = 0.0
+        self._callbacks: Dict[str, Callable] = {}
+        self._flash_free = 0.0
+        self._pending: List[float] = []         # finish times of buffered flash writes
+
+        self.prn = 0
+        self._packets = 0
+        self.command = bytearray()
+        self._command_size = 0
+        self._command_crc = 0
+        self.command_valid = False
+        self._expected: Optional[Tuple[int, bytes]] = None
+        self.firmware = bytearray()
+        self._crc = 0
+        self.executed = 0                       # firmware bytes in executed objects
+        self._object_end = 0
+        self._object_type = 0
+        self.completed: Optional[bool] = None   # set when the last object is executed
+
+        self.requests = Counter()
+        self.dropped = 0
+        self.disconnects = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    # -------------------------------------------------------------------------
+    # BleakClient surface
+    # -------------------------------------------------------------------------
+
+    async def connect(self):
+        self.is_connected = True
+        return True
+
+    async def disconnect(self):
+        self.is_connected = False
+        return True
+
+    async def start_notify(self, char_specifier, callback: Callable):
+        self._callbacks[str(char_specifier)] = callback
+
+    async def stop_notify(self, char_specifier):
+        self._callbacks.pop(str(char_specifier), None)
+
+    async def write_gatt_char(self, char_specifier, data, response: bool = False):
+        if not self.is_connected:
+            raise ConnectionError(f"{self.name} is not connected")
+        data = bytes(data)
+        if len(data) > self.link_mtu - ATT_OVERHEAD:
+            raise ValueError(f"Write of {len(data)} bytes exceeds MTU {self.link_mtu}")
+        if str(char_specifier) == DFU_PACKET:
+            self._on_packet(data)
+        elif str(char_specifier) == DFU_CONTROL_POINT:
+            self.now += 2 * self.interval
+            self._on_request(data)
+        else:
+            raise ValueError(f"Unknown characteristic {char_specifier}")
+
+    def _notify(self, data: bytes):
+        callback = self._callbacks.get(DFU_CONTROL_POINT)
+        if callback is not None:
+            callback(DFU_CONTROL_POINT, bytearray(data))
+
+    # -------------------------------------------------------------------------
+    # Target
+    # -------------------------------------------------------------------------
+
+    def _respond(self, opcode: int, result: int = RES_SUCCESS, params: bytes = b""):
+        self._notify(bytes([OP_RESPONSE, opcode, result]) + params)
+
+    def _wait_for_flash(self):
+        self.now = max(self.now, self._flash_free)
+        self._pending.clear()
+
+    def _on_packet(self, data: bytes):
+        self.now += self.interval / self.packets_per_event
+        if self.disconnect_at is not None and len(self.firmware) >= self.disconnect_at:
+            self.disconnect_at = None
+            self.disconnects += 1
+            self.is_connected = False
+            raise ConnectionError(f"{self.name} disconnected")
+
+        self._packets += 1
+        if self._object_type == OBJ_COMMAND:
+            self.command += data[:max(0, self._command_size - len(self.command))]
+            self._command_crc = zlib.crc32(self.command)
+        elif self._object_type == OBJ_DATA:
+            self._pending = [t for t in self._pending if t > self.now]
+            data = data[:max(0, self._object_end - len(self.firmware))]
+            if len(self._pending) >= self.buffers:
+                self.dropped += 1
+            elif data:
+                self._flash_free = max(self.now, self._flash_free) + len(data) / self.flash_rate
+                self._pending.append(self._flash_free)
+                self.firmware += data
+                self._crc = zlib.crc32(data, self._crc)
+
+        if self.prn and self._packets % self.prn == 0:
+            offset, crc = self._progress()
+            self.now += 2 * self.interval
+            self._respond(OP_CALC_CHECKSUM, params=struct.pack("<II", offset, crc))
+
+    def _progress(self) -> Tuple[int, int]:
+        if self._object_type == OBJ_COMMAND:
+            return len(self.command), self._command_crc
+        return len(self.firmware), self._crc
+
+    def _on_request(self, request: bytes):
+        opcode, params = request[0], request[1:]
+        self.requests[opcode] += 1
+        if opcode == OP_SET_PRN:
+            self.prn = struct.unpack("<H", params)[0]
+            self._respond(opcode)
+        elif opcode == OP_SELECT:
+            self._select(params[0])
+        elif opcode == OP_CREATE:
+            self._create(*struct.unpack("<BI", params))
+        elif opcode == OP_CALC_CHECKSUM:
+            self._respond(opcode, params=struct.pack("<II", *self._progress()))
+        elif opcode == OP_EXECUTE:
+            self._execute()
+        else:
+            self._respond(opcode, RES_OP_NOT_SUPPORTED)
+
+    def _select(self, obj_type: int):
+        self._object_type = obj_type
+        if obj_type == OBJ_COMMAND:
+            params = struct.pack("<III", self.MAX_COMMAND, len(self.command), self._command_crc)
+        elif obj_type == OBJ_DATA:
+            params = struct.pack("<III", self.object_size, len(self.firmware), self._crc)
+        else:
+            return self._respond(OP_SELECT, RES_UNSUPPORTED_TYPE)
+        self._respond(OP_SELECT, params=params)
+
+    def _create(self, obj_type: int, size: int):
+        self._object_type = obj_type
+        self._packets = 0
+        if obj_type == OBJ_COMMAND:
+            if size > self.MAX_COMMAND:
+                return self._respond(OP_CREATE, RES_INSUFFICIENT_RESOURCES)
+            # A new init packet discards the previous one and any firmware progress
+            self.command, self._command_size, self._command_crc = bytearray(), size, 0
+            self.command_valid, self._expected, self.completed = False, None, None
+            self.firmware, self._crc, self.executed = bytearray(), 0, 0
+        elif obj_type == OBJ_DATA:
+            if not self.command_valid:
+                return self._respond(OP_CREATE, RES_NOT_PERMITTED)
+            if size > self.object_size:
+                return self._respond(OP_CREATE, RES_INSUFFICIENT_RESOURCES)
+            # Drop the unexecuted part, then erase the object's pages
+            del self.firmware[self.executed:]
+            self._crc = zlib.crc32(self.firmware)
+            self._object_end = self.executed + size
+            self._wait_for_flash()
+            self.now += -(-size // self.page_size) * self.page_erase
+        else:
+            return self._respond(OP_CREATE, RES_UNSUPPORTED_TYPE)
+        self._respond(OP_CREATE)
+
+    def _execute(self):
+        if self._object_type == OBJ_COMMAND:
+            if not self._command_size or len(self.command) != self._command_size:
+                return self._respond(OP_EXECUTE, RES_NOT_PERMITTED)
+            if self.validate:
+                try:
+                    self._expected = self.validate(bytes(self.command))
+                except ValueError:
+                    # NRF_DFU_EXT_ERROR_INIT_COMMAND_INVALID
+                    return self._respond(OP_EXECUTE, RES_EXTENDED_ERROR, b"\x02")
+            self.command_valid = True
+            return self._respond(OP_EXECUTE)
+
+        if len(self.firmware) != self._object_end:
+            return self._respond(OP_EXECUTE, RES_NOT_PERMITTED)
+        self._wait_for_flash()
+        self.executed = len(self.firmware)
+        if self._expected and self.executed >= self._expected[0]:
+            size, sha256 = self._expected
+            self.completed = self.executed == size and hashlib.sha256(self.firmware).digest() == sha256
+            if not self.completed:
+                # NRF_DFU_EXT_ERROR_VERIFICATION_FAILED
+                return self._respond(OP_EXECUTE, RES_EXTENDED_ERROR, b"\x0c")
+        self._respond(OP_EXECUTE)
@@ -0,0 +1,348 @@
+"""
+G2 Content Channel Framing
+
+Shared helpers for the 5401 (write) / 5402 (notify) content channel:
+packet building, CRC, varints, frame parsing with multi-packet reassembly,
+a minimal protobuf field walker for inspecting payloads, and FrameWriter,
+which sizes packets from the negotiated ATT MTU.
+
+Packet layout (see docs/packet-structure.md):
+    [AA] [type] [seq] [len] [pkt_tot] [pkt_ser] [svc_hi] [svc_lo] [payload...] [crc_lo] [crc_hi]
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Errors that mean the link is gone rather than that the write was too long
+LINK_ERRORS = (ConnectionError, TimeoutError)
+
+# BLE UUIDs
+UUID_BASE = "00002760-08c2-11e1-9073-0e8ac72e{:04x}"
+CHAR_WRITE = UUID_BASE.format(0x5401)
+CHAR_NOTIFY = UUID_BASE.format(0x5402)
+CHAR_RENDER_WRITE = UUID_BASE.format(0x6401)
+CHAR_RENDER_NOTIFY = UUID_BASE.format(0x6402)
+CHAR_FILE_WRITE = UUID_BASE.format(0x7401)
+CHAR_FILE_NOTIFY = UUID_BASE.format(0x7402)
+
+MAGIC = 0xAA
+TYPE_COMMAND = 0x21     # Phone -> Glasses
+TYPE_RESPONSE = 0x12    # Glasses -> Phone
+HEADER_LEN = 8
+CRC_LEN = 2
+MAX_PACKET_PAYLOAD = 234    # per packet at a 247-byte MTU: 244 ATT payload - 10 framing
+MAX_FRAME_PAYLOAD = 0xFF - CRC_LEN      # the length byte counts payload + CRC
+
+ATT_OVERHEAD = 3            # opcode + handle of a write command
+DEFAULT_MTU = 23            # what every BLE link supports
+MTU_STEPS = (512, 247, 185, DEFAULT_MTU)    # common negotiated sizes, tried in turn after a failed write
+
+
+# =============================================================================
+# CRC-16/CCITT & Varints
+# =============================================================================
+
+def _crc16_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return table
+
+
+CRC16_TABLE = _crc16_table()
+
+
+def crc16_ccitt(data: bytes, init: int = 0xFFFF) -> int:
+    """CRC-16/CCITT with init=0xFFFF, polynomial=0x1021 (table-driven)."""
+    crc = init
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC16_TABLE[(crc >> 8) ^ byte]
+    return crc
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode integer as protobuf varint."""
+    result = []
+    while value > 0x7F:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value & 0x7F)
+    return bytes(result)
+
+
+def decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Decode protobuf varint, return (value, new_offset)."""
+    result = 0
+    shift = 0
+    while offset < len(data):
+        byte = data[offset]
+        result |= (byte & 0x7F) << shift
+        offset += 1
+        if not (byte & 0x80):
+            break
+        shift += 7
+    return result, offset
+
+
+# =============================================================================
+# Packets
+# =============================================================================
+
+def build_packet(seq: int, svc_hi: int, svc_lo: int, payload: bytes,
+                 total_pkts: int = 1, pkt_num: int = 1, pkt_type: int = TYPE_COMMAND) -> bytes:
+    """Build a G2 packet with header and CRC."""
+    header = bytes([MAGIC, pkt_type, seq & 0xFF, len(payload) + 2, total_pkts, pkt_num, svc_hi, svc_lo])
+    crc = crc16_ccitt(payload)
+    return header + payload + bytes([crc & 0xFF, (crc >> 8) & 0xFF])
+
+
+def build_packets(seq: int, svc_hi: int, svc_lo: int, payload: bytes,
+                  max_payload: int = MAX_PACKET_PAYLOAD, pkt_type: int = TYPE_COMMAND) -> List[bytes]:
+    """Split a payload into one multi-packet message (every part shares seq)."""
+    if not 0 < max_payload <= 0xFF - CRC_LEN:
+        raise ValueError(f"max_payload must be 1-{0xFF - CRC_LEN}, got {max_payload}")
+    chunks = [payload[i:i + max_payload] for i in range(0, len(payload), max_payload)] or [b""]
+    if len(chunks) > 0xFF:
+        raise ValueError(f"Payload of {len(payload)} bytes needs {len(chunks)} packets (max 255)")
+    return [build_packet(seq, svc_hi, svc_lo, chunk, len(chunks), i + 1, pkt_type)
+            for i, chunk in enumerate(chunks)]
+
+
+class Frame(NamedTuple):
+    """A decoded content-channel message (payload reassembled if multi-packet)."""
+    type: int
+    seq: int
+    service: int        # e.g. 0x0720
+    payload: bytes
+    packets: int = 1
+
+    @property
+    def service_hi(self) -> int:
+        return self.service >> 8
+
+    @property
+    def service_lo(self) -> int:
+        return self.service & 0xFF
+
+
+def parse_packet(data: bytes) -> Optional[Tuple[int, int, int, int, int, bytes]]:
+    """
+    Validate one packet.
+
+    Returns (type, seq, total, serial, service, payload), or None if it is
+    not an 0xAA packet or the CRC does not match.
+    """
+    if len(data) < HEADER_LEN + CRC_LEN or data[0] != MAGIC:
+        return None
+    payload = bytes(data[HEADER_LEN:-CRC_LEN])
+    crc = data[-2] | (data[-1] << 8)
+    if crc16_ccitt(payload) != crc:
+        return None
+    return data[1], data[2], data[4], data[5], (data[6] << 8) | data[7], payload
+
+
+def parse_frame(data: bytes) -> Optional[Frame]:
+    """Parse a single-packet frame. Returns None for invalid or partial packets."""
+    parsed = parse_packet(data)
+    if parsed is None:
+        return None
+    pkt_type, seq, total, serial, service, payload = parsed
+    if total > 1:
+        return None
+    return Frame(pkt_type, seq, service, payload)
+
+
+class FrameDecoder:
+    """
+    Turns a stream of notifications/writes into complete frames.
+
+    Multi-packet messages (pkt_tot > 1) share one seq; their payloads are
+    joined in serial order once every part has arrived. Bad CRCs and stray
+    parts are counted and dropped.
+    """
+
+    def __init__(self):
+        self._partial: Dict[Tuple[int, int], Dict[int, bytes]] = {}
+        self.crc_errors = 0
+        self.dropped = 0
+
+    def feed(self, data: bytes) -> Optional[Frame]:
+        """Feed one packet; returns a Frame when a message is complete."""
+        parsed = parse_packet(data)
+        if parsed is None:
+            if data and data[0] == MAGIC:
+                self.crc_errors += 1
+            return None
+
+        pkt_type, seq, total, serial, service, payload = parsed
+        if total <= 1:
+            return Frame(pkt_type, seq, service, payload)
+
+        key = (service, seq)
+        parts = self._partial.setdefault(key, {})
+        if serial == 1 and parts:
+            # A new message reused the seq before the old one completed
+            self.dropped += 1
+            parts.clear()
+        parts[serial] = payload
+        if len(parts) < total:
+            return None
+
+        del self._partial[key]
+        if set(parts) != set(range(1, total + 1)):
+            self.dropped += 1
+            return None
+        return Frame(pkt_type, seq, service, b"".join(parts[i] for i in range(1, total + 1)), total)
+
+
+# =============================================================================
+# Protobuf Field Walking
+# =============================================================================
+
+def iter_fields(payload: bytes) -> Iterator[Tuple[int, int, object]]:
+    """
+    Yield (field_number, wire_type, value) for each top-level field.
+
+    Varints yield ints; length-delimited and fixed32/64 fields yield bytes.
+    Stops quietly at the first malformed field.
+    """
+    offset = 0
+    end = len(payload)
+    while offset < end:
+        key, offset = decode_varint(payload, offset)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, offset = decode_varint(payload, offset)
+        elif wire_type == 2:
+            length, offset = decode_varint(payload, offset)
+            if offset + length > end:
+                return
+            value = payload[offset:offset + length]
+            offset += length
+        elif wire_type == 5:
+            value = payload[offset:offset + 4]
+            offset += 4
+        elif wire_type == 1:
+            value = payload[offset:offset + 8]
+            offset += 8
+        else:
+            return
+        yield field, wire_type, value
+
+
+def fields(payload: bytes) -> Dict[int, object]:
+    """Map field number -> value (last occurrence wins)."""
+    return {field: value for field, _, value in iter_fields(payload)}
+
+
+# =============================================================================
+# MTU-Aware Writing
+# =============================================================================
+
+def max_payload_for_mtu(mtu: int) -> int:
+    """Largest packet payload that fits one write at this ATT MTU."""
+    return max(1, min(mtu - ATT_OVERHEAD - HEADER_LEN - CRC_LEN, MAX_FRAME_PAYLOAD))
+
+
+def reported_mtu(client, default: int = DEFAULT_MTU) -> int:
+    """The client's mtu_size (bleak), or default if it has none."""
+    mtu = getattr(client, "mtu_size", None)
+    return mtu if isinstance(mtu, int) and mtu >= DEFAULT_MTU else default
+
+
+async def negotiated_mtu(client, default: int = DEFAULT_MTU) -> int:
+    """Like reported_mtu(), but asks BlueZ first, which reports 23 until _acquire_mtu() is called."""
+    acquire = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception:
+            pass
+    return reported_mtu(client, default)
+
+
+class FrameWriter:
+    """
+    Writes content-channel messages in packets sized from the ATT MTU.
+
+    The MTU comes from the client (mtu_size) unless given. Every write is
+    also a probe: when the link rejects one, the writer drops to the next
+    smaller size in MTU_STEPS and sends the whole message again, down to
+    23. A message that fits one packet is written exactly as build_packet()
+    makes it, so at the usual MTUs nothing changes on the air.
+
+        writer = FrameWriter(client)
+        await writer.negotiate()                # optional: BlueZ MTU exchange
+        await writer.send(seq, 0x0C, 0x20, payload)
+        await writer.write(build_packet(...))   # re-split if it is too long
+    """
+
+    def __init__(self, client, char: str = CHAR_WRITE, mtu: Optional[int] = None):
+        self.client = client
+        self.char = char
+        self.mtu = mtu or reported_mtu(client)
+        self.shrinks = 0
+        self.packets = 0
+        self.bytes = 0
+
+    @property
+    def max_payload(self) -> int:
+        return max_payload_for_mtu(self.mtu)
+
+    @property
+    def max_write(self) -> int:
+        return self.max_payload + HEADER_LEN + CRC_LEN
+
+    async def negotiate(self) -> int:
+        self.mtu = await negotiated_mtu(self.client, self.mtu)
+        return self.mtu
+
+    def shrink(self) -> bool:
+        """Step down to the next smaller MTU; False if already at the minimum."""
+        smaller = [mtu for mtu in MTU_STEPS if mtu < self.mtu]
+        if not smaller:
+            return False
+        self.mtu = smaller[0]
+        self.shrinks += 1
+        return True
+
+    async def _write_all(self, packets: List[bytes]):
+        for packet in packets:
+            await self.client.write_gatt_char(self.char, packet, response=False)
+        self.packets += len(packets)
+        self.bytes += sum(len(packet) for packet in packets)
+
+    def _retry(self, error: Exception) -> bool:
+        if isinstance(error, LINK_ERRORS) or not getattr(self.client, "is_connected", True):
+            return False
+        return self.shrink()
+
+    async def send(self, seq: int, svc_hi: int, svc_lo: int, payload: bytes,
+                   pkt_type: int = TYPE_COMMAND, max_payload: Optional[int] = None) -> List[bytes]:
+        """Write one message as packets of at most max_payload; returns the packets written."""
+        while True:
+            size = min(max_payload or self.max_payload, self.max_payload)
+            packets = build_packets(seq, svc_hi, svc_lo, payload, size, pkt_type)
+            try:
+                await self._write_all(packets)
+                return packets
+            except Exception as e:
+                if not self._retry(e):
+                    raise
+
+    async def write(self, packet: bytes) -> List[bytes]:
+        """Write a built packet, split into several if it is longer than the MTU allows."""
+        if len(packet) <= self.max_write:
+            try:
+                await self._write_all([packet])
+                return [packet]
+            except Exception as e:
+                if not self._retry(e):
+                    raise
+        parsed = parse_packet(packet)
+        if parsed is None or parsed[2] != 1:
+            raise ValueError(f"Cannot split a {len(packet)}-byte packet for MTU {self.mtu}")
+        pkt_type, seq, _, _, service, payload = parsed
+        return await self.send(seq, service >> 8, service & 0xFF, payload, pkt_type)
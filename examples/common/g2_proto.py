@@ -0,0 +1,4363 @@
+"""
+G2 Protobuf Codec
+
+GENERATED by tools/protogen.py from proto/g2_protocol.proto - do not edit.
+Regenerate with: python tools/protogen.py
+
+    payload = encode_even_ai_message(command_id=ASK, magic_random=magic,
+                                     ask_info=encode_even_ai_text(0, 0, 0, "Hi"))
+    msg = decode_even_ai_message(payload)
+    msg.ask_info.text                               # "Hi"
+
+Fields set to None are omitted; every other value (including 0 and b"")
+is written, matching the frames the glasses send and expect. Nested
+message arguments to encode_*() are already-encoded bytes; Message.encode()
+handles nesting from objects.
+"""
+
+import struct
+
+# EvenAICommand
+NONE_COMMAND = 0
+CTRL = 1
+VAD_INFO = 2
+ASK = 3
+ANALYSE = 4
+REPLY = 5
+SKILL = 6
+PROMPT = 7
+EVENT = 8
+HEARTBEAT = 9
+CONFIG = 10
+COMM_RSP = 161
+
+# RingCommandId
+RING_COMMAND_NONE = 0
+RING_EVENT = 1
+RING_RAW_DATA = 2
+
+# RingEventId
+RING_EVENT_NONE = 0
+RING_BLE_ADV = 1
+
+_pack_float = struct.Struct('<f').pack
+_unpack_float = struct.Struct('<f').unpack_from
+
+
+# =============================================================================
+# Runtime
+# =============================================================================
+
+class Message:
+    """Base for generated messages: slots, equality and repr."""
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__
+                           if getattr(self, name) not in (None, []))
+        return f"{type(self).__name__}({values})"
+
+
+def _varint(value: int) -> bytes:
+    if 0x80 <= value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    if value < 0:
+        value += 1 << 64
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _skip(data: bytes, pos: int, tag: int) -> int:
+    """Skip an unknown field."""
+    wire_type = tag & 0x07
+    if wire_type == 0:
+        return _read_varint(data, pos)[1]
+    if wire_type == 1:
+        return pos + 8
+    if wire_type == 2:
+        length, pos = _read_varint(data, pos)
+        return pos + length
+    if wire_type == 5:
+        return pos + 4
+    raise ValueError(f"Unsupported wire type {wire_type} (tag {tag:#x})")
+
+
+def _signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+# =============================================================================
+# Messages
+# =============================================================================
+
+class AuthRequest(Message):
+    __slots__ = ('type', 'msg_id', 'data', 'ack')
+
+    def __init__(self, type=None, msg_id=None, data=None, ack=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.data = data
+        self.ack = ack
+
+    def encode(self) -> bytes:
+        return encode_auth_request(
+            self.type,
+            self.msg_id,
+            None if self.data is None else self.data.encode(),
+            None if self.ack is None else self.ack.encode(),
+        )
+
+
+class AuthData(Message):
+    __slots__ = ('capability', 'field2')
+
+    def __init__(self, capability=None, field2=None):
+        self.capability = capability
+        self.field2 = field2
+
+    def encode(self) -> bytes:
+        return encode_auth_data(self.capability, self.field2)
+
+
+class AuthAck(Message):
+    __slots__ = ('value',)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def encode(self) -> bytes:
+        return encode_auth_ack(self.value)
+
+
+class TimeSyncRequest(Message):
+    __slots__ = ('type', 'msg_id', 'sync')
+
+    def __init__(self, type=None, msg_id=None, sync=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.sync = sync
+
+    def encode(self) -> bytes:
+        return encode_time_sync_request(
+            self.type,
+            self.msg_id,
+            None if self.sync is None else self.sync.encode(),
+        )
+
+
+class TimeSyncData(Message):
+    __slots__ = ('timestamp', 'transaction_id')
+
+    def __init__(self, timestamp=None, transaction_id=None):
+        self.timestamp = timestamp
+        self.transaction_id = transaction_id
+
+    def encode(self) -> bytes:
+        return encode_time_sync_data(self.timestamp, self.transaction_id)
+
+
+class TeleprompterMessage(Message):
+    __slots__ = ('type', 'msg_id', 'init', 'list', 'content', 'complete', 'marker')
+
+    def __init__(self, type=None, msg_id=None, init=None, list=None, content=None, complete=None, marker=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.init = init
+        self.list = list
+        self.content = content
+        self.complete = complete
+        self.marker = marker
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_message(
+            self.type,
+            self.msg_id,
+            None if self.init is None else self.init.encode(),
+            None if self.list is None else self.list.encode(),
+            None if self.content is None else self.content.encode(),
+            None if self.complete is None else self.complete.encode(),
+            None if self.marker is None else self.marker.encode(),
+        )
+
+
+class TeleprompterInit(Message):
+    __slots__ = ('script_index', 'display')
+
+    def __init__(self, script_index=None, display=None):
+        self.script_index = script_index
+        self.display = display
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_init(
+            self.script_index,
+            None if self.display is None else self.display.encode(),
+        )
+
+
+class TeleprompterDisplaySettings(Message):
+    __slots__ = ('field1', 'field2', 'field3', 'display_width', 'content_height', 'line_height', 'viewport_height', 'font_size', 'scroll_mode')
+
+    def __init__(self, field1=None, field2=None, field3=None, display_width=None, content_height=None, line_height=None, viewport_height=None, font_size=None, scroll_mode=None):
+        self.field1 = field1
+        self.field2 = field2
+        self.field3 = field3
+        self.display_width = display_width
+        self.content_height = content_height
+        self.line_height = line_height
+        self.viewport_height = viewport_height
+        self.font_size = font_size
+        self.scroll_mode = scroll_mode
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_display_settings(
+            self.field1,
+            self.field2,
+            self.field3,
+            self.display_width,
+            self.content_height,
+            self.line_height,
+            self.viewport_height,
+            self.font_size,
+            self.scroll_mode,
+        )
+
+
+class TeleprompterList(Message):
+    __slots__ = ('scripts',)
+
+    def __init__(self, scripts=None):
+        self.scripts = [] if scripts is None else scripts
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_list([item.encode() for item in self.scripts])
+
+
+class TeleprompterScript(Message):
+    __slots__ = ('script_id', 'title')
+
+    def __init__(self, script_id=None, title=None):
+        self.script_id = script_id
+        self.title = title
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_script(self.script_id, self.title)
+
+
+class TeleprompterContent(Message):
+    __slots__ = ('page_number', 'line_count', 'text')
+
+    def __init__(self, page_number=None, line_count=None, text=None):
+        self.page_number = page_number
+        self.line_count = line_count
+        self.text = text
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_content(self.page_number, self.line_count, self.text)
+
+
+class TeleprompterComplete(Message):
+    __slots__ = ('start_page', 'total_pages', 'total_lines')
+
+    def __init__(self, start_page=None, total_pages=None, total_lines=None):
+        self.start_page = start_page
+        self.total_pages = total_pages
+        self.total_lines = total_lines
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_complete(self.start_page, self.total_pages, self.total_lines)
+
+
+class TeleprompterMarker(Message):
+    __slots__ = ('field1', 'field2')
+
+    def __init__(self, field1=None, field2=None):
+        self.field1 = field1
+        self.field2 = field2
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_marker(self.field1, self.field2)
+
+
+class TeleprompterStart(Message):
+    __slots__ = ('type', 'msg_id', 'state')
+
+    def __init__(self, type=None, msg_id=None, state=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.state = state
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_start(
+            self.type,
+            self.msg_id,
+            None if self.state is None else self.state.encode(),
+        )
+
+
+class TeleprompterState(Message):
+    __slots__ = ('state',)
+
+    def __init__(self, state=None):
+        self.state = state
+
+    def encode(self) -> bytes:
+        return encode_teleprompter_state(self.state)
+
+
+class DisplayConfig(Message):
+    __slots__ = ('type', 'msg_id', 'settings')
+
+    def __init__(self, type=None, msg_id=None, settings=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.settings = settings
+
+    def encode(self) -> bytes:
+        return encode_display_config(
+            self.type,
+            self.msg_id,
+            None if self.settings is None else self.settings.encode(),
+        )
+
+
+class DisplaySettings(Message):
+    __slots__ = ('enabled', 'regions', 'field3')
+
+    def __init__(self, enabled=None, regions=None, field3=None):
+        self.enabled = enabled
+        self.regions = [] if regions is None else regions
+        self.field3 = field3
+
+    def encode(self) -> bytes:
+        return encode_display_settings(self.enabled, [item.encode() for item in self.regions], self.field3)
+
+
+class DisplayRegion(Message):
+    __slots__ = ('region_id', 'param1', 'param2', 'param3', 'param4', 'param5')
+
+    def __init__(self, region_id=None, param1=None, param2=None, param3=None, param4=None, param5=None):
+        self.region_id = region_id
+        self.param1 = param1
+        self.param2 = param2
+        self.param3 = param3
+        self.param4 = param4
+        self.param5 = param5
+
+    def encode(self) -> bytes:
+        return encode_display_region(
+            self.region_id,
+            self.param1,
+            self.param2,
+            self.param3,
+            self.param4,
+            self.param5,
+        )
+
+
+class SyncMessage(Message):
+    __slots__ = ('type', 'msg_id', 'data')
+
+    def __init__(self, type=None, msg_id=None, data=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.data = data
+
+    def encode(self) -> bytes:
+        return encode_sync_message(self.type, self.msg_id, self.data)
+
+
+class EvenAIMessage(Message):
+    __slots__ = ('command_id', 'magic_random', 'ctrl', 'vad_info', 'ask_info', 'reply_info', 'config')
+
+    def __init__(self, command_id=None, magic_random=None, ctrl=None, vad_info=None, ask_info=None, reply_info=None, config=None):
+        self.command_id = command_id
+        self.magic_random = magic_random
+        self.ctrl = ctrl
+        self.vad_info = vad_info
+        self.ask_info = ask_info
+        self.reply_info = reply_info
+        self.config = config
+
+    def encode(self) -> bytes:
+        return encode_even_ai_message(
+            self.command_id,
+            self.magic_random,
+            None if self.ctrl is None else self.ctrl.encode(),
+            None if self.vad_info is None else self.vad_info.encode(),
+            None if self.ask_info is None else self.ask_info.encode(),
+            None if self.reply_info is None else self.reply_info.encode(),
+            None if self.config is None else self.config.encode(),
+        )
+
+
+class EvenAIControl(Message):
+    __slots__ = ('status',)
+
+    def __init__(self, status=None):
+        self.status = status
+
+    def encode(self) -> bytes:
+        return encode_even_ai_control(self.status)
+
+
+class EvenAIVadInfo(Message):
+    __slots__ = ('vad_status', 'error_code')
+
+    def __init__(self, vad_status=None, error_code=None):
+        self.vad_status = vad_status
+        self.error_code = error_code
+
+    def encode(self) -> bytes:
+        return encode_even_ai_vad_info(self.vad_status, self.error_code)
+
+
+class EvenAIText(Message):
+    __slots__ = ('cmd_cnt', 'stream_enable', 'text_mode', 'text', 'error_code')
+
+    def __init__(self, cmd_cnt=None, stream_enable=None, text_mode=None, text=None, error_code=None):
+        self.cmd_cnt = cmd_cnt
+        self.stream_enable = stream_enable
+        self.text_mode = text_mode
+        self.text = text
+        self.error_code = error_code
+
+    def encode(self) -> bytes:
+        return encode_even_ai_text(
+            self.cmd_cnt,
+            self.stream_enable,
+            self.text_mode,
+            self.text,
+            self.error_code,
+        )
+
+
+class EvenAIConfig(Message):
+    __slots__ = ('voice_switch', 'stream_speed', 'error_code')
+
+    def __init__(self, voice_switch=None, stream_speed=None, error_code=None):
+        self.voice_switch = voice_switch
+        self.stream_speed = stream_speed
+        self.error_code = error_code
+
+    def encode(self) -> bytes:
+        return encode_even_ai_config(self.voice_switch, self.stream_speed, self.error_code)
+
+
+class DashboardMessage(Message):
+    __slots__ = ('type', 'msg_id', 'widget')
+
+    def __init__(self, type=None, msg_id=None, widget=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.widget = widget
+
+    def encode(self) -> bytes:
+        return encode_dashboard_message(
+            self.type,
+            self.msg_id,
+            None if self.widget is None else self.widget.encode(),
+        )
+
+
+class DashboardWidget(Message):
+    __slots__ = ('widget_type', 'content')
+
+    def __init__(self, widget_type=None, content=None):
+        self.widget_type = widget_type
+        self.content = content
+
+    def encode(self) -> bytes:
+        return encode_dashboard_widget(self.widget_type, self.content)
+
+
+class NavigationMessage(Message):
+    __slots__ = ('mode', 'widget', 'step')
+
+    def __init__(self, mode=None, widget=None, step=None):
+        self.mode = mode
+        self.widget = widget
+        self.step = step
+
+    def encode(self) -> bytes:
+        return encode_navigation_message(
+            self.mode,
+            None if self.widget is None else self.widget.encode(),
+            None if self.step is None else self.step.encode(),
+        )
+
+
+class NavigationStep(Message):
+    __slots__ = ('distance_type', 'distance', 'instruction', 'time_remaining', 'total_distance', 'eta', 'speed', 'icon')
+
+    def __init__(self, distance_type=None, distance=None, instruction=None, time_remaining=None, total_distance=None, eta=None, speed=None, icon=None):
+        self.distance_type = distance_type
+        self.distance = distance
+        self.instruction = instruction
+        self.time_remaining = time_remaining
+        self.total_distance = total_distance
+        self.eta = eta
+        self.speed = speed
+        self.icon = icon
+
+    def encode(self) -> bytes:
+        return encode_navigation_step(
+            self.distance_type,
+            self.distance,
+            self.instruction,
+            self.time_remaining,
+            self.total_distance,
+            self.eta,
+            self.speed,
+            self.icon,
+        )
+
+
+class NavigationWidget(Message):
+    __slots__ = ('type', 'text', 'extra')
+
+    def __init__(self, type=None, text=None, extra=None):
+        self.type = type
+        self.text = text
+        self.extra = extra
+
+    def encode(self) -> bytes:
+        return encode_navigation_widget(self.type, self.text, self.extra)
+
+
+class DisplayWake(Message):
+    __slots__ = ('type', 'msg_id', 'settings')
+
+    def __init__(self, type=None, msg_id=None, settings=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.settings = settings
+
+    def encode(self) -> bytes:
+        return encode_display_wake(
+            self.type,
+            self.msg_id,
+            None if self.settings is None else self.settings.encode(),
+        )
+
+
+class DisplayWakeSettings(Message):
+    __slots__ = ('field1', 'field2', 'field3', 'field5')
+
+    def __init__(self, field1=None, field2=None, field3=None, field5=None):
+        self.field1 = field1
+        self.field2 = field2
+        self.field3 = field3
+        self.field5 = field5
+
+    def encode(self) -> bytes:
+        return encode_display_wake_settings(self.field1, self.field2, self.field3, self.field5)
+
+
+class ConversateMessage(Message):
+    __slots__ = ('type', 'msg_id', 'transcript')
+
+    def __init__(self, type=None, msg_id=None, transcript=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.transcript = transcript
+
+    def encode(self) -> bytes:
+        return encode_conversate_message(
+            self.type,
+            self.msg_id,
+            None if self.transcript is None else self.transcript.encode(),
+        )
+
+
+class ConversateTranscript(Message):
+    __slots__ = ('text', 'is_final')
+
+    def __init__(self, text=None, is_final=None):
+        self.text = text
+        self.is_final = is_final
+
+    def encode(self) -> bytes:
+        return encode_conversate_transcript(self.text, self.is_final)
+
+
+class TasksMessage(Message):
+    __slots__ = ('type', 'msg_id', 'sync')
+
+    def __init__(self, type=None, msg_id=None, sync=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.sync = sync
+
+    def encode(self) -> bytes:
+        return encode_tasks_message(
+            self.type,
+            self.msg_id,
+            None if self.sync is None else self.sync.encode(),
+        )
+
+
+class TaskSync(Message):
+    __slots__ = ('version', 'full', 'upsert', 'removed', 'count')
+
+    def __init__(self, version=None, full=None, upsert=None, removed=None, count=None):
+        self.version = version
+        self.full = full
+        self.upsert = [] if upsert is None else upsert
+        self.removed = [] if removed is None else removed
+        self.count = count
+
+    def encode(self) -> bytes:
+        return encode_task_sync(
+            self.version,
+            self.full,
+            [item.encode() for item in self.upsert],
+            self.removed,
+            self.count,
+        )
+
+
+class TaskItem(Message):
+    __slots__ = ('id', 'title', 'done', 'order', 'due')
+
+    def __init__(self, id=None, title=None, done=None, order=None, due=None):
+        self.id = id
+        self.title = title
+        self.done = done
+        self.order = order
+        self.due = due
+
+    def encode(self) -> bytes:
+        return encode_task_item(self.id, self.title, self.done, self.order, self.due)
+
+
+class NotificationMessage(Message):
+    __slots__ = ('type', 'msg_id', 'notification')
+
+    def __init__(self, type=None, msg_id=None, notification=None):
+        self.type = type
+        self.msg_id = msg_id
+        self.notification = notification
+
+    def encode(self) -> bytes:
+        return encode_notification_message(
+            self.type,
+            self.msg_id,
+            None if self.notification is None else self.notification.encode(),
+        )
+
+
+class NotificationData(Message):
+    __slots__ = ('app_id', 'count')
+
+    def __init__(self, app_id=None, count=None):
+        self.app_id = app_id
+        self.count = count
+
+    def encode(self) -> bytes:
+        return encode_notification_data(self.app_id, self.count)
+
+
+class RingDataPackage(Message):
+    __slots__ = ('command_id', 'magic_random', 'event', 'raw_data')
+
+    def __init__(self, command_id=None, magic_random=None, event=None, raw_data=None):
+        self.command_id = command_id
+        self.magic_random = magic_random
+        self.event = event
+        self.raw_data = raw_data
+
+    def encode(self) -> bytes:
+        return encode_ring_data_package(
+            self.command_id,
+            self.magic_random,
+            None if self.event is None else self.event.encode(),
+            None if self.raw_data is None else self.raw_data.encode(),
+        )
+
+
+class RingEvent(Message):
+    __slots__ = ('ring_mac', 'event_id', 'event_param', 'error_code')
+
+    def __init__(self, ring_mac=None, event_id=None, event_param=None, error_code=None):
+        self.ring_mac = ring_mac
+        self.event_id = event_id
+        self.event_param = event_param
+        self.error_code = error_code
+
+    def encode(self) -> bytes:
+        return encode_ring_event(self.ring_mac, self.event_id, self.event_param, self.error_code)
+
+
+class RingRawData(Message):
+    __slots__ = ('battery', 'charge_states', 'hr', 'hr_timestamp', 'spo2', 'spo2_timestamp', 'hrv', 'hrv_timestamp', 'temp', 'temp_timestamp', 'act_kcal', 'act_kcal_timestamp', 'all_kcal', 'all_kcal_timestamp', 'steps', 'steps_timestamp', 'error_code')
+
+    def __init__(self, battery=None, charge_states=None, hr=None, hr_timestamp=None, spo2=None, spo2_timestamp=None, hrv=None, hrv_timestamp=None, temp=None, temp_timestamp=None, act_kcal=None, act_kcal_timestamp=None, all_kcal=None, all_kcal_timestamp=None, steps=None, steps_timestamp=None, error_code=None):
+        self.battery = battery
+        self.charge_states = charge_states
+        self.hr = hr
+        self.hr_timestamp = hr_timestamp
+        self.spo2 = spo2
+        self.spo2_timestamp = spo2_timestamp
+        self.hrv = hrv
+        self.hrv_timestamp = hrv_timestamp
+        self.temp = temp
+        self.temp_timestamp = temp_timestamp
+        self.act_kcal = act_kcal
+        self.act_kcal_timestamp = act_kcal_timestamp
+        self.all_kcal = all_kcal
+        self.all_kcal_timestamp = all_kcal_timestamp
+        self.steps = steps
+        self.steps_timestamp = steps_timestamp
+        self.error_code = error_code
+
+    def encode(self) -> bytes:
+        return encode_ring_raw_data(
+            self.battery,
+            self.charge_states,
+            self.hr,
+            self.hr_timestamp,
+            self.spo2,
+            self.spo2_timestamp,
+            self.hrv,
+            self.hrv_timestamp,
+            self.temp,
+            self.temp_timestamp,
+            self.act_kcal,
+            self.act_kcal_timestamp,
+            self.all_kcal,
+            self.all_kcal_timestamp,
+            self.steps,
+            self.steps_timestamp,
+            self.error_code,
+        )
+
+
+def encode_auth_request(type=None, msg_id=None, data=None, ack=None) -> bytes:
+    """Encode AuthRequest."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if data is not None:
+        out.append(0x1A)
+        size = len(data)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += data
+    if ack is not None:
+        out.append(0x22)
+        size = len(ack)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += ack
+    return bytes(out)
+
+
+def decode_auth_request(data: bytes) -> AuthRequest:
+    """Decode AuthRequest. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = AuthRequest()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.data = decode_auth_data(data[pos:end])
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.ack = decode_auth_ack(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated AuthRequest")
+    return msg
+
+
+def encode_auth_data(capability=None, field2=None) -> bytes:
+    """Encode AuthData."""
+    out = bytearray()
+    if capability is not None:
+        out.append(0x08)
+        if capability < 0x80:
+            out.append(capability)
+        else:
+            out += _varint(capability)
+    if field2 is not None:
+        out.append(0x10)
+        if field2 < 0x80:
+            out.append(field2)
+        else:
+            out += _varint(field2)
+    return bytes(out)
+
+
+def decode_auth_data(data: bytes) -> AuthData:
+    """Decode AuthData. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = AuthData()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.capability = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field2 = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated AuthData")
+    return msg
+
+
+def encode_auth_ack(value=None) -> bytes:
+    """Encode AuthAck."""
+    out = bytearray()
+    if value is not None:
+        out.append(0x08)
+        if value < 0x80:
+            out.append(value)
+        else:
+            out += _varint(value)
+    return bytes(out)
+
+
+def decode_auth_ack(data: bytes) -> AuthAck:
+    """Decode AuthAck. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = AuthAck()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.value = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated AuthAck")
+    return msg
+
+
+def encode_time_sync_request(type=None, msg_id=None, sync=None) -> bytes:
+    """Encode TimeSyncRequest."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if sync is not None:
+        out += b'\x82\x08'
+        size = len(sync)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += sync
+    return bytes(out)
+
+
+def decode_time_sync_request(data: bytes) -> TimeSyncRequest:
+    """Decode TimeSyncRequest. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TimeSyncRequest()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x402:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.sync = decode_time_sync_data(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TimeSyncRequest")
+    return msg
+
+
+def encode_time_sync_data(timestamp=None, transaction_id=None) -> bytes:
+    """Encode TimeSyncData."""
+    out = bytearray()
+    if timestamp is not None:
+        out.append(0x08)
+        if timestamp < 0x80:
+            out.append(timestamp)
+        else:
+            out += _varint(timestamp)
+    if transaction_id is not None:
+        out.append(0x10)
+        if 0 <= transaction_id < 0x80:
+            out.append(transaction_id)
+        else:
+            out += _varint(transaction_id)
+    return bytes(out)
+
+
+def decode_time_sync_data(data: bytes) -> TimeSyncData:
+    """Decode TimeSyncData. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TimeSyncData()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.timestamp = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.transaction_id = _signed(value)
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TimeSyncData")
+    return msg
+
+
+def encode_teleprompter_message(type=None, msg_id=None, init=None, list=None, content=None, complete=None, marker=None) -> bytes:
+    """Encode TeleprompterMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if init is not None:
+        out.append(0x1A)
+        size = len(init)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += init
+    if list is not None:
+        out.append(0x22)
+        size = len(list)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += list
+    if content is not None:
+        out.append(0x2A)
+        size = len(content)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += content
+    if complete is not None:
+        out.append(0x32)
+        size = len(complete)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += complete
+    if marker is not None:
+        out.append(0x6A)
+        size = len(marker)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += marker
+    return bytes(out)
+
+
+def decode_teleprompter_message(data: bytes) -> TeleprompterMessage:
+    """Decode TeleprompterMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.init = decode_teleprompter_init(data[pos:end])
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.list = decode_teleprompter_list(data[pos:end])
+                pos = end
+            elif tag == 0x2A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.content = decode_teleprompter_content(data[pos:end])
+                pos = end
+            elif tag == 0x32:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.complete = decode_teleprompter_complete(data[pos:end])
+                pos = end
+            elif tag == 0x6A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.marker = decode_teleprompter_marker(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterMessage")
+    return msg
+
+
+def encode_teleprompter_init(script_index=None, display=None) -> bytes:
+    """Encode TeleprompterInit."""
+    out = bytearray()
+    if script_index is not None:
+        out.append(0x08)
+        if script_index < 0x80:
+            out.append(script_index)
+        else:
+            out += _varint(script_index)
+    if display is not None:
+        out.append(0x12)
+        size = len(display)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += display
+    return bytes(out)
+
+
+def decode_teleprompter_init(data: bytes) -> TeleprompterInit:
+    """Decode TeleprompterInit. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterInit()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.script_index = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.display = decode_teleprompter_display_settings(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterInit")
+    return msg
+
+
+def encode_teleprompter_display_settings(field1=None, field2=None, field3=None, display_width=None, content_height=None, line_height=None, viewport_height=None, font_size=None, scroll_mode=None) -> bytes:
+    """Encode TeleprompterDisplaySettings."""
+    out = bytearray()
+    if field1 is not None:
+        out.append(0x08)
+        if field1 < 0x80:
+            out.append(field1)
+        else:
+            out += _varint(field1)
+    if field2 is not None:
+        out.append(0x10)
+        if field2 < 0x80:
+            out.append(field2)
+        else:
+            out += _varint(field2)
+    if field3 is not None:
+        out.append(0x18)
+        if field3 < 0x80:
+            out.append(field3)
+        else:
+            out += _varint(field3)
+    if display_width is not None:
+        out.append(0x20)
+        if display_width < 0x80:
+            out.append(display_width)
+        else:
+            out += _varint(display_width)
+    if content_height is not None:
+        out.append(0x28)
+        if content_height < 0x80:
+            out.append(content_height)
+        else:
+            out += _varint(content_height)
+    if line_height is not None:
+        out.append(0x30)
+        if line_height < 0x80:
+            out.append(line_height)
+        else:
+            out += _varint(line_height)
+    if viewport_height is not None:
+        out.append(0x38)
+        if viewport_height < 0x80:
+            out.append(viewport_height)
+        else:
+            out += _varint(viewport_height)
+    if font_size is not None:
+        out.append(0x40)
+        if font_size < 0x80:
+            out.append(font_size)
+        else:
+            out += _varint(font_size)
+    if scroll_mode is not None:
+        out.append(0x48)
+        if scroll_mode < 0x80:
+            out.append(scroll_mode)
+        else:
+            out += _varint(scroll_mode)
+    return bytes(out)
+
+
+def decode_teleprompter_display_settings(data: bytes) -> TeleprompterDisplaySettings:
+    """Decode TeleprompterDisplaySettings. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterDisplaySettings()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field1 = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field2 = value
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field3 = value
+            elif tag == 0x20:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.display_width = value
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.content_height = value
+            elif tag == 0x30:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.line_height = value
+            elif tag == 0x38:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.viewport_height = value
+            elif tag == 0x40:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.font_size = value
+            elif tag == 0x48:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.scroll_mode = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterDisplaySettings")
+    return msg
+
+
+def encode_teleprompter_list(scripts=None) -> bytes:
+    """Encode TeleprompterList."""
+    out = bytearray()
+    if scripts is not None:
+        for item in scripts:
+            out.append(0x0A)
+            size = len(item)
+            if size < 0x80:
+                out.append(size)
+            else:
+                out += _varint(size)
+            out += item
+    return bytes(out)
+
+
+def decode_teleprompter_list(data: bytes) -> TeleprompterList:
+    """Decode TeleprompterList. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterList()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x0A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.scripts.append(decode_teleprompter_script(data[pos:end]))
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterList")
+    return msg
+
+
+def encode_teleprompter_script(script_id=None, title=None) -> bytes:
+    """Encode TeleprompterScript."""
+    out = bytearray()
+    if script_id is not None:
+        if script_id.__class__ is str:
+            script_id = script_id.encode('utf-8')
+        out.append(0x0A)
+        size = len(script_id)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += script_id
+    if title is not None:
+        if title.__class__ is str:
+            title = title.encode('utf-8')
+        out.append(0x12)
+        size = len(title)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += title
+    return bytes(out)
+
+
+def decode_teleprompter_script(data: bytes) -> TeleprompterScript:
+    """Decode TeleprompterScript. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterScript()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x0A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.script_id = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.title = data[pos:end].decode('utf-8')
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterScript")
+    return msg
+
+
+def encode_teleprompter_content(page_number=None, line_count=None, text=None) -> bytes:
+    """Encode TeleprompterContent."""
+    out = bytearray()
+    if page_number is not None:
+        out.append(0x08)
+        if page_number < 0x80:
+            out.append(page_number)
+        else:
+            out += _varint(page_number)
+    if line_count is not None:
+        out.append(0x10)
+        if line_count < 0x80:
+            out.append(line_count)
+        else:
+            out += _varint(line_count)
+    if text is not None:
+        out.append(0x1A)
+        size = len(text)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += text
+    return bytes(out)
+
+
+def decode_teleprompter_content(data: bytes) -> TeleprompterContent:
+    """Decode TeleprompterContent. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterContent()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.page_number = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.line_count = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.text = data[pos:end]
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterContent")
+    return msg
+
+
+def encode_teleprompter_complete(start_page=None, total_pages=None, total_lines=None) -> bytes:
+    """Encode TeleprompterComplete."""
+    out = bytearray()
+    if start_page is not None:
+        out.append(0x08)
+        if start_page < 0x80:
+            out.append(start_page)
+        else:
+            out += _varint(start_page)
+    if total_pages is not None:
+        out.append(0x10)
+        if total_pages < 0x80:
+            out.append(total_pages)
+        else:
+            out += _varint(total_pages)
+    if total_lines is not None:
+        out.append(0x18)
+        if total_lines < 0x80:
+            out.append(total_lines)
+        else:
+            out += _varint(total_lines)
+    return bytes(out)
+
+
+def decode_teleprompter_complete(data: bytes) -> TeleprompterComplete:
+    """Decode TeleprompterComplete. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterComplete()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.start_page = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.total_pages = value
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.total_lines = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterComplete")
+    return msg
+
+
+def encode_teleprompter_marker(field1=None, field2=None) -> bytes:
+    """Encode TeleprompterMarker."""
+    out = bytearray()
+    if field1 is not None:
+        out.append(0x08)
+        if field1 < 0x80:
+            out.append(field1)
+        else:
+            out += _varint(field1)
+    if field2 is not None:
+        out.append(0x10)
+        if field2 < 0x80:
+            out.append(field2)
+        else:
+            out += _varint(field2)
+    return bytes(out)
+
+
+def decode_teleprompter_marker(data: bytes) -> TeleprompterMarker:
+    """Decode TeleprompterMarker. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterMarker()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field1 = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field2 = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterMarker")
+    return msg
+
+
+def encode_teleprompter_start(type=None, msg_id=None, state=None) -> bytes:
+    """Encode TeleprompterStart."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if state is not None:
+        out.append(0x1A)
+        size = len(state)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += state
+    return bytes(out)
+
+
+def decode_teleprompter_start(data: bytes) -> TeleprompterStart:
+    """Decode TeleprompterStart. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterStart()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.state = decode_teleprompter_state(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterStart")
+    return msg
+
+
+def encode_teleprompter_state(state=None) -> bytes:
+    """Encode TeleprompterState."""
+    out = bytearray()
+    if state is not None:
+        out.append(0x08)
+        if state < 0x80:
+            out.append(state)
+        else:
+            out += _varint(state)
+    return bytes(out)
+
+
+def decode_teleprompter_state(data: bytes) -> TeleprompterState:
+    """Decode TeleprompterState. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TeleprompterState()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.state = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TeleprompterState")
+    return msg
+
+
+def encode_display_config(type=None, msg_id=None, settings=None) -> bytes:
+    """Encode DisplayConfig."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if settings is not None:
+        out.append(0x22)
+        size = len(settings)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += settings
+    return bytes(out)
+
+
+def decode_display_config(data: bytes) -> DisplayConfig:
+    """Decode DisplayConfig. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DisplayConfig()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.settings = decode_display_settings(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DisplayConfig")
+    return msg
+
+
+def encode_display_settings(enabled=None, regions=None, field3=None) -> bytes:
+    """Encode DisplaySettings."""
+    out = bytearray()
+    if enabled is not None:
+        out.append(0x08)
+        if enabled < 0x80:
+            out.append(enabled)
+        else:
+            out += _varint(enabled)
+    if regions is not None:
+        for item in regions:
+            out.append(0x12)
+            size = len(item)
+            if size < 0x80:
+                out.append(size)
+            else:
+                out += _varint(size)
+            out += item
+    if field3 is not None:
+        out.append(0x18)
+        if field3 < 0x80:
+            out.append(field3)
+        else:
+            out += _varint(field3)
+    return bytes(out)
+
+
+def decode_display_settings(data: bytes) -> DisplaySettings:
+    """Decode DisplaySettings. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DisplaySettings()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.enabled = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.regions.append(decode_display_region(data[pos:end]))
+                pos = end
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field3 = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DisplaySettings")
+    return msg
+
+
+def encode_display_region(region_id=None, param1=None, param2=None, param3=None, param4=None, param5=None) -> bytes:
+    """Encode DisplayRegion."""
+    out = bytearray()
+    if region_id is not None:
+        out.append(0x08)
+        if region_id < 0x80:
+            out.append(region_id)
+        else:
+            out += _varint(region_id)
+    if param1 is not None:
+        out.append(0x10)
+        if param1 < 0x80:
+            out.append(param1)
+        else:
+            out += _varint(param1)
+    if param2 is not None:
+        out.append(0x1D)
+        out += _pack_float(param2)
+    if param3 is not None:
+        out.append(0x25)
+        out += _pack_float(param3)
+    if param4 is not None:
+        out.append(0x28)
+        if param4 < 0x80:
+            out.append(param4)
+        else:
+            out += _varint(param4)
+    if param5 is not None:
+        out.append(0x30)
+        if param5 < 0x80:
+            out.append(param5)
+        else:
+            out += _varint(param5)
+    return bytes(out)
+
+
+def decode_display_region(data: bytes) -> DisplayRegion:
+    """Decode DisplayRegion. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DisplayRegion()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.region_id = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.param1 = value
+            elif tag == 0x1D:
+                msg.param2 = _unpack_float(data, pos)[0]
+                pos += 4
+            elif tag == 0x25:
+                msg.param3 = _unpack_float(data, pos)[0]
+                pos += 4
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.param4 = value
+            elif tag == 0x30:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.param5 = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DisplayRegion")
+    return msg
+
+
+def encode_sync_message(type=None, msg_id=None, data=None) -> bytes:
+    """Encode SyncMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if data is not None:
+        out.append(0x6A)
+        size = len(data)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += data
+    return bytes(out)
+
+
+def decode_sync_message(data: bytes) -> SyncMessage:
+    """Decode SyncMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = SyncMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x6A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.data = data[pos:end]
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated SyncMessage")
+    return msg
+
+
+def encode_even_ai_message(command_id=None, magic_random=None, ctrl=None, vad_info=None, ask_info=None, reply_info=None, config=None) -> bytes:
+    """Encode EvenAIMessage."""
+    out = bytearray()
+    if command_id is not None:
+        out.append(0x08)
+        if 0 <= command_id < 0x80:
+            out.append(command_id)
+        else:
+            out += _varint(command_id)
+    if magic_random is not None:
+        out.append(0x10)
+        if magic_random < 0x80:
+            out.append(magic_random)
+        else:
+            out += _varint(magic_random)
+    if ctrl is not None:
+        out.append(0x1A)
+        size = len(ctrl)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += ctrl
+    if vad_info is not None:
+        out.append(0x22)
+        size = len(vad_info)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += vad_info
+    if ask_info is not None:
+        out.append(0x2A)
+        size = len(ask_info)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += ask_info
+    if reply_info is not None:
+        out.append(0x3A)
+        size = len(reply_info)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += reply_info
+    if config is not None:
+        out.append(0x6A)
+        size = len(config)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += config
+    return bytes(out)
+
+
+def decode_even_ai_message(data: bytes) -> EvenAIMessage:
+    """Decode EvenAIMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = EvenAIMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.command_id = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.magic_random = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.ctrl = decode_even_ai_control(data[pos:end])
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.vad_info = decode_even_ai_vad_info(data[pos:end])
+                pos = end
+            elif tag == 0x2A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.ask_info = decode_even_ai_text(data[pos:end])
+                pos = end
+            elif tag == 0x3A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.reply_info = decode_even_ai_text(data[pos:end])
+                pos = end
+            elif tag == 0x6A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.config = decode_even_ai_config(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated EvenAIMessage")
+    return msg
+
+
+def encode_even_ai_control(status=None) -> bytes:
+    """Encode EvenAIControl."""
+    out = bytearray()
+    if status is not None:
+        out.append(0x08)
+        if status < 0x80:
+            out.append(status)
+        else:
+            out += _varint(status)
+    return bytes(out)
+
+
+def decode_even_ai_control(data: bytes) -> EvenAIControl:
+    """Decode EvenAIControl. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = EvenAIControl()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.status = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated EvenAIControl")
+    return msg
+
+
+def encode_even_ai_vad_info(vad_status=None, error_code=None) -> bytes:
+    """Encode EvenAIVadInfo."""
+    out = bytearray()
+    if vad_status is not None:
+        out.append(0x08)
+        if vad_status < 0x80:
+            out.append(vad_status)
+        else:
+            out += _varint(vad_status)
+    if error_code is not None:
+        out.append(0x10)
+        if error_code < 0x80:
+            out.append(error_code)
+        else:
+            out += _varint(error_code)
+    return bytes(out)
+
+
+def decode_even_ai_vad_info(data: bytes) -> EvenAIVadInfo:
+    """Decode EvenAIVadInfo. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = EvenAIVadInfo()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.vad_status = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.error_code = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated EvenAIVadInfo")
+    return msg
+
+
+def encode_even_ai_text(cmd_cnt=None, stream_enable=None, text_mode=None, text=None, error_code=None) -> bytes:
+    """Encode EvenAIText."""
+    out = bytearray()
+    if cmd_cnt is not None:
+        out.append(0x08)
+        if 0 <= cmd_cnt < 0x80:
+            out.append(cmd_cnt)
+        else:
+            out += _varint(cmd_cnt)
+    if stream_enable is not None:
+        out.append(0x10)
+        if 0 <= stream_enable < 0x80:
+            out.append(stream_enable)
+        else:
+            out += _varint(stream_enable)
+    if text_mode is not None:
+        out.append(0x18)
+        if 0 <= text_mode < 0x80:
+            out.append(text_mode)
+        else:
+            out += _varint(text_mode)
+    if text is not None:
+        if text.__class__ is str:
+            text = text.encode('utf-8')
+        out.append(0x22)
+        size = len(text)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += text
+    if error_code is not None:
+        out.append(0x28)
+        if error_code < 0x80:
+            out.append(error_code)
+        else:
+            out += _varint(error_code)
+    return bytes(out)
+
+
+def decode_even_ai_text(data: bytes) -> EvenAIText:
+    """Decode EvenAIText. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = EvenAIText()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.cmd_cnt = _signed(value)
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.stream_enable = _signed(value)
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.text_mode = _signed(value)
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.text = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.error_code = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated EvenAIText")
+    return msg
+
+
+def encode_even_ai_config(voice_switch=None, stream_speed=None, error_code=None) -> bytes:
+    """Encode EvenAIConfig."""
+    out = bytearray()
+    if voice_switch is not None:
+        out.append(0x08)
+        if 0 <= voice_switch < 0x80:
+            out.append(voice_switch)
+        else:
+            out += _varint(voice_switch)
+    if stream_speed is not None:
+        out.append(0x10)
+        if 0 <= stream_speed < 0x80:
+            out.append(stream_speed)
+        else:
+            out += _varint(stream_speed)
+    if error_code is not None:
+        out.append(0x18)
+        if error_code < 0x80:
+            out.append(error_code)
+        else:
+            out += _varint(error_code)
+    return bytes(out)
+
+
+def decode_even_ai_config(data: bytes) -> EvenAIConfig:
+    """Decode EvenAIConfig. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = EvenAIConfig()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.voice_switch = _signed(value)
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.stream_speed = _signed(value)
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.error_code = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated EvenAIConfig")
+    return msg
+
+
+def encode_dashboard_message(type=None, msg_id=None, widget=None) -> bytes:
+    """Encode DashboardMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if widget is not None:
+        out.append(0x1A)
+        size = len(widget)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += widget
+    return bytes(out)
+
+
+def decode_dashboard_message(data: bytes) -> DashboardMessage:
+    """Decode DashboardMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DashboardMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.widget = decode_dashboard_widget(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DashboardMessage")
+    return msg
+
+
+def encode_dashboard_widget(widget_type=None, content=None) -> bytes:
+    """Encode DashboardWidget."""
+    out = bytearray()
+    if widget_type is not None:
+        out.append(0x08)
+        if widget_type < 0x80:
+            out.append(widget_type)
+        else:
+            out += _varint(widget_type)
+    if content is not None:
+        out.append(0x12)
+        size = len(content)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += content
+    return bytes(out)
+
+
+def decode_dashboard_widget(data: bytes) -> DashboardWidget:
+    """Decode DashboardWidget. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DashboardWidget()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.widget_type = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.content = data[pos:end]
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DashboardWidget")
+    return msg
+
+
+def encode_navigation_message(mode=None, widget=None, step=None) -> bytes:
+    """Encode NavigationMessage."""
+    out = bytearray()
+    if mode is not None:
+        out.append(0x08)
+        if mode < 0x80:
+            out.append(mode)
+        else:
+            out += _varint(mode)
+    if widget is not None:
+        out.append(0x22)
+        size = len(widget)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += widget
+    if step is not None:
+        out.append(0x2A)
+        size = len(step)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += step
+    return bytes(out)
+
+
+def decode_navigation_message(data: bytes) -> NavigationMessage:
+    """Decode NavigationMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = NavigationMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.mode = value
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.widget = decode_navigation_widget(data[pos:end])
+                pos = end
+            elif tag == 0x2A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.step = decode_navigation_step(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated NavigationMessage")
+    return msg
+
+
+def encode_navigation_step(distance_type=None, distance=None, instruction=None, time_remaining=None, total_distance=None, eta=None, speed=None, icon=None) -> bytes:
+    """Encode NavigationStep."""
+    out = bytearray()
+    if distance_type is not None:
+        out.append(0x08)
+        if distance_type < 0x80:
+            out.append(distance_type)
+        else:
+            out += _varint(distance_type)
+    if distance is not None:
+        if distance.__class__ is str:
+            distance = distance.encode('utf-8')
+        out.append(0x12)
+        size = len(distance)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += distance
+    if instruction is not None:
+        if instruction.__class__ is str:
+            instruction = instruction.encode('utf-8')
+        out.append(0x1A)
+        size = len(instruction)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += instruction
+    if time_remaining is not None:
+        if time_remaining.__class__ is str:
+            time_remaining = time_remaining.encode('utf-8')
+        out.append(0x22)
+        size = len(time_remaining)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += time_remaining
+    if total_distance is not None:
+        if total_distance.__class__ is str:
+            total_distance = total_distance.encode('utf-8')
+        out.append(0x2A)
+        size = len(total_distance)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += total_distance
+    if eta is not None:
+        if eta.__class__ is str:
+            eta = eta.encode('utf-8')
+        out.append(0x32)
+        size = len(eta)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += eta
+    if speed is not None:
+        if speed.__class__ is str:
+            speed = speed.encode('utf-8')
+        out.append(0x3A)
+        size = len(speed)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += speed
+    if icon is not None:
+        out.append(0x40)
+        if icon < 0x80:
+            out.append(icon)
+        else:
+            out += _varint(icon)
+    return bytes(out)
+
+
+def decode_navigation_step(data: bytes) -> NavigationStep:
+    """Decode NavigationStep. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = NavigationStep()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.distance_type = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.distance = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.instruction = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.time_remaining = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x2A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.total_distance = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x32:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.eta = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x3A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.speed = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x40:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.icon = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated NavigationStep")
+    return msg
+
+
+def encode_navigation_widget(type=None, text=None, extra=None) -> bytes:
+    """Encode NavigationWidget."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if text is not None:
+        if text.__class__ is str:
+            text = text.encode('utf-8')
+        out.append(0x12)
+        size = len(text)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += text
+    if extra is not None:
+        out.append(0x1A)
+        size = len(extra)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += extra
+    return bytes(out)
+
+
+def decode_navigation_widget(data: bytes) -> NavigationWidget:
+    """Decode NavigationWidget. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = NavigationWidget()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.text = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.extra = data[pos:end]
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated NavigationWidget")
+    return msg
+
+
+def encode_display_wake(type=None, msg_id=None, settings=None) -> bytes:
+    """Encode DisplayWake."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if settings is not None:
+        out.append(0x1A)
+        size = len(settings)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += settings
+    return bytes(out)
+
+
+def decode_display_wake(data: bytes) -> DisplayWake:
+    """Decode DisplayWake. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DisplayWake()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.settings = decode_display_wake_settings(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DisplayWake")
+    return msg
+
+
+def encode_display_wake_settings(field1=None, field2=None, field3=None, field5=None) -> bytes:
+    """Encode DisplayWakeSettings."""
+    out = bytearray()
+    if field1 is not None:
+        out.append(0x08)
+        if field1 < 0x80:
+            out.append(field1)
+        else:
+            out += _varint(field1)
+    if field2 is not None:
+        out.append(0x10)
+        if field2 < 0x80:
+            out.append(field2)
+        else:
+            out += _varint(field2)
+    if field3 is not None:
+        out.append(0x18)
+        if field3 < 0x80:
+            out.append(field3)
+        else:
+            out += _varint(field3)
+    if field5 is not None:
+        out.append(0x28)
+        if field5 < 0x80:
+            out.append(field5)
+        else:
+            out += _varint(field5)
+    return bytes(out)
+
+
+def decode_display_wake_settings(data: bytes) -> DisplayWakeSettings:
+    """Decode DisplayWakeSettings. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = DisplayWakeSettings()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field1 = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field2 = value
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field3 = value
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.field5 = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated DisplayWakeSettings")
+    return msg
+
+
+def encode_conversate_message(type=None, msg_id=None, transcript=None) -> bytes:
+    """Encode ConversateMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if transcript is not None:
+        out.append(0x3A)
+        size = len(transcript)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += transcript
+    return bytes(out)
+
+
+def decode_conversate_message(data: bytes) -> ConversateMessage:
+    """Decode ConversateMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = ConversateMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x3A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.transcript = decode_conversate_transcript(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated ConversateMessage")
+    return msg
+
+
+def encode_conversate_transcript(text=None, is_final=None) -> bytes:
+    """Encode ConversateTranscript."""
+    out = bytearray()
+    if text is not None:
+        if text.__class__ is str:
+            text = text.encode('utf-8')
+        out.append(0x0A)
+        size = len(text)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += text
+    if is_final is not None:
+        out.append(0x10)
+        out.append(1 if is_final else 0)
+    return bytes(out)
+
+
+def decode_conversate_transcript(data: bytes) -> ConversateTranscript:
+    """Decode ConversateTranscript. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = ConversateTranscript()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x0A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.text = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.is_final = value != 0
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated ConversateTranscript")
+    return msg
+
+
+def encode_tasks_message(type=None, msg_id=None, sync=None) -> bytes:
+    """Encode TasksMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if sync is not None:
+        out.append(0x1A)
+        size = len(sync)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += sync
+    return bytes(out)
+
+
+def decode_tasks_message(data: bytes) -> TasksMessage:
+    """Decode TasksMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TasksMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.sync = decode_task_sync(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TasksMessage")
+    return msg
+
+
+def encode_task_sync(version=None, full=None, upsert=None, removed=None, count=None) -> bytes:
+    """Encode TaskSync."""
+    out = bytearray()
+    if version is not None:
+        out.append(0x08)
+        if version < 0x80:
+            out.append(version)
+        else:
+            out += _varint(version)
+    if full is not None:
+        out.append(0x10)
+        out.append(1 if full else 0)
+    if upsert is not None:
+        for item in upsert:
+            out.append(0x1A)
+            size = len(item)
+            if size < 0x80:
+                out.append(size)
+            else:
+                out += _varint(size)
+            out += item
+    if removed is not None:
+        packed = bytearray()
+        for item in removed:
+            packed += _varint(item)
+        out.append(0x22)
+        size = len(packed)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += packed
+    if count is not None:
+        out.append(0x28)
+        if count < 0x80:
+            out.append(count)
+        else:
+            out += _varint(count)
+    return bytes(out)
+
+
+def decode_task_sync(data: bytes) -> TaskSync:
+    """Decode TaskSync. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TaskSync()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.version = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.full = value != 0
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.upsert.append(decode_task_item(data[pos:end]))
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                while pos < end:
+                    value = data[pos]
+                    if value < 0x80:
+                        pos += 1
+                    else:
+                        value, pos = _read_varint(data, pos)
+                    msg.removed.append(value)
+            elif tag == 0x20:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.removed.append(value)
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.count = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TaskSync")
+    return msg
+
+
+def encode_task_item(id=None, title=None, done=None, order=None, due=None) -> bytes:
+    """Encode TaskItem."""
+    out = bytearray()
+    if id is not None:
+        out.append(0x08)
+        if id < 0x80:
+            out.append(id)
+        else:
+            out += _varint(id)
+    if title is not None:
+        if title.__class__ is str:
+            title = title.encode('utf-8')
+        out.append(0x12)
+        size = len(title)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += title
+    if done is not None:
+        out.append(0x18)
+        out.append(1 if done else 0)
+    if order is not None:
+        out.append(0x20)
+        if order < 0x80:
+            out.append(order)
+        else:
+            out += _varint(order)
+    if due is not None:
+        out.append(0x28)
+        if due < 0x80:
+            out.append(due)
+        else:
+            out += _varint(due)
+    return bytes(out)
+
+
+def decode_task_item(data: bytes) -> TaskItem:
+    """Decode TaskItem. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = TaskItem()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.id = value
+            elif tag == 0x12:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.title = data[pos:end].decode('utf-8')
+                pos = end
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.done = value != 0
+            elif tag == 0x20:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.order = value
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.due = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated TaskItem")
+    return msg
+
+
+def encode_notification_message(type=None, msg_id=None, notification=None) -> bytes:
+    """Encode NotificationMessage."""
+    out = bytearray()
+    if type is not None:
+        out.append(0x08)
+        if type < 0x80:
+            out.append(type)
+        else:
+            out += _varint(type)
+    if msg_id is not None:
+        out.append(0x10)
+        if msg_id < 0x80:
+            out.append(msg_id)
+        else:
+            out += _varint(msg_id)
+    if notification is not None:
+        out.append(0x1A)
+        size = len(notification)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += notification
+    return bytes(out)
+
+
+def decode_notification_message(data: bytes) -> NotificationMessage:
+    """Decode NotificationMessage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = NotificationMessage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.type = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.msg_id = value
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.notification = decode_notification_data(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated NotificationMessage")
+    return msg
+
+
+def encode_notification_data(app_id=None, count=None) -> bytes:
+    """Encode NotificationData."""
+    out = bytearray()
+    if app_id is not None:
+        out.append(0x08)
+        if app_id < 0x80:
+            out.append(app_id)
+        else:
+            out += _varint(app_id)
+    if count is not None:
+        out.append(0x10)
+        if count < 0x80:
+            out.append(count)
+        else:
+            out += _varint(count)
+    return bytes(out)
+
+
+def decode_notification_data(data: bytes) -> NotificationData:
+    """Decode NotificationData. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = NotificationData()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.app_id = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.count = value
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated NotificationData")
+    return msg
+
+
+def encode_ring_data_package(command_id=None, magic_random=None, event=None, raw_data=None) -> bytes:
+    """Encode RingDataPackage."""
+    out = bytearray()
+    if command_id is not None:
+        out.append(0x08)
+        if 0 <= command_id < 0x80:
+            out.append(command_id)
+        else:
+            out += _varint(command_id)
+    if magic_random is not None:
+        out.append(0x10)
+        if 0 <= magic_random < 0x80:
+            out.append(magic_random)
+        else:
+            out += _varint(magic_random)
+    if event is not None:
+        out.append(0x1A)
+        size = len(event)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += event
+    if raw_data is not None:
+        out.append(0x22)
+        size = len(raw_data)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += raw_data
+    return bytes(out)
+
+
+def decode_ring_data_package(data: bytes) -> RingDataPackage:
+    """Decode RingDataPackage. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = RingDataPackage()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.command_id = value
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.magic_random = _signed(value)
+            elif tag == 0x1A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.event = decode_ring_event(data[pos:end])
+                pos = end
+            elif tag == 0x22:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.raw_data = decode_ring_raw_data(data[pos:end])
+                pos = end
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated RingDataPackage")
+    return msg
+
+
+def encode_ring_event(ring_mac=None, event_id=None, event_param=None, error_code=None) -> bytes:
+    """Encode RingEvent."""
+    out = bytearray()
+    if ring_mac is not None:
+        out.append(0x0A)
+        size = len(ring_mac)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _varint(size)
+        out += ring_mac
+    if event_id is not None:
+        out.append(0x10)
+        if 0 <= event_id < 0x80:
+            out.append(event_id)
+        else:
+            out += _varint(event_id)
+    if event_param is not None:
+        out.append(0x18)
+        if 0 <= event_param < 0x80:
+            out.append(event_param)
+        else:
+            out += _varint(event_param)
+    if error_code is not None:
+        out.append(0x20)
+        if 0 <= error_code < 0x80:
+            out.append(error_code)
+        else:
+            out += _varint(error_code)
+    return bytes(out)
+
+
+def decode_ring_event(data: bytes) -> RingEvent:
+    """Decode RingEvent. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = RingEvent()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x0A:
+                length = data[pos]
+                if length < 0x80:
+                    pos += 1
+                else:
+                    length, pos = _read_varint(data, pos)
+                end = pos + length
+                msg.ring_mac = data[pos:end]
+                pos = end
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.event_id = value
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.event_param = _signed(value)
+            elif tag == 0x20:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.error_code = _signed(value)
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated RingEvent")
+    return msg
+
+
+def encode_ring_raw_data(battery=None, charge_states=None, hr=None, hr_timestamp=None, spo2=None, spo2_timestamp=None, hrv=None, hrv_timestamp=None, temp=None, temp_timestamp=None, act_kcal=None, act_kcal_timestamp=None, all_kcal=None, all_kcal_timestamp=None, steps=None, steps_timestamp=None, error_code=None) -> bytes:
+    """Encode RingRawData."""
+    out = bytearray()
+    if battery is not None:
+        out.append(0x08)
+        if 0 <= battery < 0x80:
+            out.append(battery)
+        else:
+            out += _varint(battery)
+    if charge_states is not None:
+        out.append(0x10)
+        if 0 <= charge_states < 0x80:
+            out.append(charge_states)
+        else:
+            out += _varint(charge_states)
+    if hr is not None:
+        out.append(0x18)
+        if 0 <= hr < 0x80:
+            out.append(hr)
+        else:
+            out += _varint(hr)
+    if hr_timestamp is not None:
+        out.append(0x20)
+        if 0 <= hr_timestamp < 0x80:
+            out.append(hr_timestamp)
+        else:
+            out += _varint(hr_timestamp)
+    if spo2 is not None:
+        out.append(0x28)
+        if 0 <= spo2 < 0x80:
+            out.append(spo2)
+        else:
+            out += _varint(spo2)
+    if spo2_timestamp is not None:
+        out.append(0x30)
+        if 0 <= spo2_timestamp < 0x80:
+            out.append(spo2_timestamp)
+        else:
+            out += _varint(spo2_timestamp)
+    if hrv is not None:
+        out.append(0x38)
+        if 0 <= hrv < 0x80:
+            out.append(hrv)
+        else:
+            out += _varint(hrv)
+    if hrv_timestamp is not None:
+        out.append(0x40)
+        if 0 <= hrv_timestamp < 0x80:
+            out.append(hrv_timestamp)
+        else:
+            out += _varint(hrv_timestamp)
+    if temp is not None:
+        out.append(0x48)
+        if 0 <= temp < 0x80:
+            out.append(temp)
+        else:
+            out += _varint(temp)
+    if temp_timestamp is not None:
+        out.append(0x50)
+        if 0 <= temp_timestamp < 0x80:
+            out.append(temp_timestamp)
+        else:
+            out += _varint(temp_timestamp)
+    if act_kcal is not None:
+        out.append(0x58)
+        if 0 <= act_kcal < 0x80:
+            out.append(act_kcal)
+        else:
+            out += _varint(act_kcal)
+    if act_kcal_timestamp is not None:
+        out.append(0x60)
+        if 0 <= act_kcal_timestamp < 0x80:
+            out.append(act_kcal_timestamp)
+        else:
+            out += _varint(act_kcal_timestamp)
+    if all_kcal is not None:
+        out.append(0x68)
+        if 0 <= all_kcal < 0x80:
+            out.append(all_kcal)
+        else:
+            out += _varint(all_kcal)
+    if all_kcal_timestamp is not None:
+        out.append(0x70)
+        if 0 <= all_kcal_timestamp < 0x80:
+            out.append(all_kcal_timestamp)
+        else:
+            out += _varint(all_kcal_timestamp)
+    if steps is not None:
+        out.append(0x78)
+        if 0 <= steps < 0x80:
+            out.append(steps)
+        else:
+            out += _varint(steps)
+    if steps_timestamp is not None:
+        out += b'\x80\x01'
+        if 0 <= steps_timestamp < 0x80:
+            out.append(steps_timestamp)
+        else:
+            out += _varint(steps_timestamp)
+    if error_code is not None:
+        out += b'\x88\x01'
+        if 0 <= error_code < 0x80:
+            out.append(error_code)
+        else:
+            out += _varint(error_code)
+    return bytes(out)
+
+
+def decode_ring_raw_data(data: bytes) -> RingRawData:
+    """Decode RingRawData. Unknown fields are skipped; truncated input raises ValueError."""
+    if data.__class__ is not bytes:
+        data = bytes(data)
+    msg = RingRawData()
+    pos = 0
+    size = len(data)
+    try:
+        while pos < size:
+            tag = data[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _read_varint(data, pos)
+            if tag == 0x08:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.battery = _signed(value)
+            elif tag == 0x10:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.charge_states = _signed(value)
+            elif tag == 0x18:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.hr = _signed(value)
+            elif tag == 0x20:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.hr_timestamp = _signed(value)
+            elif tag == 0x28:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.spo2 = _signed(value)
+            elif tag == 0x30:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.spo2_timestamp = _signed(value)
+            elif tag == 0x38:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.hrv = _signed(value)
+            elif tag == 0x40:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.hrv_timestamp = _signed(value)
+            elif tag == 0x48:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.temp = _signed(value)
+            elif tag == 0x50:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.temp_timestamp = _signed(value)
+            elif tag == 0x58:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.act_kcal = _signed(value)
+            elif tag == 0x60:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.act_kcal_timestamp = _signed(value)
+            elif tag == 0x68:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.all_kcal = _signed(value)
+            elif tag == 0x70:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.all_kcal_timestamp = _signed(value)
+            elif tag == 0x78:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.steps = _signed(value)
+            elif tag == 0x80:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.steps_timestamp = _signed(value)
+            elif tag == 0x88:
+                value = data[pos]
+                if value < 0x80:
+                    pos += 1
+                else:
+                    value, pos = _read_varint(data, pos)
+                msg.error_code = _signed(value)
+            else:
+                pos = _skip(data, pos, tag)
+    except (IndexError, struct.error):
+        pos = size + 1
+    if pos > size:
+        raise ValueError("Truncated RingRawData")
+    return msg
+
+
+# =============================================================================
+# Schema (for introspection and the runtime comparison in bench_codec.py)
+# =============================================================================
+
+SCHEMA = {
+    'AuthRequest': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('data', 3, 'AuthData', False),
+        ('ack', 4, 'AuthAck', False),
+    ),
+    'AuthData': (
+        ('capability', 1, 'uint32', False),
+        ('field2', 2, 'uint32', False),
+    ),
+    'AuthAck': (
+        ('value', 1, 'uint32', False),
+    ),
+    'TimeSyncRequest': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('sync', 128, 'TimeSyncData', False),
+    ),
+    'TimeSyncData': (
+        ('timestamp', 1, 'uint64', False),
+        ('transaction_id', 2, 'int64', False),
+    ),
+    'TeleprompterMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('init', 3, 'TeleprompterInit', False),
+        ('list', 4, 'TeleprompterList', False),
+        ('content', 5, 'TeleprompterContent', False),
+        ('complete', 6, 'TeleprompterComplete', False),
+        ('marker', 13, 'TeleprompterMarker', False),
+    ),
+    'TeleprompterInit': (
+        ('script_index', 1, 'uint32', False),
+        ('display', 2, 'TeleprompterDisplaySettings', False),
+    ),
+    'TeleprompterDisplaySettings': (
+        ('field1', 1, 'uint32', False),
+        ('field2', 2, 'uint32', False),
+        ('field3', 3, 'uint32', False),
+        ('display_width', 4, 'uint32', False),
+        ('content_height', 5, 'uint32', False),
+        ('line_height', 6, 'uint32', False),
+        ('viewport_height', 7, 'uint32', False),
+        ('font_size', 8, 'uint32', False),
+        ('scroll_mode', 9, 'uint32', False),
+    ),
+    'TeleprompterList': (
+        ('scripts', 1, 'TeleprompterScript', True),
+    ),
+    'TeleprompterScript': (
+        ('script_id', 1, 'string', False),
+        ('title', 2, 'string', False),
+    ),
+    'TeleprompterContent': (
+        ('page_number', 1, 'uint32', False),
+        ('line_count', 2, 'uint32', False),
+        ('text', 3, 'bytes', False),
+    ),
+    'TeleprompterComplete': (
+        ('start_page', 1, 'uint32', False),
+        ('total_pages', 2, 'uint32', False),
+        ('total_lines', 3, 'uint32', False),
+    ),
+    'TeleprompterMarker': (
+        ('field1', 1, 'uint32', False),
+        ('field2', 2, 'uint32', False),
+    ),
+    'TeleprompterStart': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('state', 3, 'TeleprompterState', False),
+    ),
+    'TeleprompterState': (
+        ('state', 1, 'uint32', False),
+    ),
+    'DisplayConfig': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('settings', 4, 'DisplaySettings', False),
+    ),
+    'DisplaySettings': (
+        ('enabled', 1, 'uint32', False),
+        ('regions', 2, 'DisplayRegion', True),
+        ('field3', 3, 'uint32', False),
+    ),
+    'DisplayRegion': (
+        ('region_id', 1, 'uint32', False),
+        ('param1', 2, 'uint32', False),
+        ('param2', 3, 'float', False),
+        ('param3', 4, 'float', False),
+        ('param4', 5, 'uint32', False),
+        ('param5', 6, 'uint32', False),
+    ),
+    'SyncMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('data', 13, 'bytes', False),
+    ),
+    'EvenAIMessage': (
+        ('command_id', 1, 'enum', False),
+        ('magic_random', 2, 'uint32', False),
+        ('ctrl', 3, 'EvenAIControl', False),
+        ('vad_info', 4, 'EvenAIVadInfo', False),
+        ('ask_info', 5, 'EvenAIText', False),
+        ('reply_info', 7, 'EvenAIText', False),
+        ('config', 13, 'EvenAIConfig', False),
+    ),
+    'EvenAIControl': (
+        ('status', 1, 'uint32', False),
+    ),
+    'EvenAIVadInfo': (
+        ('vad_status', 1, 'uint32', False),
+        ('error_code', 2, 'uint32', False),
+    ),
+    'EvenAIText': (
+        ('cmd_cnt', 1, 'int32', False),
+        ('stream_enable', 2, 'int32', False),
+        ('text_mode', 3, 'int32', False),
+        ('text', 4, 'string', False),
+        ('error_code', 5, 'uint32', False),
+    ),
+    'EvenAIConfig': (
+        ('voice_switch', 1, 'int32', False),
+        ('stream_speed', 2, 'int32', False),
+        ('error_code', 3, 'uint32', False),
+    ),
+    'DashboardMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('widget', 3, 'DashboardWidget', False),
+    ),
+    'DashboardWidget': (
+        ('widget_type', 1, 'uint32', False),
+        ('content', 2, 'bytes', False),
+    ),
+    'NavigationMessage': (
+        ('mode', 1, 'uint32', False),
+        ('widget', 4, 'NavigationWidget', False),
+        ('step', 5, 'NavigationStep', False),
+    ),
+    'NavigationStep': (
+        ('distance_type', 1, 'uint32', False),
+        ('distance', 2, 'string', False),
+        ('instruction', 3, 'string', False),
+        ('time_remaining', 4, 'string', False),
+        ('total_distance', 5, 'string', False),
+        ('eta', 6, 'string', False),
+        ('speed', 7, 'string', False),
+        ('icon', 8, 'uint32', False),
+    ),
+    'NavigationWidget': (
+        ('type', 1, 'uint32', False),
+        ('text', 2, 'string', False),
+        ('extra', 3, 'bytes', False),
+    ),
+    'DisplayWake': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('settings', 3, 'DisplayWakeSettings', False),
+    ),
+    'DisplayWakeSettings': (
+        ('field1', 1, 'uint32', False),
+        ('field2', 2, 'uint32', False),
+        ('field3', 3, 'uint32', False),
+        ('field5', 5, 'uint32', False),
+    ),
+    'ConversateMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('transcript', 7, 'ConversateTranscript', False),
+    ),
+    'ConversateTranscript': (
+        ('text', 1, 'string', False),
+        ('is_final', 2, 'bool', False),
+    ),
+    'TasksMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('sync', 3, 'TaskSync', False),
+    ),
+    'TaskSync': (
+        ('version', 1, 'uint32', False),
+        ('full', 2, 'bool', False),
+        ('upsert', 3, 'TaskItem', True),
+        ('removed', 4, 'uint32', True),
+        ('count', 5, 'uint32', False),
+    ),
+    'TaskItem': (
+        ('id', 1, 'uint32', False),
+        ('title', 2, 'string', False),
+        ('done', 3, 'bool', False),
+        ('order', 4, 'uint32', False),
+        ('due', 5, 'uint32', False),
+    ),
+    'NotificationMessage': (
+        ('type', 1, 'uint32', False),
+        ('msg_id', 2, 'uint32', False),
+        ('notification', 3, 'NotificationData', False),
+    ),
+    'NotificationData': (
+        ('app_id', 1, 'uint32', False),
+        ('count', 2, 'uint32', False),
+    ),
+    'RingDataPackage': (
+        ('command_id', 1, 'enum', False),
+        ('magic_random', 2, 'int32', False),
+        ('event', 3, 'RingEvent', False),
+        ('raw_data', 4, 'RingRawData', False),
+    ),
+    'RingEvent': (
+        ('ring_mac', 1, 'bytes', False),
+        ('event_id', 2, 'enum', False),
+        ('event_param', 3, 'int32', False),
+        ('error_code', 4, 'int32', False),
+    ),
+    'RingRawData': (
+        ('battery', 1, 'int32', False),
+        ('charge_states', 2, 'int32', False),
+        ('hr', 3, 'int32', False),
+        ('hr_timestamp', 4, 'int32', False),
+        ('spo2', 5, 'int32', False),
+        ('spo2_timestamp', 6, 'int32', False),
+        ('hrv', 7, 'int32', False),
+        ('hrv_timestamp', 8, 'int32', False),
+        ('temp', 9, 'int32', False),
+        ('temp_timestamp', 10, 'int32', False),
+        ('act_kcal', 11, 'int32', False),
+        ('act_kcal_timestamp', 12, 'int32', False),
+        ('all_kcal', 13, 'int32', False),
+        ('all_kcal_timestamp', 14, 'int32', False),
+        ('steps', 15, 'int32', False),
+        ('steps_timestamp', 16, 'int32', False),
+        ('error_code', 17, 'int32', False),
+    ),
+}
@@ -0,0 +1,326 @@
+"""
+G2 Gesture Events
+
+Decodes touch gestures from 5402 notifications by walking the protobuf
+fields of service 0x01-01 (tap / swipe) and 0x0D-01 (long press) frames,
+instead of searching hex strings (see docs/gestures.md).
+
+    gestures = GestureEngine(double_tap_window=0.3)
+
+    @gestures.on(SWIPE_FORWARD)
+    async def next_page(event):
+        ...
+
+    await client.start_notify(CHAR_NOTIFY, gestures)
+
+Features:
+    - Gap detection from the per-gesture counter (event.missed)
+    - Double tap synthesized from two taps inside the window
+    - Sync or async handlers; async ones run as tasks
+    - Per-gesture latency histograms, notification -> handler done
+    - Other devices (the R1 ring) can emit() into the same handlers
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from frames import Frame, FrameDecoder, fields
+
+SERVICE_STATUS = 0x0101
+SERVICE_LONG_PRESS = 0x0D01
+
+TAP = "tap"
+DOUBLE_TAP = "double_tap"
+SWIPE_FORWARD = "swipe_forward"
+SWIPE_BACKWARD = "swipe_backward"
+LONG_PRESS = "long_press"
+
+GESTURES = (TAP, DOUBLE_TAP, SWIPE_FORWARD, SWIPE_BACKWARD, LONG_PRESS)
+
+SWIPE_DIRECTIONS = {1: SWIPE_FORWARD, 2: SWIPE_BACKWARD}
+
+
+class GestureEvent(NamedTuple):
+    """One recognised gesture."""
+    kind: str
+    counter: Optional[int]      # None for long press (no counter on 0x0D-01)
+    received: float             # time.monotonic() when the notification arrived
+    missed: int = 0             # gestures skipped since the previous counter
+    source: str = "glasses"     # "glasses", or "r1" for ring gestures (see ring.py)
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+def decode_gesture(frame: Frame) -> Optional[Tuple[str, Optional[int]]]:
+    """
+    Return (kind, counter) for a gesture frame, else None.
+
+    0x01-01 status:  field 6 { 1: stamp, 2: { 1: 1, 2: { [1: direction], 2: counter } } }
+                     no direction = tap, 1 = swipe forward, 2 = swipe backward
+    0x0D-01:         { 1: 1, 3: { 1: 1, 2: 3 } } = long press
+    """
+    if frame.service == SERVICE_STATUS:
+        status = fields(frame.payload).get(6)
+        if not isinstance(status, bytes):
+            return None
+        gesture = fields(status).get(2)
+        if not isinstance(gesture, bytes):
+            return None
+        gesture = fields(gesture)
+        event = gesture.get(2)
+        if gesture.get(1) != 1 or not isinstance(event, bytes):
+            return None
+        event = fields(event)
+        counter = event.get(2)
+        if not isinstance(counter, int):
+            return None
+        direction = event.get(1)
+        if direction is None:
+            return TAP, counter
+        kind = SWIPE_DIRECTIONS.get(direction)
+        return (kind, counter) if kind else None
+
+    if frame.service == SERVICE_LONG_PRESS:
+        msg = fields(frame.payload)
+        action = msg.get(3)
+        if msg.get(1) != 1 or not isinstance(action, bytes):
+            return None
+        action = fields(action)
+        if action.get(1) == 1 and action.get(2) == 3:
+            return LONG_PRESS, None
+    return None
+
+
+# =============================================================================
+# Latency Histogram
+# =============================================================================
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (ms) of the bucket holding the q-th sample, capped at the max seen."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(q * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(float(self.BOUNDS_MS[i]), self.max_ms) if i < len(self.BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def buckets(self) -> List[Tuple[str, int]]:
+        """[(label, count), ...] e.g. ("<=5ms", 3), (">1000ms", 0)."""
+        labels = [f"<={b}ms" for b in self.BOUNDS_MS] + [f">{self.BOUNDS_MS[-1]}ms"]
+        return list(zip(labels, self.counts))
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class GestureEngine:
+    """
+    Notification handler that turns gesture frames into dispatched events.
+
+    Call it like a bleak notify callback (engine(sender, data)) or feed() raw
+    packets. Taps are held for double_tap_window seconds to see if a second
+    tap follows, but only while a DOUBLE_TAP handler is registered; otherwise
+    they dispatch immediately. A window of 0 disables double taps.
+    """
+
+    def __init__(self, double_tap_window: float = 0.3):
+        self.double_tap_window = double_tap_window
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._decoder = FrameDecoder()
+        self._last_counter: Optional[int] = None
+        self._pending_tap: Optional[GestureEvent] = None
+        self._tap_timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+        self.received = 0
+        self.missed = 0
+        self.duplicates = 0
+        self.handler_errors = 0
+        self.counts = {kind: 0 for kind in GESTURES}
+        self.latency = {kind: LatencyHistogram() for kind in GESTURES}
+
+    def on(self, kind: str, handler: Callable = None):
+        """
+        Register handler(event) for a gesture kind; usable as a decorator.
+
+        Handlers may be plain functions or coroutine functions.
+        """
+        if kind not in GESTURES:
+            raise ValueError(f"Unknown gesture {kind!r}, expected one of {GESTURES}")
+
+        def register(handler: Callable) -> Callable:
+            self._handlers.setdefault(kind, []).append(handler)
+            return handler
+
+        return register(handler) if handler is not None else register
+
+    def __call__(self, sender, data: bytearray):
+        self.feed(bytes(data))
+
+    def feed(self, data: bytes, received: float = None) -> Optional[GestureEvent]:
+        """Feed one notification packet; returns the decoded gesture, if any."""
+        received = time.monotonic() if received is None else received
+        frame = self._decoder.feed(data)
+        if frame is None:
+            return None
+        return self.feed_frame(frame, received)
+
+    def feed_frame(self, frame: Frame, received: float = None) -> Optional[GestureEvent]:
+        """Feed one complete frame (for callers that already run a FrameDecoder)."""
+        decoded = decode_gesture(frame)
+        if decoded is None:
+            return None
+        kind, counter = decoded
+        received = time.monotonic() if received is None else received
+
+        missed = 0
+        if counter is not None:
+            last = self._last_counter
+            if counter == last:
+                # Same counter twice: a repeated notification, not a new gesture
+                self.duplicates += 1
+                return None
+            if last is not None and counter > last:
+                missed = counter - last - 1
+            # counter < last: wrapped or the glasses restarted; nothing to infer
+            self._last_counter = counter
+            self.missed += missed
+
+        self.received += 1
+        event = GestureEvent(kind, counter, received, missed)
+        if kind == TAP:
+            self._tap(event)
+        else:
+            self._dispatch(event)
+        return event
+
+    def emit(self, kind: str, received: float = None, source: str = "glasses") -> GestureEvent:
+        """
+        Dispatch a gesture decoded elsewhere (e.g. by R1Client).
+
+        The event skips counter tracking and double-tap synthesis: the ring
+        reports double taps itself.
+        """
+        if kind not in GESTURES:
+            raise ValueError(f"Unknown gesture {kind!r}, expected one of {GESTURES}")
+        received = time.monotonic() if received is None else received
+        self.received += 1
+        event = GestureEvent(kind, None, received, 0, source)
+        self._dispatch(event)
+        return event
+
+    # -------------------------------------------------------------------------
+    # Double tap
+    # -------------------------------------------------------------------------
+
+    def _tap(self, event: GestureEvent):
+        if self.double_tap_window <= 0 or not self._handlers.get(DOUBLE_TAP):
+            self._dispatch(event)
+            return
+
+        pending = self._pending_tap
+        if pending is not None and event.received - pending.received <= self.double_tap_window:
+            self._tap_timer.cancel()
+            self._pending_tap = self._tap_timer = None
+            # Latency counts from the first tap: that is when the wearer started
+            self._dispatch(event._replace(kind=DOUBLE_TAP, received=pending.received,
+                                          missed=pending.missed + event.missed))
+            return
+
+        if pending is not None:
+            self._flush_tap()
+        self._pending_tap = event
+        self._tap_timer = asyncio.get_running_loop().call_later(self.double_tap_window, self._flush_tap)
+
+    def _flush_tap(self):
+        if self._tap_timer is not None:
+            self._tap_timer.cancel()
+        event, self._pending_tap, self._tap_timer = self._pending_tap, None, None
+        if event is not None:
+            self._dispatch(event)
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    def _dispatch(self, event: GestureEvent):
+        self.counts[event.kind] += 1
+        handlers = self._handlers.get(event.kind)
+        if not handlers:
+            return
+
+        coros = []
+        for handler in handlers:
+            try:
+                result = handler(event)
+            except Exception as e:
+                self.handler_errors += 1
+                print(f"  Gesture handler error ({event.kind}): {e}")
+                continue
+            if asyncio.iscoroutine(result):
+                coros.append(result)
+
+        if not coros:
+            self.latency[event.kind].record(time.monotonic() - event.received)
+            return
+        task = asyncio.get_running_loop().create_task(self._run(event, coros))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, event: GestureEvent, coros: list):
+        for result in await asyncio.gather(*coros, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.handler_errors += 1
+                print(f"  Gesture handler error ({event.kind}): {result}")
+        self.latency[event.kind].record(time.monotonic() - event.received)
+
+    async def drain(self):
+        """Dispatch any held tap and wait for running handlers."""
+        self._flush_tap()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def print_stats(self):
+        """Per-gesture counts and handler latency."""
+        if not self.received:
+            return
+        print(f"\nGestures: {self.received} received, {self.missed} missed, {self.duplicates} duplicate")
+        for kind in GESTURES:
+            hist = self.latency[kind]
+            if not self.counts[kind]:
+                continue
+            line = f"  {kind:<15} {self.counts[kind]:>4}"
+            if hist.count:
+                line += (f"   p50 <={hist.percentile(0.50):.0f} ms  p90 <={hist.percentile(0.90):.0f} ms"
+                         f"  max {hist.max_ms:.0f} ms")
+            print(line)
@@ -0,0 +1,274 @@
+"""
+R1 Health Data Store
+
+Append-only storage for RingRawData samples (docs/R1_ANALYSIS.md) whose
+memory use stays flat over multi-day sessions:
+
+    store = HealthStore("r1_health.bin", bucket=60)
+    store.add_raw(raw, now=time.time())     # a decoded RingRawData
+    store.recent("hr")                      # [(t, bpm), ...] last `recent` samples
+    store.history("hr", start, end)         # per-minute HealthBuckets from disk
+    store.close()
+
+Two tiers:
+    - recent: the last `recent` raw samples per metric, in preallocated
+      arrays (fixed size, overwritten in a ring)
+    - history: one 32-byte record per metric per `bucket` seconds
+      (count/min/max/last/sum), appended to a file through a memory map of
+      one 64 KiB chunk at a time
+
+The ring repeats readings: a sample whose timestamp is not newer than the
+last one stored for that metric is counted in `duplicates` and dropped.
+
+File layout (little endian):
+    header  "R1HS" u16 version, u16 record size, u32 bucket seconds, u64 count
+    record  u32 t, u8 metric, pad, u16 count, i32 min, i32 max, i32 last, i64 sum, pad
+A crash can leave records past the header count. They are found again on
+open, because unused space is zero and every record has count >= 1.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+METRICS = ("hr", "spo2", "hrv", "temp", "act_kcal", "all_kcal", "steps", "battery")
+METRIC_INDEX = {name: i for i, name in enumerate(METRICS)}
+
+# RingRawData value field -> timestamp field (battery has none)
+RAW_FIELDS = tuple((name, None if name == "battery" else name + "_timestamp") for name in METRICS)
+
+MAGIC = b"R1HS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQ12x")
+RECORD = struct.Struct("<IBxHiiiq4x")
+CHUNK = max(65536, mmap.ALLOCATIONGRANULARITY)
+
+assert HEADER.size == RECORD.size == 32 and CHUNK % RECORD.size == 0
+
+
+class HealthBucket(NamedTuple):
+    """Summary of one metric over one bucket."""
+    t: int                  # bucket start (epoch seconds)
+    metric: str
+    count: int
+    min: int
+    max: int
+    last: int
+    sum: int
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count
+
+
+class HealthStore:
+    """Fixed-memory recent samples plus memory-mapped per-bucket history."""
+
+    def __init__(self, path: Optional[str] = None, recent: int = 1024, bucket: int = 60):
+        self.path = path
+        self.bucket = bucket
+        self.capacity = recent
+        n = len(METRICS)
+
+        self._recent_t = array("q", [0]) * (n * recent)
+        self._recent_v = array("i", [0]) * (n * recent)
+        self._recent_n = array("Q", [0]) * n
+        self._last_t = array("q", [-1]) * n
+
+        # Open (not yet written) bucket per metric
+        self._open_t = array("q", [-1]) * n
+        self._open_count = array("I", [0]) * n
+        self._open_min = array("i", [0]) * n
+        self._open_max = array("i", [0]) * n
+        self._open_last = array("i", [0]) * n
+        self._open_sum = array("q", [0]) * n
+
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b") if path else tempfile.TemporaryFile()
+        self._map: Optional[mmap.mmap] = None
+        self._chunk = -1
+        self.count = self._load()
+
+        self.samples = 0
+        self.duplicates = 0
+
+    # -------------------------------------------------------------------------
+    # File
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> int:
+        """Read the header (writing one for a new file); returns the record count."""
+        self._file.seek(0)
+        header = self._file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            self._file.seek(0)
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, self.bucket, 0))
+            return 0
+
+        magic, version, size, bucket, count = HEADER.unpack(header)
+        if magic != MAGIC or size != RECORD.size:
+            raise ValueError(f"{self.path}: not an R1 health store (magic {magic!r}, record size {size})")
+        if bucket != self.bucket:
+            raise ValueError(f"{self.path}: written with {bucket} s buckets, not {self.bucket}")
+
+        # Recover records appended after the last header update
+        self._file.seek(HEADER.size + count * RECORD.size)
+        while True:
+            record = self._file.read(RECORD.size)
+            if len(record) < RECORD.size or RECORD.unpack(record)[2] == 0:
+                break
+            count += 1
+
+        # Samples up to the end of each metric's last written bucket are repeats
+        tail = min(count, 4 * CHUNK // RECORD.size)
+        self._file.seek(HEADER.size + (count - tail) * RECORD.size)
+        for record in RECORD.iter_unpack(self._file.read(tail * RECORD.size)):
+            t, m = record[0], record[1]
+            if m < len(METRICS):
+                self._last_t[m] = max(self._last_t[m], t + bucket - 1)
+        return count
+
+    def _map_chunk(self, chunk: int):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        end = (chunk + 1) * CHUNK
+        fd = self._file.fileno()
+        if os.fstat(fd).st_size < end:
+            os.ftruncate(fd, end)
+        self._map = mmap.mmap(fd, CHUNK, offset=chunk * CHUNK)
+        self._chunk = chunk
+
+    def _write_bucket(self, m: int):
+        offset = HEADER.size + self.count * RECORD.size
+        chunk = offset // CHUNK
+        if chunk != self._chunk:
+            self._map_chunk(chunk)
+        RECORD.pack_into(self._map, offset - chunk * CHUNK, self._open_t[m], m, self._open_count[m],
+                         self._open_min[m], self._open_max[m], self._open_last[m], self._open_sum[m])
+        self.count += 1
+
+    def flush(self):
+        """Make written buckets durable and update the header count."""
+        if self._map is not None:
+            self._map.flush()
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, self.bucket, self.count))
+        self._file.flush()
+
+    def close(self):
+        """Write the open buckets and close the file."""
+        if self._file.closed:
+            return
+        for m in range(len(METRICS)):
+            if self._open_count[m]:
+                self._write_bucket(m)
+                self._open_count[m] = 0
+        self.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def file_bytes(self) -> int:
+        return HEADER.size + self.count * RECORD.size
+
+    # -------------------------------------------------------------------------
+    # Appending
+    # -------------------------------------------------------------------------
+
+    def add(self, metric: str, t: int, value: int) -> bool:
+        """Append one sample; False if it is not newer than the last one."""
+        m = METRIC_INDEX[metric]
+        if t <= self._last_t[m]:
+            self.duplicates += 1
+            return False
+        self._last_t[m] = t
+
+        i = m * self.capacity + self._recent_n[m] % self.capacity
+        self._recent_t[i] = t
+        self._recent_v[i] = value
+        self._recent_n[m] += 1
+
+        start = t - t % self.bucket
+        if start != self._open_t[m]:
+            if self._open_count[m]:
+                self._write_bucket(m)
+            self._open_t[m] = start
+            self._open_count[m] = 0
+            self._open_min[m] = self._open_max[m] = value
+            self._open_sum[m] = 0
+        self._open_count[m] += 1
+        if value < self._open_min[m]:
+            self._open_min[m] = value
+        elif value > self._open_max[m]:
+            self._open_max[m] = value
+        self._open_last[m] = value
+        self._open_sum[m] += value
+        self.samples += 1
+        return True
+
+    def add_raw(self, raw, now: int) -> int:
+        """
+        Append the metrics present in a RingRawData; returns how many were new.
+
+        Readings without a timestamp (battery, or a zero timestamp) are
+        stamped with now.
+        """
+        added = 0
+        for name, stamp in RAW_FIELDS:
+            value = getattr(raw, name)
+            if value is None:
+                continue
+            t = getattr(raw, stamp) if stamp else None
+            added += self.add(name, t or int(now), value)
+        return added
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def recent(self, metric: str) -> List[Tuple[int, int]]:
+        """The last `recent` raw samples of a metric, oldest first: [(t, value), ...]."""
+        m = METRIC_INDEX[metric]
+        n = self._recent_n[m]
+        base = m * self.capacity
+        first = max(0, n - self.capacity)
+        return [(self._recent_t[base + i % self.capacity], self._recent_v[base + i % self.capacity])
+                for i in range(first, n)]
+
+    def history(self, metric: Optional[str] = None, start: int = 0,
+                end: Optional[int] = None) -> Iterator[HealthBucket]:
+        """Written buckets (optionally one metric, start <= t < end), read a chunk at a time."""
+        if self._map is not None:
+            self._map.flush()
+        want = METRIC_INDEX[metric] if metric is not None else None
+        per_read = CHUNK // RECORD.size
+        for first in range(0, self.count, per_read):
+            n = min(per_read, self.count - first)
+            self._file.seek(HEADER.size + first * RECORD.size)
+            block = self._file.read(n * RECORD.size)
+            for t, m, count, lo, hi, last, total in RECORD.iter_unpack(block):
+                if (want is None or m == want) and t >= start and (end is None or t < end):
+                    yield HealthBucket(t, METRICS[m], count, lo, hi, last, total)
+
+    def to_numpy(self):
+        """Read-only structured NumPy view of the written buckets (needs numpy)."""
+        import numpy as np
+
+        dtype = np.dtype([("t", "<u4"), ("metric", "u1"), ("_pad", "u1"), ("count", "<u2"),
+                          ("min", "<i4"), ("max", "<i4"), ("last", "<i4"), ("sum", "<i8"), ("_pad2", "<u4")])
+        if self._map is not None:
+            self._map.flush()
+        if not self.count:
+            return np.zeros(0, dtype)
+        return np.memmap(self._file, dtype=dtype, mode="r", offset=HEADER.size, shape=(self.count,))
@@ -0,0 +1,231 @@
+"""
+G2 Rendering Channel (6402) Receiver
+
+Subscribes to the 6402 notify characteristic and copies every frame into a
+preallocated ring buffer. The capture in docs/capture-analysis.md shows
+~11-12 frames/s of 205-byte packets that end in a wrapping sequence byte:
+
+    [random-looking body ...] [00] [int16 LE] [seq]
+
+    stream = RenderStream(capacity=1024)
+    await stream.start(client)
+
+    async for frame in stream:
+        frame.seq, frame.received, bytes(frame.data)
+
+The notification path does no per-frame buffer allocation: the payload is
+written into a slot of one bytearray and the metadata into preallocated
+arrays. Consumers get a memoryview of the slot. It stays valid until the
+producer laps the consumer, so copy it (bytes(frame.data)) if you keep it.
+
+Counters:
+    received, missed (sequence gaps), duplicates (same seq and body), wraps
+    overruns - frames overwritten before the consumer read them
+    oversize - notifications longer than a slot (not stored)
+    interval - inter-arrival histogram, jitter_ms - RFC 3550 style estimate
+"""
+
+import asyncio
+import time
+from array import array
+from typing import AsyncIterator, NamedTuple, Optional
+
+from frames import CHAR_RENDER_NOTIFY
+from gestures import LatencyHistogram
+
+FRAME_LEN = 205             # observed 6402 notification size
+
+
+class RenderFrame(NamedTuple):
+    """One received frame; data is a view into the ring buffer."""
+    index: int              # position in the stream (0, 1, 2 ...)
+    seq: int                # last byte of the frame
+    received: float         # time.monotonic() on arrival
+    data: memoryview
+
+
+class RenderStream:
+    """
+    Ring-buffered 6402 notification receiver.
+
+    Usable directly as a bleak notify callback (stream(sender, data)). When
+    the consumer falls more than `capacity` frames behind, the oldest unread
+    frames are overwritten and counted in `overruns`.
+    """
+
+    def __init__(self, capacity: int = 1024, frame_len: int = FRAME_LEN):
+        self.capacity = capacity
+        self.frame_len = frame_len
+        self._buf = bytearray(capacity * frame_len)
+        self._view = memoryview(self._buf)
+        self._lengths = array("H", [0]) * capacity
+        self._seqs = array("B", [0]) * capacity
+        self._times = array("d", [0.0]) * capacity
+        self._written = 0           # frames ever written
+        self._read = 0              # frames handed to the consumer
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+        self._client = None
+
+        self._last_seq: Optional[int] = None
+        self._last_time: Optional[float] = None
+        self._last_interval: Optional[float] = None
+
+        self.received = 0
+        self.missed = 0
+        self.duplicates = 0
+        self.wraps = 0
+        self.overruns = 0
+        self.oversize = 0
+        self.jitter = 0.0           # seconds
+        self.interval = LatencyHistogram()
+
+    # -------------------------------------------------------------------------
+    # Subscription
+    # -------------------------------------------------------------------------
+
+    async def start(self, client, char: str = CHAR_RENDER_NOTIFY):
+        """Subscribe to 6402 on a connected BleakClient (or G2Emulator)."""
+        self._client = client
+        self._closed = False
+        await client.start_notify(char, self)
+
+    async def stop(self, char: str = CHAR_RENDER_NOTIFY):
+        """Unsubscribe and end any running consumer iteration."""
+        if self._client is not None:
+            await self._client.stop_notify(char)
+            self._client = None
+        self.close()
+
+    def close(self):
+        self._closed = True
+        self._wake()
+
+    # -------------------------------------------------------------------------
+    # Producer (notification callback)
+    # -------------------------------------------------------------------------
+
+    def __call__(self, sender, data: bytearray):
+        self.feed(data)
+
+    def feed(self, data, received: float = None):
+        """Store one notification; returns False if it was not stored."""
+        received = time.monotonic() if received is None else received
+        n = len(data)
+        if n > self.frame_len or n == 0:
+            self.oversize += 1
+            return False
+
+        seq = data[-1]
+        last = self._last_seq
+        if last is not None:
+            if seq == last and self._same_as_last(data):
+                self.duplicates += 1
+                return False
+            # A repeated seq with a new body is a gap of a whole 256-frame lap
+            step = (seq - last) & 0xFF or 0x100
+            if step != 1:
+                self.missed += step - 1
+            if seq <= last:
+                self.wraps += 1
+        self._last_seq = seq
+
+        if self._last_time is not None:
+            interval = received - self._last_time
+            self.interval.record(interval)
+            if self._last_interval is not None:
+                self.jitter += (abs(interval - self._last_interval) - self.jitter) / 16
+            self._last_interval = interval
+        self._last_time = received
+
+        slot = self._written % self.capacity
+        offset = slot * self.frame_len
+        self._view[offset:offset + n] = data
+        self._lengths[slot] = n
+        self._seqs[slot] = seq
+        self._times[slot] = received
+        self._written += 1
+        self.received += 1
+
+        if self._written - self._read > self.capacity:
+            lost = self._written - self._read - self.capacity
+            self.overruns += lost
+            self._read += lost
+        self._wake()
+        return True
+
+    def _same_as_last(self, data) -> bool:
+        """Whether data repeats the last stored frame byte for byte."""
+        slot = (self._written - 1) % self.capacity
+        offset = slot * self.frame_len
+        return self._lengths[slot] == len(data) and self._view[offset:offset + len(data)] == data
+
+    def _wake(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    # -------------------------------------------------------------------------
+    # Consumer
+    # -------------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        """Frames stored but not yet consumed."""
+        return self._written - self._read
+
+    def read(self) -> Optional[RenderFrame]:
+        """Next unread frame, or None if the consumer has caught up."""
+        if self._read >= self._written:
+            return None
+        index = self._read
+        slot = index % self.capacity
+        offset = slot * self.frame_len
+        self._read += 1
+        return RenderFrame(index, self._seqs[slot], self._times[slot],
+                           self._view[offset:offset + self._lengths[slot]])
+
+    def __aiter__(self) -> AsyncIterator[RenderFrame]:
+        return self._frames()
+
+    async def _frames(self) -> AsyncIterator[RenderFrame]:
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = self.read()
+            if frame is not None:
+                yield frame
+                continue
+            if self._closed:
+                return
+            self._waiter = loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    @property
+    def jitter_ms(self) -> float:
+        return self.jitter * 1000
+
+    def stats(self) -> dict:
+        return {
+            "received": self.received, "missed": self.missed, "duplicates": self.duplicates,
+            "wraps": self.wraps, "overruns": self.overruns, "oversize": self.oversize,
+            "pending": self.pending, "jitter_ms": round(self.jitter_ms, 2),
+            "interval_p50_ms": self.interval.percentile(0.50),
+            "interval_p99_ms": self.interval.percentile(0.99),
+        }
+
+    def print_stats(self):
+        if not self.received:
+            return
+        print(f"\n6402 stream: {self.received} frames, {self.missed} missed, "
+              f"{self.duplicates} duplicate, {self.wraps} wraps, {self.overruns} overrun")
+        if self.interval.count:
+            print(f"  interval p50 <={self.interval.percentile(0.50):.0f} ms  "
+                  f"p99 <={self.interval.percentile(0.99):.0f} ms  max {self.interval.max_ms:.0f} ms  "
+                  f"jitter {self.jitter_ms:.1f} ms")
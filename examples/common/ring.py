@@ -0,0 +1,164 @@
+"""
+Even R1 Ring Client
+
+Decodes R1 ring notifications (docs/R1_ANALYSIS.md) and routes them:
+
+    gestures = GestureEngine()
+    ring = R1Client(gestures, health=HealthStore("r1_health.bin"))
+    await ring.start(ring_client)           # a BleakClient connected to the ring
+
+    @gestures.on(DOUBLE_TAP)
+    def dismiss(event):                     # fires for glasses and ring taps
+        event.source                        # "glasses" or "r1"
+
+Notifications are classified by shape:
+    FF tt pp     gesture: HOLD (03), TAP (04, 01 single / 02 double), SWIPE (05)
+    01 / 00      state: ready / menu
+    64 00        battery percent
+    anything else: a RingDataPackage protobuf (RingEvent or RingRawData)
+
+Gestures go straight to GestureEngine.emit(): three byte compares and a
+dict lookup, no frame parsing. RingRawData samples go to the HealthStore.
+
+NOTE: The swipe parameter values are not in the captures yet. 01/02 are
+assumed to mean forward/backward, like the glasses' swipe directions.
+"""
+
+import time
+from typing import Callable, List, Optional
+
+import g2_proto as pb
+from gestures import DOUBLE_TAP, LONG_PRESS, SWIPE_BACKWARD, SWIPE_FORWARD, TAP, GestureEngine
+from health import HealthStore
+
+RING_SERVICE = "bae80001-4f05-4503-8e65-3af1f7329d1f"
+RING_CHAR_WRITE = "bae80012-4f05-4503-8e65-3af1f7329d1f"
+RING_CHAR_NOTIFY = "bae80013-4f05-4503-8e65-3af1f7329d1f"
+
+GESTURE_PREFIX = 0xFF
+GESTURE_HOLD = 0x03
+GESTURE_TAP = 0x04
+GESTURE_SWIPE = 0x05
+
+STATE_MENU = 0x00
+STATE_READY = 0x01
+
+# (type, param) -> gesture kind; HOLD carries a duration-like param, so it matches on type
+RING_GESTURES = {
+    (GESTURE_TAP, 0x01): TAP,
+    (GESTURE_TAP, 0x02): DOUBLE_TAP,
+    (GESTURE_SWIPE, 0x01): SWIPE_FORWARD,
+    (GESTURE_SWIPE, 0x02): SWIPE_BACKWARD,
+}
+RING_GESTURE_TYPES = {GESTURE_HOLD: LONG_PRESS}
+
+SOURCE = "r1"
+
+
+def decode_ring_gesture(data: bytes) -> Optional[str]:
+    """Gesture kind for an FF tt pp notification, else None."""
+    if len(data) != 3 or data[0] != GESTURE_PREFIX:
+        return None
+    return RING_GESTURES.get((data[1], data[2])) or RING_GESTURE_TYPES.get(data[1])
+
+
+class R1Client:
+    """
+    Notification handler for the R1 ring.
+
+    Usable directly as a bleak notify callback. clock() supplies the wall
+    time used for health readings without their own timestamp.
+    """
+
+    def __init__(self, gestures: GestureEngine, health: Optional[HealthStore] = None,
+                 clock: Callable[[], float] = time.time):
+        self.gestures = gestures
+        self.health = health
+        self.clock = clock
+        self._client = None
+        self._chars: List = []
+
+        self.state: Optional[int] = None
+        self.battery: Optional[int] = None
+        self.last_event: Optional[pb.RingEvent] = None
+
+        self.gesture_count = 0
+        self.unknown_gestures = 0
+        self.packages = 0
+        self.bad_packages = 0
+        self.event_count = 0
+        self.samples = 0
+
+    # -------------------------------------------------------------------------
+    # Subscription
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def notify_characteristics(client) -> list:
+        """Every notifying characteristic in the ring service, if the client can list them."""
+        try:
+            service = client.services.get_service(RING_SERVICE)
+        except AttributeError:
+            return []
+        if service is None:
+            return []
+        return [c for c in service.characteristics if "notify" in c.properties]
+
+    async def start(self, client):
+        """Subscribe to the ring's notifications (falls back to BAE80013 alone)."""
+        self._client = client
+        self._chars = self.notify_characteristics(client) or [RING_CHAR_NOTIFY]
+        for char in self._chars:
+            await client.start_notify(char, self)
+
+    async def stop(self):
+        if self._client is not None:
+            for char in self._chars:
+                await self._client.stop_notify(char)
+            self._client = None
+
+    # -------------------------------------------------------------------------
+    # Decoding
+    # -------------------------------------------------------------------------
+
+    def __call__(self, sender, data: bytearray):
+        self.feed(data)
+
+    def feed(self, data, received: float = None):
+        """Handle one notification."""
+        n = len(data)
+        if n == 3 and data[0] == GESTURE_PREFIX:
+            kind = decode_ring_gesture(data)
+            if kind is None:
+                self.unknown_gestures += 1
+                return
+            self.gesture_count += 1
+            self.gestures.emit(kind, time.monotonic() if received is None else received, SOURCE)
+        elif n == 1:
+            self.state = data[0]
+        elif n == 2 and data[1] == 0 and data[0] <= 100:
+            self.battery = data[0]
+        else:
+            self._package(bytes(data))
+
+    def _package(self, data: bytes):
+        try:
+            package = pb.decode_ring_data_package(data)
+        except ValueError:
+            self.bad_packages += 1
+            return
+        self.packages += 1
+        if package.event is not None:
+            self.last_event = package.event
+            self.event_count += 1
+        raw = package.raw_data
+        if raw is not None:
+            if raw.battery is not None:
+                self.battery = raw.battery
+            if self.health is not None:
+                self.samples += self.health.add_raw(raw, int(self.clock()))
+
+    def print_stats(self):
+        print(f"\nR1: {self.gesture_count} gestures ({self.unknown_gestures} unknown), "
+              f"{self.packages} packages ({self.bad_packages} bad), {self.samples} health samples stored"
+              f"{'' if self.battery is None else f', battery {self.battery}%'}")
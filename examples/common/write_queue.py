@@ -0,0 +1,276 @@
+"""
+Priority Write Queue
+
+One queue per connection puts all write-without-response traffic through
+a single writer, so a bulk upload cannot crowd out a heartbeat or an AI
+reply, and at most one write is outstanding at the controller:
+
+    queue = WriteQueue(client)
+    await queue.send(build_heartbeat(...), CONTROL)         # waits until written
+    await queue.put(build_content_page(...), BULK)          # waits for room only
+    await queue.send_message(seq, 0x0C, 0x20, payload, BULK)  # split at dequeue
+    await queue.close()                                     # drain and stop
+    print(queue.stats())
+
+Scheduling:
+
+    - Priority classes CONTROL > INTERACTIVE > BULK. The highest class with
+      a message waiting goes next, except that a lower class that has been
+      passed over starvation_limit times in a row gets the next turn.
+    - Within a class, services (the packet's 2-byte service id, or the
+      service given to put()) take turns one message at a time, so two
+      bulk transfers share the link instead of running one after the other.
+    - Each class holds at most depth messages. put() waits for room, which
+      slows producers down to the link's pace (backpressure);
+      put_nowait() raises asyncio.QueueFull instead.
+    - A message's packets go out back to back. Other writes never come
+      between the parts of a multi-packet frame, because the glasses'
+      reassembly of interleaved frames is unverified.
+
+Writes go through a frames.FrameWriter, so packets are sized from the MTU.
+Queueing delay, the time from put() until the first packet goes out, is
+kept per class in a gestures.LatencyHistogram.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Union
+
+from frames import HEADER_LEN, MAGIC, FrameWriter
+from gestures import LatencyHistogram
+
+CONTROL = 0         # heartbeats, auth, mode changes
+INTERACTIVE = 1     # AI replies, page flips, captions
+BULK = 2            # teleprompter uploads, task syncs
+PRIORITY_NAMES = ("control", "interactive", "bulk")
+
+
+class ClassStats:
+    """Counters and queueing delay of one priority class."""
+
+    def __init__(self):
+        self.messages = 0
+        self.packets = 0
+        self.bytes = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.blocked = 0            # put() calls that had to wait for room
+        self.blocked_time = 0.0
+        self.delay = LatencyHistogram()
+        self.services: Dict[int, int] = {}      # service -> messages sent
+
+    def summary(self) -> Dict:
+        return {
+            "messages": self.messages, "packets": self.packets, "bytes": self.bytes, "errors": self.errors,
+            "max_depth": self.max_depth, "blocked": self.blocked, "blocked_s": round(self.blocked_time, 3),
+            "delay_mean_ms": round(self.delay.mean_ms, 2), "delay_p95_ms": round(self.delay.percentile(0.95), 2),
+            "delay_max_ms": round(self.delay.max_ms, 2),
+        }
+
+
+class _Entry:
+    __slots__ = ("priority", "service", "packets", "message", "future", "queued")
+
+    def __init__(self, priority: int, service: int, packets: Optional[List[bytes]], message: Optional[tuple],
+                 future: asyncio.Future, queued: float):
+        self.priority = priority
+        self.service = service
+        self.packets = packets
+        self.message = message
+        self.future = future
+        self.queued = queued
+
+
+def packet_service(packet: bytes) -> int:
+    """Service id (hi << 8 | lo) of a content-channel packet, 0 for anything else."""
+    if len(packet) >= HEADER_LEN and packet[0] == MAGIC:
+        return packet[6] << 8 | packet[7]
+    return 0
+
+
+class WriteQueue:
+    """
+    Per-connection write queue with priority classes and backpressure.
+
+    client is a connected BleakClient (or emulator); writer defaults to a
+    FrameWriter on it. The drain task starts on the first put().
+    """
+
+    def __init__(self, client, depth: int = 16, starvation_limit: int = 8,
+                 writer: Optional[FrameWriter] = None, clock: Callable[[], float] = time.monotonic):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.client = client
+        self.writer = writer or FrameWriter(client)
+        self.depth = depth
+        self.starvation_limit = starvation_limit
+        self.clock = clock
+
+        # Per class: service -> FIFO of messages, and the services' turn order
+        self._queues: List[Dict[int, Deque[_Entry]]] = [{} for _ in PRIORITY_NAMES]
+        self._turns: List[Deque[int]] = [deque() for _ in PRIORITY_NAMES]
+        self._depth = [0] * len(PRIORITY_NAMES)
+        self._skipped = [0] * len(PRIORITY_NAMES)
+        self._room = [asyncio.Condition() for _ in PRIORITY_NAMES]
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.classes = [ClassStats() for _ in PRIORITY_NAMES]
+
+    def __len__(self) -> int:
+        return sum(self._depth)
+
+    def depth_of(self, priority: int) -> int:
+        return self._depth[priority]
+
+    # -------------------------------------------------------------------------
+    # Producers
+    # -------------------------------------------------------------------------
+
+    def _entry(self, packets, priority: int, service: Optional[int], message: Optional[tuple]) -> _Entry:
+        if not 0 <= priority < len(PRIORITY_NAMES):
+            raise ValueError(f"Unknown priority {priority}")
+        if self._closing:
+            raise RuntimeError("WriteQueue is closed")
+        if packets is not None:
+            packets = [bytes(packets)] if isinstance(packets, (bytes, bytearray)) else [bytes(p) for p in packets]
+            if not packets:
+                raise ValueError("Nothing to write")
+        if service is None:
+            service = packet_service(packets[0]) if packets else message[1] << 8 | message[2]
+        return _Entry(priority, service, packets, message, asyncio.get_running_loop().create_future(),
+                      self.clock())
+
+    def _enqueue(self, entry: _Entry):
+        queues, turns = self._queues[entry.priority], self._turns[entry.priority]
+        if entry.service not in queues:
+            queues[entry.service] = deque()
+            turns.append(entry.service)
+        queues[entry.service].append(entry)
+        self._depth[entry.priority] += 1
+        stats = self.classes[entry.priority]
+        stats.max_depth = max(stats.max_depth, self._depth[entry.priority])
+        self._ready.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+
+    async def _put(self, entry: _Entry) -> asyncio.Future:
+        priority = entry.priority
+        if self._depth[priority] < self.depth:
+            self._enqueue(entry)
+            return entry.future
+        started = self.clock()
+        room = self._room[priority]
+        async with room:
+            await room.wait_for(lambda: self._depth[priority] < self.depth)
+            stats = self.classes[priority]
+            stats.blocked += 1
+            stats.blocked_time += self.clock() - started
+            entry.queued = self.clock()
+            self._enqueue(entry)
+        return entry.future
+
+    async def put(self, packets: Union[bytes, Sequence[bytes]], priority: int = INTERACTIVE,
+                  service: Optional[int] = None) -> asyncio.Future:
+        """Queue one message (a packet or its packets), waiting while the class is full.
+
+        Returns a future for the packets written; await it, or use send(), to
+        see write errors.
+        """
+        return await self._put(self._entry(packets, priority, service, None))
+
+    def put_nowait(self, packets: Union[bytes, Sequence[bytes]], priority: int = INTERACTIVE,
+                   service: Optional[int] = None) -> asyncio.Future:
+        """Like put(), but raises asyncio.QueueFull instead of waiting."""
+        entry = self._entry(packets, priority, service, None)
+        if self._depth[priority] >= self.depth:
+            raise asyncio.QueueFull(f"{PRIORITY_NAMES[priority]} queue is full ({self.depth})")
+        self._enqueue(entry)
+        return entry.future
+
+    async def send(self, packets: Union[bytes, Sequence[bytes]], priority: int = INTERACTIVE,
+                   service: Optional[int] = None) -> List[bytes]:
+        """Queue one message and wait until it has been written; returns the packets written."""
+        return await (await self.put(packets, priority, service))
+
+    async def send_message(self, seq: int, svc_hi: int, svc_lo: int, payload: bytes,
+                           priority: int = BULK) -> List[bytes]:
+        """Queue a payload that is split into MTU-sized packets when its turn comes."""
+        entry = self._entry(None, priority, None, (seq, svc_hi, svc_lo, payload))
+        return await (await self._put(entry))
+
+    # -------------------------------------------------------------------------
+    # Drain
+    # -------------------------------------------------------------------------
+
+    def _next(self) -> Optional[_Entry]:
+        waiting = [p for p in range(len(PRIORITY_NAMES)) if self._depth[p]]
+        if not waiting:
+            return None
+        priority = waiting[0]
+        starved = [p for p in waiting[1:] if self._skipped[p] >= self.starvation_limit]
+        if starved:
+            priority = starved[0]
+        for p in waiting:
+            self._skipped[p] = 0 if p == priority else self._skipped[p] + 1
+
+        queues, turns = self._queues[priority], self._turns[priority]
+        service = turns.popleft()
+        entry = queues[service].popleft()
+        if queues[service]:
+            turns.append(service)
+        else:
+            del queues[service]
+        self._depth[priority] -= 1
+        return entry
+
+    async def _drain(self):
+        while True:
+            entry = self._next()
+            if entry is None:
+                if self._closing:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            room = self._room[entry.priority]
+            async with room:
+                room.notify()
+            stats = self.classes[entry.priority]
+            stats.delay.record(self.clock() - entry.queued)
+            try:
+                if entry.message is not None:
+                    written = await self.writer.send(*entry.message)
+                else:
+                    written = []
+                    for packet in entry.packets:
+                        written += await self.writer.write(packet)
+            except asyncio.CancelledError:
+                entry.future.cancel()
+                raise
+            except Exception as e:
+                stats.errors += 1
+                if not entry.future.cancelled():
+                    entry.future.set_exception(e)
+                continue
+            stats.messages += 1
+            stats.packets += len(written)
+            stats.bytes += sum(len(packet) for packet in written)
+            stats.services[entry.service] = stats.services.get(entry.service, 0) + 1
+            if not entry.future.cancelled():
+                entry.future.set_result(written)
+
+    async def close(self):
+        """Write everything queued, then stop the drain task."""
+        self._closing = True
+        self._ready.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per class: messages, packets, bytes, errors, depth and queueing delay."""
+        return {name: self.classes[p].summary() for p, name in enumerate(PRIORITY_NAMES)}
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Conversate - Live Captions for G2 Glasses
+
+Streams speech-recognition output to the Conversate service (0x0B-20,
+ConversateMessage in proto/g2_protocol.proto) as live captions:
+
+    - Partial segments replace the live (unfinished) caption; final segments
+      commit it. The caption is word-wrapped to the display width and a
+      rolling window of the last `lines` lines is kept.
+    - Only changed lines are re-sent. A wrapped line that was the same in two
+      partials in a row, with words after it, is committed early as a final.
+      Later partials then carry only the unfinished last line.
+    - Frames are throttled to the link with a token bucket: on average at most
+      max_fps, and never faster than writes are completing, with bursts of
+      `burst` frames (a final plus the live line after it). Segments that
+      arrive while waiting are coalesced into the next frame.
+
+The benchmark feeds a fast simulated transcript (partials every 20 ms, with
+misrecognitions corrected one partial later) through the emulator. It
+compares caption lag and frame rate with sending every segment as it
+arrives:
+
+Usage:
+    python captions.py                          # benchmark both modes on the emulator
+    python captions.py --wpm 400 --link-ms 40
+    python captions.py --glasses                # captions on real glasses (pip install bleak)
+
+NOTE: The ConversateMessage `type` value (1) and how the glasses lay out
+successive finals are not confirmed by a capture yet. Final frames join
+lines with newlines.
+"""
+
+import argparse
+import asyncio
+import re
+import os
+import sys
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+import g2_proto as pb
+from frames import CHAR_NOTIFY, CHAR_WRITE, FrameWriter, build_packet, encode_varint, negotiated_mtu
+from gestures import LatencyHistogram
+
+CONVERSATE = (0x0B, 0x20)
+CONVERSATE_ALT = (0x11, 0x20)
+TYPE_TRANSCRIPT = 1         # assumed
+
+LINE_WIDTH = 28             # characters per caption line
+WINDOW_LINES = 4
+
+
+def wrap_words(words: List[str], width: int) -> List[List[str]]:
+    """Greedy word wrap into lines of words; an over-long word gets a line of its own."""
+    lines, line, used = [], [], 0
+    for word in words:
+        if line and used + 1 + len(word) > width:
+            lines.append(line)
+            line, used = [], 0
+        used += len(word) + (1 if line else 0)
+        line.append(word)
+    if line:
+        lines.append(line)
+    return lines
+
+
+class CaptionService:
+    """
+    Rolling-window live captions on one Conversate connection.
+
+    accept() never blocks: it updates the caption state and wakes the sender
+    task started by start(). close() sends whatever is still pending.
+    """
+
+    def __init__(self, client, width: int = LINE_WIDTH, lines: int = WINDOW_LINES,
+                 max_fps: float = 10.0, burst: int = 2, service: Tuple[int, int] = CONVERSATE,
+                 seq: int = 0x40):
+        self.client = client
+        self.writer = FrameWriter(client)
+        self.width = width
+        self.lines = lines
+        self.max_fps = max_fps
+        self.burst = burst
+        self.service = service
+        self.seq = seq
+        self.msg_id = 0
+
+        self.window: Deque[str] = deque(maxlen=lines)   # committed lines, newest last
+        self._committed_words = 0       # words of the current utterance already committed
+        self._live_lines: List[List[str]] = []
+        self._live_text = ""
+        self._sent_live = ""
+        self._finals: List[str] = []    # committed lines not yet sent
+
+        self._arrivals: Deque[Tuple[int, float]] = deque()     # (segment index, accept time)
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._first = self._last_done = None
+        self.write_time = 0.0           # EWMA of write duration (seconds)
+
+        self.segments = 0
+        self.unchanged = 0
+        self.early_commits = 0
+        self.frames = 0
+        self.final_frames = 0
+        self.bytes_sent = 0
+        self.lag = LatencyHistogram()
+
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+
+    def accept(self, text: str, is_final: bool = False, received: float = None):
+        """Take one recognizer segment: the full text of the current utterance so far."""
+        received = time.monotonic() if received is None else received
+        if self._first is None:
+            self._first = received
+        index = self.segments
+        self.segments += 1
+
+        lines = wrap_words(text.split()[self._committed_words:], self.width)
+        if is_final:
+            self._commit(lines)
+            self._committed_words = 0
+            lines = []
+        else:
+            # Lines before the last that match the previous partial are stable
+            stable = 0
+            previous = self._live_lines
+            while stable < len(lines) - 1 and stable < len(previous) and lines[stable] == previous[stable]:
+                stable += 1
+            if stable:
+                self._commit(lines[:stable])
+                self._committed_words += sum(len(line) for line in lines[:stable])
+                self.early_commits += stable
+                lines = lines[stable:]
+        self._live_lines = lines
+        self._live_text = "\n".join(" ".join(line) for line in lines)
+
+        if not self.pending:
+            self.unchanged += 1
+            return
+        self._arrivals.append((index, received))
+        self._wake.set()
+
+    def _commit(self, lines: List[List[str]]):
+        for words in lines:
+            line = " ".join(words)
+            self._finals.append(line)
+            self.window.append(line)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._finals) or self._live_text != self._sent_live
+
+    def visible(self) -> List[str]:
+        """What the glasses should show: the last `lines` committed + live lines."""
+        live = self._live_text.split("\n") if self._live_text else []
+        return (list(self.window) + live)[-self.lines:]
+
+    # -------------------------------------------------------------------------
+    # Sender
+    # -------------------------------------------------------------------------
+
+    @property
+    def rate(self) -> float:
+        """Sustained frames/s: the max_fps cap, or the rate writes are completing at."""
+        return min(self.max_fps, 1 / self.write_time) if self.write_time else self.max_fps
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self.pending:
+                now, rate = time.monotonic(), self.rate
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled) * rate)
+                self._refilled = now
+                if self._tokens < 1:
+                    # Segments arriving meanwhile are coalesced into the next frame
+                    await asyncio.sleep((1 - self._tokens) / rate)
+                    continue
+                self._tokens -= 1
+                await self._send_next()
+            if self._closed:
+                return
+
+    async def _send_next(self):
+        # The frame shows every segment so far, unless it is a final with a live caption still to follow
+        covered = self.segments
+        if self._finals:
+            text, is_final = "\n".join(self._finals), True
+            self._finals.clear()
+            complete = not self._live_text
+        else:
+            text, is_final, complete = self._live_text, False, True
+
+        self.msg_id += 1
+        payload = pb.encode_conversate_message(TYPE_TRANSCRIPT, self.msg_id,
+                                               pb.encode_conversate_transcript(text, is_final))
+        packet = build_packet(self.seq, *self.service, payload)
+        self.seq = (self.seq + 1) & 0xFF
+
+        started = time.monotonic()
+        written = await self.writer.write(packet)
+        done = time.monotonic()
+        self.write_time += (done - started - self.write_time) / 8
+        self._last_done = done
+        # A final replaces the live caption on the glasses
+        self._sent_live = "" if is_final else text
+
+        self.frames += 1
+        self.final_frames += is_final
+        self.bytes_sent += sum(len(p) for p in written)
+        if not self.pending:
+            covered = self.segments     # segments that arrived during the write changed nothing
+        elif not complete:
+            return
+        while self._arrivals and self._arrivals[0][0] < covered:
+            self.lag.record(done - self._arrivals.popleft()[1])
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    @property
+    def fps(self) -> float:
+        if self._first is None or self._last_done is None or self._last_done <= self._first:
+            return 0.0
+        return self.frames / (self._last_done - self._first)
+
+    def summary(self) -> dict:
+        return {
+            "segments": self.segments, "frames": self.frames, "fps": self.fps, "bytes": self.bytes_sent,
+            "lag_mean_ms": self.lag.mean_ms, "lag_p90_ms": self.lag.percentile(0.90),
+            "lag_max_ms": self.lag.max_ms,
+        }
+
+
+class NaiveCaptions:
+    """Baseline: every segment is sent as it arrives, full utterance text, in order."""
+
+    def __init__(self, client, service: Tuple[int, int] = CONVERSATE, seq: int = 0x40):
+        self.client = client
+        self.writer = FrameWriter(client)
+        self.service = service
+        self.seq = seq
+        self.msg_id = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._first = self._last_done = None
+
+        self.segments = 0
+        self.frames = 0
+        self.bytes_sent = 0
+        self.lag = LatencyHistogram()
+
+    def accept(self, text: str, is_final: bool = False, received: float = None):
+        received = time.monotonic() if received is None else received
+        if self._first is None:
+            self._first = received
+        self.segments += 1
+        self._queue.put_nowait((text, is_final, received))
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        self._queue.put_nowait(None)
+        await self._task
+
+    async def _run(self):
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            text, is_final, received = item
+            self.msg_id += 1
+            payload = pb.encode_conversate_message(TYPE_TRANSCRIPT, self.msg_id,
+                                                   pb.encode_conversate_transcript(text, is_final))
+            packet = build_packet(self.seq, *self.service, payload)
+            self.seq = (self.seq + 1) & 0xFF
+            written = await self.writer.write(packet)
+            self._last_done = time.monotonic()
+            self.frames += 1
+            self.bytes_sent += sum(len(p) for p in written)
+            self.lag.record(self._last_done - received)
+
+    fps = CaptionService.fps
+    summary = CaptionService.summary
+
+
+# =============================================================================
+# Simulated Recognizer
+# =============================================================================
+
+TRANSCRIPT = (
+    "Welcome everyone to the design review. Today we walk through the new caption "
+    "pipeline for the glasses. The phone receives partial transcripts many times a "
+    "second, but the display link only takes a few frames. So we keep a rolling "
+    "window, send only the lines that changed, and commit stable lines early. "
+    "Questions are welcome at the end."
+)
+
+
+def mishear(word: str) -> str:
+    return word[:-2] + "ah" if len(word) > 3 else word + "h"
+
+
+async def transcript_feed(sink, text: str = TRANSCRIPT, wpm: float = 300, partial_ms: float = 20,
+                          revise_every: int = 5):
+    """
+    Feed text to sink.accept() like a streaming recognizer: a new word every
+    60/wpm seconds, partials every partial_ms, and every revise_every-th word
+    misheard for the first partials then corrected. Each sentence ends
+    with a final.
+    """
+    word_time = 60 / wpm
+    count = 0
+    for sentence in re.split(r"(?<=[.?!])\s+", text.strip()):
+        heard: List[str] = []
+        for word in sentence.split():
+            count += 1
+            heard.append(word)
+            wrong = heard[:-1] + [mishear(word)] if revise_every and count % revise_every == 0 else None
+            end = time.monotonic() + word_time
+            first = True
+            while time.monotonic() < end:
+                sink.accept(" ".join(wrong if wrong and first else heard))
+                first = False
+                await asyncio.sleep(partial_ms / 1000)
+        sink.accept(" ".join(heard), is_final=True)
+
+
+# =============================================================================
+# Glasses
+# =============================================================================
+
+def build_auth_packets() -> list:
+    """7-packet authentication sequence (same bytes as examples/even-ai)."""
+    ts = encode_varint(int(time.time()))
+    txid = bytes([0xE8, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x01])
+    capability = bytes([0x1A, 0x04, 0x08, 0x01, 0x10, 0x04])
+    return [
+        build_packet(0x01, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x0C]) + capability),
+        build_packet(0x02, 0x80, 0x20, bytes([0x08, 0x05, 0x10, 0x0E, 0x22, 0x02, 0x08, 0x02])),
+        build_packet(0x03, 0x80, 0x20, bytes([0x08, 0x80, 0x01, 0x10, 0x0F, 0x82, 0x08, 0x11, 0x08])
+                     + ts + bytes([0x10]) + txid),
+        build_packet(0x04, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x10]) + capability),
+        build_packet(0x05, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x11]) + capability),
+        build_packet(0x06, 0x80, 0x20, bytes([0x08, 0x05, 0x10, 0x12, 0x22, 0x02, 0x08, 0x01])),
+        build_packet(0x07, 0x80, 0x20, bytes([0x08, 0x80, 0x01, 0x10, 0x13, 0x82, 0x08, 0x11, 0x08])
+                     + ts + bytes([0x10]) + txid),
+    ]
+
+
+async def connect_glasses(left: bool = False):
+    from bleak import BleakClient, BleakScanner
+
+    print("Scanning for G2 glasses...")
+    devices = await BleakScanner.discover(timeout=10.0)
+    pattern = "_L_" if left else "_R_"
+    device = next((d for d in devices if d.name and "G2" in d.name and pattern in d.name), None)
+    if not device:
+        print("ERROR: No G2 glasses found")
+        return None
+    print(f"  Using: {device.name}")
+    client = BleakClient(device)
+    await client.connect()
+    await client.start_notify(CHAR_NOTIFY, lambda sender, data: None)
+    for pkt in build_auth_packets():
+        await client.write_gatt_char(CHAR_WRITE, pkt, response=False)
+        await asyncio.sleep(0.1)
+    await asyncio.sleep(0.5)
+    print(f"  Authenticated! (MTU {await negotiated_mtu(client)})")
+    return client
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def run(sink, args):
+    sink.start()
+    await transcript_feed(sink, wpm=args.wpm, partial_ms=args.partial_ms)
+    await sink.close()
+    return sink
+
+
+async def main():
+    from emulator import G2Emulator
+
+    parser = argparse.ArgumentParser(description='Live captions on the Conversate service')
+    parser.add_argument('--wpm', type=float, default=300, help='Simulated speaking rate')
+    parser.add_argument('--partial-ms', type=float, default=20, help='Recognizer partial interval')
+    parser.add_argument('--link-ms', type=float, default=30, help='Emulated time per write')
+    parser.add_argument('--max-fps', type=float, default=10, help='Caption frame rate cap')
+    parser.add_argument('--alt', action='store_true', help='Use the alternative 0x11-20 service')
+    parser.add_argument('--glasses', action='store_true', help='Send to real glasses instead of the emulator')
+    args = parser.parse_args()
+    service = CONVERSATE_ALT if args.alt else CONVERSATE
+
+    if args.glasses:
+        client = await connect_glasses()
+        if client is None:
+            return
+        try:
+            captions = await run(CaptionService(client, max_fps=args.max_fps, service=service), args)
+        finally:
+            await client.disconnect()
+        print(captions.summary())
+        return
+
+    expected = TRANSCRIPT.split()
+    print(f"Transcript: {len(expected)} words at {args.wpm:g} wpm, partials every {args.partial_ms:g} ms, "
+          f"{args.link_ms:g} ms per write\n")
+    print(f"{'mode':<10} {'segments':>8} {'frames':>7} {'fps':>6} {'bytes':>7} "
+          f"{'lag mean':>8} {'p90':>7} {'max':>7}  screen")
+    for name in ("naive", "captions"):
+        glasses = G2Emulator(write_latency=args.link_ms / 1000)
+        if name == "naive":
+            sink = NaiveCaptions(glasses, service=service)
+        else:
+            sink = CaptionService(glasses, max_fps=args.max_fps, service=service)
+        await run(sink, args)
+        shown = " ".join(glasses.captions).split()
+        ok = "ok" if shown == expected and not glasses.caption_live else "MISMATCH"
+        s = sink.summary()
+        print(f"{name:<10} {s['segments']:>8} {s['frames']:>7} {s['fps']:>6.1f} {s['bytes']:>7} "
+              f"{s['lag_mean_ms']:>6.0f}ms {s['lag_p90_ms']:>5.0f}ms {s['lag_max_ms']:>5.0f}ms  {ok}")
+        if name == "captions":
+            print(f"\n{sink.unchanged} unchanged segments skipped, {sink.early_commits} lines committed early, "
+                  f"{sink.final_frames} final frames")
+            print("Window:\n  " + "\n  ".join(sink.visible()))
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted")
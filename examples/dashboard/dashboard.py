@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Dashboard - Widget Refresh Scheduler for G2 Glasses
+
+Keeps calendar, weather and task widgets on the glasses dashboard current
+(service 0x07-20, DashboardMessage in proto/g2_protocol.proto) without
+re-sending unchanged data:
+
+    - Each WidgetSource is polled on its own interval.
+    - The encoded widget (type + content) is hashed; a widget is only sent
+      when its hash differs from what the glasses last received.
+    - Changes that land within `window` seconds of each other are sent as
+      one back-to-back burst, and a widget that changes twice inside the
+      window is sent once.
+
+The demo simulates an hour (or more) of polling in virtual time and compares
+frames sent with naive polling (one frame per poll):
+
+Usage:
+    python dashboard.py                         # 1 simulated hour, emulator
+    python dashboard.py --hours 8 --window 2
+    python dashboard.py --realtime --hours 0.02 # same sources on the wall clock
+
+NOTE: The 0x07-20 dashboard layout is only partly known. DashboardMessage
+type 10 comes from the R1 capture notes (docs/R1_ANALYSIS.md), and the
+widget type numbers and content formats below are assumptions.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import inspect
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+import g2_proto as pb
+from frames import FrameWriter, build_packet
+
+# Placeholder: cmd=10 is what docs/R1_ANALYSIS.md saw the glasses send on 0x07-20 for
+# dashboard navigation. It is also EvenAICommand.CONFIG on the same service, a known
+# collision; the phone -> glasses dashboard type has not been captured.
+DASHBOARD_TYPE = 10
+
+# Widget types (assumed)
+WIDGET_CALENDAR = 1
+WIDGET_WEATHER = 2
+WIDGET_TASKS = 3
+
+Content = Union[str, bytes]
+
+
+class WidgetSource:
+    """
+    One widget and how to refresh it.
+
+    fetch(now) returns the widget content (str or bytes); it may be a
+    coroutine function. now is the scheduler clock, so sources can be
+    driven in virtual time.
+    """
+
+    def __init__(self, name: str, widget_type: int, interval: float,
+                 fetch: Callable[[float], Union[Content, Awaitable[Content]]]):
+        self.name = name
+        self.widget_type = widget_type
+        self.interval = interval
+        self.fetch = fetch
+
+        self.next_due = 0.0
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+
+    async def poll(self, now: float) -> Content:
+        result = self.fetch(now)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+
+class DashboardScheduler:
+    """
+    Polls WidgetSources and sends changed widgets in coalesced bursts.
+
+    Drive it with run() on the wall clock, or call step(now) with any clock
+    (simulate() does this in virtual time). step() returns the next time it
+    needs to run.
+    """
+
+    def __init__(self, client, window: float = 0.5, seq: int = 0x60):
+        self.client = client
+        self.writer = FrameWriter(client)
+        self.window = window
+        self.seq = seq
+        self.msg_id = 0
+        self.sources: List[WidgetSource] = []
+
+        self._sent_hash: Dict[int, bytes] = {}      # widget type -> hash on the glasses
+        self._pending: Dict[int, bytes] = {}        # widget type -> encoded widget to send
+        self._window_end: Optional[float] = None
+
+        self.polls = 0
+        self.unchanged = 0
+        self.superseded = 0
+        self.frames_sent = 0
+        self.bursts = 0
+        self.bytes_sent = 0
+
+    def add(self, source: WidgetSource):
+        self.sources.append(source)
+
+    @staticmethod
+    def encode_widget(widget_type: int, content: Content) -> bytes:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return pb.encode_dashboard_widget(widget_type, content)
+
+    @staticmethod
+    def digest(widget: bytes) -> bytes:
+        return hashlib.blake2b(widget, digest_size=16).digest()
+
+    async def _poll(self, source: WidgetSource, now: float):
+        try:
+            content = await source.poll(now)
+        except Exception as e:
+            source.errors += 1
+            print(f"  Widget {source.name} failed: {e}")
+            return
+        source.polls += 1
+        self.polls += 1
+
+        widget = self.encode_widget(source.widget_type, content)
+        digest = self.digest(widget)
+        if digest == self._sent_hash.get(source.widget_type):
+            self._pending.pop(source.widget_type, None)     # changed back before it was sent
+            if not self._pending:
+                self._window_end = None                     # nothing left to send in this window
+            self.unchanged += 1
+            return
+        source.changes += 1
+        if source.widget_type in self._pending:
+            self.superseded += 1
+        self._pending[source.widget_type] = widget
+        if self._window_end is None:
+            self._window_end = now + self.window
+
+    async def _burst(self):
+        if not self._pending:
+            self._window_end = None
+            return
+        for widget_type, widget in sorted(self._pending.items()):
+            self.msg_id += 1
+            payload = pb.encode_dashboard_message(DASHBOARD_TYPE, self.msg_id, widget)
+            packet = build_packet(self.seq, 0x07, 0x20, payload)
+            self.seq = (self.seq + 1) & 0xFF
+            written = await self.writer.write(packet)
+            self._sent_hash[widget_type] = self.digest(widget)
+            self.frames_sent += 1
+            self.bytes_sent += sum(len(p) for p in written)
+        self._pending.clear()
+        self._window_end = None
+        self.bursts += 1
+
+    async def step(self, now: float) -> float:
+        """Poll due sources, send the burst if its window closed; returns the next wake time."""
+        due = [s for s in self.sources if s.next_due <= now]
+        for source in due:
+            source.next_due = now + source.interval
+        if due:
+            await asyncio.gather(*(self._poll(s, now) for s in due))
+
+        if self._window_end is not None and now >= self._window_end:
+            await self._burst()
+
+        wake = min(s.next_due for s in self.sources)
+        if self._window_end is not None:
+            wake = min(wake, self._window_end)
+        return wake
+
+    async def run(self, duration: Optional[float] = None):
+        """Run on the wall clock (time.monotonic), forever or for duration seconds."""
+        start = time.monotonic()
+        for source in self.sources:
+            source.next_due = start
+        while duration is None or time.monotonic() - start < duration:
+            wake = await self.step(time.monotonic())
+            await asyncio.sleep(max(0.0, wake - time.monotonic()))
+
+    async def simulate(self, duration: float, start: float = 0.0):
+        """Run in virtual time from start to start + duration, as fast as possible."""
+        for source in self.sources:
+            source.next_due = start
+        now = start
+        while now < start + duration:
+            now = await self.step(now)
+        if self._pending:
+            await self._burst()
+
+    @property
+    def naive_frames(self) -> int:
+        """Frames naive polling would have sent: one per poll."""
+        return self.polls
+
+    def print_stats(self, hours: float):
+        print(f"\n{'widget':<10} {'every':>7} {'polls':>7} {'changes':>8}")
+        for source in self.sources:
+            print(f"{source.name:<10} {source.interval:>6.0f}s {source.polls:>7} {source.changes:>8}")
+        print(f"\nPolls:         {self.polls} ({self.unchanged} unchanged)")
+        print(f"Frames sent:   {self.frames_sent} in {self.bursts} bursts "
+              f"({self.superseded} superseded inside the window), {self.bytes_sent} bytes")
+        per_hour = self.frames_sent / hours if hours else 0
+        naive = self.naive_frames / hours if hours else 0
+        print(f"Frames/hour:   {per_hour:.0f} vs {naive:.0f} naive polling"
+              + (f" ({naive / per_hour:.0f}x fewer)" if per_hour else ""))
+
+
+# =============================================================================
+# Demo Sources
+# =============================================================================
+
+MEETINGS = ["09:00 Standup", "10:30 Design review", "12:00 Lunch", "14:00 1:1",
+            "15:30 Planning", "17:00 Gym"]
+WEATHER = ["Sunny 18C", "Sunny 19C", "Cloudy 19C", "Cloudy 17C", "Rain 15C", "Rain 14C", "Cloudy 15C"]
+TASKS = ["Reply to Sam", "Book flights", "Review PR #42", "Buy milk", "Call bank", "Renew passport"]
+
+
+def calendar(now: float) -> str:
+    """Next meeting; advances every 90 minutes."""
+    return "Next: " + MEETINGS[int(now // 5400) % len(MEETINGS)]
+
+
+def weather(now: float) -> str:
+    """Conditions; change roughly every 20 minutes."""
+    return WEATHER[int(now // 1200) % len(WEATHER)]
+
+
+def tasks(now: float) -> str:
+    """Open tasks; one is ticked off every ~7 minutes, the list refills hourly."""
+    done = int(now % 3600 // 420)
+    remaining = TASKS[done % len(TASKS):] or ["All done"]
+    return "\n".join(remaining[:3])
+
+
+def demo_sources() -> List[WidgetSource]:
+    return [
+        WidgetSource("calendar", WIDGET_CALENDAR, 60, calendar),
+        WidgetSource("weather", WIDGET_WEATHER, 30, weather),
+        WidgetSource("tasks", WIDGET_TASKS, 15, tasks),
+    ]
+
+
+async def main():
+    from emulator import G2Emulator
+
+    parser = argparse.ArgumentParser(description='Dashboard widget scheduler demo (emulator)')
+    parser.add_argument('--hours', type=float, default=1.0, help='Time to simulate (default: 1 hour)')
+    parser.add_argument('--window', type=float, default=0.5, help='Coalescing window in seconds')
+    parser.add_argument('--realtime', action='store_true', help='Run on the wall clock instead of virtual time')
+    args = parser.parse_args()
+
+    glasses = G2Emulator(write_latency=0.0)
+    scheduler = DashboardScheduler(glasses, window=args.window)
+    for source in demo_sources():
+        scheduler.add(source)
+
+    started = time.perf_counter()
+    if args.realtime:
+        await scheduler.run(args.hours * 3600)
+    else:
+        await scheduler.simulate(args.hours * 3600)
+    elapsed = time.perf_counter() - started
+
+    print(f"Simulated {args.hours:g} h in {elapsed:.2f} s" if not args.realtime else f"Ran {elapsed:.1f} s")
+    scheduler.print_stats(args.hours)
+    shown = {t: c.decode("utf-8").replace("\n", " / ") for t, c in sorted(glasses.dashboard.items())}
+    print(f"Glasses show:  {shown}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted")
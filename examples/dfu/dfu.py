@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+DFU - Push a Firmware Package over Secure DFU
+
+Streams the .dat init packets and .bin images of a DFU package (read with
+FirmwarePackage from tools/extract_firmware.py) with DfuClient from
+examples/common/dfu.py:
+
+    - against DfuEmulator, a simulated bootloader on a virtual clock, it
+      sweeps PRN intervals and chunk sizes and reports the simulated
+      throughput, retries and dropped packets of each, so both can be
+      tuned without touching hardware
+    - a resume run drops the link halfway through and reconnects; the
+      client picks up where the target's SELECT says it stopped
+    - with --address it updates one component on a real device that is
+      already in DFU mode (the bootloader resets after each image)
+
+Usage:
+    python dfu.py                                   # synthetic 400 KB application, default sweep
+    python dfu.py --package firmware.zip --prn 0 8 12 --chunk 128 244
+    python dfu.py --packets-per-event 6 --buffers 4 # a faster link into a slower target
+    python dfu.py --package firmware.zip --component application --address AA:BB:CC:DD:EE:FF
+
+NOTE: The G2's DFU exchange has not been captured. This follows the nRF5
+SDK Secure DFU bootloader (docs/firmware-format.md has the init packet
+layout). Updating real glasses can brick them; only use --address on a
+device you can recover.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import random
+import sys
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "common"))
+sys.path.insert(0, os.path.join(HERE, "..", "..", "tools"))
+from dfu import DfuClient, DfuError
+from emulator import DfuEmulator
+from extract_firmware import FirmwarePackage, decode_init_packet
+from frames import encode_varint
+
+# Nordic's update order: SoftDevice and bootloader before the application
+SWEEP_PRN = [0, 4, 8, 12, 24]
+SWEEP_CHUNK = [20, 128, 244]
+# A real target is not known to keep up, so receipts pace the link unless --prn says otherwise
+DEVICE_PRN = 12
+
+COMPONENT_ORDER = ["softdevice_bootloader", "softdevice", "bootloader", "application"]
+
+
+def _field(number: int, value) -> bytes:
+    if isinstance(value, int):
+        return encode_varint(number << 3) + encode_varint(value)
+    return encode_varint(number << 3 | 2) + encode_varint(len(value)) + value
+
+
+def make_init_packet(firmware: bytes, fw_version: int = 1) -> bytes:
+    """Unsigned application init packet (dfu-cc.proto) for a synthetic image."""
+    digest = _field(1, 3) + _field(2, hashlib.sha256(firmware).digest()[::-1])
+    init = (_field(1, fw_version) + _field(2, 52) + _field(3, encode_varint(0xFFFE)) + _field(4, 0)
+            + _field(7, len(firmware)) + _field(8, digest))
+    command = _field(1, 1) + _field(2, init)
+    return _field(1, command)
+
+
+def synthetic_images(size: int, seed: int = 1) -> List[Tuple[str, bytes, bytes]]:
+    rng = random.Random(seed)
+    firmware = rng.randbytes(size)
+    return [("application", make_init_packet(firmware), firmware)]
+
+
+def package_images(path: Path, component: str = None) -> List[Tuple[str, bytes, bytes]]:
+    """(name, init packet, image) of each component, in update order."""
+    package = FirmwarePackage(path)
+    with zipfile.ZipFile(path) as zf:
+        package.load_manifest(zf)
+        names = sorted(package.components, key=lambda n: COMPONENT_ORDER.index(n)
+                       if n in COMPONENT_ORDER else len(COMPONENT_ORDER))
+        if component:
+            names = [component] if component in package.components else []
+        images = []
+        for name in names:
+            info = package.components[name]
+            if not info.dat_file:
+                raise ValueError(f"{name} has no init packet")
+            images.append((name, zf.read(info.dat_file), zf.read(info.bin_file)))
+    return images
+
+
+def validate(init: bytes) -> Tuple[int, bytes]:
+    """DfuEmulator check: image size and SHA-256 promised by the init packet."""
+    packet = decode_init_packet(init)
+    if packet.firmware_sha256 is None:
+        raise ValueError("init packet has no SHA-256")
+    return packet.image_size, bytes.fromhex(packet.firmware_sha256)
+
+
+def emulator(args, **kwargs) -> DfuEmulator:
+    return DfuEmulator(mtu=args.mtu, packets_per_event=args.packets_per_event, buffers=args.buffers,
+                       validate=validate, **kwargs)
+
+
+# =============================================================================
+# Emulated Runs
+# =============================================================================
+
+async def run_emulated(images, args, prn: int, chunk: int) -> Dict:
+    """Update every image on a fresh emulated target; totals over the package."""
+    totals = {"seconds": 0.0, "bytes": 0, "sent": 0, "packets": 0, "receipts": 0, "retries": 0,
+              "dropped": 0, "ok": True, "error": ""}
+    for name, init, firmware in images:
+        target = emulator(args)
+        dfu = DfuClient(target, prn=prn, chunk=chunk, clock=target.clock)
+        await dfu.start()
+        try:
+            result = await dfu.update(init, firmware)
+        except DfuError as e:
+            totals.update(ok=False, error=f"{name}: {e}")
+        else:
+            totals["bytes"] += result.bytes
+            totals["ok"] &= bool(target.completed)
+        totals["seconds"] += target.now
+        for key in ("sent", "packets", "receipts", "retries"):
+            totals[key] += getattr(dfu, key)
+        totals["dropped"] += target.dropped
+        if not totals["ok"]:
+            break
+    return totals
+
+
+async def sweep(images, args):
+    total = sum(len(init) + len(firmware) for _, init, firmware in images)
+    print(f"{len(images)} image(s), {total:,} bytes; emulated link: MTU {args.mtu}, "
+          f"{args.packets_per_event} packets per 7.5 ms event, {args.buffers} target buffers\n")
+    print(f"{'PRN':>4} {'chunk':>6} {'seconds':>8} {'KB/s':>7} {'packets':>8} {'receipts':>8} "
+          f"{'retries':>7} {'dropped':>7}  result")
+    best = None
+    for chunk in args.chunk:
+        for prn in args.prn:
+            run = await run_emulated(images, args, prn, chunk)
+            rate = run["bytes"] / run["seconds"] / 1024 if run["ok"] and run["seconds"] else 0.0
+            print(f"{prn:>4} {chunk:>6} {run['seconds']:>8.2f} {rate:>7.1f} {run['packets']:>8} "
+                  f"{run['receipts']:>8} {run['retries']:>7} {run['dropped']:>7}  "
+                  f"{'ok' if run['ok'] else 'FAILED ' + run['error']}")
+            if run["ok"] and (best is None or rate > best[0]):
+                best = (rate, prn, chunk)
+    if best:
+        print(f"\nFastest: PRN {best[1]}, chunk {best[2]} ({best[0]:.1f} KB/s)")
+    return best
+
+
+async def resume_demo(images, args, prn: int, chunk: int):
+    """Drop the link halfway through the last image and resume after reconnecting."""
+    name, init, firmware = images[-1]
+    target = emulator(args, disconnect_at=len(firmware) // 2)
+    dfu = DfuClient(target, prn=prn, chunk=chunk, clock=target.clock)
+    await dfu.start()
+    try:
+        await dfu.update(init, firmware)
+    except ConnectionError as e:
+        print(f"\nResume: {name} {e} at {len(target.firmware):,} of {len(firmware):,} bytes "
+              f"({target.executed:,} executed)")
+    await target.connect()
+    dfu = DfuClient(target, prn=prn, chunk=chunk, clock=target.clock)
+    await dfu.start()
+    result = await dfu.update(init, firmware)
+    print(f"  reconnected: {result.resumed:,} bytes resumed, {result.sent:,} sent, "
+          f"image {'verified' if target.completed else 'NOT verified'} in {target.now:.2f} s total")
+    if not target.completed:
+        raise AssertionError("Resumed update did not verify")
+
+
+# =============================================================================
+# Real Device
+# =============================================================================
+
+async def run_device(address: str, images, prn: int, chunk: Optional[int]):
+    """Update the first image; chunk None sizes packets from the negotiated MTU."""
+    from bleak import BleakClient
+
+    name, init, firmware = images[0]
+    async with BleakClient(address) as client:
+        dfu = DfuClient(client, prn=prn, chunk=chunk)
+        print(f"Connected to {address}; sending {name} ({len(firmware):,} bytes), PRN {prn}, chunk {dfu.chunk}")
+        await dfu.start()
+        result = await dfu.update(init, firmware, progress=lambda done, size: print(
+            f"\r  {done * 100 // size:>3}%", end="", flush=True))
+        print(f"\n  {result.bytes:,} bytes in {result.seconds:.1f} s ({result.rate / 1024:.1f} KB/s), "
+              f"{result.resumed:,} resumed, {result.retries} retries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Secure DFU client with an emulated target for tuning')
+    parser.add_argument('--package', type=Path, help='DFU package (.zip; default: synthetic application)')
+    parser.add_argument('--component', help='Only this component (e.g. application)')
+    parser.add_argument('--size', type=int, default=400, help='Synthetic image size in KB')
+    parser.add_argument('--prn', type=int, nargs='+',
+                        help=f'PRN intervals (sweep default: {SWEEP_PRN}; --address default: {DEVICE_PRN})')
+    parser.add_argument('--chunk', type=int, nargs='+',
+                        help=f'Packet sizes (sweep default: {SWEEP_CHUNK}; --address default: MTU - 3)')
+    parser.add_argument('--mtu', type=int, default=247, help='Emulated ATT MTU')
+    parser.add_argument('--packets-per-event', type=int, default=4, help='Emulated packets per connection event')
+    parser.add_argument('--buffers', type=int, default=8, help='Emulated target receive buffers')
+    parser.add_argument('--address', help='Update a real device in DFU mode (pip install bleak)')
+    args = parser.parse_args()
+
+    try:
+        images = package_images(args.package, args.component) if args.package else synthetic_images(args.size * 1024)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not images:
+        print(f"Error: no component {args.component!r} in {args.package}")
+        sys.exit(1)
+
+    if args.address:
+        asyncio.run(run_device(args.address, images, args.prn[0] if args.prn else DEVICE_PRN,
+                               args.chunk[0] if args.chunk else None))
+        return
+    args.prn = args.prn or SWEEP_PRN
+    args.chunk = args.chunk or SWEEP_CHUNK
+    best = asyncio.run(sweep(images, args))
+    if best:
+        asyncio.run(resume_demo(images, args, best[1], best[2]))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nInterrupted")
@@ -169,28 +169,108 @@ def build_reply(seq: int, magic: int, text: str) -> bytes:
 # Main
 # ============================================================
 
-async def display_qa(client, question: str, answer: str):
+AI_STATUS_WAKE_UP = 1
+AI_STATUS_ENTER = 2
+AI_STATUS_EXIT = 3
+
+
+def decode_varint(data: bytes, offset: int) -> tuple:
+    """Decode protobuf varint, return (value, new_offset)."""
+    result = 0
+    shift = 0
+    while offset < len(data):
+        byte = data[offset]
+        result |= (byte & 0x7F) << shift
+        offset += 1
+        if not (byte & 0x80):
+            break
+        shift += 7
+    return result, offset
+
+
+def parse_ctrl_status(data: bytes):
+    """Return the CTRL status of an Even AI event from the glasses (0x07-00/0x07-01), else None."""
+    if len(data) < 12 or data[0] != 0xAA or data[6] != 0x07 or data[7] not in (0x00, 0x01):
+        return None
+
+    payload = data[8:-2]
+    command_id = ctrl = None
+    offset = 0
+    while offset < len(payload):
+        key, offset = decode_varint(payload, offset)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, offset = decode_varint(payload, offset)
+            if field == 1:
+                command_id = value
+        elif wire_type == 2:
+            length, offset = decode_varint(payload, offset)
+            if field == 3:
+                ctrl = payload[offset:offset + length]
+            offset += length
+        else:
+            return None
+
+    if command_id != 1 or not ctrl or ctrl[0] != 0x08:
+        return None
+    return decode_varint(ctrl, 1)[0]
+
+
+class EvenAISession:
+    """
+    Even AI mode held open across Q&A displays.
+
+    CTRL(ENTER) is only sent when the session is not already in AI mode;
+    the glasses' WAKE_UP/EXIT events (fed through handle_notify) drop it
+    back out so the next display re-enters.
+    """
+
+    def __init__(self, client, seq: int = 0x08, magic: int = 100):
+        self.client = client
+        self.seq = seq
+        self.magic = magic
+        self.active = False
+
+    def next_ids(self) -> tuple:
+        """Allocate the next (seq, magic) pair. magicRandom stays a one-byte varint."""
+        ids = (self.seq, self.magic)
+        self.seq = (self.seq + 1) & 0xFF
+        self.magic = self.magic % 0x7F + 1
+        return ids
+
+    def handle_notify(self, sender, data: bytearray):
+        """Notification callback: track AI mode from CTRL status events."""
+        status = parse_ctrl_status(bytes(data))
+        if status == AI_STATUS_ENTER:
+            self.active = True
+        elif status in (AI_STATUS_WAKE_UP, AI_STATUS_EXIT):
+            self.active = False
+
+    async def ensure_active(self):
+        """Enter AI mode (REQUIRED before ASK/REPLY) unless already in it."""
+        if self.active:
+            return
+        print(f"  Entering AI mode...")
+        await self.client.write_gatt_char(CHAR_WRITE, build_ctrl_enter(*self.next_ids()), response=False)
+        self.active = True
+        await asyncio.sleep(0.3)
+
+
+async def display_qa(session: EvenAISession, question: str, answer: str):
     """Display a question and answer on the Even AI card."""
-    seq = 0x08
-    magic = 100
+    client = session.client
 
-    # 1. Enter AI mode (REQUIRED!)
-    print(f"  Entering AI mode...")
-    await client.write_gatt_char(CHAR_WRITE, build_ctrl_enter(seq, magic), response=False)
-    seq += 1
-    magic += 1
-    await asyncio.sleep(0.3)
+    # 1. Enter AI mode (only if the glasses are not already in it)
+    await session.ensure_active()
 
     # 2. Display question
     print(f"  Displaying question: {question}")
-    await client.write_gatt_char(CHAR_WRITE, build_ask(seq, magic, question), response=False)
-    seq += 1
-    magic += 1
+    await client.write_gatt_char(CHAR_WRITE, build_ask(*session.next_ids(), question), response=False)
     await asyncio.sleep(1.0)
 
     # 3. Display answer
     print(f"  Displaying answer: {answer}")
-    await client.write_gatt_char(CHAR_WRITE, build_reply(seq, magic, answer), response=False)
+    await client.write_gatt_char(CHAR_WRITE, build_reply(*session.next_ids(), answer), response=False)
 
 
 async def main():
@@ -229,7 +309,8 @@ async def main():
     async with BleakClient(device) as client:
         print("  Connected!")
 
-        await client.start_notify(CHAR_NOTIFY, lambda s, d: None)
+        session = EvenAISession(client)
+        await client.start_notify(CHAR_NOTIFY, session.handle_notify)
 
         # Authenticate
         print("\nAuthenticating...")
@@ -241,7 +322,7 @@ async def main():
 
         # Display Q&A
         print(f"\nDisplaying Q&A...")
-        await display_qa(client, question, answer)
+        await display_qa(session, question, answer)
 
         print("\n" + "=" * 50)
         print("Done! Check your glasses.")
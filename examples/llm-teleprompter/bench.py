@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+LLM Teleprompter Benchmark - Offline, End-to-End
+
+Drives query_and_display against the G2 device emulator with the stub LLM
+provider and reports question-to-display latency percentiles. The "legacy"
+mode replays the original per-question sequence (CTRL(ENTER) + 0.3 s,
+ASK + 0.5 s, blocking LLM call, REPLY) for a before/after comparison with
+the warm session.
+
+Usage:
+    python bench.py                          # 50 questions, legacy vs warm
+    python bench.py -n 200 --first-token-ms 150 --tps 80 --error-rate 0.05
+    python bench.py --via openai             # through stub_server + openai client
+    python bench.py --via ollama             # through stub_server + ollama client
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+
+from emulator import G2Emulator
+from frames import CHAR_NOTIFY
+from gestures import GestureEngine
+
+from llm_teleprompter import (
+    CHAR_WRITE, SYSTEM_PROMPT, EvenAISession, PageFlipper, build_ask, build_ctrl_enter,
+    build_reply, percentile, query_and_display, truncate_for_display,
+)
+from providers import LLMProvider, StubProvider, get_provider
+from stub_server import StubServer
+
+QUESTIONS = [
+    "What is 2 + 2?",
+    "What is the capital of France?",
+    "Explain quantum computing",
+    "Why is the sky blue?",
+    "Is water wet?",
+]
+
+
+async def legacy_query_and_display(client, provider: LLMProvider, question: str, seq: int, magic: int):
+    """The original per-question flow, kept for comparison."""
+    await client.write_gatt_char(CHAR_WRITE, build_ctrl_enter(seq, magic), response=False)
+    seq += 1
+    magic += 1
+    await asyncio.sleep(0.3)
+
+    await client.write_gatt_char(CHAR_WRITE, build_ask(seq, magic, truncate_for_display(question, 150)),
+                                 response=False)
+    seq += 1
+    magic += 1
+    await asyncio.sleep(0.5)
+
+    try:
+        answer = truncate_for_display(provider.query(question, system_prompt=SYSTEM_PROMPT), 200)
+    except Exception as e:
+        answer = f"Error: {str(e)[:50]}"
+
+    await client.write_gatt_char(CHAR_WRITE, build_reply(seq, magic, answer), response=False)
+    return (seq + 1) & 0xFF, magic % 0x7F + 1
+
+
+async def run(mode: str, provider: LLMProvider, count: int, write_latency: float) -> list:
+    """Ask count questions; returns per-question latency until the REPLY is on the glasses."""
+    glasses = G2Emulator(write_latency=write_latency)
+    session = EvenAISession(glasses)
+    gestures = GestureEngine()
+    flipper = PageFlipper(session.queue, gestures)
+
+    def on_notify(sender, data: bytearray):
+        session.handle_notify(bytes(data))
+        gestures(sender, data)
+
+    await glasses.start_notify(CHAR_NOTIFY, on_notify)
+
+    latencies = []
+    seq, magic = 0x08, 100
+    quiet = open(os.devnull, "w")
+    for i in range(count):
+        question = QUESTIONS[i % len(QUESTIONS)]
+        replies = sum(1 for _, kind, _ in glasses.displayed if kind == "reply")
+        started = time.monotonic()
+
+        stdout, sys.stdout = sys.stdout, quiet
+        try:
+            if mode == "legacy":
+                seq, magic = await legacy_query_and_display(glasses, provider, question, seq, magic)
+            else:
+                await query_and_display(session, provider, question, flipper)
+        finally:
+            sys.stdout = stdout
+
+        shown = [t for t, kind, _ in glasses.displayed if kind == "reply"]
+        if len(shown) > replies:
+            latencies.append(shown[-1] - started)
+
+    quiet.close()
+    if glasses.ignored_ai:
+        print(f"  WARNING: {glasses.ignored_ai} Even AI frames ignored outside AI mode")
+    return latencies
+
+
+def report(label: str, latencies: list, count: int):
+    if not latencies:
+        print(f"{label:<8} no replies displayed")
+        return
+    mean = sum(latencies) / len(latencies)
+    print(f"{label:<8} {len(latencies):>4}/{count:<4} "
+          f"{percentile(latencies, 0.50) * 1000:>8.0f} {percentile(latencies, 0.90) * 1000:>8.0f} "
+          f"{percentile(latencies, 0.99) * 1000:>8.0f} {max(latencies) * 1000:>8.0f} {mean * 1000:>8.0f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Offline question-to-display latency benchmark')
+    parser.add_argument('-n', '--count', type=int, default=50, help='Questions per run (default: 50)')
+    parser.add_argument('--mode', choices=['legacy', 'warm', 'both'], default='both')
+    parser.add_argument('--first-token-ms', type=float, default=300.0)
+    parser.add_argument('--tps', type=float, default=50.0, help='Tokens/sec after the first token')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--write-latency-ms', type=float, default=7.5,
+                        help='Simulated BLE write latency (default: one 7.5 ms connection interval)')
+    parser.add_argument('--via', choices=['direct', 'openai', 'ollama'], default='direct',
+                        help='Call the stub directly, or over HTTP through a real provider client')
+    args = parser.parse_args()
+
+    stub = StubProvider(first_token_ms=args.first_token_ms, tokens_per_sec=args.tps,
+                        error_rate=args.error_rate, seed=args.seed)
+    provider = stub
+    if args.via != 'direct':
+        server = StubServer(stub)
+        server.start_background()
+        os.environ["OPENAI_BASE_URL"] = f"{server.url}/v1"
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+        os.environ["OLLAMA_HOST"] = server.url
+        provider = get_provider(args.via)
+
+    print(f"Provider: {stub.name}" + (f" via {provider.name}" if provider is not stub else ""))
+    print(f"Emulated write latency: {args.write_latency_ms} ms, {args.count} questions\n")
+    print(f"{'mode':<8} {'shown':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'mean ms':>8}")
+
+    modes = ['legacy', 'warm'] if args.mode == 'both' else [args.mode]
+    for mode in modes:
+        stub.rng.seed(args.seed)
+        latencies = await run(mode, provider, args.count, args.write_latency_ms / 1000)
+        report(mode, latencies, args.count)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""
+Async Console Input
+
+Line input for interactive mode that does not block the asyncio event loop.
+input() runs on a daemon reader thread, so BLE notifications, keepalives and
+LLM requests keep running while the user types. Readline line editing and
+history work as usual (where readline is available), and the history is
+saved between runs.
+
+Live mode reads keystroke by keystroke instead, and reports the text typed
+so far after every edit (used for live query refinement).
+"""
+
+import asyncio
+import codecs
+import os
+import queue
+import sys
+import threading
+from typing import Callable, Optional
+
+try:
+    import readline
+except ImportError:  # Windows
+    readline = None
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = tty = None
+
+HISTORY_FILE = os.path.expanduser("~/.llm_teleprompter_history")
+HISTORY_LENGTH = 500
+
+
+class AsyncConsole:
+    """Prompt for lines from stdin without blocking the event loop."""
+
+    def __init__(self, history_file: Optional[str] = HISTORY_FILE):
+        self.history_file = history_file
+        self._requests: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+        if readline and history_file and os.path.exists(history_file):
+            try:
+                readline.read_history_file(history_file)
+            except OSError:
+                pass
+
+    @staticmethod
+    def live_supported() -> bool:
+        """Keystroke input needs a POSIX terminal."""
+        return termios is not None and sys.stdin.isatty()
+
+    def _reader(self):
+        """Reader thread: answer each readline() request with one line of input."""
+        while True:
+            loop, future, prompt, on_change = self._requests.get()
+            try:
+                if on_change is not None and self.live_supported():
+                    line = self._read_live(prompt, loop, on_change)
+                else:
+                    line = input(prompt)
+            except BaseException as e:  # EOFError, KeyboardInterrupt
+                loop.call_soon_threadsafe(_set_exception, future, e)
+            else:
+                if readline and on_change is not None and line.strip():
+                    readline.add_history(line)
+                loop.call_soon_threadsafe(_set_result, future, line)
+
+    @staticmethod
+    def _read_live(prompt: str, loop, on_change: Callable[[str], None]) -> str:
+        """Read one line in cbreak mode, reporting the text after every edit."""
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        text = ""
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        tty.setcbreak(fd)
+        try:
+            while True:
+                raw = os.read(fd, 1)
+                if not raw or (raw == b'\x04' and not text):  # EOF / Ctrl-D
+                    raise EOFError
+                if raw == b'\x03':  # Ctrl-C
+                    raise KeyboardInterrupt
+
+                if raw in (b'\r', b'\n'):
+                    sys.stdout.write("\n")
+                    return text
+                elif raw in (b'\x7f', b'\x08'):  # Backspace
+                    if not text:
+                        continue
+                    text = text[:-1]
+                    sys.stdout.write("\b \b")
+                elif raw == b'\x15':  # Ctrl-U
+                    sys.stdout.write("\b \b" * len(text))
+                    text = ""
+                else:
+                    char = decoder.decode(raw)
+                    if not char or not char.isprintable():
+                        continue
+                    text += char
+                    sys.stdout.write(char)
+
+                sys.stdout.flush()
+                loop.call_soon_threadsafe(on_change, text)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    async def readline(self, prompt: str = "", on_change: Callable[[str], None] = None) -> str:
+        """
+        Read one line. Raises EOFError at end of input.
+
+        With on_change, input is read keystroke by keystroke and
+        on_change(text_so_far) is called on the event loop after every edit.
+        Falls back to plain line input when stdin is not a terminal.
+        """
+        if self._thread is None:
+            # Daemon thread: a pending input() must not keep the process alive
+            self._thread = threading.Thread(target=self._reader, name="console", daemon=True)
+            self._thread.start()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.put((loop, future, prompt, on_change))
+        return await future
+
+    def save_history(self):
+        """Persist readline history for the next session."""
+        if readline and self.history_file:
+            try:
+                readline.set_history_length(HISTORY_LENGTH)
+                readline.write_history_file(self.history_file)
+            except OSError:
+                pass
+
+
+def _set_result(future: asyncio.Future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException):
+    if not future.done():
+        future.set_exception(exc)
@@ -9,6 +9,7 @@ Usage:
     python llm_teleprompter.py "What is the capital of France?"
     python llm_teleprompter.py "Explain quantum computing" --provider ollama
     python llm_teleprompter.py --interactive
+    python llm_teleprompter.py --voice      # speak after "Hey Even" (vosk + sounddevice)
 
 Requirements:
     pip install -r requirements.txt
@@ -17,6 +18,8 @@ Requirements:
 
 import asyncio
 import argparse
+import os
+import sys
 import time
 from bleak import BleakClient, BleakScanner
 
@@ -25,6 +28,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from providers import get_provider, LLMProvider
+from console import AsyncConsole
+from voice import MicrophoneSource, VoicePipeline, VoskRecognizer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from frames import FrameWriter
+from gestures import SWIPE_BACKWARD, SWIPE_FORWARD, GestureEngine, GestureEvent
+from write_queue import CONTROL, INTERACTIVE, WriteQueue
 
 # BLE UUIDs
 UUID_BASE = "00002760-08c2-11e1-9073-0e8ac72e{:04x}"
@@ -112,6 +122,12 @@ def build_auth_packets() -> list:
     return packets
 
 
+def build_heartbeat(seq: int, msg_id: int) -> bytes:
+    """Service 0x80-20 type=14: Heartbeat/sync (keeps the glasses awake)."""
+    payload = bytes([0x08, 0x0E, 0x10]) + encode_varint(msg_id) + bytes([0x6A, 0x00])
+    return build_packet(seq, 0x80, 0x20, payload)
+
+
 # =============================================================================
 # Even AI Protocol (from even_ai.py)
 # =============================================================================
@@ -171,53 +187,498 @@ def build_reply(seq: int, magic: int, text: str) -> bytes:
 # LLM Integration
 # =============================================================================
 
+def _char_boundary(encoded: bytes, end: int) -> int:
+    """Move end back so it does not split a UTF-8 sequence."""
+    while end > 0 and end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+        end -= 1
+    return end
+
+
 def truncate_for_display(text: str, max_bytes: int = 200) -> str:
     """Truncate text to fit display byte limit."""
     encoded = text.encode('utf-8')
     if len(encoded) <= max_bytes:
         return text
 
-    # Truncate with ellipsis
-    while len(encoded) > max_bytes - 3:
-        text = text[:-1]
-        encoded = text.encode('utf-8')
-    return text + "..."
+    # Truncate with ellipsis (single cut on a character boundary)
+    end = _char_boundary(encoded, max(0, max_bytes - 3))
+    return encoded[:end].decode('utf-8') + "..."
+
+
+def paginate_for_display(text: str, max_bytes: int = 200) -> list:
+    """
+    Split text into pages of at most max_bytes UTF-8 bytes.
+
+    Pages break on the last space inside the byte window where possible,
+    and never inside a multi-byte character. Runs in a single pass over
+    the encoded text.
+    """
+    encoded = text.strip().encode('utf-8')
+    pages = []
+    start = 0
+
+    while start < len(encoded):
+        end = start + max_bytes
+        if end >= len(encoded):
+            pages.append(encoded[start:].decode('utf-8'))
+            break
+
+        end = _char_boundary(encoded, end)
+        space = encoded.rfind(b' ', start, end + 1)
+        if space > start:
+            end = space
+        elif end == start:
+            # Window smaller than one character - take the character whole
+            end = start + 1
+            while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+                end += 1
+
+        pages.append(encoded[start:end].decode('utf-8').rstrip())
+        start = end
+        while start < len(encoded) and encoded[start] == 0x20:
+            start += 1
+
+    return pages or [""]
+
+
+def page_marker_bytes(count: int) -> int:
+    """Bytes of the widest " [i/count]" marker."""
+    return len(f" [{count}/{count}]")
+
+
+def paginate_with_markers(text: str, max_bytes: int = 200) -> list:
+    """
+    Pages of at most max_bytes including their " [i/n]" marker.
+
+    The marker grows with the page count (" [9/9]", " [10/10]", ...), so
+    the text is paginated again whenever the count needs more digits than
+    the room left for it.
+    """
+    count = 9
+    while True:
+        room = max_bytes - page_marker_bytes(count)
+        if room < 1:
+            raise ValueError(f"Pages of {max_bytes} bytes leave no room for text next to a {count}-page marker")
+        pages = paginate_for_display(text, room)
+        if len(str(len(pages))) <= len(str(count)):
+            return [f"{page} [{i + 1}/{len(pages)}]" for i, page in enumerate(pages)]
+        count = len(pages)
+
+
+class ReplyPager:
+    """
+    Pre-encoded REPLY frames for a paged answer.
+
+    Every page is built once, with its own seq/magic taken from next_ids,
+    when the answer arrives. Flipping pages on a swipe is then a single
+    write of an already-built frame.
+    """
+
+    def __init__(self, answer: str, next_ids, max_bytes: int = 200):
+        if len(answer.encode('utf-8')) <= max_bytes:
+            pages = [answer]
+        else:
+            pages = paginate_with_markers(answer, max_bytes)
+
+        self.pages = pages
+        self.frames = [build_reply(*next_ids(), page) for page in pages]
+        self.index = 0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def current(self) -> bytes:
+        return self.frames[self.index]
+
+    def next(self):
+        """Advance one page. Returns the frame to send, or None at the end."""
+        if self.index + 1 >= len(self.frames):
+            return None
+        self.index += 1
+        return self.frames[self.index]
+
+    def prev(self):
+        """Go back one page. Returns the frame to send, or None at the start."""
+        if self.index == 0:
+            return None
+        self.index -= 1
+        return self.frames[self.index]
+
+
+class ReplyStream:
+    """
+    Pages of an answer that arrives in chunks.
+
+    feed() buffers the text after the last finished page and returns a
+    REPLY frame for each page that has filled up, built once. finish()
+    builds the ReplyPager for the whole answer, with its " [i/n]" markers
+    now that n is known, positioned on the last page.
+    """
+
+    def __init__(self, next_ids, max_bytes: int = 200):
+        self.next_ids = next_ids
+        self.max_bytes = max_bytes
+        self.answer = ""
+        self.pending = ""
+
+    def feed(self, chunk: str) -> list:
+        """Add a chunk; returns the frames of pages it completed."""
+        self.answer += chunk
+        self.pending += chunk
+        if len(self.pending.encode('utf-8')) <= self.max_bytes:
+            return []
+        # Everything but the last page is final: later chunks can only extend the last one
+        pages = paginate_for_display(self.pending, self.max_bytes)
+        self.pending = pages[-1] + self.pending[len(self.pending.rstrip()):]
+        return [build_reply(*self.next_ids(), page) for page in pages[:-1]]
+
+    def finish(self) -> ReplyPager:
+        """The pager for the complete answer, showing its last page."""
+        pager = ReplyPager(self.answer.strip(), self.next_ids, self.max_bytes)
+        pager.index = len(pager) - 1
+        return pager
+
+
+# =============================================================================
+# Gestures
+# =============================================================================
+
+class PageFlipper:
+    """Flips the active pager on swipe gestures from a GestureEngine, through the session's WriteQueue."""
+
+    def __init__(self, queue: WriteQueue, gestures: GestureEngine):
+        self.queue = queue
+        self.pager = None
+        gestures.on(SWIPE_FORWARD, self.flip)
+        gestures.on(SWIPE_BACKWARD, self.flip)
+
+    async def flip(self, event: GestureEvent):
+        if self.pager is None:
+            return
+        frame = self.pager.next() if event.kind == SWIPE_FORWARD else self.pager.prev()
+        if frame is not None:
+            print(f"  Page {self.pager.index + 1}/{len(self.pager)}")
+            await self.queue.send(frame, INTERACTIVE)
+
+
+# =============================================================================
+# Even AI Session
+# =============================================================================
+
+AI_STATUS_WAKE_UP = 1
+AI_STATUS_ENTER = 2
+AI_STATUS_EXIT = 3
+
+
+def decode_varint(data: bytes, offset: int) -> tuple:
+    """Decode protobuf varint, return (value, new_offset)."""
+    result = 0
+    shift = 0
+    while offset < len(data):
+        byte = data[offset]
+        result |= (byte & 0x7F) << shift
+        offset += 1
+        if not (byte & 0x80):
+            break
+        shift += 7
+    return result, offset
+
+
+def parse_ctrl_status(data: bytes):
+    """Return the CTRL status of an Even AI event from the glasses (0x07-00/0x07-01), else None."""
+    if len(data) < 12 or data[0] != 0xAA or data[6] != 0x07 or data[7] not in (0x00, 0x01):
+        return None
+
+    payload = data[8:-2]
+    command_id = ctrl = None
+    offset = 0
+    while offset < len(payload):
+        key, offset = decode_varint(payload, offset)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, offset = decode_varint(payload, offset)
+            if field == 1:
+                command_id = value
+        elif wire_type == 2:
+            length, offset = decode_varint(payload, offset)
+            if field == 3:
+                ctrl = payload[offset:offset + length]
+            offset += length
+        else:
+            return None
+
+    if command_id != 1 or not ctrl or ctrl[0] != 0x08:
+        return None
+    return decode_varint(ctrl, 1)[0]
+
+
+class EvenAISession:
+    """
+    Even AI mode held open across questions.
+
+    CTRL(ENTER) is sent once and again only after the glasses report
+    WAKE_UP or EXIT. Feed every notification to handle_notify() so the
+    session sees those events. Owns the seq/magic counters for all Even
+    AI frames on the connection, and its WriteQueue: heartbeats and
+    CTRL(ENTER) go out as CONTROL, ahead of ASK/REPLY pages.
+    """
+
+    # Glasses sleep after ~10-15 s without traffic
+    KEEPALIVE_INTERVAL = 5.0
+
+    def __init__(self, client, seq: int = 0x08, magic: int = 100):
+        self.client = client
+        self.writer = FrameWriter(client, CHAR_WRITE)
+        self.queue = WriteQueue(client, writer=self.writer)    # shared by everything on the connection
+        self.seq = seq
+        self.magic = magic
+        self.active = False
+        self._enter_lock = asyncio.Lock()
+        self.latencies = []
+        self.last_write = time.monotonic()
+
+    def next_ids(self) -> tuple:
+        """Allocate the next (seq, magic) pair. magicRandom stays a one-byte varint."""
+        ids = (self.seq, self.magic)
+        self.seq = (self.seq + 1) & 0xFF
+        self.magic = self.magic % 0x7F + 1
+        return ids
+
+    def handle_notify(self, data: bytes):
+        """Track AI mode from CTRL status events."""
+        status = parse_ctrl_status(data)
+        if status == AI_STATUS_ENTER:
+            self.active = True
+        elif status in (AI_STATUS_WAKE_UP, AI_STATUS_EXIT):
+            if self.active:
+                print("  (glasses left AI mode - will re-enter)")
+            self.active = False
+
+    async def write(self, packet: bytes, priority: int = INTERACTIVE):
+        self.last_write = time.monotonic()
+        await self.queue.send(packet, priority)
+
+    async def keepalive(self):
+        """Send a heartbeat whenever the link has been idle for KEEPALIVE_INTERVAL."""
+        while True:
+            idle = time.monotonic() - self.last_write
+            if idle >= self.KEEPALIVE_INTERVAL:
+                await self.write(build_heartbeat(*self.next_ids()), CONTROL)
+                idle = 0.0
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL - idle)
+
+    async def ensure_active(self):
+        """Enter AI mode unless the glasses are already in it."""
+        if self.active:
+            return
+        async with self._enter_lock:
+            if self.active:
+                return
+            print(f"  Entering AI mode...")
+            await self.write(build_ctrl_enter(*self.next_ids()), CONTROL)
+            self.active = True
+            await asyncio.sleep(0.3)
+
+    async def ask(self, text: str):
+        await self.ensure_active()
+        await self.write(build_ask(*self.next_ids(), text))
+
+    def reply_stream(self) -> ReplyStream:
+        """Pages for an answer that is still arriving; write the frames it returns."""
+        return ReplyStream(self.next_ids)
+
+    async def reply(self, answer: str) -> ReplyPager:
+        """Encode all pages of the answer and show the first one."""
+        pager = ReplyPager(answer, self.next_ids)
+        await self.write(pager.current)
+        return pager
+
 
+# =============================================================================
+# Query & Display
+# =============================================================================
 
-async def query_and_display(client, provider: LLMProvider, question: str, seq: int, magic: int):
-    """Query LLM and display Q&A on glasses. Returns updated seq, magic."""
+SYSTEM_PROMPT = "Be concise."
 
-    # Enter AI mode
-    print(f"  Entering AI mode...")
-    await client.write_gatt_char(CHAR_WRITE, build_ctrl_enter(seq, magic), response=False)
-    seq += 1
-    magic += 1
-    await asyncio.sleep(0.3)
 
-    # Display question
+async def query_and_display(session: EvenAISession, provider: LLMProvider, question: str,
+                            flipper: PageFlipper = None) -> ReplyPager:
+    """Query LLM and display Q&A on glasses. Returns the answer's pager."""
+    started = time.perf_counter()
+
+    # Start the LLM request, then show the question while it runs
+    print(f"  Querying {provider.name}...")
+    llm = asyncio.create_task(asyncio.to_thread(
+        provider.query, question, system_prompt=SYSTEM_PROMPT))
+
     display_q = truncate_for_display(question, 150)
     print(f"  Question: {display_q}")
-    await client.write_gatt_char(CHAR_WRITE, build_ask(seq, magic, display_q), response=False)
-    seq += 1
-    magic += 1
-    await asyncio.sleep(0.5)
+    await session.ask(display_q)
 
-    # Query LLM
-    print(f"  Querying {provider.name}...")
     try:
-        answer = provider.query(question, system_prompt="Be concise. Answer in 1-2 sentences.")
-        display_a = truncate_for_display(answer, 200)
-        print(f"  Answer: {display_a}")
+        answer = await llm
+        print(f"  Answer: {answer}")
     except Exception as e:
-        display_a = f"Error: {str(e)[:50]}"
+        answer = f"Error: {str(e)[:50]}"
         print(f"  LLM Error: {e}")
 
-    # Display answer
-    await client.write_gatt_char(CHAR_WRITE, build_reply(seq, magic, display_a), response=False)
-    seq += 1
-    magic += 1
-
-    return seq, magic
+    # Encode every page up front, then display the first one
+    pager = await session.reply(answer)
+    session.latencies.append(time.perf_counter() - started)
+    if len(pager) > 1:
+        print(f"  {len(pager)} pages - swipe forward/back on the glasses to flip")
+
+    if flipper is not None:
+        flipper.pager = pager
+
+    return pager
+
+
+class QueryRefiner:
+    """
+    Live query refinement while the user types or speaks ("Query Evolution").
+
+    Call update() with the full text so far after every edit, and submit()
+    with the final text. ASK updates go out debounced by ask_delay, so the
+    glasses follow the text without one write per keystroke. Once the text
+    has been stable for settle_delay, a speculative LLM request starts.
+    Further edits cancel it, and it restarts at the next pause. If the
+    submitted text matches the speculation, its answer is reused and
+    finish() can display it almost at once.
+    """
+
+    def __init__(self, session: EvenAISession, provider: LLMProvider, flipper: PageFlipper = None,
+                 ask_delay: float = 0.15, settle_delay: float = 0.6):
+        self.session = session
+        self.provider = provider
+        self.flipper = flipper
+        self.ask_delay = ask_delay
+        self.settle_delay = settle_delay
+
+        self.text = ""
+        self.speculations = 0
+        self.hit = False
+        self._asked = None
+        self._ask_timer = None
+        self._settle_timer = None
+        self._query = None           # (question, task) of the in-flight LLM request
+        self._writes = set()
+        self._submitted_at = None
+
+    def _cancel_timers(self):
+        for timer in (self._ask_timer, self._settle_timer):
+            if timer is not None:
+                timer.cancel()
+        self._ask_timer = self._settle_timer = None
+
+    def update(self, text: str):
+        """New partial text (typed or transcribed)."""
+        self.text = text
+        self._cancel_timers()
+        question = text.strip()
+        if not question:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._ask_timer = loop.call_later(self.ask_delay, self._push_ask)
+
+        if self._query and self._query[0] != question:
+            # The worker thread runs to completion; its answer is dropped
+            self._query[1].cancel()
+            self._query = None
+        if self._query is None:
+            self._settle_timer = loop.call_later(self.settle_delay, self._start_query)
+
+    def _push_ask(self):
+        text = truncate_for_display(self.text.strip(), 150)
+        if text and text != self._asked:
+            self._asked = text
+            task = asyncio.create_task(self.session.ask(text))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    def _start_query(self):
+        question = self.text.strip()
+        self.speculations += 1
+        task = asyncio.create_task(asyncio.to_thread(
+            self.provider.query, question, system_prompt=SYSTEM_PROMPT))
+        self._query = (question, task)
+
+    def submit(self, text: str):
+        """Final text: send the last ASK and make sure its answer is on the way."""
+        self._submitted_at = time.perf_counter()
+        self.text = text
+        self._cancel_timers()
+        self._push_ask()
+
+        question = text.strip()
+        self.hit = self._query is not None and self._query[0] == question
+        if not self.hit:
+            self.cancel()
+            self._start_query()
+
+    def cancel(self):
+        """Abandon the query (e.g. the user quit)."""
+        self._cancel_timers()
+        if self._query:
+            self._query[1].cancel()
+            self._query = None
+
+    async def finish(self) -> ReplyPager:
+        """Wait for the answer to the submitted text and display it."""
+        question, task = self._query
+        print(f"\n  Question: {question}"
+              f" ({'speculative answer reused' if self.hit else 'not speculated'})")
+        try:
+            answer = await task
+            print(f"  Answer: {answer}")
+        except Exception as e:
+            answer = f"Error: {str(e)[:50]}"
+            print(f"  LLM Error: {e}")
+
+        if self._writes:
+            await asyncio.gather(*self._writes)
+        pager = await self.session.reply(answer)
+        self.session.latencies.append(time.perf_counter() - self._submitted_at)
+        if len(pager) > 1:
+            print(f"  {len(pager)} pages - swipe forward/back on the glasses to flip")
+
+        if self.flipper is not None:
+            self.flipper.pager = pager
+        return pager
+
+
+async def answer_questions(session: EvenAISession, provider: LLMProvider,
+                           questions: asyncio.Queue, flipper: PageFlipper = None):
+    """Worker: display questions (or submitted QueryRefiners) from the queue in order."""
+    while True:
+        question = await questions.get()
+        try:
+            print()
+            if isinstance(question, QueryRefiner):
+                await question.finish()
+            else:
+                await query_and_display(session, provider, question, flipper)
+            print()
+        finally:
+            questions.task_done()
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of a list of numbers."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def print_latency_summary(latencies: list):
+    """Print question-to-display latency percentiles."""
+    if not latencies:
+        return
+    print(f"Question-to-display latency over {len(latencies)} questions: "
+          f"p50 {percentile(latencies, 0.50) * 1000:.0f} ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms, "
+          f"max {max(latencies) * 1000:.0f} ms")
 
 
 # =============================================================================
@@ -228,13 +689,19 @@ async def main():
     parser = argparse.ArgumentParser(description='Query AI and display on G2 glasses')
     parser.add_argument('question', nargs='?', help='Question to ask')
     parser.add_argument('-p', '--provider', default='openai',
-                        choices=['openai', 'azure', 'anthropic', 'ollama'],
+                        choices=['openai', 'azure', 'anthropic', 'ollama', 'stub'],
                         help='LLM provider (default: openai)')
     parser.add_argument('-i', '--interactive', action='store_true',
                         help='Interactive mode - ask multiple questions')
+    parser.add_argument('--live', action='store_true',
+                        help='Interactive mode: show the question while typing and query the LLM speculatively')
+    parser.add_argument('--voice', action='store_true',
+                        help='Voice input: VAD events from the glasses, phone microphone + Vosk (VOSK_MODEL)')
     parser.add_argument('--left', action='store_true', help='Use left eye instead of right')
 
     args = parser.parse_args()
+    if args.live:
+        args.interactive = True
 
     print("LLM Teleprompter - AI on G2 Glasses")
     print("=" * 50)
@@ -248,6 +715,16 @@ async def main():
         print("Check your .env file for API keys")
         return
 
+    pipeline = None
+    if args.voice:
+        try:
+            source, recognizer = MicrophoneSource(), VoskRecognizer()
+            print(f"Recognizer: {recognizer.name}")
+        except Exception as e:
+            print(f"Voice input error: {e}")
+            print("pip install vosk sounddevice, and set VOSK_MODEL to an unpacked Vosk model")
+            return
+
     # Connect to glasses
     print(f"\nScanning for G2 glasses...")
     devices = await BleakScanner.discover(timeout=10.0)
@@ -267,7 +744,20 @@ async def main():
     async with BleakClient(device) as client:
         print("  Connected!")
 
-        await client.start_notify(CHAR_NOTIFY, lambda s, d: None)
+        session = EvenAISession(client)
+        gestures = GestureEngine()
+        flipper = PageFlipper(session.queue, gestures)
+        if args.voice:
+            pipeline = VoicePipeline(session, provider, source, recognizer, flipper,
+                                     system_prompt=SYSTEM_PROMPT)
+
+        def on_notify(sender, data: bytearray):
+            session.handle_notify(bytes(data))
+            gestures(sender, data)
+            if pipeline is not None:
+                pipeline.handle_notify(data)
+
+        await client.start_notify(CHAR_NOTIFY, on_notify)
 
         # Authenticate
         print("\nAuthenticating...")
@@ -275,38 +765,73 @@ async def main():
             await client.write_gatt_char(CHAR_WRITE, pkt, response=False)
             await asyncio.sleep(0.1)
         await asyncio.sleep(0.5)
-        print("  Authenticated!")
-
-        seq = 0x08
-        magic = 100
+        print(f"  Authenticated! (MTU {await session.writer.negotiate()})")
 
-        if args.interactive:
+        if args.voice:
+            print("\n" + "=" * 50)
+            print('Voice mode. Say "Hey Even" (or long-press), then ask. Ctrl-C to exit.')
+            print("=" * 50 + "\n")
+            keepalive = asyncio.create_task(session.keepalive())
+            try:
+                await pipeline.run()
+            except asyncio.CancelledError:
+                pass
+            finally:
+                keepalive.cancel()
+                pipeline.print_stats()
+                gestures.print_stats()
+        elif args.interactive:
             # Interactive mode
             print("\n" + "=" * 50)
             print("Interactive mode. Type 'quit' to exit.")
             print("=" * 50 + "\n")
 
-            while True:
-                try:
-                    question = input("You: ").strip()
-                except EOFError:
-                    break
-
-                if question.lower() in ('quit', 'exit', 'q'):
-                    break
-                if not question:
-                    continue
-
-                print()
-                seq, magic = await query_and_display(client, provider, question, seq, magic)
-                print()
-                await asyncio.sleep(3.0)
+            # Typing, LLM calls, gestures and keepalives all run concurrently
+            console = AsyncConsole()
+            questions = asyncio.Queue()
+            tasks = [
+                asyncio.create_task(session.keepalive()),
+                asyncio.create_task(answer_questions(session, provider, questions, flipper)),
+            ]
+
+            try:
+                while True:
+                    refiner = QueryRefiner(session, provider, flipper) if args.live else None
+                    try:
+                        question = (await console.readline(
+                            "You: ", on_change=refiner.update if refiner else None)).strip()
+                    except EOFError:
+                        break
+
+                    if question.lower() in ('quit', 'exit', 'q'):
+                        if refiner:
+                            refiner.cancel()
+                        break
+                    if not question:
+                        continue
+
+                    if refiner:
+                        refiner.submit(question)
+                        await questions.put(refiner)
+                    else:
+                        await questions.put(question)
+
+                # Let queued questions finish before disconnecting
+                await questions.join()
+            finally:
+                console.save_history()
+                for task in tasks:
+                    task.cancel()
+
+            print_latency_summary(session.latencies)
+            gestures.print_stats()
         else:
             # Single question mode
             question = args.question or "What is 2 + 2?"
             print(f"\nAsking: {question}")
-            seq, magic = await query_and_display(client, provider, question, seq, magic)
-            await asyncio.sleep(5.0)
+            pager = await query_and_display(session, provider, question, flipper)
+            # Leave time to swipe through multi-page answers
+            await asyncio.sleep(5.0 + 10.0 * (len(pager) - 1))
 
         print("\n" + "=" * 50)
         print("Done! Check your glasses.")
@@ -6,11 +6,15 @@ Supports multiple LLM backends:
 - azure: Azure OpenAI Service
 - anthropic: Anthropic Claude
 - ollama: Local models via Ollama
+- stub: Deterministic offline answers with simulated latency (benchmarks)
 """
 
 import os
+import random
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, List, Optional
 
 
 class LLMProvider(ABC):
@@ -139,6 +143,75 @@ class OllamaProvider(LLMProvider):
         return response["message"]["content"]
 
 
+STUB_ANSWERS = [
+    "4.",
+    "Paris is the capital of France.",
+    "Quantum computers use qubits, which can hold a mix of 0 and 1 at once. "
+    "Interference between these states lets some problems be solved with far "
+    "fewer steps than on a classical computer, such as factoring large numbers "
+    "or simulating molecules.",
+    "Light from the sun is scattered by the air. Blue light has a shorter "
+    "wavelength and scatters more than red, so the sky looks blue from the ground.",
+    "Yes.",
+]
+
+
+class StubError(RuntimeError):
+    """Injected provider failure."""
+
+
+class StubProvider(LLMProvider):
+    """
+    Deterministic local provider for offline runs and benchmarks.
+
+    Answers come from STUB_ANSWERS_FILE (one answer per line) or a built-in
+    script, picked by a hash of the prompt, so the same question always gets
+    the same answer. Timing is simulated: STUB_FIRST_TOKEN_MS before the
+    first token, then STUB_TOKENS_PER_SEC (0 = instant). STUB_ERROR_RATE
+    makes that fraction of queries fail, using a STUB_SEED random stream.
+    """
+
+    def __init__(self, answers: Optional[List[str]] = None, first_token_ms: Optional[float] = None,
+                 tokens_per_sec: Optional[float] = None, error_rate: Optional[float] = None,
+                 seed: Optional[int] = None):
+        if answers is None:
+            path = os.getenv("STUB_ANSWERS_FILE")
+            if path:
+                with open(path, encoding="utf-8") as f:
+                    answers = [line.strip() for line in f if line.strip()]
+        self.answers = answers or STUB_ANSWERS
+        self.first_token_ms = float(first_token_ms if first_token_ms is not None
+                                    else os.getenv("STUB_FIRST_TOKEN_MS", "300"))
+        self.tokens_per_sec = float(tokens_per_sec if tokens_per_sec is not None
+                                    else os.getenv("STUB_TOKENS_PER_SEC", "50"))
+        self.error_rate = float(error_rate if error_rate is not None
+                                else os.getenv("STUB_ERROR_RATE", "0"))
+        self.rng = random.Random(seed if seed is not None else int(os.getenv("STUB_SEED", "0")))
+
+    @property
+    def name(self) -> str:
+        return f"Stub ({self.first_token_ms:.0f} ms, {self.tokens_per_sec:.0f} tok/s)"
+
+    def answer_for(self, prompt: str) -> str:
+        return self.answers[zlib.crc32(prompt.encode("utf-8")) % len(self.answers)]
+
+    def stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Yield the scripted answer word by word with simulated timing. system_prompt is ignored."""
+        failed = self.rng.random() < self.error_rate
+        time.sleep(self.first_token_ms / 1000)
+        if failed:
+            raise StubError("Injected provider error")
+
+        delay = 1.0 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+        for i, word in enumerate(self.answer_for(prompt).split(" ")):
+            if i and delay:
+                time.sleep(delay)
+            yield word if i == 0 else " " + word
+
+    def query(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        return "".join(self.stream(prompt, system_prompt))
+
+
 def get_provider(name: str) -> LLMProvider:
     """Factory function to get provider by name."""
     providers = {
@@ -146,6 +219,7 @@ def get_provider(name: str) -> LLMProvider:
         "azure": AzureOpenAIProvider,
         "anthropic": AnthropicProvider,
         "ollama": OllamaProvider,
+        "stub": StubProvider,
     }
     if name not in providers:
         raise ValueError(f"Unknown provider: {name}. Options: {list(providers.keys())}")
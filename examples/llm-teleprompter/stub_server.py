@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Stub LLM Server - Local OpenAI/Ollama Stand-in
+
+Serves scripted StubProvider answers over the OpenAI and Ollama HTTP wire
+formats, with the same latency/throughput/error injection. Lets the real
+openai and ollama providers (and their client libraries) run offline.
+
+Usage:
+    python stub_server.py --port 8000 --first-token-ms 300 --tps 40
+
+    OPENAI_BASE_URL=http://127.0.0.1:8000/v1 OPENAI_API_KEY=stub \
+        python llm_teleprompter.py -p openai "What is 2 + 2?"
+    OLLAMA_HOST=http://127.0.0.1:8000 python llm_teleprompter.py -p ollama "Hi"
+
+Endpoints:
+    POST /v1/chat/completions   OpenAI chat completions (stream or not)
+    POST /api/chat              Ollama chat (NDJSON stream or not)
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from providers import StubProvider
+
+
+def _last_user_message(messages: list) -> str:
+    for message in reversed(messages or []):
+        if message.get("role") == "user":
+            return message.get("content") or ""
+    return ""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler; the server's .provider supplies answers."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_stream(self, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+
+        if self.path.rstrip("/").endswith("/chat/completions"):
+            self._openai(request)
+        elif self.path.rstrip("/") == "/api/chat":
+            self._ollama(request)
+        else:
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+
+    def _openai(self, request: dict):
+        model = request.get("model", "stub")
+        prompt = _last_user_message(request.get("messages"))
+        created = int(time.time())
+        base = {"id": f"chatcmpl-stub{created}", "created": created, "model": model}
+        tokens = self.server.provider.stream(prompt)
+
+        try:
+            first = next(tokens, "")
+        except Exception as e:
+            self._send_json(500, {"error": {"message": str(e), "type": "server_error"}})
+            return
+
+        if not request.get("stream"):
+            text = first + "".join(tokens)
+            self._send_json(200, dict(base, object="chat.completion", choices=[{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text},
+            }], usage={"prompt_tokens": len(prompt.split()), "completion_tokens": len(text.split()),
+                       "total_tokens": len(prompt.split()) + len(text.split())}))
+            return
+
+        self._start_stream("text/event-stream")
+        for token in _chain(first, tokens):
+            event = dict(base, object="chat.completion.chunk", choices=[{
+                "index": 0, "finish_reason": None, "delta": {"content": token}}])
+            self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+        event = dict(base, object="chat.completion.chunk", choices=[{
+            "index": 0, "finish_reason": "stop", "delta": {}}])
+        self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _ollama(self, request: dict):
+        model = request.get("model", "stub")
+        prompt = _last_user_message(request.get("messages"))
+        tokens = self.server.provider.stream(prompt)
+
+        try:
+            first = next(tokens, "")
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+
+        if request.get("stream") is False:
+            self._send_json(200, {"model": model, "created_at": _timestamp(), "done": True,
+                                  "message": {"role": "assistant", "content": first + "".join(tokens)}})
+            return
+
+        # Ollama streams by default
+        self._start_stream("application/x-ndjson")
+        for token in _chain(first, tokens):
+            line = {"model": model, "created_at": _timestamp(), "done": False,
+                    "message": {"role": "assistant", "content": token}}
+            self._chunk(json.dumps(line).encode() + b"\n")
+        done = {"model": model, "created_at": _timestamp(), "done": True,
+                "message": {"role": "assistant", "content": ""}}
+        self._chunk(json.dumps(done).encode() + b"\n")
+        self._chunk(b"")
+
+
+def _timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _chain(first: str, rest):
+    if first:
+        yield first
+    yield from rest
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a StubProvider."""
+
+    daemon_threads = True
+
+    def __init__(self, provider: StubProvider, host: str = "127.0.0.1", port: int = 0,
+                 verbose: bool = False):
+        super().__init__((host, port), StubHandler)
+        self.provider = provider
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_background(self) -> threading.Thread:
+        """Serve from a daemon thread (for benchmarks in the same process)."""
+        thread = threading.Thread(target=self.serve_forever, name="stub-server", daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local OpenAI/Ollama stand-in with scripted answers')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--first-token-ms', type=float, help='Delay before the first token')
+    parser.add_argument('--tps', type=float, help='Tokens per second after the first (0 = instant)')
+    parser.add_argument('--error-rate', type=float, help='Fraction of requests that fail (0-1)')
+    parser.add_argument('--seed', type=int, help='Seed for error injection')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log requests')
+    args = parser.parse_args()
+
+    provider = StubProvider(first_token_ms=args.first_token_ms, tokens_per_sec=args.tps,
+                            error_rate=args.error_rate, seed=args.seed)
+    server = StubServer(provider, args.host, args.port, args.verbose)
+    print(f"{provider.name} listening on {server.url}")
+    print(f"  OpenAI: OPENAI_BASE_URL={server.url}/v1")
+    print(f"  Ollama: OLLAMA_HOST={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
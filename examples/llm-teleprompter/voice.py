@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+"""
+Voice Input Pipeline - Speech to Even AI ASK/REPLY
+
+Implements the voice flow from docs/even-ai.md as a chain of asyncio stages
+joined by bounded queues:
+
+    glasses VAD_START/VAD_END (0x07-00)
+      -> capture:    audio frames from an AudioSource, start..end of speech
+      -> recognize:  pluggable Recognizer, partial + final transcripts
+      -> ask:        ASK updates as the transcript grows (coalesced)
+      -> llm:        provider answer, streamed word by word when supported
+      -> reply:      REPLY pages, each written once it has filled up
+
+The glasses do not stream audio over BLE, so audio comes from the phone
+(MicrophoneSource, needs sounddevice). A full queue makes the stage
+upstream wait: a slow recognizer holds back capture, and a slow LLM holds
+back the answer stream. Only the live microphone drops frames when full,
+and those drops are counted.
+
+Per utterance the pipeline records when each stage finished, measured from
+VAD_END (end of speech). The headline number is end of speech -> first
+reply page on the glasses.
+
+Offline run against the emulator (scripted speech + stub recognizer/LLM):
+    python voice.py
+    python voice.py -n 10 --decode-ms 5 --first-token-ms 150 --queue-size 4
+
+On glasses: python llm_teleprompter.py --voice  (needs vosk + sounddevice)
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from frames import FrameDecoder, fields
+
+from providers import LLMProvider
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * FRAME_MS // 1000 * 2      # 16-bit mono PCM
+THREAD_POLL = 0.1                                      # seconds a worker thread waits before checking for stop
+
+AI_VAD_INFO = 2
+VAD_START = 1
+VAD_END = 2
+VAD_TIMEOUT = 3
+
+
+def parse_ai_event(payload: bytes) -> Optional[tuple]:
+    """("ctrl", status) or ("vad", status) for an Even AI event payload, else None."""
+    msg = fields(payload)
+    command = msg.get(1)
+    if command == 1 and isinstance(msg.get(3), bytes):
+        return "ctrl", fields(msg[3]).get(1)
+    if command == AI_VAD_INFO and isinstance(msg.get(4), bytes):
+        return "vad", fields(msg[4]).get(1)
+    return None
+
+
+# =============================================================================
+# Audio Sources
+# =============================================================================
+
+class AudioSource(ABC):
+    """Delivers 20 ms PCM frames to pipeline.push_audio() between start() and stop()."""
+
+    @abstractmethod
+    async def start(self, pipeline: "VoicePipeline"):
+        pass
+
+    @abstractmethod
+    async def stop(self):
+        """Stop capturing; every frame captured so far must have been pushed."""
+        pass
+
+
+class MicrophoneSource(AudioSource):
+    """Phone microphone via sounddevice. Frames are dropped (and counted) if the pipeline is full."""
+
+    def __init__(self, device=None):
+        import sounddevice
+        self._sd = sounddevice
+        self.device = device
+        self._stream = None
+
+    async def start(self, pipeline: "VoicePipeline"):
+        loop = asyncio.get_running_loop()
+
+        def callback(indata, frame_count, time_info, status):
+            loop.call_soon_threadsafe(pipeline.push_audio_nowait, bytes(indata))
+
+        self._stream = self._sd.RawInputStream(samplerate=SAMPLE_RATE, blocksize=FRAME_BYTES // 2,
+                                               dtype="int16", channels=1, device=self.device,
+                                               callback=callback)
+        self._stream.start()
+
+    async def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        await asyncio.sleep(0)      # let queued callbacks run
+
+
+class ScriptedAudio(AudioSource):
+    """
+    Offline stand-in: "speaks" queued sentences in real time.
+
+    Each word becomes word_ms of 20 ms frames; the first frame of a word
+    carries the word as a marker that ScriptedRecognizer reads back.
+    Pushing waits on a full queue, so backpressure reaches the source.
+    """
+
+    MARKER = b"W:"
+
+    def __init__(self, word_ms: float = 300):
+        self.word_ms = word_ms
+        self.script: List[str] = []
+        self._task = None
+
+    def say(self, text: str) -> float:
+        """Queue a sentence for the next start(); returns its duration in seconds."""
+        self.script.append(text)
+        return len(text.split()) * self.word_ms / 1000
+
+    def frames(self, text: str):
+        per_word = max(1, round(self.word_ms / FRAME_MS))
+        for word in text.split():
+            marker = self.MARKER + word.encode("utf-8")
+            yield marker + bytes(FRAME_BYTES - len(marker))
+            for _ in range(per_word - 1):
+                yield bytes(FRAME_BYTES)
+
+    async def _play(self, pipeline: "VoicePipeline", text: str):
+        started = time.monotonic()
+        for i, frame in enumerate(self.frames(text)):
+            await pipeline.push_audio(frame)
+            delay = started + (i + 1) * FRAME_MS / 1000 - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def start(self, pipeline: "VoicePipeline"):
+        if self.script:
+            self._task = asyncio.create_task(self._play(pipeline, self.script.pop(0)))
+
+    async def stop(self):
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+# =============================================================================
+# Recognizers
+# =============================================================================
+
+class Recognizer(ABC):
+    """Speech-to-text over 20 ms PCM frames. Methods run in a worker thread."""
+
+    @abstractmethod
+    def accept(self, frame: bytes) -> Optional[str]:
+        """Feed one frame; return the partial transcript if it changed, else None."""
+        pass
+
+    @abstractmethod
+    def finish(self) -> str:
+        """End of speech: return the final transcript and reset for the next utterance."""
+        pass
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+
+class ScriptedRecognizer(Recognizer):
+    """Reads back ScriptedAudio word markers, with decode_ms of simulated work per frame."""
+
+    def __init__(self, decode_ms: float = 2.0):
+        self.decode_ms = decode_ms
+        self.words: List[str] = []
+
+    @property
+    def name(self) -> str:
+        return f"Scripted ({self.decode_ms:g} ms/frame)"
+
+    def accept(self, frame: bytes) -> Optional[str]:
+        if self.decode_ms:
+            time.sleep(self.decode_ms / 1000)
+        if not frame.startswith(ScriptedAudio.MARKER):
+            return None
+        self.words.append(frame[len(ScriptedAudio.MARKER):].rstrip(b"\x00").decode("utf-8"))
+        return " ".join(self.words)
+
+    def finish(self) -> str:
+        text, self.words = " ".join(self.words), []
+        return text
+
+
+class VoskRecognizer(Recognizer):
+    """Offline speech recognition with Vosk (pip install vosk; model path in VOSK_MODEL)."""
+
+    def __init__(self, model_path: Optional[str] = None):
+        from vosk import KaldiRecognizer, Model
+        model_path = model_path or os.getenv("VOSK_MODEL")
+        if not model_path:
+            raise ValueError("VOSK_MODEL not set (path to an unpacked Vosk model)")
+        self.model_path = model_path
+        self._recognizer = KaldiRecognizer(Model(model_path), SAMPLE_RATE)
+        self._done: List[str] = []
+        self._partial = ""
+
+    @property
+    def name(self) -> str:
+        return f"Vosk ({os.path.basename(self.model_path.rstrip('/'))})"
+
+    def accept(self, frame: bytes) -> Optional[str]:
+        if self._recognizer.AcceptWaveform(frame):
+            text = json.loads(self._recognizer.Result()).get("text", "")
+            if text:
+                self._done.append(text)
+            partial = ""
+        else:
+            partial = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        text = " ".join(self._done + ([partial] if partial else []))
+        if text == self._partial:
+            return None
+        self._partial = text
+        return text
+
+    def finish(self) -> str:
+        last = json.loads(self._recognizer.FinalResult()).get("text", "")
+        text = " ".join(self._done + ([last] if last else []))
+        self._done, self._partial = [], ""
+        return text
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+class StageQueue(asyncio.Queue):
+    """Bounded queue that records how often and how long producers waited on it."""
+
+    def __init__(self, name: str, maxsize: int):
+        super().__init__(maxsize)
+        self.name = name
+        self.high_water = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    async def put(self, item):
+        if self.full():
+            self.waits += 1
+            started = time.monotonic()
+            await super().put(item)
+            self.wait_time += time.monotonic() - started
+        else:
+            self.put_nowait(item)
+        self.high_water = max(self.high_water, self.qsize())
+
+
+class Utterance:
+    """One spoken question and its stage timestamps (time.monotonic())."""
+
+    def __init__(self, number: int, speech_start: float):
+        self.number = number
+        self.speech_start = speech_start
+        self.speech_end = None
+        self.transcribed = None     # final transcript ready
+        self.asked = None           # final ASK written
+        self.first_token = None     # first answer text from the LLM
+        self.first_reply = None     # first REPLY written
+        self.replied = None         # complete answer written
+        self.text = ""
+        self.answer = ""
+        self.partials = 0
+        self.ask_writes = 0
+        self.reply_writes = 0
+
+    def since_end(self, t: Optional[float]) -> Optional[float]:
+        return None if t is None or self.speech_end is None else t - self.speech_end
+
+
+class _Done(NamedTuple):
+    """End-of-stream marker passed down a queue."""
+    utterance: Utterance
+
+
+STAGES = ("transcribed", "asked", "first_token", "first_reply", "replied")
+
+
+class VoicePipeline:
+    """
+    VAD events -> capture -> recognize -> ASK -> LLM -> REPLY.
+
+    Feed every glasses notification to handle_notify() and run run() as a
+    task. session is an EvenAISession (it writes ASK/REPLY and handles
+    CTRL(ENTER)). Each queue holds at most queue_size items.
+    """
+
+    def __init__(self, session, provider: LLMProvider, source: AudioSource, recognizer: Recognizer,
+                 flipper=None, queue_size: int = 8, system_prompt: str = "Be concise.",
+                 quiet: bool = False):
+        self.session = session
+        self.provider = provider
+        self.source = source
+        self.recognizer = recognizer
+        self.flipper = flipper
+        self.system_prompt = system_prompt
+        self.quiet = quiet
+
+        self.events = StageQueue("events", 0)
+        self.audio = StageQueue("audio", queue_size * 25)     # ~0.5 s of 20 ms frames per slot
+        self.transcripts = StageQueue("transcripts", queue_size)
+        self.questions = StageQueue("questions", queue_size)
+        self.tokens = StageQueue("tokens", queue_size)
+        self.queues = (self.audio, self.transcripts, self.questions, self.tokens)
+
+        self._decoder = FrameDecoder()
+        self._current: Optional[Utterance] = None
+        self._tasks = set()
+        self._stopped = threading.Event()   # set when run() ends; releases worker threads waiting on a queue
+        self.utterances: List[Utterance] = []
+        self.audio_dropped = 0
+        self.completed = 0
+        self.errors = 0
+
+    def log(self, message: str):
+        if not self.quiet:
+            print(message)
+
+    # -------------------------------------------------------------------------
+    # Inputs
+    # -------------------------------------------------------------------------
+
+    def handle_notify(self, data: bytes):
+        """Pick Even AI CTRL/VAD events out of glasses notifications."""
+        frame = self._decoder.feed(bytes(data))
+        if frame is None or frame.service not in (0x0700, 0x0701):
+            return
+        event = parse_ai_event(frame.payload)
+        if event is not None:
+            self.events.put_nowait((time.monotonic(), *event))
+
+    async def push_audio(self, frame: bytes):
+        """Queue a captured frame, waiting while the recognizer is behind."""
+        if self._current is not None:
+            await self.audio.put(frame)
+
+    def push_audio_nowait(self, frame: bytes):
+        """Queue a captured frame, dropping it if the recognizer is behind (live microphone)."""
+        if self._current is None:
+            return
+        try:
+            self.audio.put_nowait(frame)
+            self.audio.high_water = max(self.audio.high_water, self.audio.qsize())
+        except asyncio.QueueFull:
+            self.audio_dropped += 1
+
+    # -------------------------------------------------------------------------
+    # Stages
+    # -------------------------------------------------------------------------
+
+    async def _control(self):
+        """VAD/CTRL events: start and stop capture, keep AI mode entered."""
+        while True:
+            received, kind, status = await self.events.get()
+            if kind == "ctrl" and status == 1:
+                # WAKE_UP: CTRL(ENTER) keeps AI mode open for the voice flow. It
+                # runs beside capture so VAD_START is not held up behind it.
+                task = asyncio.create_task(self.session.ensure_active())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            elif kind == "vad" and status == VAD_START and self._current is None:
+                self._current = Utterance(len(self.utterances) + 1, received)
+                self.utterances.append(self._current)
+                self.log(f"  [{self._current.number}] Listening...")
+                await self.source.start(self)
+            elif kind == "vad" and status in (VAD_END, VAD_TIMEOUT) and self._current is not None:
+                utterance = self._current
+                utterance.speech_end = received
+                await self.source.stop()
+                self._current = None
+                await self.audio.put(_Done(utterance))
+
+    async def _recognize(self):
+        """Audio frames -> partial transcripts, then the final one at end of speech."""
+        while True:
+            item = await self.audio.get()
+            if isinstance(item, _Done):
+                utterance = item.utterance
+                utterance.text = await asyncio.to_thread(self.recognizer.finish)
+                utterance.transcribed = time.monotonic()
+                await self.transcripts.put(_Done(utterance))
+                continue
+            partial = await asyncio.to_thread(self.recognizer.accept, item)
+            if partial:
+                await self.transcripts.put(partial)
+
+    async def _ask(self):
+        """Transcripts -> ASK writes. Only the newest partial waiting in the queue is sent."""
+        asked = None
+        while True:
+            item = await self.transcripts.get()
+            while not isinstance(item, _Done) and not self.transcripts.empty():
+                item = self.transcripts.get_nowait()
+
+            if isinstance(item, _Done):
+                utterance = item.utterance
+                text = utterance.text.strip()
+                if text and text != asked:
+                    await self.session.ask(text)
+                    utterance.ask_writes += 1
+                utterance.asked = time.monotonic()
+                asked = None
+                if text:
+                    self.log(f"  [{utterance.number}] Heard: {text}")
+                    await self.questions.put(utterance)
+                else:
+                    self.log(f"  [{utterance.number}] (nothing recognized)")
+                continue
+
+            if item != asked:
+                await self.session.ask(item)
+                asked = item
+                if self.utterances:
+                    self.utterances[-1].partials += 1
+                    self.utterances[-1].ask_writes += 1
+
+    async def _llm(self):
+        """Questions -> answer chunks, streamed from a worker thread with backpressure."""
+        loop = asyncio.get_running_loop()
+        while True:
+            utterance = await self.questions.get()
+
+            def produce():
+                stream = getattr(self.provider, "stream", None)
+                chunks = (stream(utterance.text, system_prompt=self.system_prompt) if stream is not None
+                          else [self.provider.query(utterance.text, system_prompt=self.system_prompt)])
+                try:
+                    for chunk in chunks:
+                        if not self._put_from_thread(self.tokens, chunk, loop):
+                            return
+                finally:
+                    close = getattr(chunks, "close", None)
+                    if close is not None:
+                        close()
+
+            try:
+                await asyncio.to_thread(produce)
+            except Exception as e:
+                self.errors += 1
+                await self.tokens.put(f"Error: {str(e)[:50]}")
+            await self.tokens.put(_Done(utterance))
+
+    def _put_from_thread(self, queue: StageQueue, item, loop) -> bool:
+        """Put item from a worker thread, waiting for room; False once run() has stopped."""
+        if self._stopped.is_set():
+            return False
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(THREAD_POLL)
+                return True
+            except concurrent.futures.TimeoutError:
+                if self._stopped.is_set():
+                    future.cancel()
+                    return False
+
+    async def _reply(self):
+        """Answer chunks -> REPLY writes, one per page as it fills up and the last page when done."""
+        stream = None
+        while True:
+            item = await self.tokens.get()
+            done = None
+            frames = []
+            while True:
+                if isinstance(item, _Done):
+                    done = item.utterance
+                    break
+                if stream is None:
+                    stream = self.session.reply_stream()
+                frames += stream.feed(item)
+                if self.tokens.empty():
+                    break
+                item = self.tokens.get_nowait()
+
+            answer = stream.answer if stream is not None else ""
+            utterance = done or next((u for u in self.utterances if u.asked and not u.replied), None)
+            if utterance is not None and utterance.first_token is None and answer:
+                utterance.first_token = time.monotonic()
+
+            pager = None
+            if done is not None and answer:
+                pager = stream.finish()
+                frames.append(pager.current)
+            for frame in frames:
+                await self.session.write(frame)
+            if frames and utterance is not None:
+                utterance.reply_writes += len(frames)
+                if utterance.first_reply is None:
+                    utterance.first_reply = time.monotonic()
+            if pager is not None and self.flipper is not None:
+                self.flipper.pager = pager
+
+            if done is not None:
+                done.answer = answer.strip()
+                done.replied = time.monotonic()
+                self.completed += 1
+                latency = done.since_end(done.first_reply)
+                self.log(f"  [{done.number}] Answer: {done.answer}"
+                         + (f"  ({latency * 1000:.0f} ms to first page)" if latency is not None else ""))
+                stream = None
+
+    async def run(self):
+        """Run all stages until cancelled."""
+        self._stopped.clear()
+        stages = [self._control(), self._recognize(), self._ask(), self._llm(), self._reply()]
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self._stopped.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def print_stats(self):
+        done = [u for u in self.utterances if u.replied is not None]
+        if not done:
+            return
+        print(f"\nVoice: {len(done)} utterances answered, {self.errors} LLM errors, "
+              f"{self.audio_dropped} audio frames dropped")
+        print(f"  {'after end of speech':<22} {'p50 ms':>8} {'p90 ms':>8} {'max ms':>8}")
+        for stage in STAGES:
+            values = sorted(u.since_end(getattr(u, stage)) for u in done
+                            if u.since_end(getattr(u, stage)) is not None)
+            if values:
+                p50 = values[min(len(values) - 1, int(0.5 * len(values)))]
+                p90 = values[min(len(values) - 1, int(0.9 * len(values)))]
+                print(f"  {stage:<22} {p50 * 1000:>8.0f} {p90 * 1000:>8.0f} {values[-1] * 1000:>8.0f}")
+        print(f"  {'queue':<22} {'max':>8} {'waits':>8} {'wait ms':>8}")
+        for queue in self.queues:
+            print(f"  {queue.name:<22} {queue.high_water:>4}/{queue.maxsize:<3} {queue.waits:>8} "
+                  f"{queue.wait_time * 1000:>8.0f}")
+
+
+# =============================================================================
+# Offline Demo
+# =============================================================================
+
+SPOKEN = [
+    "what is the capital of France",
+    "why is the sky blue",
+    "explain quantum computing",
+    "what is two plus two",
+    "is water wet",
+]
+
+
+async def main():
+    from emulator import G2Emulator
+    from frames import CHAR_NOTIFY
+    from llm_teleprompter import EvenAISession
+    from providers import StubProvider
+
+    parser = argparse.ArgumentParser(description='Offline voice pipeline run against the G2 emulator')
+    parser.add_argument('-n', '--count', type=int, default=5, help='Utterances (default: 5)')
+    parser.add_argument('--word-ms', type=float, default=300.0, help='Speaking time per word')
+    parser.add_argument('--decode-ms', type=float, default=2.0, help='Recognizer work per 20 ms frame')
+    parser.add_argument('--first-token-ms', type=float, default=300.0)
+    parser.add_argument('--tps', type=float, default=50.0, help='LLM tokens/sec after the first token')
+    parser.add_argument('--queue-size', type=int, default=8)
+    parser.add_argument('--write-latency-ms', type=float, default=7.5)
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args()
+
+    glasses = G2Emulator(write_latency=args.write_latency_ms / 1000)
+    session = EvenAISession(glasses)
+    audio = ScriptedAudio(word_ms=args.word_ms)
+    recognizer = ScriptedRecognizer(decode_ms=args.decode_ms)
+    provider = StubProvider(first_token_ms=args.first_token_ms, tokens_per_sec=args.tps)
+    pipeline = VoicePipeline(session, provider, audio, recognizer,
+                             queue_size=args.queue_size, quiet=args.quiet)
+
+    def on_notify(sender, data: bytearray):
+        session.handle_notify(bytes(data))
+        pipeline.handle_notify(data)
+
+    await glasses.start_notify(CHAR_NOTIFY, on_notify)
+    print(f"Recognizer: {recognizer.name}, provider: {provider.name}\n")
+
+    runner = asyncio.create_task(pipeline.run())
+    stdout = sys.stdout
+    if args.quiet:
+        sys.stdout = open(os.devnull, "w")
+    try:
+        for i in range(args.count):
+            spoken = audio.say(SPOKEN[i % len(SPOKEN)])
+            glasses.send_ai_status(1)                   # "Hey Even"
+            glasses.send_vad(VAD_START)
+            await asyncio.sleep(spoken)
+            glasses.send_vad(VAD_END)
+            while pipeline.completed <= i:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.2)
+    finally:
+        if args.quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+    pipeline.print_stats()
+    if glasses.ignored_ai:
+        print(f"  WARNING: {glasses.ignored_ai} Even AI frames ignored outside AI mode")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
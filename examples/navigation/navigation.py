@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Navigation - Turn-by-Turn Updates on G2 Glasses
+
+Builds navigation frames (service 0x08-20, docs/navigation.md) from a route
+state and sends only meaningful changes:
+
+    - Each displayed field is encoded once and cached. An update re-encodes
+      only the fields whose text changed.
+    - Distances are shown in buckets (10 m under 100 m, 50 m under 1 km,
+      0.1 km above), so most GPS ticks change nothing and send nothing.
+    - A new maneuver (instruction/icon) is sent at once. Distance and time
+      changes are sent at most once per second. Speed/ETA changes are
+      sent at most every 5 s, or with the next larger change.
+
+Replays a GPX track (or a built-in synthetic drive) through the G2 emulator
+as fast as possible and reports frames/min and CPU per update:
+
+Usage:
+    python navigation.py                          # synthetic route, emulator
+    python navigation.py ride.gpx --speedup 20    # GPX track at 20x real time
+    python navigation.py ride.gpx --glasses       # send to real glasses
+
+Requirements:
+    pip install bleak       # only for --glasses
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+import g2_proto as pb
+from frames import CHAR_NOTIFY, CHAR_WRITE, FrameWriter, build_packet, encode_varint, negotiated_mtu
+
+MODE_NAVIGATION = 7
+DISTANCE_TYPE = 4           # NavigationStep field 1, always 4 in captures
+
+ICON_LEFT = 1
+ICON_RIGHT = 2              # assumed (docs/navigation.md)
+ICON_STRAIGHT = 3           # assumed
+ICON_UTURN = 4              # assumed
+
+# NavigationStep fields (proto/g2_protocol.proto): name -> (number, send priority)
+URGENT, NORMAL, MINOR = 0, 1, 2
+STEP_FIELDS = {
+    "distance": (2, NORMAL),
+    "instruction": (3, URGENT),
+    "time_remaining": (4, NORMAL),
+    "total_distance": (5, NORMAL),
+    "eta": (6, MINOR),
+    "speed": (7, MINOR),
+    "icon": (8, URGENT),
+}
+MAX_TEXT_BYTES = 48
+
+
+class RouteState(NamedTuple):
+    """Where we are on the route, in raw units."""
+    maneuver_m: float       # distance to the next maneuver
+    instruction: str
+    icon: int
+    remaining_m: float
+    remaining_s: float
+    speed_mps: float
+    eta: float              # unix time
+
+
+# =============================================================================
+# Formatting
+# =============================================================================
+
+def format_distance(meters: float) -> str:
+    """Bucketed distance text: 10 m steps below 100 m, 50 m below 1 km, then 0.1 km."""
+    if meters < 100:
+        return f"{int(meters // 10 * 10)} m"
+    if meters < 1000:
+        return f"{int(meters // 50 * 50)} m"
+    return f"{meters / 1000:.1f} km"
+
+
+def format_duration(seconds: float) -> str:
+    minutes = max(0, math.ceil(seconds / 60))
+    if minutes < 60:
+        return f"{minutes} min"
+    return f"{minutes // 60} h {minutes % 60:02d} min"
+
+
+def format_eta(unix_time: float) -> str:
+    return "ETA: " + datetime.fromtimestamp(unix_time).strftime("%H:%M")
+
+
+def format_speed(mps: float) -> str:
+    return f"{mps * 3.6:.0f} km/h"
+
+
+def render(state: RouteState) -> Dict[str, object]:
+    """Display values for each NavigationStep field."""
+    return {
+        "distance": format_distance(state.maneuver_m),
+        "instruction": state.instruction,
+        "time_remaining": format_duration(state.remaining_s),
+        "total_distance": format_distance(state.remaining_m),
+        "eta": format_eta(state.eta),
+        "speed": format_speed(state.speed_mps),
+        "icon": state.icon,
+    }
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+def _truncate(text: str, max_bytes: int) -> bytes:
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return data
+    return data[:max_bytes].decode("utf-8", errors="ignore").encode("utf-8")
+
+
+class StepEncoder:
+    """
+    NavigationStep payload built from cached per-field segments.
+
+    set() re-encodes a field only when its value changed; payload() joins
+    the cached segments, and is itself cached until the next change.
+    """
+
+    def __init__(self):
+        self.values: Dict[str, object] = {}
+        self.segments: Dict[str, bytes] = {}
+        self.encodes = 0
+        self._prefix = bytes([0x08]) + encode_varint(DISTANCE_TYPE)
+        self._payload: Optional[bytes] = None
+
+    def set(self, name: str, value) -> bool:
+        if self.values.get(name) == value:
+            return False
+        number = STEP_FIELDS[name][0]
+        if isinstance(value, int):
+            segment = encode_varint(number << 3) + encode_varint(value)
+        else:
+            data = _truncate(value, MAX_TEXT_BYTES)
+            segment = encode_varint(number << 3 | 2) + encode_varint(len(data)) + data
+        self.values[name] = value
+        self.segments[name] = segment
+        self.encodes += 1
+        self._payload = None
+        return True
+
+    def payload(self) -> bytes:
+        """NavigationMessage { mode: 7, step: {...} }."""
+        if self._payload is None:
+            step = self._prefix + b"".join(self.segments[name] for name in STEP_FIELDS
+                                           if name in self.segments)
+            self._payload = (bytes([0x08, MODE_NAVIGATION, 0x2A]) + encode_varint(len(step)) + step)
+        return self._payload
+
+
+class NavigationClient:
+    """
+    Sends RouteState updates to 0x08-20, skipping and rate-limiting small changes.
+
+    Fields changed since the last send are tracked. Their highest priority
+    sets how long since the last send is required: 0 for a new maneuver,
+    min_interval for distance/time, minor_interval for speed/ETA. Held
+    changes go out with a later update or flush().
+    """
+
+    def __init__(self, client, seq: int = 0x40, min_interval: float = 1.0,
+                 minor_interval: float = 5.0, clock=time.monotonic):
+        self.client = client
+        self.writer = FrameWriter(client)
+        self.seq = seq
+        self.wait = {URGENT: 0.0, NORMAL: min_interval, MINOR: minor_interval}
+        self.clock = clock
+        self.encoder = StepEncoder()
+        self._unsent: Dict[str, int] = {}
+        self._last_send: Optional[float] = None
+
+        self.updates = 0
+        self.sent = 0
+        self.unchanged = 0
+        self.held = 0
+        self.bytes_sent = 0
+        self.cpu_time = 0.0         # process time spent in update(), excluding the write
+
+    async def update(self, state: RouteState, now: float = None) -> bool:
+        """Apply a new route state; returns True if a frame was sent."""
+        started = time.process_time()
+        now = self.clock() if now is None else now
+        self.updates += 1
+        for name, value in render(state).items():
+            if self.encoder.set(name, value):
+                self._unsent[name] = STEP_FIELDS[name][1]
+
+        packet = None
+        if not self._unsent:
+            self.unchanged += 1
+        elif (self._last_send is not None
+              and now - self._last_send < self.wait[min(self._unsent.values())]):
+            self.held += 1
+        else:
+            packet = self._packet(now)
+        self.cpu_time += time.process_time() - started
+
+        if packet is None:
+            return False
+        await self._write(packet)
+        return True
+
+    async def flush(self, now: float = None):
+        """Send held changes regardless of the rate limit."""
+        if self._unsent:
+            packet = self._packet(self.clock() if now is None else now)
+            await self._write(packet)
+
+    async def _write(self, packet: bytes):
+        written = await self.writer.write(packet)
+        self.bytes_sent += sum(len(p) for p in written)
+
+    def _packet(self, now: float) -> bytes:
+        packet = build_packet(self.seq, 0x08, 0x20, self.encoder.payload())
+        self.seq = (self.seq + 1) & 0xFF
+        self._unsent.clear()
+        self._last_send = now
+        self.sent += 1
+        return packet
+
+
+# =============================================================================
+# Route Replay
+# =============================================================================
+
+class TrackPoint(NamedTuple):
+    lat: float
+    lon: float
+    t: float                # unix time
+
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine(a: TrackPoint, b: TrackPoint) -> float:
+    lat1, lat2 = math.radians(a.lat), math.radians(b.lat)
+    dlat, dlon = lat2 - lat1, math.radians(b.lon - a.lon)
+    h = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(h))
+
+
+def bearing(a: TrackPoint, b: TrackPoint) -> float:
+    lat1, lat2 = math.radians(a.lat), math.radians(b.lat)
+    dlon = math.radians(b.lon - a.lon)
+    x = math.sin(dlon) * math.cos(lat2)
+    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
+    return math.degrees(math.atan2(x, y)) % 360
+
+
+def load_gpx(path: str, speed_kmh: float = 30.0) -> List[TrackPoint]:
+    """Track (or route) points from a GPX file. Points without times get speed_kmh."""
+    points = []
+    for _, elem in ET.iterparse(path):
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag not in ("trkpt", "rtept"):
+            continue
+        when = next((child.text for child in elem if child.tag.rsplit("}", 1)[-1] == "time"), None)
+        t = datetime.fromisoformat(when.replace("Z", "+00:00")).timestamp() if when else None
+        points.append((float(elem.get("lat")), float(elem.get("lon")), t))
+        elem.clear()
+
+    track = []
+    start = time.time()
+    for i, (lat, lon, t) in enumerate(points):
+        if t is None:
+            t = start if not track else track[-1].t + haversine(track[-1], TrackPoint(lat, lon, 0)) / (speed_kmh / 3.6)
+        track.append(TrackPoint(lat, lon, t))
+    return track
+
+
+def synthetic_track(seed: int = 1) -> List[TrackPoint]:
+    """A ~25 minute city drive with turns, speed changes and 3 m GPS noise, one fix per second."""
+    rng = random.Random(seed)
+    legs = [(0, 1200), (90, 800), (0, 400), (270, 1500), (0, 2500), (90, 300),
+            (180, 600), (90, 2000), (45, 900), (0, 700), (270, 250)]
+    lat0, lon0 = 51.5007, -0.1246
+    m_per_deg_lat = 111320.0
+    m_per_deg_lon = m_per_deg_lat * math.cos(math.radians(lat0))
+    x = y = 0.0
+    t = time.time()
+    track = [TrackPoint(lat0, lon0, t)]
+    speed = 8.0
+    for heading, length in legs:
+        travelled = 0.0
+        speed = 4.0                     # slow through the turn
+        while travelled < length:
+            speed = min(15.0, max(2.0, speed + rng.uniform(-0.5, 1.0)))
+            step = min(speed, length - travelled)
+            travelled += step
+            x += step * math.sin(math.radians(heading))
+            y += step * math.cos(math.radians(heading))
+            t += 1.0
+            nx, ny = x + rng.gauss(0, 3), y + rng.gauss(0, 3)
+            track.append(TrackPoint(lat0 + ny / m_per_deg_lat, lon0 + nx / m_per_deg_lon, t))
+    return track
+
+
+def find_maneuvers(track: List[TrackPoint], cum: List[float], min_turn: float = 45.0,
+                   spacing: float = 25.0) -> List[Tuple[float, str, int]]:
+    """(distance along track, instruction, icon) for each turn, from the track geometry."""
+    # Bearings between points at least `spacing` apart, so GPS noise does not look like turns
+    anchors = [0]
+    for i in range(1, len(track)):
+        if cum[i] - cum[anchors[-1]] >= spacing:
+            anchors.append(i)
+
+    maneuvers = []
+    for a, b, c in zip(anchors, anchors[1:], anchors[2:]):
+        turn = (bearing(track[b], track[c]) - bearing(track[a], track[b]) + 180) % 360 - 180
+        if abs(turn) < min_turn or (maneuvers and cum[b] - maneuvers[-1][0] < 2 * spacing):
+            continue
+        if abs(turn) > 150:
+            maneuvers.append((cum[b], "Make a U-turn", ICON_UTURN))
+        elif turn < 0:
+            maneuvers.append((cum[b], "Turn left", ICON_LEFT))
+        else:
+            maneuvers.append((cum[b], "Turn right", ICON_RIGHT))
+    maneuvers.append((cum[-1], "Arrive at destination", ICON_STRAIGHT))
+    return maneuvers
+
+
+def route_states(track: List[TrackPoint]):
+    """Yield (track time, RouteState) for every fix."""
+    cum = [0.0]
+    for a, b in zip(track, track[1:]):
+        cum.append(cum[-1] + haversine(a, b))
+    total = cum[-1]
+    maneuvers = find_maneuvers(track, cum)
+
+    m = 0
+    speed = 0.0
+    for i, point in enumerate(track):
+        while m < len(maneuvers) - 1 and maneuvers[m][0] <= cum[i]:
+            m += 1
+        if i:
+            dt = max(1e-3, point.t - track[i - 1].t)
+            speed = 0.7 * speed + 0.3 * (cum[i] - cum[i - 1]) / dt
+        elapsed = point.t - track[0].t
+        average = cum[i] / elapsed if elapsed > 0 else speed
+        remaining_m = total - cum[i]
+        remaining_s = remaining_m / max(average, 0.5)
+        at, instruction, icon = maneuvers[m]
+        yield point.t, RouteState(max(0.0, at - cum[i]), instruction, icon, remaining_m,
+                                  remaining_s, speed, point.t + remaining_s)
+
+
+# =============================================================================
+# Glasses
+# =============================================================================
+
+def build_auth_packets() -> list:
+    """7-packet authentication sequence (same bytes as examples/even-ai)."""
+    ts = encode_varint(int(time.time()))
+    txid = bytes([0xE8, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x01])
+    capability = bytes([0x1A, 0x04, 0x08, 0x01, 0x10, 0x04])
+    return [
+        build_packet(0x01, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x0C]) + capability),
+        build_packet(0x02, 0x80, 0x20, bytes([0x08, 0x05, 0x10, 0x0E, 0x22, 0x02, 0x08, 0x02])),
+        build_packet(0x03, 0x80, 0x20, bytes([0x08, 0x80, 0x01, 0x10, 0x0F, 0x82, 0x08, 0x11, 0x08])
+                     + ts + bytes([0x10]) + txid),
+        build_packet(0x04, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x10]) + capability),
+        build_packet(0x05, 0x80, 0x00, bytes([0x08, 0x04, 0x10, 0x11]) + capability),
+        build_packet(0x06, 0x80, 0x20, bytes([0x08, 0x05, 0x10, 0x12, 0x22, 0x02, 0x08, 0x01])),
+        build_packet(0x07, 0x80, 0x20, bytes([0x08, 0x80, 0x01, 0x10, 0x13, 0x82, 0x08, 0x11, 0x08])
+                     + ts + bytes([0x10]) + txid),
+    ]
+
+
+async def connect_glasses(left: bool = False):
+    from bleak import BleakClient, BleakScanner
+
+    print("Scanning for G2 glasses...")
+    devices = await BleakScanner.discover(timeout=10.0)
+    pattern = "_L_" if left else "_R_"
+    device = next((d for d in devices if d.name and "G2" in d.name and pattern in d.name), None)
+    if not device:
+        print("ERROR: No G2 glasses found")
+        return None
+    print(f"  Using: {device.name}")
+    client = BleakClient(device)
+    await client.connect()
+    await client.start_notify(CHAR_NOTIFY, lambda sender, data: None)
+    for pkt in build_auth_packets():
+        await client.write_gatt_char(CHAR_WRITE, pkt, response=False)
+        await asyncio.sleep(0.1)
+    await asyncio.sleep(0.5)
+    print(f"  Authenticated! (MTU {await negotiated_mtu(client)})")
+    return client
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def replay(client, track: List[TrackPoint], speedup: float, verify: bool = False) -> NavigationClient:
+    """Feed every fix of the track to a NavigationClient on client."""
+    nav = NavigationClient(client)
+    previous = None
+    for t, state in route_states(track):
+        if speedup > 0 and previous is not None:
+            await asyncio.sleep((t - previous) / speedup)
+        previous = t
+        await nav.update(state, now=t)
+        if verify:
+            values = nav.encoder.values
+            step = [values[name] if name == "icon" else _truncate(values[name], MAX_TEXT_BYTES).decode("utf-8")
+                    for name in STEP_FIELDS]
+            expected = pb.encode_navigation_message(
+                mode=MODE_NAVIGATION, step=pb.encode_navigation_step(DISTANCE_TYPE, *step))
+            if nav.encoder.payload() != expected:
+                raise AssertionError(f"Cached payload {nav.encoder.payload().hex()} != {expected.hex()}")
+    await nav.flush(now=previous)
+    return nav
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Replay a route as G2 navigation updates')
+    parser.add_argument('gpx', nargs='?', help='GPX track (default: built-in synthetic drive)')
+    parser.add_argument('--speedup', type=float, default=0.0,
+                        help='Replay speed vs real time (default: 0 = as fast as possible)')
+    parser.add_argument('--speed-kmh', type=float, default=30.0, help='Speed for GPX points without times')
+    parser.add_argument('--glasses', action='store_true', help='Send to real glasses instead of the emulator')
+    parser.add_argument('--left', action='store_true', help='Use left eye instead of right')
+    parser.add_argument('--verify', action='store_true',
+                        help='Check every cached payload against the generated protobuf codec')
+    args = parser.parse_args()
+
+    track = load_gpx(args.gpx, args.speed_kmh) if args.gpx else synthetic_track()
+    if len(track) < 2:
+        print("ERROR: track needs at least 2 points")
+        return
+    duration = track[-1].t - track[0].t
+    print(f"Track: {args.gpx or 'synthetic'} - {len(track)} fixes over {duration / 60:.1f} min")
+
+    if args.glasses:
+        client = await connect_glasses(args.left)
+        if client is None:
+            return
+        speedup = args.speedup or 1.0
+    else:
+        from emulator import G2Emulator
+        client = G2Emulator(write_latency=0.0)
+        speedup = args.speedup
+
+    try:
+        nav = await replay(client, track, speedup, args.verify)
+    finally:
+        if args.glasses:
+            await client.disconnect()
+
+    minutes = max(duration / 60, 1e-9)
+    print(f"\nUpdates:   {nav.updates} ({nav.updates / minutes:.0f}/min of track time)")
+    print(f"Sent:      {nav.sent} frames ({nav.sent / minutes:.1f}/min), {nav.bytes_sent} bytes")
+    print(f"Skipped:   {nav.unchanged} unchanged, {nav.held} held by the rate limit")
+    print(f"Encoded:   {nav.encoder.encodes} fields (vs {nav.updates * len(STEP_FIELDS)} re-encoding every update)")
+    print(f"CPU:       {nav.cpu_time / nav.updates * 1e6:.1f} us per update")
+    if not args.glasses:
+        shown = client.navigation
+        print(f"Glasses:   {shown.get('distance')} - {shown.get('instruction')} - "
+              f"{shown.get('total_distance')} left ({client.services[0x0820]} frames received)")
+        if args.verify:
+            print("Verify:    every payload matches g2_proto.encode_navigation_message()")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted")
@@ -148,6 +148,41 @@ def build_packet(seq: int, svc_hi: int, svc_lo: int, payload: bytes,
     return header + payload + bytes([crc & 0xFF, (crc >> 8) & 0xFF])
 
 
+# =============================================================================
+# Packet Sizing
+# =============================================================================
+
+ATT_OVERHEAD = 3            # opcode + handle of a write command
+FRAME_OVERHEAD = 10         # 8-byte header + CRC-16
+MTU_STEPS = (512, 247, 185, 23)     # tried in turn after a rejected write
+
+
+async def negotiated_mtu(client) -> int:
+    """ATT MTU of the connection; BlueZ reports 23 until asked to acquire it."""
+    acquire = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception:
+            pass
+    mtu = getattr(client, "mtu_size", None)
+    return mtu if isinstance(mtu, int) and mtu >= 23 else 23
+
+
+def max_chunk(mtu: int) -> int:
+    """Largest packet payload one write can carry at this MTU."""
+    return max(1, min(mtu - ATT_OVERHEAD - FRAME_OVERHEAD, 0xFF - 2))
+
+
+def smaller_mtu(mtu: int, error: Exception) -> int:
+    """Next MTU to try after a rejected write; re-raises when there is none or the link is gone."""
+    smaller = [m for m in MTU_STEPS if m < mtu]
+    if isinstance(error, (ConnectionError, TimeoutError)) or not smaller:
+        raise error
+    print(f"  Write rejected at MTU {mtu} ({error}); retrying at {smaller[0]}")
+    return smaller[0]
+
+
 async def authenticate(client, name: str):
     """Send authentication sequence to a G2 eye."""
     ts = int(time.time())
@@ -186,7 +221,23 @@ def build_notification_json(title: str, subtitle: str, message: str,
     return json.dumps(notif, separators=(',', ':')).encode()
 
 
-async def send_notification(right_client, left_client, title: str, subtitle: str, message: str):
+async def send_data(client, data: bytes, mtu: int) -> int:
+    """Send DATA packets sized from the MTU, all again one step smaller if a write is rejected."""
+    while True:
+        size = max_chunk(mtu)
+        chunks = [data[i:i+size] for i in range(0, len(data), size)]
+        try:
+            for i, chunk in enumerate(chunks):
+                pkt = build_packet(0x49, 0xC5, 0x00, chunk, len(chunks), i+1)
+                await client.write_gatt_char(CHAR_NOTIF_WRITE, pkt, response=False)
+                await asyncio.sleep(0.05)
+            return mtu
+        except Exception as e:
+            mtu = smaller_mtu(mtu, e)
+
+
+async def send_notification(right_client, left_client, title: str, subtitle: str, message: str,
+                            mtu: int = 247):
     """Send a push notification to G2 glasses."""
     json_bytes = build_notification_json(title, subtitle, message)
     size, checksum, extra = calc_file_check_fields(json_bytes)
@@ -214,11 +265,7 @@ async def send_notification(right_client, left_client, title: str, subtitle: str
     await asyncio.sleep(0.1)
 
     # DATA chunks
-    chunks = [json_bytes[i:i+234] for i in range(0, len(json_bytes), 234)]
-    for i, chunk in enumerate(chunks):
-        pkt = build_packet(0x49, 0xC5, 0x00, chunk, len(chunks), i+1)
-        await right_client.write_gatt_char(CHAR_NOTIF_WRITE, pkt, response=False)
-        await asyncio.sleep(0.05)
+    await send_data(right_client, json_bytes, mtu)
     await asyncio.sleep(0.3)
 
     # END
@@ -272,8 +319,10 @@ async def main():
         await authenticate(left, "LEFT")
         await authenticate(right, "RIGHT")
         await asyncio.sleep(0.5)
+        mtu = await negotiated_mtu(right)
+        print(f"  MTU {mtu}: up to {max_chunk(mtu)} bytes per DATA packet")
 
-        await send_notification(right, left, title, subtitle, message)
+        await send_notification(right, left, title, subtitle, message, mtu)
 
         print("\nNotification sent!")
         await asyncio.sleep(3.0)
@@ -3,7 +3,8 @@
 Even G2 Push Notification - Size-Limited Version
 
 Sends push notifications with custom text to Even G2 glasses.
-Automatically truncates content to fit in a single BLE packet (234 bytes max).
+Automatically truncates content to fit in a single BLE packet: 234 bytes
+at a 247-byte MTU, up to 253 at 512, as the connection's MTU allows.
 
 Usage:
     python notification_limited.py "Title" "Subtitle" "Message"
@@ -28,7 +29,7 @@ CHAR_NOTIFY = UUID_BASE.format(0x5402)
 CHAR_NOTIF_WRITE = UUID_BASE.format(0x7401)
 CHAR_NOTIF_NOTIFY = UUID_BASE.format(0x7402)
 
-# Maximum JSON size for single-packet transfer
+# Maximum JSON size for single-packet transfer at a 247-byte MTU
 MAX_JSON_SIZE = 234
 
 # CRC32C (Castagnoli) lookup table
@@ -152,6 +153,41 @@ def build_packet(seq: int, svc_hi: int, svc_lo: int, payload: bytes,
     return header + payload + bytes([crc & 0xFF, (crc >> 8) & 0xFF])
 
 
+# =============================================================================
+# Packet Sizing
+# =============================================================================
+
+ATT_OVERHEAD = 3            # opcode + handle of a write command
+FRAME_OVERHEAD = 10         # 8-byte header + CRC-16
+MTU_STEPS = (512, 247, 185, 23)     # tried in turn after a rejected write
+
+
+async def negotiated_mtu(client) -> int:
+    """ATT MTU of the connection; BlueZ reports 23 until asked to acquire it."""
+    acquire = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception:
+            pass
+    mtu = getattr(client, "mtu_size", None)
+    return mtu if isinstance(mtu, int) and mtu >= 23 else 23
+
+
+def max_chunk(mtu: int) -> int:
+    """Largest packet payload one write can carry at this MTU."""
+    return max(1, min(mtu - ATT_OVERHEAD - FRAME_OVERHEAD, 0xFF - 2))
+
+
+def smaller_mtu(mtu: int, error: Exception) -> int:
+    """Next MTU to try after a rejected write; re-raises when there is none or the link is gone."""
+    smaller = [m for m in MTU_STEPS if m < mtu]
+    if isinstance(error, (ConnectionError, TimeoutError)) or not smaller:
+        raise error
+    print(f"  Write rejected at MTU {mtu} ({error}); retrying at {smaller[0]}")
+    return smaller[0]
+
+
 async def authenticate(client, name: str):
     """Send authentication sequence to a G2 eye."""
     ts = int(time.time())
@@ -213,6 +249,8 @@ def build_notification_json(title: str, subtitle: str, message: str,
     # Calculate overhead (JSON with empty strings)
     overhead = len(make_json("", "", ""))
     available = max_size - overhead
+    if available < 0:
+        raise ValueError(f"A notification needs {overhead} bytes; a packet carries {max_size}")
 
     # Truncate message first (priority: title > subtitle > message)
     truncated = True
@@ -239,14 +277,30 @@ def build_notification_json(title: str, subtitle: str, message: str,
     return make_json(current_title, current_subtitle, current_message), truncated
 
 
-async def send_notification(right_client, left_client, title: str, subtitle: str, message: str):
-    """Send a push notification to G2 glasses."""
-    json_bytes, was_truncated = build_notification_json(title, subtitle, message)
-    size, checksum, extra = calc_file_check_fields(json_bytes)
-
+async def send_notification(right_client, left_client, title: str, subtitle: str, message: str,
+                            mtu: int = 247):
+    """Send a push notification to G2 glasses, truncated to one packet at this MTU."""
     print(f"\nSending: {title} / {subtitle}")
-    if was_truncated:
-        print(f"  (Content truncated to fit {MAX_JSON_SIZE} byte limit)")
+    while True:
+        limit = max_chunk(mtu)
+        json_bytes, was_truncated = build_notification_json(title, subtitle, message, max_size=limit)
+        if was_truncated:
+            print(f"  (Content truncated to fit {limit} byte limit at MTU {mtu})")
+        try:
+            await send_file(right_client, json_bytes)
+            break
+        except Exception as e:
+            mtu = smaller_mtu(mtu, e)
+
+    # Heartbeat to left eye
+    await asyncio.sleep(0.2)
+    await left_client.write_gatt_char(CHAR_WRITE,
+        bytes.fromhex("aa210e0601018020080e106b6a00e174"), response=False)
+
+
+async def send_file(right_client, json_bytes: bytes):
+    """FILE_CHECK, START, one DATA packet and END on the notification channel."""
+    size, checksum, extra = calc_file_check_fields(json_bytes)
     print(f"  {len(json_bytes)} bytes, checksum: 0x{checksum:08X}")
 
     filename = b"user/notify_whitelist.json"
@@ -277,11 +331,6 @@ async def send_notification(right_client, left_client, title: str, subtitle: str
     await right_client.write_gatt_char(CHAR_NOTIF_WRITE,
         build_packet(0xDA, 0xC4, 0x00, bytes([0x02])), response=False)
 
-    # Heartbeat to left eye
-    await asyncio.sleep(0.2)
-    await left_client.write_gatt_char(CHAR_WRITE,
-        bytes.fromhex("aa210e0601018020080e106b6a00e174"), response=False)
-
 
 async def main():
     if len(sys.argv) < 2:
@@ -324,8 +373,10 @@ async def main():
         await authenticate(left, "LEFT")
         await authenticate(right, "RIGHT")
         await asyncio.sleep(0.5)
+        mtu = await negotiated_mtu(right)
+        print(f"  MTU {mtu}: notifications up to {max_chunk(mtu)} bytes")
 
-        await send_notification(right, left, title, subtitle, message)
+        await send_notification(right, left, title, subtitle, message, mtu)
 
         print("\nNotification sent!")
         await asyncio.sleep(3.0)
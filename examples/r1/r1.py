@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+R1 Ring - Gestures and Health Data
+
+Runs the R1 ring client from examples/common/ring.py:
+
+    - Ring gestures (FF tt pp) are emitted into the same GestureEngine as the
+      glasses' temple gestures; handlers see event.source = "r1" / "glasses".
+    - RingRawData health readings are stored in a HealthStore: fixed-size
+      recent samples plus per-minute buckets appended to a memory-mapped file.
+
+Usage:
+    python r1.py                        # emulated glasses + ring, 3 simulated days
+    python r1.py --days 7 --store r1_health.bin
+    python r1.py --ring AA:BB:CC:DD:EE:FF --seconds 60    # real ring (pip install bleak)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from frames import CHAR_NOTIFY
+from gestures import GESTURES, GestureEngine
+from health import HealthStore
+from ring import R1Client
+
+DAY = 86400
+
+# Seconds between new readings of each metric in the simulation
+CADENCE = {"hr": 30, "spo2": 600, "hrv": 300, "temp": 600, "act_kcal": 60, "all_kcal": 60, "steps": 60}
+
+
+def print_event(event):
+    print(f"  {event.source:<8} {event.kind}")
+
+
+def subscribe_all(gestures: GestureEngine):
+    for kind in GESTURES:
+        gestures.on(kind, print_event)
+
+
+# =============================================================================
+# Emulated Session
+# =============================================================================
+
+async def gesture_demo():
+    """Glasses and ring gestures through one engine."""
+    from emulator import G2Emulator, R1Emulator
+
+    glasses, ring_device = G2Emulator(write_latency=0.0), R1Emulator()
+    gestures = GestureEngine(double_tap_window=0)
+    subscribe_all(gestures)
+    ring = R1Client(gestures)
+    await glasses.start_notify(CHAR_NOTIFY, gestures)
+    await ring.start(ring_device)
+
+    print("Gestures:")
+    ring_device.hold()
+    ring_device.tap(double=True)
+    glasses.swipe(1)
+    ring_device.swipe(2)
+    glasses.long_press()
+    ring_device.tap()
+    ring_device.notify(b"\xff\x09\x01")         # unknown gesture type
+    await gestures.drain()
+
+    # Notification -> dispatched, with no handlers registered
+    quiet = GestureEngine(double_tap_window=0)
+    timed = R1Client(quiet)
+    n = 100_000
+    started = time.perf_counter()
+    for i in range(n):
+        timed.feed(b"\xff\x04\x01")
+    per_event = (time.perf_counter() - started) / n * 1e6
+    print(f"  ring gesture decode + dispatch: {per_event:.2f} us")
+    ring.print_stats()
+
+
+def simulate_health(ring_device, days: float, interval: int, start: int, clock: list):
+    """Notify one RingRawData every interval seconds, carrying each metric's latest reading."""
+    for t in range(start, start + int(days * DAY), interval):
+        clock[0] = t
+        readings = {"battery": 100 - (t - start) // 3600 % 100}
+        for metric, every in CADENCE.items():
+            stamp = t - t % every
+            readings[metric + "_timestamp"] = stamp
+        minute = t // 60
+        steps = (minute * 37) % 9000
+        kcal = steps // 25
+        readings.update(hr=60 + (t // 30) % 25, spo2=95 + (t // 600) % 4, hrv=40 + (t // 300) % 30,
+                        temp=3630 + (t // 600) % 40, steps=steps, act_kcal=kcal, all_kcal=1500 + kcal)
+        ring_device.raw_data(**readings)
+        if (t - start + interval) % DAY == 0:
+            yield (t - start + interval) // DAY
+
+
+def health_demo(days: float, interval: int, path: str):
+    from emulator import R1Emulator
+
+    start = 1_760_000_000 - 1_760_000_000 % DAY
+    clock = [start]
+    ring_device = R1Emulator()
+    store = HealthStore(path)
+    ring = R1Client(GestureEngine(), health=store, clock=lambda: clock[0])
+    asyncio.run(ring.start(ring_device))
+
+    print(f"\nHealth: {days:g} simulated days, one RingRawData every {interval} s")
+    print(f"{'day':>4} {'packages':>9} {'stored':>8} {'repeats':>8} {'buckets':>8} {'file KB':>8} {'heap +KB':>8}")
+    tracemalloc.start()
+    for day in simulate_health(ring_device, days, interval, start, clock):
+        heap, _ = tracemalloc.get_traced_memory()
+        print(f"{day:>4} {ring.packages:>9} {store.samples:>8} {store.duplicates:>8} "
+              f"{store.count:>8} {store.file_bytes / 1024:>8.0f} {heap / 1024:>8.0f}")
+    tracemalloc.stop()
+
+    last_hour = start + int(days * DAY) - 3600
+    hours = {}
+    for bucket in store.history("hr", start=last_hour):
+        hours.setdefault(bucket.t // 900 * 900, []).append(bucket)
+    print("\nHeart rate, last hour (15 min summaries from per-minute buckets):")
+    for t, buckets in sorted(hours.items()):
+        total, count = sum(b.sum for b in buckets), sum(b.count for b in buckets)
+        print(f"  {time.strftime('%H:%M', time.gmtime(t))} UTC  mean {total / count:.0f}  "
+              f"min {min(b.min for b in buckets)}  max {max(b.max for b in buckets)}")
+    print(f"Recent raw hr samples kept: {len(store.recent('hr'))}")
+    store.close()
+
+
+# =============================================================================
+# Real Ring
+# =============================================================================
+
+async def run_ring(address: str, seconds: float, path: str):
+    from bleak import BleakClient
+
+    gestures = GestureEngine(double_tap_window=0)
+    subscribe_all(gestures)
+    with HealthStore(path) as store:
+        ring = R1Client(gestures, health=store)
+        async with BleakClient(address) as client:
+            print(f"Connected to {address}; listening for {seconds:g} s")
+            await ring.start(client)
+            await asyncio.sleep(seconds)
+            await ring.stop()
+        ring.print_stats()
+        print(f"State: {ring.state}  health buckets on disk: {store.count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='R1 ring gestures and health data')
+    parser.add_argument('--ring', help='R1 address (real ring; default: emulator)')
+    parser.add_argument('--seconds', type=float, default=60, help='Listening time with --ring')
+    parser.add_argument('--days', type=float, default=3, help='Simulated days of health data')
+    parser.add_argument('--interval', type=int, default=10, help='Seconds between simulated RingRawData')
+    parser.add_argument('--store', help='Health store file (default: temporary)')
+    args = parser.parse_args()
+
+    if args.ring:
+        asyncio.run(run_ring(args.ring, args.seconds, args.store or "r1_health.bin"))
+        return
+    asyncio.run(gesture_demo())
+    health_demo(args.days, args.interval, args.store)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nInterrupted")
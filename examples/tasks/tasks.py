@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Tasks - Todo List Sync for G2 Glasses
+
+Keeps the glasses' task list (service 0x0C-20) in step with a backend list
+of hundreds of items without re-sending it:
+
+    - The engine remembers the list as last pushed. Each sync() diffs the
+      new list against it by id and sends only inserted/changed items
+      (upsert) and deleted ids (removed).
+    - Upserts and removals are packed into TaskSync messages of up to
+      max_packets packets each. Each message goes out as one multi-packet
+      frame, and the packets are written back to back. Packets are sized
+      from the connection's MTU (frames.FrameWriter), so a bigger MTU means
+      fewer, larger messages.
+    - The whole list is only sent on the first sync after reset(), which
+      callers make on (re)connect, or after a failed write, because then
+      the glasses' copy is unknown.
+
+Usage:
+    python tasks.py                         # benchmark 10/100/1000 items on the emulator
+    python tasks.py --sizes 50 500 --rounds 50 --edit-rate 0.05
+    python tasks.py --mtu 23 185 247 512    # the same at several MTUs
+
+NOTE: The 0x0C-20 payload has not been captured. TasksMessage / TaskSync /
+TaskItem in proto/g2_protocol.proto are this example's own layout.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+import g2_proto as pb
+from frames import FrameWriter
+
+TYPE_SYNC = 1
+MESSAGE_OVERHEAD = 32       # TasksMessage + TaskSync fields besides the items, upper bound
+
+
+class Task(NamedTuple):
+    id: int
+    title: str
+    done: bool = False
+    order: int = 0          # sparse sort key, so an insert does not renumber the rest
+    due: int = 0            # Unix time, 0 = none
+
+
+class SyncResult(NamedTuple):
+    version: int
+    full: bool
+    upserts: int
+    removed: int
+    messages: int
+    packets: int
+    bytes: int
+    seconds: float
+
+
+def encode_task(task: Task) -> bytes:
+    return pb.encode_task_item(task.id, task.title, task.done or None, task.order or None, task.due or None)
+
+
+class TaskSyncEngine:
+    """
+    Diff-based task list sync on one connection.
+
+    max_payload fixes the packet payload size; by default it follows the
+    writer's MTU, which steps down if the link rejects a packet.
+    """
+
+    def __init__(self, client, max_packets: int = 8, max_payload: Optional[int] = None,
+                 seq: int = 0x50, writer: Optional[FrameWriter] = None):
+        self.client = client
+        self.writer = writer or FrameWriter(client)
+        self.max_packets = max_packets
+        self._max_payload = max_payload
+        self.seq = seq
+        self.msg_id = 0
+        self.version = 0
+
+        self._synced: Dict[int, Task] = {}          # as last pushed
+        self._encoded: Dict[int, bytes] = {}        # id -> encoded TaskItem of the synced task
+        self._full = True
+
+        self.syncs = 0
+        self.full_syncs = 0
+        self.bytes_sent = 0
+        self.packets_sent = 0
+
+    @property
+    def max_payload(self) -> int:
+        return min(self._max_payload or self.writer.max_payload, self.writer.max_payload)
+
+    def reset(self):
+        """The glasses' copy is unknown (new connection): the next sync sends everything."""
+        self._full = True
+
+    def diff(self, tasks: Iterable[Task]) -> Tuple[Dict[int, Task], List[Task], List[int]]:
+        """(new list by id, inserted or changed tasks, deleted ids) against the last push."""
+        current: Dict[int, Task] = {}
+        upserts = []
+        synced = self._synced
+        for task in tasks:
+            if task.id in current:
+                raise ValueError(f"Duplicate task id {task.id}")
+            current[task.id] = task
+            if synced.get(task.id) != task:
+                upserts.append(task)
+        removed = [task_id for task_id in synced if task_id not in current]
+        return current, upserts, removed
+
+    def _messages(self, full: bool, items: List[bytes], removed: List[int], count: int) -> List[bytes]:
+        """Pack items and removed ids into TaskSync payloads of at most max_packets packets."""
+        budget = self.max_packets * self.max_payload - MESSAGE_OVERHEAD
+        messages: List[bytes] = []
+        batch: List[bytes] = []
+        batch_removed: List[int] = []
+        used = 0
+
+        def flush():
+            self.msg_id += 1
+            sync = pb.encode_task_sync(self.version, full and not messages, batch, batch_removed, count)
+            messages.append(pb.encode_tasks_message(TYPE_SYNC, self.msg_id, sync))
+
+        # Items cost their bytes plus tag and length; a removed id at most a 5-byte varint
+        for size, entry in [(len(item) + 3, item) for item in items] + [(5, task_id) for task_id in removed]:
+            if (batch or batch_removed) and used + size > budget:
+                flush()
+                batch, batch_removed, used = [], [], 0
+            if isinstance(entry, bytes):
+                batch.append(entry)
+            else:
+                batch_removed.append(entry)
+            used += size
+        if batch or batch_removed or not messages:
+            flush()
+        return messages
+
+    async def sync(self, tasks: Iterable[Task]) -> SyncResult:
+        """Push the changes since the last sync (or everything after reset())."""
+        started = time.perf_counter()
+        current, upserts, removed = self.diff(tasks)
+        full = self._full
+        if full:
+            upserts, removed = list(current.values()), []
+        elif not upserts and not removed:
+            return SyncResult(self.version, False, 0, 0, 0, 0, 0, time.perf_counter() - started)
+
+        # A full sync reuses the encodings of tasks that did not change
+        encoded = {} if full else dict(self._encoded)
+        items = []
+        for task in upserts:
+            item = self._encoded.get(task.id) if self._synced.get(task.id) == task else None
+            encoded[task.id] = item = item or encode_task(task)
+            items.append(item)
+        for task_id in removed:
+            encoded.pop(task_id, None)
+
+        self.version += 1
+        messages = self._messages(full, items, removed, len(current))
+        packets = 0
+        sent = 0
+        try:
+            for payload in messages:
+                written = await self.writer.send(self.seq, 0x0C, 0x20, payload, max_payload=self._max_payload)
+                packets += len(written)
+                sent += sum(len(packet) for packet in written)
+                self.seq = (self.seq + 1) & 0xFF
+        except Exception:
+            self.reset()
+            raise
+        finally:
+            self.packets_sent += packets
+            self.bytes_sent += sent
+
+        self._synced = current
+        self._encoded = encoded
+        self._full = False
+        self.syncs += 1
+        self.full_syncs += full
+        return SyncResult(self.version, full, len(upserts), len(removed), len(messages), packets, sent,
+                          time.perf_counter() - started)
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+WORDS = ("buy", "milk", "call", "bank", "review", "design", "doc", "book", "flights", "fix", "bug",
+         "email", "team", "plan", "sprint", "renew", "passport", "pay", "rent", "water", "plants")
+
+
+def random_title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).capitalize()
+
+
+def make_tasks(n: int, rng: random.Random) -> List[Task]:
+    return [Task(i + 1, random_title(rng), rng.random() < 0.2, (i + 1) * 1024,
+                 1_760_000_000 + rng.randint(0, 30) * 86400 if rng.random() < 0.3 else 0)
+            for i in range(n)]
+
+
+def edit(tasks: List[Task], count: int, rng: random.Random, next_id: List[int]) -> List[Task]:
+    """Apply count random edits: toggle done, rename, insert, delete."""
+    tasks = list(tasks)
+    for _ in range(count):
+        op = rng.random()
+        if op < 0.5 or len(tasks) < 2:
+            i = rng.randrange(len(tasks))
+            tasks[i] = tasks[i]._replace(done=not tasks[i].done)
+        elif op < 0.7:
+            i = rng.randrange(len(tasks))
+            tasks[i] = tasks[i]._replace(title=random_title(rng))
+        elif op < 0.85:
+            i = rng.randrange(len(tasks))
+            before = tasks[i - 1].order if i else 0
+            next_id[0] += 1
+            tasks.insert(i, Task(next_id[0], random_title(rng), False, (before + tasks[i].order) // 2))
+        else:
+            del tasks[rng.randrange(len(tasks))]
+    return tasks
+
+
+def check(glasses, tasks: List[Task]):
+    expected = {t.id: (t.title, t.done, t.order, t.due) for t in tasks}
+    if glasses.tasks != expected:
+        raise AssertionError(f"Glasses have {len(glasses.tasks)} tasks, expected {len(expected)}")
+
+
+async def bench(n: int, rounds: int, edit_rate: float, latency: float, seed: int = 1,
+                mtu: int = 512, link_mtu: Optional[int] = None) -> dict:
+    from emulator import G2Emulator
+
+    rng = random.Random(seed)
+    glasses = G2Emulator(write_latency=latency, mtu=mtu, link_mtu=link_mtu)
+    engine = TaskSyncEngine(glasses)
+    tasks = make_tasks(n, rng)
+    next_id = [n]
+
+    full = await engine.sync(tasks)
+    check(glasses, tasks)
+
+    diffs = []
+    for _ in range(rounds):
+        tasks = edit(tasks, max(1, round(len(tasks) * edit_rate)), rng, next_id)
+        diffs.append(await engine.sync(tasks))
+        check(glasses, tasks)
+
+    engine.reset()                  # reconnect
+    again = await engine.sync(tasks)
+    check(glasses, tasks)
+    return {"n": n, "mtu": mtu, "link_mtu": glasses.link_mtu, "final_mtu": engine.writer.mtu,
+            "shrinks": engine.writer.shrinks, "rejected": glasses.rejected,
+            "full": full, "reconnect": again, "diffs": diffs}
+
+
+def print_row(result: dict):
+    full, diffs = result["full"], result["diffs"]
+    k = len(diffs)
+    avg = lambda attr: sum(getattr(d, attr) for d in diffs) / k
+    edits = avg("upserts") + avg("removed")
+    print(f"{result['mtu']:>5} {result['n']:>6} {full.packets:>6} {full.bytes:>8} {full.seconds * 1000:>8.0f}   "
+          f"{edits:>6.1f} {avg('packets'):>6.1f} {avg('bytes'):>7.0f} {avg('seconds') * 1000:>7.1f}   "
+          f"{full.bytes / avg('bytes'):>6.0f}x {full.bytes / full.seconds / 1024:>7.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Tasks (0x0C-20) diff sync benchmark (emulator)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help='List sizes')
+    parser.add_argument('--rounds', type=int, default=20, help='Edit + sync rounds per size')
+    parser.add_argument('--edit-rate', type=float, default=0.01, help='Fraction of items edited per round')
+    parser.add_argument('--link-ms', type=float, default=7.5, help='Emulated time per write')
+    parser.add_argument('--mtu', type=int, nargs='+', default=[512], help='Emulated ATT MTUs')
+    parser.add_argument('--link-mtu', type=int, help='MTU the emulated link really carries (probe test)')
+    args = parser.parse_args()
+
+    print(f"{args.rounds} rounds, {args.edit_rate:.0%} of items edited per round (at least 1), "
+          f"{args.link_ms:g} ms per write\n")
+    print(f"{'':>5} {'':>6} {'full sync':^24}   {'diff sync (mean per round)':^30}")
+    print(f"{'MTU':>5} {'items':>6} {'pkts':>6} {'bytes':>8} {'ms':>8}   {'edits':>6} {'pkts':>6} {'bytes':>7} "
+          f"{'ms':>7}   {'saved':>6} {'KB/s':>7}")
+    for mtu in args.mtu:
+        for n in args.sizes:
+            result = await bench(n, args.rounds, args.edit_rate, args.link_ms / 1000, mtu=mtu,
+                                 link_mtu=args.link_mtu)
+            print_row(result)
+            if not result["reconnect"].full:
+                raise AssertionError("Reconnect did not trigger a full sync")
+            if result["shrinks"]:
+                print(f"      MTU {mtu} reported, {result['link_mtu']} carried: {result['rejected']} write(s) "
+                      f"rejected, writer settled on {result['final_mtu']} after {result['shrinks']} step(s)")
+    print("\nGlasses state matched the backend list after every sync, including a reconnect resync.")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nInterrupted")
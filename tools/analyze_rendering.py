@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+G2 Rendering Channel Analyzer - 6402 Text Captures
+
+Streams the text hex-dump captures written by the Flutter BLE capture screen
+(captures/Untitled.txt, see docs/capture-analysis.md):
+
+    [13:30:28.674] IN  6402
+      Hex: 3C BF 31 ... 12 00 11 00 D8
+
+into a NumPy frame matrix (one row per notification) chunk by chunk, and
+computes the statistics that were previously done by hand:
+
+    - Trailer histogram (bytes N-4..N-2 before the sequence byte)
+    - Sequence counter gaps, duplicates and wraps (last byte)
+    - Inter-arrival timing: rate, jitter, per-second packet counts
+    - Shannon entropy per byte position (structured vs random positions)
+
+Only per-chunk state is kept in memory (byte counts per position, trailer
+counts, inter-arrival deltas), so hour-long recordings are fine.
+
+Requirements:
+    pip install numpy
+
+Usage:
+    python tools/analyze_rendering.py                         # captures/Untitled.txt
+    python tools/analyze_rendering.py session1.txt session2.txt --char 6402
+    python tools/analyze_rendering.py --positions 35-40       # byte distribution at offsets
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CAPTURE = ROOT / "captures" / "Untitled.txt"
+
+CHUNK_FRAMES = 4096
+TRAILER_LEN = 3             # bytes between the payload and the sequence byte
+LOW_ENTROPY_BITS = 6.0      # positions below this are reported as structured
+
+
+class FrameChunk(NamedTuple):
+    """A block of equal-length frames from one capture."""
+    times: np.ndarray       # float64 seconds since midnight (unwrapped across midnight)
+    frames: np.ndarray      # uint8 [n, frame_len]
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+def _parse_times(stamps: List[str]) -> np.ndarray:
+    """Vectorized 'HH:MM:SS.mmm' -> seconds since midnight."""
+    raw = np.array(stamps, dtype="S12").view(np.uint8).reshape(-1, 12).astype(np.int64) - ord("0")
+    hours = raw[:, 0] * 10 + raw[:, 1]
+    minutes = raw[:, 3] * 10 + raw[:, 4]
+    seconds = raw[:, 6] * 10 + raw[:, 7]
+    millis = raw[:, 9] * 100 + raw[:, 10] * 10 + raw[:, 11]
+    return hours * 3600.0 + minutes * 60.0 + seconds + millis / 1000.0
+
+
+def iter_chunks(path, char: str = "6402", direction: str = "IN",
+                frame_len: Optional[int] = None,
+                chunk_frames: int = CHUNK_FRAMES,
+                skipped: Optional[Dict[str, int]] = None) -> Iterator[FrameChunk]:
+    """
+    Yield FrameChunks of frames on one characteristic/direction.
+
+    frame_len defaults to the length of the first matching frame; frames of
+    any other length are counted in skipped["length"] and left out of the
+    matrix. Timestamps that go backwards by more than 12 hours are taken as a
+    midnight rollover.
+    """
+    skipped = skipped if skipped is not None else {}
+    hex_width = None if frame_len is None else frame_len * 3 - 1
+    stamps: List[str] = []
+    lines: List[str] = []
+    day_offset = 0.0
+    last_raw = None
+    want = None
+
+    def flush() -> FrameChunk:
+        nonlocal day_offset, last_raw
+        raw = _parse_times(stamps)
+        rollover = np.diff(raw, prepend=raw[0] if last_raw is None else last_raw) < -43200
+        offsets = day_offset + np.cumsum(rollover) * 86400.0
+        day_offset, last_raw = float(offsets[-1]), float(raw[-1])
+        frames = np.frombuffer(bytes.fromhex(" ".join(lines)), dtype=np.uint8).reshape(len(lines), -1)
+        stamps.clear()
+        lines.clear()
+        return FrameChunk(raw + offsets, frames)
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("["):
+                parts = line.split()
+                want = (parts[0][1:-1] if len(parts) >= 3 and parts[1] == direction
+                        and parts[2] == char else None)
+                continue
+            if want is None:
+                continue
+            stripped = line.strip()
+            if not stripped.startswith("Hex:"):
+                continue
+            hexdata = stripped[4:].strip()
+            stamp, want = want, None
+            if len(stamp) != 12:
+                skipped["timestamp"] = skipped.get("timestamp", 0) + 1
+                continue
+            if hex_width is None:
+                hex_width = len(hexdata)
+            if len(hexdata) != hex_width:
+                skipped["length"] = skipped.get("length", 0) + 1
+                continue
+            stamps.append(stamp)
+            lines.append(hexdata)
+            if len(lines) >= chunk_frames:
+                yield flush()
+    if lines:
+        yield flush()
+
+
+def load_frames(path, char: str = "6402", direction: str = "IN",
+                frame_len: Optional[int] = None) -> FrameChunk:
+    """Whole capture as one FrameChunk (for interactive use)."""
+    chunks = list(iter_chunks(path, char, direction, frame_len))
+    if not chunks:
+        return FrameChunk(np.empty(0), np.empty((0, frame_len or 0), dtype=np.uint8))
+    return FrameChunk(np.concatenate([c.times for c in chunks]),
+                      np.concatenate([c.frames for c in chunks]))
+
+
+# =============================================================================
+# Analysis
+# =============================================================================
+
+def shannon_entropy(counts: np.ndarray) -> np.ndarray:
+    """Entropy in bits of each row of a [positions, 256] count matrix."""
+    totals = counts.sum(axis=1, keepdims=True)
+    p = counts / np.maximum(totals, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(p > 0, p * np.log2(p), 0.0)
+    return 0.0 - terms.sum(axis=1)
+
+
+class RenderingStats:
+    """Accumulates statistics over FrameChunks of one capture."""
+
+    def __init__(self):
+        self.frames = 0
+        self.frame_len = None
+        self.byte_counts = None             # int64 [frame_len, 256]
+        self.trailers: Dict[int, int] = {}  # 24-bit trailer -> count
+        self.deltas: List[np.ndarray] = []  # inter-arrival seconds per chunk
+        self.per_second: Dict[int, int] = {}
+        self.first_time = None
+        self.last_time = None
+        self.last_seq = None
+
+        self.in_order = 0
+        self.duplicates = 0
+        self.gaps = 0
+        self.missed = 0
+        self.wraps = 0
+
+    def add(self, chunk: FrameChunk):
+        frames, times = chunk.frames, chunk.times
+        n, length = frames.shape
+        if not n:
+            return
+        if self.frame_len is None:
+            self.frame_len = length
+            self.byte_counts = np.zeros((length, 256), dtype=np.int64)
+        elif length != self.frame_len:
+            raise ValueError(f"Frame length changed from {self.frame_len} to {length}")
+
+        # Byte histogram per position: one bincount over (position * 256 + value)
+        index = (np.arange(length, dtype=np.int64) * 256 + frames).ravel()
+        self.byte_counts += np.bincount(index, minlength=length * 256).reshape(length, 256)
+
+        # Trailer (3 bytes before the sequence byte) packed into one int
+        t = frames[:, -1 - TRAILER_LEN:-1].astype(np.uint32)
+        keys, counts = np.unique((t[:, 0] << 16) | (t[:, 1] << 8) | t[:, 2], return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.trailers[key] = self.trailers.get(key, 0) + count
+
+        # Sequence byte, carried across chunks
+        seq = frames[:, -1].astype(np.int16)
+        if self.last_seq is not None:
+            seq = np.concatenate(([self.last_seq], seq))
+        if seq.size > 1:
+            step = np.diff(seq) % 256
+            self.in_order += int(np.count_nonzero(step == 1))
+            self.duplicates += int(np.count_nonzero(step == 0))
+            gap = step > 1
+            self.gaps += int(np.count_nonzero(gap))
+            self.missed += int((step[gap] - 1).sum())
+            self.wraps += int(np.count_nonzero(np.diff(seq) < 0))
+        self.last_seq = int(seq[-1])
+
+        # Timing, carried across chunks
+        stamps = times if self.last_time is None else np.concatenate(([self.last_time], times))
+        if stamps.size > 1:
+            self.deltas.append(np.diff(stamps))
+        if self.first_time is None:
+            self.first_time = float(times[0])
+        self.last_time = float(times[-1])
+        seconds, per = np.unique(np.floor(times - self.first_time).astype(np.int64), return_counts=True)
+        for second, count in zip(seconds.tolist(), per.tolist()):
+            self.per_second[second] = self.per_second.get(second, 0) + count
+
+        self.frames += n
+
+    # -------------------------------------------------------------------------
+    # Results
+    # -------------------------------------------------------------------------
+
+    @property
+    def duration(self) -> float:
+        return (self.last_time - self.first_time) if self.frames else 0.0
+
+    def trailer_histogram(self) -> List[Tuple[bytes, int]]:
+        """[(trailer bytes, count), ...] most common first."""
+        items = sorted(self.trailers.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(key.to_bytes(TRAILER_LEN, "big"), count) for key, count in items]
+
+    def entropy(self) -> np.ndarray:
+        """Bits of entropy per byte position (8.0 = uniform)."""
+        return shannon_entropy(self.byte_counts)
+
+    def timing(self) -> dict:
+        """Inter-arrival statistics in milliseconds plus per-second packet rates."""
+        deltas = np.concatenate(self.deltas) * 1000 if self.deltas else np.empty(0)
+        if not deltas.size:
+            return {}
+        # Seconds with no packets count as 0 pkt/s; the last second is partial
+        seconds = max(self.per_second) + 1
+        rate = np.zeros(seconds, dtype=np.int64)
+        rate[list(self.per_second)] = list(self.per_second.values())
+        full = rate[:-1] if seconds > 1 else rate
+        p50, p90, p99 = np.percentile(deltas, [50, 90, 99])
+        return {
+            "mean_ms": float(deltas.mean()),
+            "std_ms": float(deltas.std()),
+            # RFC 3550 style: mean absolute change between consecutive intervals
+            "jitter_ms": float(np.abs(np.diff(deltas)).mean()) if deltas.size > 1 else 0.0,
+            "p50_ms": float(p50), "p90_ms": float(p90), "p99_ms": float(p99),
+            "min_ms": float(deltas.min()), "max_ms": float(deltas.max()),
+            "burst": int(np.count_nonzero(deltas < 10)),
+            "stalls": int(np.count_nonzero(deltas > 250)),
+            "rate_mean": float(self.frames / self.duration) if self.duration else 0.0,
+            "rate_median": float(np.median(full)),
+            "rate_peak": int(rate.max()),
+        }
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def parse_positions(spec: str, length: int) -> List[int]:
+    """'35-40,-5' -> [35, 36, 37, 38, 39, 40, length - 5]."""
+    positions = []
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        match = re.fullmatch(r"(-?\d+)(?:-(-?\d+))?", part)
+        if not match:
+            raise ValueError(f"Bad position {part!r}")
+        lo = int(match.group(1)) % length
+        hi = int(match.group(2) or match.group(1)) % length
+        positions.extend(range(lo, hi + 1))
+    return positions
+
+
+def print_report(name: str, stats: RenderingStats, skipped: Dict[str, int],
+                 top: int = 10, positions: Optional[str] = None):
+    print(f"\n{name}")
+    print("=" * 60)
+    if not stats.frames:
+        print("  No matching frames")
+        return
+    print(f"  Frames:    {stats.frames} x {stats.frame_len} bytes")
+    print(f"  Duration:  {stats.duration:.1f} s")
+    if skipped:
+        print("  Skipped:   " + ", ".join(f"{count} ({why})" for why, count in sorted(skipped.items())))
+
+    print(f"\nTrailer (bytes N-{TRAILER_LEN + 1}..N-2)")
+    for trailer, count in stats.trailer_histogram()[:top]:
+        value = int.from_bytes(trailer[1:], "little", signed=True)
+        print(f"  {trailer.hex(' ').upper()} [seq]  {count:>7}  {count / stats.frames:6.1%}"
+              f"   (N-3..N-2 as int16 LE: {value:+d})")
+    if len(stats.trailers) > top:
+        rest = sum(count for _, count in stats.trailer_histogram()[top:])
+        print(f"  ({len(stats.trailers) - top} more patterns, {rest} frames)")
+
+    print("\nSequence (last byte)")
+    print(f"  In order:   {stats.in_order}")
+    print(f"  Gaps:       {stats.gaps} ({stats.missed} frames missed)")
+    print(f"  Duplicates: {stats.duplicates}")
+    print(f"  Wraps:      {stats.wraps}")
+
+    timing = stats.timing()
+    if timing:
+        print("\nTiming (inter-arrival)")
+        print(f"  Mean {timing['mean_ms']:.1f} ms, std {timing['std_ms']:.1f} ms, "
+              f"jitter {timing['jitter_ms']:.1f} ms")
+        print(f"  p50 {timing['p50_ms']:.0f} ms  p90 {timing['p90_ms']:.0f} ms  p99 {timing['p99_ms']:.0f} ms"
+              f"  (min {timing['min_ms']:.0f}, max {timing['max_ms']:.0f})")
+        print(f"  Bursts (<10 ms): {timing['burst']}, stalls (>250 ms): {timing['stalls']}")
+        print(f"  Rate: {timing['rate_mean']:.1f} pkt/s mean, {timing['rate_median']:.0f} median, "
+              f"{timing['rate_peak']} peak")
+
+    entropy = stats.entropy()
+    order = np.argsort(entropy, kind="stable")
+    low = order[entropy[order] < LOW_ENTROPY_BITS]
+    print(f"\nEntropy per position (bits, 8.0 = uniform; {stats.frames} samples "
+          f"cap it at {np.log2(min(256, stats.frames)):.1f})")
+    print(f"  Mean {entropy.mean():.2f}, min {entropy.min():.2f} at {int(order[0])}")
+    if low.size:
+        print(f"  Structured positions (< {LOW_ENTROPY_BITS:.0f} bits):")
+        for pos in sorted(low.tolist()):
+            counts = stats.byte_counts[pos]
+            value = int(counts.argmax())
+            print(f"    {pos:>4} (N{pos - stats.frame_len:+d})  {entropy[pos]:.2f} bits  "
+                  f"most common {value:02X} ({counts[value] / stats.frames:.0%})")
+
+    if positions:
+        print("\nByte distribution")
+        for pos in parse_positions(positions, stats.frame_len):
+            counts = stats.byte_counts[pos]
+            common = np.argsort(counts)[::-1][:5]
+            shown = "  ".join(f"{v:02X}:{counts[v] / stats.frames:.0%}" for v in common if counts[v])
+            print(f"  {pos:>4}  {entropy[pos]:.2f} bits  {shown}")
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze 6402 rendering-channel text captures')
+    parser.add_argument('captures', nargs='*', help='Text captures (default: captures/Untitled.txt)')
+    parser.add_argument('--char', default='6402', help='Characteristic to analyze')
+    parser.add_argument('--direction', default='IN', choices=['IN', 'OUT'])
+    parser.add_argument('--length', type=int, help='Frame length (default: first frame)')
+    parser.add_argument('--chunk', type=int, default=CHUNK_FRAMES, help='Frames per parse chunk')
+    parser.add_argument('--top', type=int, default=10, help='Trailer patterns to list')
+    parser.add_argument('--positions', help='Byte offsets to show, e.g. 35-40,-5 (negative from end)')
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.captures] or [DEFAULT_CAPTURE]
+    for path in paths:
+        if not path.exists():
+            print(f"ERROR: {path} not found")
+            sys.exit(1)
+        stats = RenderingStats()
+        skipped: Dict[str, int] = {}
+        for chunk in iter_chunks(path, args.char, args.direction, args.length, args.chunk, skipped):
+            stats.add(chunk)
+        print_report(f"{path.name}: {args.direction} {args.char}", stats, skipped, args.top, args.positions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Firmware Checksum Benchmark
+
+Builds a synthetic DFU package in a temporary directory (manifest.json plus
+bootloader, softdevice and large application/resource images of random
+bytes, the layout of docs/firmware-format.md), extracts it with
+FirmwarePackage and times:
+
+    - legacy: each file read in 8 KB chunks into MD5 + SHA-256, one
+      component after another (the previous calculate_checksums)
+    - engine: ChecksumEngine, MD5 + SHA-256 (+ CRC32C) from one memory map
+      per file, with 1 worker and with the default pool
+    - package: extract + analyze from disk vs analyze_archive(), which
+      streams the members out of the ZIP
+
+Usage:
+    python tools/bench_firmware.py                  # 512 MB package
+    python tools/bench_firmware.py --size 256 --images 2 --jobs 1 4 8
+    python tools/bench_firmware.py --deflate        # compressed members, like real packages
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from extract_firmware import ChecksumEngine, FirmwarePackage, crc32c
+
+MB = 1024 * 1024
+
+
+def build_package(directory: Path, size_mb: int, images: int, deflate: bool = False, seed: int = 1) -> Path:
+    """Write a DFU zip with `images` large components totalling size_mb"""
+    rng = np.random.default_rng(seed)
+    files = {'bootloader': 24420, 'softdevice': 150 * 1024}
+    for i in range(images):
+        files['application' if i == 0 else f'resources{i}'] = size_mb * MB // images
+
+    manifest = {'manifest': {name: {'bin_file': f'{name}.bin', 'dat_file': f'{name}.dat'} for name in files}}
+    path = directory / 'synthetic_dfu.zip'
+    # Half-random, half-repetitive images, so deflate has something to do
+    compression = zipfile.ZIP_DEFLATED if deflate else zipfile.ZIP_STORED
+    with zipfile.ZipFile(path, 'w', compression, compresslevel=1) as zf:
+        zf.writestr('manifest.json', json.dumps(manifest, indent=4))
+        for name, size in files.items():
+            zf.writestr(f'{name}.bin', rng.bytes(size // 2) + bytes(range(256)) * (size - size // 2 >> 8)
+                        + bytes((size - size // 2) % 256))
+            zf.writestr(f'{name}.dat', rng.bytes(143))
+    return path
+
+
+def legacy_checksums(paths: List[Path]) -> Dict[Path, Dict[str, str]]:
+    results = {}
+    for path in paths:
+        md5, sha256 = hashlib.md5(), hashlib.sha256()
+        with open(path, 'rb') as f:
+            while chunk := f.read(8192):
+                md5.update(chunk)
+                sha256.update(chunk)
+        results[path] = {'md5': md5.hexdigest(), 'sha256': sha256.hexdigest()}
+    return results
+
+
+def timed(func, *args, repeat: int = 3):
+    """(best seconds, last result) over repeat runs"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def digest_rates(sample: bytes) -> Dict[str, float]:
+    """Single-thread MB/s of each digest over an in-memory buffer"""
+    rates = {}
+    for name, func in [('md5', lambda: hashlib.md5(sample).digest()),
+                       ('sha256', lambda: hashlib.sha256(sample).digest()),
+                       ('crc32c', lambda: crc32c(sample))]:
+        seconds, _ = timed(func)
+        rates[name] = len(sample) / MB / seconds
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark firmware package checksumming')
+    parser.add_argument('--size', type=int, default=512, help='Total image size in MB')
+    parser.add_argument('--images', type=int, default=4, help='Number of large components')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 0], help='Worker counts (0 = default)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    parser.add_argument('--deflate', action='store_true', help='Compress the package members')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        package = FirmwarePackage(build_package(Path(tmp), args.size, args.images, args.deflate))
+        if not package.extract():
+            sys.exit(1)
+        paths = [path for component in package.components.values() for path, _ in component.files()]
+        total = sum(path.stat().st_size for path in paths) / MB
+        print(f"Built and extracted {len(paths)} files, {total:.0f} MB, "
+              f"in {time.perf_counter() - started:.1f} s ({os.cpu_count()} CPUs)\n")
+
+        rates = digest_rates(paths[-2].read_bytes()[:64 * MB] if args.images else b'')
+        print('Single-thread digest rates: ' + ', '.join(f'{k} {v:.0f} MB/s' for k, v in rates.items()))
+        serial = total / sum(total / rate for rate in rates.values())
+        print(f"All three, one after another on one core: {serial:.0f} MB/s\n")
+
+        print(f"{'method':<28} {'digests':<22} {'seconds':>8} {'MB/s':>8}")
+        seconds, expected = timed(legacy_checksums, paths, repeat=args.repeat)
+        print(f"{'legacy 8 KB sequential':<28} {'md5 sha256':<22} {seconds:>8.2f} {total / seconds:>8.0f}")
+
+        for jobs in args.jobs:
+            for digests in [('md5', 'sha256'), ChecksumEngine.DIGESTS]:
+                engine = ChecksumEngine(jobs or None, digests=digests)
+                seconds, results = timed(engine.checksum_files, paths, repeat=args.repeat)
+                for path in paths:
+                    if {k: results[path][k] for k in ('md5', 'sha256')} != expected[path]:
+                        raise AssertionError(f"Digest mismatch for {path.name}")
+                label = f"engine, {engine.workers} workers"
+                print(f"{label:<28} {' '.join(digests):<22} {seconds:>8.2f} {total / seconds:>8.0f}")
+
+        def from_disk():
+            package.extract(force=True)
+            return package.analyze(ChecksumEngine())
+
+        print(f"\n{'package analysis':<28} {'':<22} {'seconds':>8} {'MB/s':>8}")
+        with redirect_stdout(io.StringIO()):
+            disk_seconds, disk = timed(from_disk, repeat=args.repeat)
+            archive_seconds, archive = timed(FirmwarePackage(package.package_path).analyze_archive,
+                                             ChecksumEngine(), repeat=args.repeat)
+        print(f"{'extract + analyze':<28} {'md5 sha256 crc32c':<22} {disk_seconds:>8.2f} {total / disk_seconds:>8.0f}")
+        print(f"{'analyze in archive':<28} {'md5 sha256 crc32c':<22} {archive_seconds:>8.2f} "
+              f"{total / archive_seconds:>8.0f}")
+        if archive['components'] != disk['components']:
+            raise AssertionError("In-archive analysis differs from the extracted analysis")
+
+        app = archive['components']['application']
+        print(f"\nMD5/SHA-256 match the legacy path and both analyses agree. "
+              f"application.bin CRC32C {app['bin_crc32c']}")
+
+
+if __name__ == '__main__':
+    main()
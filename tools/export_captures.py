@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+G2 Capture Export - Decoded Frames to Columnar Tables
+
+Decodes the G2 content-channel frames in btsnoop captures (captures/*.log)
+with the generated protobuf codec and writes one typed table per service,
+partitioned by capture:
+
+    <out>/teleprompter/<capture>.parquet
+    <out>/even_ai/<capture>.parquet
+    <out>/auth/<capture>.parquet
+    <out>/svc_0x0d01/<capture>.parquet      (services without a decoder)
+    <out>/manifest.json
+
+Files are processed in parallel with a process pool. A capture whose
+SHA-256 matches the manifest from the previous run is skipped.
+
+Output is Parquet when pyarrow is installed, otherwise compressed NumPy
+.npz. In .npz, missing integers are stored as -1 and missing strings as "".
+
+Requirements:
+    pip install numpy pyarrow           # pyarrow optional (Parquet output)
+
+Usage:
+    python tools/export_captures.py                       # captures/*.log -> captures/dataset/
+    python tools/export_captures.py session.log -o out -j 4
+    python tools/export_captures.py --format npz --force
+    python tools/export_captures.py --show teleprompter   # load a table back
+
+Querying:
+    from export_captures import load_table
+    pages = load_table("captures/dataset", "teleprompter")
+    sizes = pages["text_len"][pages["msg_type"] == 3]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "examples" / "common"))
+
+import numpy as np
+
+import g2_proto as pb
+from btsnoop import HANDLE_CHARS, CaptureError, iter_att, read_records
+from frames import MAGIC, FrameDecoder, fields
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+EXPORT_VERSION = 2
+DEFAULT_OUTPUT = ROOT / "captures" / "dataset"
+
+# Column types: (numpy dtype, fill for missing values in .npz, pyarrow type name)
+COLUMN_TYPES = {
+    "int": ("int64", -1, "int64"),
+    "float": ("float64", np.nan, "float64"),
+    "bool": ("int8", -1, "bool_"),
+    "str": ("str", "", "string"),
+    "bin": ("object", b"", "binary"),
+}
+
+FRAME_COLUMNS = [
+    ("capture", "str"), ("record", "int"), ("timestamp", "float"), ("direction", "str"),
+    ("handle", "int"), ("char", "str"), ("service", "int"), ("seq", "int"), ("packets", "int"),
+    ("payload_len", "int"), ("decode_error", "bool"), ("payload", "bin"),
+]
+
+
+class Table(NamedTuple):
+    name: str
+    columns: List[Tuple[str, str]]
+    extract: Callable[[bytes], tuple]
+
+
+# =============================================================================
+# Per-Service Decoding
+# =============================================================================
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    return value.decode("utf-8", errors="replace") if isinstance(value, bytes) else value
+
+
+def _teleprompter(payload: bytes) -> tuple:
+    msg = pb.decode_teleprompter_message(payload)
+    content, complete = msg.content, msg.complete
+    text = content.text if content else None
+    return (msg.type, msg.msg_id,
+            content.page_number if content else None,
+            content.line_count if content else None,
+            len(text) if text is not None else None,
+            _text(text),
+            complete.total_pages if complete else None,
+            len(msg.list.scripts) if msg.list else None)
+
+
+def _even_ai(payload: bytes) -> tuple:
+    msg = pb.decode_even_ai_message(payload)
+    info = msg.ask_info or msg.reply_info
+    text = info.text if info else None
+    return (msg.command_id, msg.magic_random,
+            msg.ctrl.status if msg.ctrl else None,
+            msg.vad_info.vad_status if msg.vad_info else None,
+            len(text.encode("utf-8")) if text is not None else None,
+            text)
+
+
+def _auth(payload: bytes) -> tuple:
+    msg = pb.decode_auth_request(payload)
+    timestamp = None
+    if msg.type == 0x80:
+        sync = pb.decode_time_sync_request(payload).sync
+        timestamp = sync.timestamp if sync else None
+    return (msg.type, msg.msg_id,
+            msg.data.capability if msg.data else None,
+            msg.ack.value if msg.ack else None,
+            timestamp)
+
+
+def _display_config(payload: bytes) -> tuple:
+    msg = pb.decode_display_config(payload)
+    return msg.type, msg.msg_id, len(msg.settings.regions) if msg.settings else None
+
+
+def _conversate(payload: bytes) -> tuple:
+    msg = pb.decode_conversate_message(payload)
+    transcript = msg.transcript
+    return (msg.type, msg.msg_id,
+            transcript.text if transcript else None,
+            transcript.is_final if transcript else None)
+
+
+def _notification(payload: bytes) -> tuple:
+    msg = pb.decode_notification_message(payload)
+    data = msg.notification
+    return msg.type, msg.msg_id, data.app_id if data else None, data.count if data else None
+
+
+def _generic(payload: bytes) -> tuple:
+    # Most services start with type (field 1) and msg_id (field 2) varints
+    top = fields(payload)
+    msg_type, msg_id = top.get(1), top.get(2)
+    return (msg_type if isinstance(msg_type, int) else None,
+            msg_id if isinstance(msg_id, int) else None)
+
+
+TELEPROMPTER = Table("teleprompter", [
+    ("msg_type", "int"), ("msg_id", "int"), ("page_number", "int"), ("line_count", "int"),
+    ("text_len", "int"), ("text", "str"), ("total_pages", "int"), ("script_count", "int"),
+], _teleprompter)
+EVEN_AI = Table("even_ai", [
+    ("command_id", "int"), ("magic_random", "int"), ("status", "int"), ("vad_status", "int"),
+    ("text_len", "int"), ("text", "str"),
+], _even_ai)
+AUTH = Table("auth", [
+    ("msg_type", "int"), ("msg_id", "int"), ("capability", "int"), ("ack", "int"),
+    ("sync_timestamp", "int"),
+], _auth)
+
+SERVICE_TABLES: Dict[int, Table] = {
+    0x0620: TELEPROMPTER, 0x0600: TELEPROMPTER, 0x0601: TELEPROMPTER,
+    0x0720: EVEN_AI, 0x0700: EVEN_AI, 0x0701: EVEN_AI,
+    0x8000: AUTH, 0x8001: AUTH, 0x8020: AUTH,
+    0x0E20: Table("display_config", [
+        ("msg_type", "int"), ("msg_id", "int"), ("region_count", "int"),
+    ], _display_config),
+    0x0B20: Table("conversate", [
+        ("msg_type", "int"), ("msg_id", "int"), ("text", "str"), ("is_final", "bool"),
+    ], _conversate),
+    0x0220: Table("notification", [
+        ("msg_type", "int"), ("msg_id", "int"), ("app_id", "int"), ("count", "int"),
+    ], _notification),
+}
+GENERIC_COLUMNS = [("msg_type", "int"), ("msg_id", "int")]
+
+
+def table_for(service: int) -> Table:
+    table = SERVICE_TABLES.get(service)
+    if table is None:
+        table = Table(f"svc_0x{service:04x}", GENERIC_COLUMNS, _generic)
+    return table
+
+
+# =============================================================================
+# Export (runs in worker processes)
+# =============================================================================
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def capture_key(path: Path) -> str:
+    """Name of a capture in the manifest, its partition files and the capture column."""
+    return path.stem
+
+
+def decode_capture(path: Path) -> Tuple[Dict[str, Table], Dict[str, Dict[str, list]], dict]:
+    """Decode every G2 frame in a capture into per-table column lists."""
+    capture = capture_key(path)
+    decoders: Dict[Tuple[str, int], FrameDecoder] = {}
+    tables: Dict[str, Table] = {}
+    columns: Dict[str, Dict[str, list]] = {}
+    stats = {"att_values": 0, "frames": 0, "non_g2_values": 0, "decode_errors": 0}
+
+    for att in iter_att(read_records(path, strict=False)):
+        stats["att_values"] += 1
+        if not att.value or att.value[0] != MAGIC:
+            stats["non_g2_values"] += 1
+            continue
+        decoder = decoders.setdefault((att.direction, att.handle), FrameDecoder())
+        frame = decoder.feed(att.value)
+        if frame is None:
+            continue
+        stats["frames"] += 1
+
+        table = table_for(frame.service)
+        tables[table.name] = table
+        cols = columns.get(table.name)
+        if cols is None:
+            cols = columns[table.name] = {name: [] for name, _ in FRAME_COLUMNS + table.columns}
+
+        try:
+            values = table.extract(frame.payload)
+            error = False
+        except ValueError:
+            values = (None,) * len(table.columns)
+            error = True
+            stats["decode_errors"] += 1
+
+        common = (capture, att.record, att.timestamp, att.direction, att.handle,
+                  HANDLE_CHARS.get(att.handle, ""), frame.service, frame.seq, frame.packets,
+                  len(frame.payload), error, frame.payload)
+        for (name, _), value in zip(FRAME_COLUMNS + table.columns, common + tuple(values)):
+            cols[name].append(value)
+
+    stats["crc_errors"] = sum(d.crc_errors for d in decoders.values())
+    stats["dropped"] = sum(d.dropped for d in decoders.values())
+    return tables, columns, stats
+
+
+def write_table(path: Path, table: Table, cols: Dict[str, list], fmt: str):
+    spec = FRAME_COLUMNS + table.columns
+    if fmt == "parquet":
+        arrays = [pa.array(cols[name], type=getattr(pa, COLUMN_TYPES[kind][2])()) for name, kind in spec]
+        pq.write_table(pa.Table.from_arrays(arrays, names=[name for name, _ in spec]), path)
+        return
+
+    arrays = {}
+    for name, kind in spec:
+        dtype, fill, _ = COLUMN_TYPES[kind]
+        values = [fill if v is None else v for v in cols[name]]
+        if dtype == "object":
+            arrays[name] = np.empty(len(values), dtype=object)
+            arrays[name][:] = values
+        else:
+            arrays[name] = np.array(values, dtype=dtype)
+    np.savez_compressed(path, **arrays)
+
+
+def export_capture(path: str, out_dir: str, fmt: str, previous: Optional[dict], force: bool) -> dict:
+    """Export one capture; returns its manifest entry."""
+    path, out_dir = Path(path), Path(out_dir)
+    entry = {"sha256": sha256_file(path), "size": path.stat().st_size, "format": fmt,
+             "version": EXPORT_VERSION}
+    ext = ".parquet" if fmt == "parquet" else ".npz"
+    key = capture_key(path)
+
+    if (not force and previous and all(previous.get(k) == entry[k] for k in ("sha256", "format", "version"))
+            and all((out_dir / table / (key + ext)).exists() for table in previous.get("tables", {}))):
+        return dict(previous, skipped=True)
+
+    # Remove this capture's partitions from the previous run
+    if previous:
+        old_ext = ".parquet" if previous.get("format") == "parquet" else ".npz"
+        for table in previous.get("tables", {}):
+            (out_dir / table / (key + old_ext)).unlink(missing_ok=True)
+
+    try:
+        tables, columns, stats = decode_capture(path)
+    except CaptureError as e:
+        return dict(entry, tables={}, error=str(e), skipped=False)
+
+    for name, cols in columns.items():
+        (out_dir / name).mkdir(parents=True, exist_ok=True)
+        write_table(out_dir / name / (key + ext), tables[name], cols, fmt)
+
+    return dict(entry, **stats, tables={name: len(cols["record"]) for name, cols in columns.items()},
+                skipped=False)
+
+
+# =============================================================================
+# Reading Back
+# =============================================================================
+
+def load_table(out_dir, table: str) -> Dict[str, np.ndarray]:
+    """Concatenate one table across all exported captures into NumPy columns."""
+    directory = Path(out_dir) / table
+    parquet = sorted(directory.glob("*.parquet"))
+    if parquet:
+        if pa is None:
+            raise RuntimeError("pyarrow is required to read Parquet exports")
+        data = pa.concat_tables([pq.read_table(p) for p in parquet])
+        return {name: data.column(name).to_numpy(zero_copy_only=False) for name in data.column_names}
+
+    parts = []
+    for path in sorted(directory.glob("*.npz")):
+        with np.load(path, allow_pickle=True) as npz:
+            parts.append({name: npz[name] for name in npz.files})
+    if not parts:
+        raise FileNotFoundError(f"No exported files for table {table!r} in {out_dir}")
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def show_table(out_dir, table: str, limit: int = 10):
+    data = load_table(out_dir, table)
+    rows = len(data["record"])
+    print(f"{table}: {rows} rows, columns: {', '.join(data)}")
+    shown = [name for name in data if name != "payload"]
+    for i in range(min(rows, limit)):
+        values = (data[name][i] for name in shown)
+        print("  " + "  ".join(f"{name}={getattr(v, 'item', lambda: v)()!r}" for name, v in zip(shown, values)))
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Export decoded G2 frames from btsnoop captures')
+    parser.add_argument('captures', nargs='*', help='Capture files (default: captures/*.log)')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT), help='Output directory')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='Worker processes')
+    parser.add_argument('--format', choices=['auto', 'parquet', 'npz'], default='auto')
+    parser.add_argument('--force', action='store_true', help='Re-export unchanged captures')
+    parser.add_argument('--show', metavar='TABLE', help='Print the first rows of an exported table')
+    args = parser.parse_args()
+
+    out_dir = Path(args.output)
+    if args.show:
+        show_table(out_dir, args.show)
+        return
+
+    fmt = args.format
+    if fmt == "auto":
+        fmt = "parquet" if pa is not None else "npz"
+    if fmt == "parquet" and pa is None:
+        print("ERROR: Parquet output needs pyarrow (pip install pyarrow), or use --format npz")
+        sys.exit(1)
+
+    paths = [Path(p) for p in args.captures] or sorted((ROOT / "captures").glob("*.log"))
+    if not paths:
+        print("No capture files found")
+        return
+
+    keys = [capture_key(p) for p in paths]
+    clashes = sorted({key for key in keys if keys.count(key) > 1})
+    if clashes:
+        print(f"ERROR: Captures would share output files: {', '.join(clashes)} (rename one of each)")
+        sys.exit(1)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    previous = manifest.get("captures", {}) if manifest.get("version") == EXPORT_VERSION else {}
+
+    jobs = [(str(p), str(out_dir), fmt, previous.get(key), args.force) for p, key in zip(paths, keys)]
+    if args.jobs <= 1 or len(jobs) == 1:
+        results = [export_capture(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            results = list(pool.map(export_capture, *zip(*jobs)))
+
+    print(f"Exporting {len(paths)} capture(s) to {out_dir} ({fmt})")
+    for path, key, result in zip(paths, keys, results):
+        skipped = result.pop("skipped")
+        previous[key] = result
+        if result.get("error"):
+            print(f"  {path.name}: ERROR {result['error']}")
+        elif skipped:
+            print(f"  {path.name}: unchanged, skipped")
+        else:
+            tables = ", ".join(f"{name}={rows}" for name, rows in sorted(result["tables"].items()))
+            print(f"  {path.name}: {result['frames']} frames ({result['crc_errors']} CRC errors) "
+                  f"-> {tables or 'no G2 frames'}")
+
+    manifest_path.write_text(json.dumps({"version": EXPORT_VERSION, "captures": previous}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
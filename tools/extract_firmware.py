@@ -4,17 +4,836 @@ Even G2 Firmware Extraction and Analysis Tool
 
 This tool extracts and analyzes DFU firmware packages from the Even Realities app.
 Supports analysis of bootloader, softdevice, and application firmware components.
+
+By default components are analyzed inside the ZIP: members are streamed in
+archive order into the hashers and header parser, so nothing is written to
+disk. Use -e to extract them first.
+
+--diff OLD compares two images (or the common components of two packages)
+rsync-style and reports changed and moved regions, optionally with a delta.
 """
 
 import os
+import re
 import sys
 import json
+import mmap
+import time
+import zlib
+import base64
+import struct
 import zipfile
 import argparse
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # CRC32C falls back to the byte-at-a-time table loop
+    np = None
+
+
+# CRC32C as used by the glasses' file service (docs/notification-file-transfer.md):
+# Castagnoli polynomial, MSB-first, init 0, no final XOR
+CRC32C_POLY = 0x1EDC6F41
+CRC32C_LANES = 16384        # independent streams in the NumPy CRC
+CRC32C_VECTOR_MIN = 65536   # below this the table loop is faster
+HASH_WINDOW = 8 * 1024 * 1024
+HEADER_SIZE = 32            # ARM vector table start, enough for SP and reset handler
+MAX_DAT_SIZE = 4096         # init packets are ~150 bytes; larger .dat files are truncated for parsing
+
+
+def _crc32c_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ CRC32C_POLY if crc & 0x80000000 else crc << 1) & 0xFFFFFFFF
+        table.append(crc)
+    return table
+
+
+CRC32C_TABLE = _crc32c_table()
+
+
+def _gf2_mulmod(a: int, b: int) -> int:
+    """Multiply two 32-bit polynomials modulo the CRC32C polynomial"""
+    result = 0
+    for bit in range(31, -1, -1):
+        result = ((result << 1) ^ CRC32C_POLY if result & 0x80000000 else result << 1) & 0xFFFFFFFF
+        if (b >> bit) & 1:
+            result ^= a
+    return result
+
+
+@lru_cache(maxsize=256)
+def _zeros_operator(length: int) -> int:
+    """x^(8 * length) mod P: appending `length` zero bytes multiplies the CRC by this"""
+    result, base = 1, 1 << 8
+    while length:
+        if length & 1:
+            result = _gf2_mulmod(result, base)
+        base = _gf2_mulmod(base, base)
+        length >>= 1
+    return result
+
+
+def crc32c_combine(crc_a: int, crc_b: int, len_b: int) -> int:
+    """CRC32C of A + B from the CRCs of A and B (init 0 makes the CRC linear)"""
+    return _gf2_mulmod(crc_a, _zeros_operator(len_b)) ^ crc_b
+
+
+@lru_cache(maxsize=64)
+def _shift_tables(length: int):
+    """Byte lookup tables that multiply a vector of CRCs by _zeros_operator(length)"""
+    op = _zeros_operator(length)
+    tables = np.zeros((4, 256), dtype=np.uint32)
+    for j in range(4):
+        column = np.zeros(1, dtype=np.uint32)
+        for bit in range(8):
+            column = np.concatenate([column, column ^ np.uint32(_gf2_mulmod(1 << (8 * j + bit), op))])
+        tables[j] = column
+    return tables
+
+
+@lru_cache(maxsize=1)
+def _crc32c_word_tables():
+    """CRC of a 16-bit value followed by 2 zero bytes (high half) and by none (low half)"""
+    byte = np.array(CRC32C_TABLE, dtype=np.uint32)
+    index = np.arange(65536, dtype=np.uint32)
+    low = (byte[index >> 8] << np.uint32(8)) ^ byte[(byte[index >> 8] >> np.uint32(24)) ^ (index & 0xFF)]
+    high = _apply_shift(_shift_tables(2), low)
+    return high, low
+
+
+def _apply_shift(tables, crcs):
+    return (tables[0][crcs & 0xFF] ^ tables[1][(crcs >> 8) & 0xFF]
+            ^ tables[2][(crcs >> 16) & 0xFF] ^ tables[3][crcs >> 24])
+
+
+def _crc32c_vector(data) -> int:
+    """CRC32C of a large buffer: CRC32C_LANES interleaved blocks advanced 4 bytes per step"""
+    size = len(data)
+    lanes = max(1, min(CRC32C_LANES, size // 1024))
+    block = -(-size // (lanes * 4)) * 4
+    # Leading zero bytes do not change a CRC with init 0, so pad the front
+    padded = np.zeros(lanes * block, dtype=np.uint8)
+    padded[lanes * block - size:] = np.frombuffer(data, dtype=np.uint8)
+    words = padded.view('>u4').reshape(lanes, block // 4).T.astype(np.uint32)
+
+    high, low = _crc32c_word_tables()
+    crcs = np.zeros(lanes, dtype=np.uint32)
+    upper, lower, folded = (np.empty(lanes, dtype=np.uint32) for _ in range(3))
+    for row in words:
+        np.bitwise_xor(crcs, row, out=crcs)
+        np.right_shift(crcs, 16, out=upper)
+        np.bitwise_and(crcs, 0xFFFF, out=lower)
+        np.take(high, upper, out=folded)
+        np.take(low, lower, out=crcs)
+        crcs ^= folded
+
+    # Fold neighbouring blocks pairwise: crc(A + B) = shift(crc(A), len(B)) ^ crc(B)
+    length = block
+    while len(crcs) > 1:
+        if len(crcs) % 2:
+            crcs = np.concatenate([np.zeros(1, dtype=np.uint32), crcs])
+        crcs = _apply_shift(_shift_tables(length), crcs[0::2]) ^ crcs[1::2]
+        length *= 2
+    return int(crcs[0])
+
+
+def crc32c(data, crc: int = 0) -> int:
+    """CRC32C of data, continuing from a previous crc"""
+    if np is not None and len(data) >= CRC32C_VECTOR_MIN:
+        return crc32c_combine(crc, _crc32c_vector(data), len(data))
+    table = CRC32C_TABLE
+    for byte in bytes(data):
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[byte ^ (crc >> 24)]
+    return crc
+
+
+class ChecksumEngine:
+    """MD5, SHA-256 and CRC32C of many files, each memory-mapped and read once
+
+    Every file's hashlib digests stream its mapped windows as one pool task
+    each. CRC32C windows are independent tasks combined afterwards. hashlib
+    and NumPy release the GIL, so all of them run in parallel across cores.
+    """
+
+    DIGESTS = ('md5', 'sha256', 'crc32c')
+
+    def __init__(self, workers: Optional[int] = None, window: int = HASH_WINDOW,
+                 digests: tuple = DIGESTS):
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.window = window
+        self.digests = digests
+
+    @staticmethod
+    def _digest(name: str, view: memoryview, window: int) -> str:
+        digest = hashlib.new(name)
+        for offset in range(0, len(view), window):
+            digest.update(view[offset:offset + window])
+        return digest.hexdigest()
+
+    def _submit(self, pool: ThreadPoolExecutor, path: Path):
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        view = memoryview(mapped) if mapped is not None else memoryview(b'')
+        digests = {name: pool.submit(self._digest, name, view, self.window)
+                   for name in self.digests if name != 'crc32c'}
+        crcs = None
+        if 'crc32c' in self.digests:
+            crcs = [(pool.submit(crc32c, view[offset:offset + self.window]), min(self.window, size - offset))
+                    for offset in range(0, size, self.window)]
+        return mapped, view, digests, crcs
+
+    @staticmethod
+    def _collect(job) -> Dict[str, str]:
+        mapped, view, digests, crcs = job
+        result = {name: future.result() for name, future in digests.items()}
+        if crcs is not None:
+            crc = 0
+            for future, length in crcs:
+                crc = crc32c_combine(crc, future.result(), length)
+            result['crc32c'] = f"{crc:08x}"
+        view.release()
+        if mapped is not None:
+            mapped.close()
+        return result
+
+    def checksum_stream(self, stream, head: int = 0,
+                        pool: Optional[ThreadPoolExecutor] = None) -> Tuple[Dict[str, str], bytes]:
+        """Checksums of a file-like object read once, plus its first `head` bytes
+
+        Each window is hashed by all digests in the pool while the next one
+        is read (and decompressed, for zip members).
+        """
+        if pool is None:
+            with ThreadPoolExecutor(self.workers) as pool:
+                return self.checksum_stream(stream, head, pool)
+
+        hashes = {name: hashlib.new(name) for name in self.digests if name != 'crc32c'}
+        crc, first = 0, b''
+        window = stream.read(self.window)
+        while window:
+            first = first or window[:head]
+            tasks = [pool.submit(digest.update, window) for digest in hashes.values()]
+            if 'crc32c' in self.digests:
+                tasks.append(pool.submit(crc32c, window))
+            size = len(window)
+            window = stream.read(self.window)
+            for task in tasks:
+                task.result()
+            if 'crc32c' in self.digests:
+                crc = crc32c_combine(crc, tasks[-1].result(), size)
+
+        result = {name: digest.hexdigest() for name, digest in hashes.items()}
+        if 'crc32c' in self.digests:
+            result['crc32c'] = f"{crc:08x}"
+        return result, first
+
+    def checksum_files(self, paths: List[Path]) -> Dict[Path, Dict[str, str]]:
+        """Checksums of every file, hashed concurrently"""
+        with ThreadPoolExecutor(self.workers) as pool:
+            jobs = [(path, self._submit(pool, path)) for path in paths]
+            return {path: self._collect(job) for path, job in jobs}
+
+    def checksum_file(self, path: Path) -> Dict[str, str]:
+        return self.checksum_files([path])[path]
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode a protobuf varint; returns (value, next position)"""
+    value = shift = 0
+    while pos < len(data):
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+    raise ValueError("truncated varint")
+
+
+def _parse_message(data: bytes) -> Dict[int, List]:
+    """Protobuf fields of one message: field number -> values (ints, or bytes for length-delimited)"""
+    fields: Dict[int, List] = {}
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            if pos + length > len(data):
+                raise ValueError(f"field {number} runs past the end ({length} bytes)")
+            value, pos = data[pos:pos + length], pos + length
+        elif wire_type in (1, 5):
+            size = 8 if wire_type == 1 else 4
+            if pos + size > len(data):
+                raise ValueError(f"field {number} runs past the end")
+            value, pos = int.from_bytes(data[pos:pos + size], 'little'), pos + size
+        else:
+            raise ValueError(f"unexpected wire type {wire_type} at field {number}")
+        fields.setdefault(number, []).append(value)
+    return fields
+
+
+# Enumerations of Nordic's dfu-cc.proto, which the .dat files follow
+FW_TYPES = {0: 'application', 1: 'softdevice', 2: 'bootloader', 3: 'softdevice_bootloader',
+            4: 'external_application'}
+HASH_TYPES = {0: 'none', 1: 'crc', 2: 'sha128', 3: 'sha256', 4: 'sha512'}
+SIGNATURE_TYPES = {0: 'ecdsa_p256_sha256', 1: 'ed25519'}
+OP_INIT = 1
+
+
+@dataclass
+class InitPacket:
+    """Nordic DFU init packet (.dat): Packet -> SignedCommand -> Command -> InitCommand"""
+    op_code: Optional[int] = None
+    fw_version: Optional[int] = None
+    hw_version: Optional[int] = None
+    sd_req: List[int] = field(default_factory=list)
+    fw_type: int = 0
+    sd_size: int = 0
+    bl_size: int = 0
+    app_size: int = 0
+    hash_type: Optional[int] = None
+    hash: bytes = b''
+    is_debug: bool = False
+    boot_validation: List[Tuple[int, bytes]] = field(default_factory=list)
+    signature_type: Optional[int] = None
+    signature: bytes = b''
+    signed_data: bytes = b''        # the serialized Command, which the signature covers
+
+    @property
+    def signed(self) -> bool:
+        return bool(self.signature)
+
+    @property
+    def firmware_sha256(self) -> Optional[str]:
+        """SHA-256 of the .bin as hex (Nordic stores the digest byte-reversed)"""
+        if self.hash_type != 3 or len(self.hash) != 32:
+            return None
+        return self.hash[::-1].hex()
+
+    @property
+    def image_size(self) -> int:
+        return self.sd_size + self.bl_size + self.app_size
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form for analysis output"""
+        return {
+            'format': 'nordic_init_packet',
+            'op_code': self.op_code,
+            'fw_type': FW_TYPES.get(self.fw_type, self.fw_type),
+            'fw_version': self.fw_version,
+            'hw_version': self.hw_version,
+            'sd_req': [f"0x{req:04x}" for req in self.sd_req],
+            'sd_size': self.sd_size,
+            'bl_size': self.bl_size,
+            'app_size': self.app_size,
+            'hash_type': HASH_TYPES.get(self.hash_type, self.hash_type),
+            'firmware_sha256': self.firmware_sha256,
+            'is_debug': self.is_debug,
+            'boot_validation': [[kind, value.hex()] for kind, value in self.boot_validation],
+            'signature_type': SIGNATURE_TYPES.get(self.signature_type, self.signature_type),
+            'signature': self.signature.hex(),
+        }
+
+
+def decode_init_packet(data: bytes) -> InitPacket:
+    """Decode a .dat init packet; raises ValueError if it is not one"""
+    packet = _parse_message(data)
+    result = InitPacket()
+
+    if 2 in packet:
+        signed = _parse_message(packet[2][-1])
+        if 1 not in signed:
+            raise ValueError("signed command without a command")
+        command_bytes = signed[1][-1]
+        result.signature_type = signed.get(2, [None])[-1]
+        result.signature = signed.get(3, [b''])[-1]
+        result.signed_data = command_bytes
+    elif 1 in packet:
+        command_bytes = packet[1][-1]
+    else:
+        raise ValueError("no command in init packet")
+    if not isinstance(command_bytes, bytes):
+        raise ValueError("command is not a message")
+
+    command = _parse_message(command_bytes)
+    result.op_code = command.get(1, [None])[-1]
+    if 2 not in command:
+        return result
+
+    init = _parse_message(command[2][-1])
+    result.fw_version = init.get(1, [None])[-1]
+    result.hw_version = init.get(2, [None])[-1]
+    for value in init.get(3, []):
+        # sd_req is packed, but accept unpacked varints too
+        if isinstance(value, bytes):
+            pos = 0
+            while pos < len(value):
+                req, pos = _read_varint(value, pos)
+                result.sd_req.append(req)
+        else:
+            result.sd_req.append(value)
+    result.fw_type = init.get(4, [0])[-1]
+    result.sd_size = init.get(5, [0])[-1]
+    result.bl_size = init.get(6, [0])[-1]
+    result.app_size = init.get(7, [0])[-1]
+    if 8 in init:
+        digest = _parse_message(init[8][-1])
+        result.hash_type = digest.get(1, [None])[-1]
+        result.hash = digest.get(2, [b''])[-1]
+    result.is_debug = bool(init.get(9, [0])[-1])
+    for validation in init.get(10, []):
+        fields = _parse_message(validation)
+        result.boot_validation.append((fields.get(1, [0])[-1], fields.get(2, [b''])[-1]))
+    return result
+
+
+# =============================================================================
+# ECDSA P-256 verification
+# =============================================================================
+
+P256_P = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
+P256_N = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+P256_B = 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B
+P256_G = (0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+          0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5)
+P256_OID = bytes.fromhex('2a8648ce3d030107')
+
+# Nordic's dfu_public_key.c spells the key as a C array of 0x.. bytes
+C_ARRAY_BYTE = re.compile(r'0x([0-9a-fA-F]{2})\b')
+
+
+def _affine_add(a: Optional[Tuple[int, int]], b: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    """Point addition in affine coordinates (None is the point at infinity)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    p = P256_P
+    if a[0] == b[0]:
+        if (a[1] + b[1]) % p == 0:
+            return None
+        slope = 3 * (a[0] * a[0] - 1) * pow(2 * a[1], -1, p) % p
+    else:
+        slope = (b[1] - a[1]) * pow(b[0] - a[0], -1, p) % p
+    x = (slope * slope - a[0] - b[0]) % p
+    return x, (slope * (a[0] - x) - a[1]) % p
+
+
+def _comb_table(point: Tuple[int, int]) -> List[List[Optional[Tuple[int, int]]]]:
+    """table[i][j] = j * 16^i * point, so a scalar multiple needs only 64 additions"""
+    table = []
+    base = point
+    for _ in range(64):
+        row = [None]
+        for _ in range(15):
+            row.append(_affine_add(row[-1], base))
+        table.append(row)
+        base = _affine_add(row[-1], base)
+    return table
+
+
+def _jacobian_add_affine(X1: int, Y1: int, Z1: int, point: Optional[Tuple[int, int]]) -> Tuple[int, int, int]:
+    """Jacobian point plus affine point"""
+    if point is None:
+        return X1, Y1, Z1
+    x2, y2 = point
+    if Z1 == 0:
+        return x2, y2, 1
+    p = P256_P
+    Z1Z1 = Z1 * Z1 % p
+    H = (x2 * Z1Z1 - X1) % p
+    R = (y2 * Z1 * Z1Z1 - Y1) % p
+    if H == 0:
+        if R:
+            return 1, 1, 0
+        # Doubling (a = -3)
+        delta, gamma = Z1Z1, Y1 * Y1 % p
+        beta = X1 * gamma % p
+        alpha = 3 * (X1 - delta) * (X1 + delta) % p
+        X3 = (alpha * alpha - 8 * beta) % p
+        return X3, (alpha * (4 * beta - X3) - 8 * gamma * gamma) % p, 2 * Y1 * Z1 % p
+    HH = H * H % p
+    HHH = H * HH % p
+    V = X1 * HH % p
+    X3 = (R * R - HHH - 2 * V) % p
+    return X3, (R * (V - X3) - Y1 * HHH) % p, Z1 * H % p
+
+
+def _p256_on_curve(point: Tuple[int, int]) -> bool:
+    x, y = point
+    p = P256_P
+    return 0 <= x < p and 0 <= y < p and (y * y - x * x * x + 3 * x - P256_B) % p == 0
+
+
+@lru_cache(maxsize=1)
+def _generator_table():
+    return _comb_table(P256_G)
+
+
+def load_public_key(path: Path) -> Tuple[int, int]:
+    """P-256 public key (x, y) from a PEM/DER SubjectPublicKeyInfo, raw or hex X||Y,
+    or Nordic's dfu_public_key.c (little-endian C array)"""
+    data = Path(path).read_bytes()
+    text = data.decode('latin-1')
+    if '-----BEGIN' in text:
+        body = ''.join(line for line in text.splitlines() if line and not line.startswith('-----'))
+        data = base64.b64decode(body)
+    elif len(C_ARRAY_BYTE.findall(text)) >= 64:
+        raw = bytes(int(b, 16) for b in C_ARRAY_BYTE.findall(text)[-64:])
+        data = raw[31::-1] + raw[63:31:-1]
+    elif re.fullmatch(rb'[0-9a-fA-F\s]+', data):
+        data = bytes.fromhex(text)
+
+    if P256_OID in data:
+        # SubjectPublicKeyInfo: the uncompressed point ends the structure
+        data = data[-65:]
+    if len(data) == 65 and data[0] == 0x04:
+        data = data[1:]
+    if len(data) != 64:
+        raise ValueError(f"{path}: not a P-256 public key ({len(data)} bytes)")
+    point = int.from_bytes(data[:32], 'big'), int.from_bytes(data[32:], 'big')
+    if not _p256_on_curve(point):
+        raise ValueError(f"{path}: point is not on the P-256 curve")
+    return point
+
+
+def key_fingerprint(public_key: Tuple[int, int]) -> str:
+    """Short identifier of a public key: SHA-256 of X||Y, first 16 hex digits"""
+    x, y = public_key
+    return hashlib.sha256(x.to_bytes(32, 'big') + y.to_bytes(32, 'big')).hexdigest()[:16]
+
+
+class P256Verifier:
+    """ECDSA P-256 / SHA-256 verification against one public key
+
+    Comb tables for the generator and the key turn each verification into
+    128 point additions and no doublings, so batches against one key are
+    fast in pure Python. The cryptography package is used when installed.
+    """
+
+    def __init__(self, public_key: Tuple[int, int]):
+        if not _p256_on_curve(public_key):
+            raise ValueError("public key is not on the P-256 curve")
+        self.public_key = public_key
+        self._native = None
+        try:
+            from cryptography.hazmat.primitives.asymmetric import ec
+            self._native = ec.EllipticCurvePublicNumbers(*public_key, ec.SECP256R1()).public_key()
+        except ImportError:
+            self._tables = (_generator_table(), _comb_table(public_key))
+
+    @property
+    def key_id(self) -> str:
+        return key_fingerprint(self.public_key)
+
+    def verify(self, message: bytes, r: int, s: int) -> bool:
+        """Check an (r, s) signature over SHA-256(message)"""
+        n = P256_N
+        if not (0 < r < n and 0 < s < n):
+            return False
+        if self._native is not None:
+            from cryptography.exceptions import InvalidSignature
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.asymmetric import ec
+            from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+            try:
+                self._native.verify(encode_dss_signature(r, s), message, ec.ECDSA(hashes.SHA256()))
+                return True
+            except InvalidSignature:
+                return False
+
+        e = int.from_bytes(hashlib.sha256(message).digest(), 'big')
+        w = pow(s, -1, n)
+        u1, u2 = e * w % n, r * w % n
+        X, Y, Z = 1, 1, 0
+        for table, scalar in zip(self._tables, (u1, u2)):
+            for row in table:
+                X, Y, Z = _jacobian_add_affine(X, Y, Z, row[scalar & 15])
+                scalar >>= 4
+        if Z == 0:
+            return False
+        return X * pow(Z * Z, -1, P256_P) % P256_P % n == r
+
+    def verify_init_packet(self, packet: InitPacket) -> Optional[bool]:
+        """Signature check of a decoded .dat; None if unsigned or not ECDSA P-256"""
+        if not packet.signed or packet.signature_type != 0 or len(packet.signature) != 64:
+            return None
+        # Nordic stores r and s little-endian
+        r = int.from_bytes(packet.signature[:32], 'little')
+        s = int.from_bytes(packet.signature[32:], 'little')
+        return self.verify(packet.signed_data, r, s)
+
+
+# =============================================================================
+# Binary diff
+# =============================================================================
+
+DIFF_BLOCK = 512
+DIFF_ROWS = 40                              # regions printed per component
+DELTA_MAGIC = b'G2D1'
+DELTA_HEADER = struct.Struct('<4sIIII')     # magic, old size, new size, old CRC-32, new CRC-32
+_MIX = 0x9E3779B97F4A7C15                   # spreads weak hashes over the prefilter bitmap
+_FILTER_BITS = 24
+
+
+@dataclass
+class DiffRegion:
+    """A run of the new image: 'same' or 'moved' (copied from old_offset) or 'changed'"""
+    kind: str
+    new_offset: int
+    length: int
+    old_offset: Optional[int] = None
+
+
+@dataclass
+class BinaryDiff:
+    """Block-level comparison of two images"""
+    old_size: int
+    new_size: int
+    block_size: int
+    regions: List[DiffRegion]
+    old_crc32: int = 0
+    new_crc32: int = 0
+    seconds: float = 0.0
+
+    def _bytes(self, kind: str) -> int:
+        return sum(region.length for region in self.regions if region.kind == kind)
+
+    @property
+    def changed_bytes(self) -> int:
+        return self._bytes('changed')
+
+    @property
+    def moved_bytes(self) -> int:
+        return self._bytes('moved')
+
+    @property
+    def changed_percent(self) -> float:
+        return 100.0 * self.changed_bytes / self.new_size if self.new_size else 0.0
+
+    def delta(self, new) -> bytes:
+        """Compact delta: COPY/ADD ops over the old image, zlib-compressed (see apply_delta)"""
+        ops = bytearray()
+        expected = 0
+        for region in self.regions:
+            if region.kind == 'changed':
+                ops += _varint(region.length << 1 | 1)
+                ops += new[region.new_offset:region.new_offset + region.length]
+            else:
+                ops += _varint(region.length << 1)
+                # Old offsets are coded relative to the end of the previous copy
+                skip = region.old_offset - expected
+                ops += _varint(skip << 1 if skip >= 0 else (-skip << 1) - 1)
+                expected = region.old_offset + region.length
+        return DELTA_HEADER.pack(DELTA_MAGIC, self.old_size, self.new_size, self.old_crc32, self.new_crc32) + \
+            zlib.compress(bytes(ops), 9)
+
+    def summary(self) -> Dict:
+        """JSON-friendly summary"""
+        return {
+            'old_size': self.old_size,
+            'new_size': self.new_size,
+            'block_size': self.block_size,
+            'changed_bytes': self.changed_bytes,
+            'moved_bytes': self.moved_bytes,
+            'changed_percent': round(self.changed_percent, 3),
+            'regions': [[r.kind, r.new_offset, r.length, r.old_offset] for r in self.regions if r.kind != 'same'],
+        }
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _block_weak(data, block: int):
+    """rsync weak checksums (a, b), exact, of the aligned blocks of data"""
+    count = len(data) // block
+    blocks = data[:count * block].reshape(count, block)
+    a = blocks.sum(axis=1, dtype=np.int64)
+    b = blocks @ np.arange(block, 0, -1, dtype=np.int64)
+    return (b << 20) | a
+
+
+def _rolling_weak(data, block: int):
+    """The same checksum at every offset, from prefix sums"""
+    n = len(data)
+    values = data.astype(np.int64)
+    sums = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(values, out=sums[1:])
+    values *= np.arange(n, dtype=np.int64)
+    weighted = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(values, out=weighted[1:])
+
+    a = sums[block:] - sums[:-block]
+    b = np.arange(block, n + 1, dtype=np.int64)
+    b *= a
+    b -= weighted[block:]
+    b += weighted[:-block]
+    b <<= 20
+    b |= a
+    return b
+
+
+def _match_blocks(old, new, block: int) -> List[Tuple[int, int, int]]:
+    """Greedy rsync-style matching: (new offset, old offset, length) copies in new order"""
+    old_weak = _block_weak(old, block)
+    new_weak = _rolling_weak(new, block)
+
+    # Cheap bitmap prefilter, then exact comparison against the sorted block checksums
+    mix, shift = np.uint64(_MIX), np.uint64(64 - _FILTER_BITS)
+    bitmap = np.zeros(1 << _FILTER_BITS, dtype=np.bool_)
+    bitmap[(old_weak.view(np.uint64) * mix) >> shift] = True
+    candidates = np.flatnonzero(bitmap[(new_weak.view(np.uint64) * mix) >> shift])
+    # Runs of repeated data give runs of one value: look each run up once
+    values = new_weak[candidates]
+    first = np.ones(len(values), dtype=np.bool_)
+    np.not_equal(values[1:], values[:-1], out=first[1:])
+    ordered = np.sort(old_weak)
+    index = np.searchsorted(ordered, values[first])
+    index[index == len(ordered)] = 0
+    found = ordered[index] == values[first]
+    candidates = candidates[found[np.cumsum(first) - 1]]
+    if not len(candidates):
+        return []
+
+    # Consecutive candidate offsets (e.g. padding) are taken a block apart, run by run
+    breaks = np.diff(candidates) != 1
+    starts = candidates[np.concatenate(([True], breaks))].tolist()
+    ends = candidates[np.concatenate((breaks, [True]))].tolist()
+    picks = []
+    position = 0
+    for start, end in zip(starts, ends):
+        if end < position:
+            continue
+        offsets = range(max(start, position), end + 1, block)
+        picks.extend(offsets)
+        position = offsets[-1] + block
+
+    # Confirm with a strong hash; prefer continuing the previous copy, then the same offset
+    old_view, new_view = memoryview(old), memoryview(new)
+    by_digest: Dict[bytes, int] = {}
+    digest_at: Dict[int, bytes] = {}
+    for offset in range(0, len(old) - block + 1, block):
+        digest = hashlib.blake2b(old_view[offset:offset + block], digest_size=16).digest()
+        by_digest.setdefault(digest, offset)
+        digest_at[offset] = digest
+
+    copies = []
+    for offset in picks:
+        digest = hashlib.blake2b(new_view[offset:offset + block], digest_size=16).digest()
+        if digest not in by_digest:
+            continue
+        if copies and copies[-1][0] + copies[-1][2] == offset:
+            follow = copies[-1][1] + copies[-1][2]
+            if digest_at.get(follow) == digest:
+                copies[-1] = (copies[-1][0], copies[-1][1], copies[-1][2] + block)
+                continue
+        source = offset if digest_at.get(offset) == digest else by_digest[digest]
+        copies.append((offset, source, block))
+    return copies
+
+
+def _extend_copies(old, new, copies: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """Grow each copy byte by byte into the unmatched gaps around it"""
+    extended = []
+    gap_start = 0
+    for i, (new_offset, old_offset, length) in enumerate(copies):
+        # Backwards into the gap before this copy (after the previous copy grew forwards)
+        limit = min(new_offset - gap_start, old_offset)
+        if limit > 0:
+            equal = new[new_offset - limit:new_offset] == old[old_offset - limit:old_offset]
+            grow = limit if equal.all() else limit - 1 - int(np.flatnonzero(~equal)[-1])
+            new_offset, old_offset, length = new_offset - grow, old_offset - grow, length + grow
+
+        # Forwards up to the next copy
+        end = copies[i + 1][0] if i + 1 < len(copies) else len(new)
+        limit = min(end - (new_offset + length), len(old) - (old_offset + length))
+        if limit > 0:
+            a, b = new_offset + length, old_offset + length
+            equal = new[a:a + limit] == old[b:b + limit]
+            length += limit if equal.all() else int(np.argmin(equal))
+
+        extended.append((new_offset, old_offset, length))
+        gap_start = new_offset + length
+    return extended
+
+
+def diff_binaries(old, new, block: int = DIFF_BLOCK) -> BinaryDiff:
+    """Compare two images (bytes, mmap or any buffer); needs NumPy"""
+    if np is None:
+        raise RuntimeError("diff needs numpy (pip install numpy)")
+    started = time.perf_counter()
+    old_array = np.frombuffer(old, dtype=np.uint8)
+    new_array = np.frombuffer(new, dtype=np.uint8)
+
+    copies = []
+    if len(old_array) >= block and len(new_array) >= block:
+        copies = _extend_copies(old_array, new_array, _match_blocks(old_array, new_array, block))
+
+    regions = []
+    position = 0
+    for new_offset, old_offset, length in copies:
+        if new_offset > position:
+            regions.append(DiffRegion('changed', position, new_offset - position))
+        kind = 'same' if new_offset == old_offset else 'moved'
+        last = regions[-1] if regions else None
+        if last and last.kind == kind and last.new_offset + last.length == new_offset \
+                and last.old_offset + last.length == old_offset:
+            last.length += length
+        else:
+            regions.append(DiffRegion(kind, new_offset, length, old_offset))
+        position = new_offset + length
+    if position < len(new_array):
+        regions.append(DiffRegion('changed', position, len(new_array) - position))
+
+    return BinaryDiff(len(old_array), len(new_array), block, regions, zlib.crc32(old), zlib.crc32(new),
+                      time.perf_counter() - started)
+
+
+def apply_delta(old, delta: bytes) -> bytes:
+    """Rebuild the new image from the old one and a BinaryDiff.delta()"""
+    magic, old_size, new_size, old_crc, new_crc = DELTA_HEADER.unpack_from(delta)
+    if magic != DELTA_MAGIC:
+        raise ValueError("not a firmware delta")
+    if len(old) != old_size or zlib.crc32(old) != old_crc:
+        raise ValueError("delta was made against a different old image")
+
+    ops = zlib.decompress(delta[DELTA_HEADER.size:])
+    new = bytearray()
+    pos = expected = 0
+    while pos < len(ops):
+        value, pos = _read_varint(ops, pos)
+        length = value >> 1
+        if value & 1:
+            new += ops[pos:pos + length]
+            pos += length
+        else:
+            skip, pos = _read_varint(ops, pos)
+            source = expected + (skip >> 1 if not skip & 1 else -((skip + 1) >> 1))
+            new += old[source:source + length]
+            expected = source + length
+
+    if len(new) != new_size or zlib.crc32(new) != new_crc:
+        raise ValueError("delta did not reproduce the new image")
+    return bytes(new)
 
 
 @dataclass
@@ -40,24 +859,22 @@ class FirmwareComponent:
             return self.dat_path.stat().st_size
         return 0
 
-    def calculate_checksums(self) -> Dict[str, str]:
-        """Calculate MD5 and SHA256 checksums"""
-        checksums = {}
-
-        for file_path, prefix in [(self.bin_path, 'bin'), (self.dat_path, 'dat')]:
-            if not file_path or not file_path.exists():
-                continue
+    def files(self) -> List[tuple]:
+        """(path, key prefix) of the component files present on disk"""
+        return [(path, prefix) for path, prefix in [(self.bin_path, 'bin'), (self.dat_path, 'dat')]
+                if path and path.exists()]
 
-            md5 = hashlib.md5()
-            sha256 = hashlib.sha256()
+    def calculate_checksums(self, engine: Optional[ChecksumEngine] = None,
+                            results: Optional[Dict[Path, Dict[str, str]]] = None) -> Dict[str, str]:
+        """Calculate MD5, SHA256 and CRC32C checksums"""
+        files = self.files()
+        if results is None:
+            results = (engine or ChecksumEngine()).checksum_files([path for path, _ in files])
 
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(8192):
-                    md5.update(chunk)
-                    sha256.update(chunk)
-
-            checksums[f'{prefix}_md5'] = md5.hexdigest()
-            checksums[f'{prefix}_sha256'] = sha256.hexdigest()
+        checksums = {}
+        for path, prefix in files:
+            for kind, value in results[path].items():
+                checksums[f'{prefix}_{kind}'] = value
 
         return checksums
 
@@ -65,15 +882,16 @@ class FirmwareComponent:
 class FirmwarePackage:
     """Handles DFU firmware package operations"""
 
-    def __init__(self, package_path: Path):
-        """Initialize with DFU package path"""
+    def __init__(self, package_path: Path, verifier: Optional[P256Verifier] = None):
+        """Initialize with DFU package path (and a key to check init packet signatures)"""
         self.package_path = Path(package_path)
+        self.verifier = verifier
         self.extract_dir = self.package_path.parent / f"{self.package_path.stem}_extracted"
         self.components: Dict[str, FirmwareComponent] = {}
         self.manifest: Dict = {}
 
-    def extract(self, force: bool = False) -> bool:
-        """Extract firmware package contents"""
+    def _check_package(self) -> bool:
+        """Check that the package exists and is a ZIP file"""
         if not self.package_path.exists():
             print(f"Error: Package not found: {self.package_path}")
             return False
@@ -82,6 +900,13 @@ class FirmwarePackage:
             print(f"Error: Not a valid ZIP file: {self.package_path}")
             return False
 
+        return True
+
+    def extract(self, force: bool = False) -> bool:
+        """Extract firmware package contents"""
+        if not self._check_package():
+            return False
+
         if self.extract_dir.exists() and not force:
             print(f"Extract directory already exists: {self.extract_dir}")
             print("Use --force to overwrite")
@@ -101,7 +926,7 @@ class FirmwarePackage:
             if manifest_path.exists():
                 with open(manifest_path, 'r') as f:
                     self.manifest = json.load(f)
-                    self._load_components()
+                    self._load_components(self.extract_dir)
 
             return True
 
@@ -109,8 +934,8 @@ class FirmwarePackage:
             print(f"Error during extraction: {e}")
             return False
 
-    def _load_components(self):
-        """Load firmware components from manifest"""
+    def _load_components(self, root: Optional[Path]):
+        """Load firmware components from manifest (no paths when root is None)"""
         if 'manifest' not in self.manifest:
             return
 
@@ -128,18 +953,29 @@ class FirmwarePackage:
                 name=component_name,
                 bin_file=bin_file,
                 dat_file=dat_file or '',
-                bin_path=self.extract_dir / bin_file,
-                dat_path=self.extract_dir / dat_file if dat_file else None
+                bin_path=root / bin_file if root else None,
+                dat_path=root / dat_file if root and dat_file else None
             )
 
             self.components[component_name] = component
 
-    def analyze(self) -> Dict:
+    def load_manifest(self, zf: zipfile.ZipFile):
+        """Parse manifest.json of an open package and load its components (without paths)"""
+        self.manifest = json.loads(zf.read('manifest.json'))
+        self.components = {}
+        self._load_components(None)
+
+    def analyze(self, engine: Optional[ChecksumEngine] = None) -> Dict:
         """Analyze firmware components"""
         if not self.components:
             print("No components found. Extract package first.")
             return {}
 
+        # Hash every component file at once so large images overlap across workers
+        engine = engine or ChecksumEngine()
+        paths = [path for component in self.components.values() for path, _ in component.files()]
+        results = engine.checksum_files(paths)
+
         analysis = {
             'package': self.package_path.name,
             'extract_dir': str(self.extract_dir),
@@ -157,7 +993,7 @@ class FirmwarePackage:
             }
 
             # Add checksums
-            checksums = component.calculate_checksums()
+            checksums = component.calculate_checksums(results=results)
             component_info.update(checksums)
 
             # Analyze binary header
@@ -165,41 +1001,143 @@ class FirmwarePackage:
                 header = self._analyze_binary_header(component.bin_path)
                 component_info['binary_analysis'] = header
 
+            # Analyze init packet
+            if component.dat_path and component.dat_path.exists():
+                with open(component.dat_path, 'rb') as f:
+                    component_info['dat_analysis'] = self._analyze_dat(f.read(MAX_DAT_SIZE))
+                self._check_init_packet(component_info)
+
             analysis['components'][name] = component_info
 
         return analysis
 
+    def analyze_archive(self, engine: Optional[ChecksumEngine] = None) -> Dict:
+        """Analyze components inside the ZIP: one sequential read, nothing written to disk"""
+        if not self._check_package():
+            return {}
+
+        engine = engine or ChecksumEngine()
+        analysis = {
+            'package': self.package_path.name,
+            'source': 'archive',
+            'components': {}
+        }
+
+        try:
+            with zipfile.ZipFile(self.package_path, 'r') as zf:
+                self.load_manifest(zf)
+
+                names = set(zf.namelist())
+                members = []
+                for name, component in self.components.items():
+                    infos = {}
+                    for file_name, prefix in [(component.bin_file, 'bin'), (component.dat_file, 'dat')]:
+                        if file_name in names:
+                            infos[prefix] = zf.getinfo(file_name)
+                            members.append((infos[prefix], name, prefix))
+
+                    analysis['components'][name] = {
+                        'bin_file': component.bin_file,
+                        'bin_size': infos['bin'].file_size if 'bin' in infos else 0,
+                        'dat_file': component.dat_file,
+                        'dat_size': infos['dat'].file_size if 'dat' in infos else 0,
+                    }
+
+                # Archive order, so the package is read front to back once
+                members.sort(key=lambda member: member[0].header_offset)
+
+                with ThreadPoolExecutor(engine.workers) as pool:
+                    for info, name, prefix in members:
+                        print(f"\nAnalyzing {name} ({info.filename})...")
+                        head = HEADER_SIZE if prefix == 'bin' else MAX_DAT_SIZE
+                        with zf.open(info) as stream:
+                            checksums, data = engine.checksum_stream(stream, head, pool)
+
+                        component_info = analysis['components'][name]
+                        for kind, value in checksums.items():
+                            component_info[f'{prefix}_{kind}'] = value
+                        if prefix == 'bin':
+                            component_info['binary_analysis'] = self._parse_binary_header(data)
+                        else:
+                            component_info['dat_analysis'] = self._analyze_dat(data)
+
+                for component_info in analysis['components'].values():
+                    self._check_init_packet(component_info)
+
+        except KeyError:
+            print(f"Error: No manifest.json in {self.package_path}")
+            return {}
+        except Exception as e:
+            print(f"Error reading package: {e}")
+            return {}
+
+        return analysis
+
     @staticmethod
     def _analyze_binary_header(bin_path: Path) -> Dict:
         """Analyze binary file header"""
         try:
             with open(bin_path, 'rb') as f:
                 # Read first 32 bytes (ARM vector table)
-                header = f.read(32)
+                header = f.read(HEADER_SIZE)
 
-            analysis = {
-                'format': 'binary',
-                'architecture': 'ARM Cortex-M4',
-                'endianness': 'little-endian',
-            }
+            return FirmwarePackage._parse_binary_header(header)
+
+        except Exception as e:
+            return {'error': str(e)}
 
-            if len(header) >= 4:
-                # First 32-bit value is typically stack pointer
-                sp = int.from_bytes(header[0:4], 'little')
-                analysis['initial_sp'] = f"0x{sp:08x}"
+    @staticmethod
+    def _parse_binary_header(header: bytes) -> Dict:
+        """Analyze the first 32 bytes (ARM vector table) of a binary"""
+        analysis = {
+            'format': 'binary',
+            'architecture': 'ARM Cortex-M4',
+            'endianness': 'little-endian',
+        }
 
-                # Second 32-bit value is reset handler
-                reset_handler = int.from_bytes(header[4:8], 'little')
-                analysis['reset_handler'] = f"0x{reset_handler:08x}"
+        if len(header) >= 4:
+            # First 32-bit value is typically stack pointer
+            sp = int.from_bytes(header[0:4], 'little')
+            analysis['initial_sp'] = f"0x{sp:08x}"
 
-                # Check for ARM magic markers
-                if header[0:4] == b'\x00\x00\x00\x00':
-                    analysis['note'] = 'Padding bytes detected at start'
+            # Second 32-bit value is reset handler
+            reset_handler = int.from_bytes(header[4:8], 'little')
+            analysis['reset_handler'] = f"0x{reset_handler:08x}"
 
-            return analysis
+            # Check for ARM magic markers
+            if header[0:4] == b'\x00\x00\x00\x00':
+                analysis['note'] = 'Padding bytes detected at start'
 
-        except Exception as e:
-            return {'error': str(e)}
+        return analysis
+
+    @staticmethod
+    def _parse_dat(data: bytes) -> Dict:
+        """Decode a .dat init packet"""
+        try:
+            return decode_init_packet(data).to_dict()
+        except ValueError as e:
+            return {'format': 'nordic_init_packet', 'error': str(e)}
+
+    def _analyze_dat(self, data: bytes) -> Dict:
+        """Decode a .dat init packet and check its signature when a key was given"""
+        analysis = self._parse_dat(data)
+        if self.verifier is not None and 'error' not in analysis:
+            analysis['signature_valid'] = self.verifier.verify_init_packet(decode_init_packet(data))
+        return analysis
+
+    @staticmethod
+    def _check_init_packet(component_info: Dict):
+        """Compare the hash and size in the init packet with the .bin"""
+        dat = component_info.get('dat_analysis')
+        if not dat or 'error' in dat:
+            return
+
+        if dat['firmware_sha256'] and component_info.get('bin_sha256'):
+            dat['hash_matches'] = dat['firmware_sha256'] == component_info['bin_sha256']
+
+        size = dat['sd_size'] + dat['bl_size'] + dat['app_size']
+        if size:
+            dat['size_matches'] = size == component_info['bin_size']
 
     def print_summary(self, analysis: Dict):
         """Print analysis summary"""
@@ -217,6 +1155,7 @@ class FirmwarePackage:
 
             print(f"  Binary MD5:  {component_info.get('bin_md5', 'N/A')}")
             print(f"  Binary SHA256: {component_info.get('bin_sha256', 'N/A')[:16]}...")
+            print(f"  Binary CRC32C: {component_info.get('bin_crc32c', 'N/A')}")
 
             if component_info.get('dat_md5'):
                 print(f"  Meta MD5:    {component_info['dat_md5']}")
@@ -227,9 +1166,27 @@ class FirmwarePackage:
                 print(f"  Initial SP:   {ba.get('initial_sp', 'Unknown')}")
                 print(f"  Reset Handle: {ba.get('reset_handler', 'Unknown')}")
 
-    def save_analysis(self, output_path: Path):
+            dat = component_info.get('dat_analysis')
+            if dat and 'error' in dat:
+                print(f"  Init packet:  undecodable ({dat['error']})")
+            elif dat:
+                print(f"  Init packet:  {dat['fw_type']}, fw_version {dat['fw_version']}, "
+                      f"hw_version {dat['hw_version']}, sd_req {', '.join(dat['sd_req']) or '-'}")
+                checks = [f"{name} {'OK' if dat[key] else 'MISMATCH'}"
+                          for name, key in [('hash', 'hash_matches'), ('size', 'size_matches')] if key in dat]
+                signature = dat.get('signature_valid')
+                if not dat['signature']:
+                    checks.append('unsigned')
+                elif signature is None:
+                    checks.append('signature not checked')
+                else:
+                    checks.append(f"signature {'OK' if signature else 'INVALID'}")
+                print(f"  Checks:       {', '.join(checks)}")
+
+    def save_analysis(self, output_path: Path, analysis: Optional[Dict] = None):
         """Save analysis to JSON file"""
-        analysis = self.analyze()
+        if analysis is None:
+            analysis = self.analyze()
 
         with open(output_path, 'w') as f:
             json.dump(analysis, f, indent=2)
@@ -237,6 +1194,57 @@ class FirmwarePackage:
         print(f"Analysis saved to: {output_path}")
 
 
+def load_images(path: Path) -> Dict[str, bytes]:
+    """Component name -> image: a .bin is memory-mapped, a package's .bin members are read"""
+    if path.suffix.lower() != '.zip':
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {path.stem: b''}
+            return {path.stem: mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)}
+    package = FirmwarePackage(path)
+    with zipfile.ZipFile(path) as zf:
+        package.load_manifest(zf)
+        return {name: zf.read(component.bin_file) for name, component in package.components.items()}
+
+
+def run_diff(old_path: Path, new_path: Path, block: int, delta: Optional[Path], output: Optional[Path]):
+    """Diff two images or the common components of two packages and print the changes"""
+    old_images, new_images = load_images(old_path), load_images(new_path)
+    if len(old_images) == len(new_images) == 1:
+        pairs = [(next(iter(new_images)), next(iter(old_images.values())), next(iter(new_images.values())))]
+    else:
+        pairs = [(name, old_images[name], new_images[name]) for name in new_images if name in old_images]
+        for name in sorted(set(old_images) ^ set(new_images)):
+            print(f"Component {name} only in {'old' if name in old_images else 'new'} package")
+
+    summaries = {}
+    for name, old, new in pairs:
+        diff = diff_binaries(old, new, block)
+        print(f"\n{name}: {diff.old_size:,} -> {diff.new_size:,} bytes ({block}-byte blocks)")
+        shown = [region for region in diff.regions if region.kind != 'same']
+        for region in shown[:DIFF_ROWS]:
+            line = f"  {region.kind:<8} 0x{region.new_offset:08X} +{region.length:<10,}"
+            if region.kind == 'moved':
+                line += f" from 0x{region.old_offset:08X} ({region.new_offset - region.old_offset:+,})"
+            print(line.rstrip())
+        if len(shown) > DIFF_ROWS:
+            print(f"  ... {len(shown) - DIFF_ROWS} more")
+
+        data = diff.delta(new)
+        print(f"  Changed: {diff.changed_bytes:,} bytes ({diff.changed_percent:.2f}%), "
+              f"moved: {diff.moved_bytes:,} bytes, delta: {len(data):,} bytes, {diff.seconds * 1000:.0f} ms")
+        if delta:
+            target = delta if len(pairs) == 1 else delta.with_name(f"{delta.stem}_{name}{delta.suffix}")
+            target.write_bytes(data)
+            print(f"  Delta saved to: {target}")
+        summaries[name] = dict(diff.summary(), delta_size=len(data))
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump({'old': str(old_path), 'new': str(new_path), 'components': summaries}, f, indent=2)
+        print(f"\nDiff saved to: {output}")
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -245,7 +1253,7 @@ def main():
     parser.add_argument(
         'package',
         type=Path,
-        help='Path to DFU firmware package (.zip file)'
+        help='Path to DFU firmware package (.zip file), or the new image with --diff'
     )
     parser.add_argument(
         '-e', '--extract',
@@ -255,7 +1263,7 @@ def main():
     parser.add_argument(
         '-a', '--analyze',
         action='store_true',
-        help='Analyze firmware components'
+        help='Analyze firmware components (the default; inside the ZIP unless -e is given)'
     )
     parser.add_argument(
         '-f', '--force',
@@ -267,24 +1275,69 @@ def main():
         type=Path,
         help='Save analysis to JSON file'
     )
+    parser.add_argument(
+        '-k', '--key',
+        type=Path,
+        help='P-256 public key (PEM, hex X||Y or dfu_public_key.c) to check .dat signatures'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Checksum worker threads (default: CPU count + 4)'
+    )
+    parser.add_argument(
+        '--diff',
+        type=Path,
+        metavar='OLD',
+        help='Diff OLD (.bin or .zip) against the package instead of analyzing it'
+    )
+    parser.add_argument(
+        '--delta',
+        type=Path,
+        help='With --diff, save the compact delta (one file per component for packages)'
+    )
+    parser.add_argument(
+        '--block',
+        type=int,
+        default=DIFF_BLOCK,
+        help=f'With --diff, block size in bytes (default: {DIFF_BLOCK})'
+    )
 
     args = parser.parse_args()
 
+    if args.diff:
+        try:
+            run_diff(args.diff, args.package, args.block, args.delta, args.output)
+        except (OSError, KeyError, ValueError, RuntimeError, zipfile.BadZipFile) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
     # Create package handler
-    package = FirmwarePackage(args.package)
+    try:
+        verifier = P256Verifier(load_public_key(args.key)) if args.key else None
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    package = FirmwarePackage(args.package, verifier)
+    engine = ChecksumEngine(args.jobs)
 
-    # Extract if requested
+    # Extract if requested, then analyze the extracted files
     if args.extract:
         if not package.extract(force=args.force):
             sys.exit(1)
+        analysis = package.analyze(engine)
+
+    # Otherwise analyze inside the archive, without touching the disk
+    else:
+        analysis = package.analyze_archive(engine)
+        if not analysis:
+            sys.exit(1)
 
-    # Analyze if requested (or by default)
-    if args.analyze or args.extract:
-        analysis = package.analyze()
-        package.print_summary(analysis)
+    package.print_summary(analysis)
 
-        if args.output:
-            package.save_analysis(args.output)
+    if args.output:
+        package.save_analysis(args.output, analysis)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+Even G2 Firmware Catalog
+
+Content-addressed index of DFU packages in a local SQLite database, so
+every vendor release can be kept analyzed without recomputing anything:
+
+    - packages and their component files (blobs) are keyed by SHA-256, so a
+      bootloader or softdevice shipped unchanged across versions and
+      hardware variants is stored and analyzed once
+    - analyzer results (vector table header, .dat init packet) are cached
+      per blob and analyzer version; bumping a version re-runs only that
+      analyzer, from the blob head kept in the database
+    - scan skips package files whose path, size and mtime are unchanged and
+      reads the members of new packages in a process pool; every member is
+      hashed, unless --trust-zip-crc lets a .bin whose ZIP CRC-32 and size
+      are already catalogued go unread (CRC-32 is not a content key: it is
+      trivial to forge). .dat files, which back signature checks, are
+      always hashed
+    - verify checks every .dat signature against a P-256 public key in a
+      process pool (each worker precomputes the key's tables once); results
+      are cached per key and the SHA-256 of the bytes actually checked, so
+      only new init packets are checked
+
+Usage:
+    python tools/firmware_catalog.py scan firmware/                 # index every .zip below firmware/
+    python tools/firmware_catalog.py scan a.zip b.zip -j 4 --trust-zip-crc  # skip .bin files known by CRC
+    python tools/firmware_catalog.py verify --key dfu_public_key.c  # init packet signatures and hashes
+    python tools/firmware_catalog.py list                           # packages and components
+    python tools/firmware_catalog.py show 3f2a9c                    # a package or blob by SHA-256 prefix
+"""
+
+import os
+import sys
+import json
+import hashlib
+import time
+import sqlite3
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from extract_firmware import (ChecksumEngine, FirmwarePackage, P256Verifier, HEADER_SIZE, MAX_DAT_SIZE,
+                              decode_init_packet, key_fingerprint, load_public_key)
+
+DEFAULT_DB = Path('firmware_catalog.db')
+
+# Bytes of each blob kept in the catalog for re-running analyzers without the package
+HEAD_SIZE = {'bin': max(HEADER_SIZE, 1024), 'dat': MAX_DAT_SIZE}
+
+# name -> (version, blob kind, function of the stored head); bump the version when an analyzer changes
+ANALYZERS = {
+    'header': (1, 'bin', FirmwarePackage._parse_binary_header),
+    'dat': (2, 'dat', FirmwarePackage._parse_dat),
+}
+
+# Outcome of checking one init packet, as stored in signature_checks.status
+SIG_OK = 'ok'
+SIG_INVALID = 'invalid'
+SIG_UNSIGNED = 'unsigned'
+SIG_NOT_CHECKED = 'not checked'     # signed, but not with a 64-byte ECDSA P-256 signature
+SIG_UNDECODABLE = 'undecodable'
+
+# Below this many unchecked .dat files, verify in-process instead of starting workers
+VERIFY_INLINE = 64
+VERIFY_CHUNK = 256
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS packages (
+    sha256 TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    manifest TEXT NOT NULL,
+    added REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS package_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL REFERENCES packages
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    zip_crc32 INTEGER NOT NULL,
+    md5 TEXT NOT NULL,
+    crc32c TEXT NOT NULL,
+    head BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_by_zip_crc ON blobs (zip_crc32, size);
+CREATE TABLE IF NOT EXISTS components (
+    package TEXT NOT NULL REFERENCES packages,
+    name TEXT NOT NULL,
+    bin_file TEXT NOT NULL,
+    bin_sha256 TEXT REFERENCES blobs,
+    dat_file TEXT NOT NULL,
+    dat_sha256 TEXT REFERENCES blobs,
+    PRIMARY KEY (package, name)
+);
+CREATE TABLE IF NOT EXISTS analyses (
+    sha256 TEXT NOT NULL REFERENCES blobs,
+    analyzer TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (sha256, analyzer)
+);
+DROP TABLE IF EXISTS signatures;         -- superseded by signature_checks
+CREATE TABLE IF NOT EXISTS signature_checks (
+    dat_sha256 TEXT NOT NULL,
+    key_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (dat_sha256, key_id)
+);
+'''
+
+
+@dataclass
+class ScanStats:
+    """Counters for one scan"""
+    files: int = 0
+    unchanged: int = 0
+    packages: int = 0
+    duplicate_packages: int = 0
+    members: int = 0
+    members_hashed: int = 0
+    members_known: int = 0
+    bytes_hashed: int = 0
+    analyses: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class VerifyStats:
+    """Counters for one verify run"""
+    checked: int = 0
+    cached: int = 0
+    valid: int = 0
+    invalid: int = 0
+    unsigned: int = 0
+    not_checked: int = 0
+    undecodable: int = 0
+    hash_mismatches: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ScanPlan:
+    """What a scan needs from one package file, decided from its central directory"""
+    path: Path
+    size: int
+    mtime_ns: int
+    manifest: Dict
+    components: List[Tuple[str, str, str]]     # (name, bin_file, dat_file)
+    members: Dict[str, Tuple[str, int, int]]   # file -> (kind, zip CRC-32, size)
+    known: Dict[str, str]                      # file -> SHA-256 already in the catalog
+    batched: List[str]                         # files read for an earlier package in this scan
+    todo: List[Tuple[str, str]]                # (file, kind) to read, in archive order
+
+
+def hash_package(path: str, todo: List[Tuple[str, str]]) -> Tuple[str, Dict[str, Dict]]:
+    """Process pool task: SHA-256 of the package file, checksums and head of the todo members"""
+    engine = ChecksumEngine(workers=2)
+    with open(path, 'rb') as f:
+        package_sha256 = ChecksumEngine(1, digests=('sha256',)).checksum_stream(f)[0]['sha256']
+
+    members = {}
+    with zipfile.ZipFile(path, 'r') as zf:
+        for file_name, kind in todo:
+            with zf.open(file_name) as stream:
+                checksums, head = engine.checksum_stream(stream, HEAD_SIZE[kind])
+            members[file_name] = dict(checksums, head=head)
+
+    return package_sha256, members
+
+
+_verifier: Optional[P256Verifier] = None
+
+
+def _init_verifier(public_key: Tuple[int, int]):
+    """Process pool initializer: build the key's tables once per worker"""
+    global _verifier
+    _verifier = P256Verifier(public_key)
+
+
+def check_dat(data: bytes) -> str:
+    """Signature status of one .dat with the worker's key"""
+    try:
+        packet = decode_init_packet(data)
+    except ValueError:
+        return SIG_UNDECODABLE
+    if not packet.signed:
+        return SIG_UNSIGNED
+    valid = _verifier.verify_init_packet(packet)
+    if valid is None:
+        return SIG_NOT_CHECKED
+    return SIG_OK if valid else SIG_INVALID
+
+
+def verify_dats(batch: List[bytes]) -> List[Tuple[str, str]]:
+    """Signature check of complete .dat files; (SHA-256 computed here, status) per file"""
+    return [(hashlib.sha256(data).hexdigest(), check_dat(data)) for data in batch]
+
+
+class FirmwareCatalog:
+    """SQLite store of packages, component blobs and cached analyses"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB):
+        """Open (or create) the catalog database"""
+        self.db_path = Path(db_path)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def find_packages(paths: List[Path]) -> List[Path]:
+        """Package files given directly or found below the given directories"""
+        found = []
+        for path in paths:
+            if path.is_dir():
+                found.extend(sorted(path.rglob('*.zip')))
+            else:
+                found.append(path)
+        return found
+
+    def _plan(self, path: Path, trust_zip_crc: bool, scheduled: set) -> Optional[ScanPlan]:
+        """Read the central directory and manifest; None if the file is unchanged since the last scan
+
+        With trust_zip_crc, .bin members whose ZIP CRC-32 and size are already
+        catalogued, or already scheduled (in `scheduled`) for an earlier
+        package of the same scan, are not read again. Everything else is.
+        """
+        stat = path.stat()
+        row = self.db.execute('SELECT size, mtime_ns FROM package_files WHERE path = ?',
+                              (str(path.resolve()),)).fetchone()
+        if row == (stat.st_size, stat.st_mtime_ns):
+            return None
+
+        package = FirmwarePackage(path)
+        with zipfile.ZipFile(path, 'r') as zf:
+            package.load_manifest(zf)
+            infos = {info.filename: info for info in zf.infolist()}
+
+        components, members = [], {}
+        for name, component in package.components.items():
+            components.append((name, component.bin_file, component.dat_file))
+            for file_name, kind in [(component.bin_file, 'bin'), (component.dat_file, 'dat')]:
+                if file_name in infos:
+                    members[file_name] = (kind, infos[file_name].CRC, infos[file_name].file_size)
+
+        known, batched = {}, []
+        if trust_zip_crc:
+            for file_name, key in members.items():
+                if key[0] != 'bin':
+                    continue
+                row = self.db.execute('SELECT sha256 FROM blobs WHERE kind = ? AND zip_crc32 = ? AND size = ?',
+                                      key).fetchone()
+                if row:
+                    known[file_name] = row[0]
+                elif key in scheduled:
+                    batched.append(file_name)
+                else:
+                    scheduled.add(key)
+
+        todo = sorted(((f, members[f][0]) for f in members if f not in known and f not in batched),
+                      key=lambda member: infos[member[0]].header_offset)
+        return ScanPlan(path, stat.st_size, stat.st_mtime_ns, package.manifest, components, members, known,
+                        batched, todo)
+
+    def _store(self, plan: ScanPlan, package_sha256: str, hashed: Dict[str, Dict], stats: ScanStats):
+        """Record one scanned package and its new blobs"""
+        db = self.db
+        blob_ids = dict(plan.known)
+        for file_name, result in hashed.items():
+            kind, crc, size = plan.members[file_name]
+            blob_ids[file_name] = result['sha256']
+            db.execute('INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                       (result['sha256'], kind, size, crc, result['md5'], result['crc32c'], result['head']))
+            stats.bytes_hashed += size
+
+        # Read earlier in this scan, possibly for this same package; missing if that package failed
+        complete = True
+        for file_name in plan.batched:
+            row = db.execute('SELECT sha256 FROM blobs WHERE kind = ? AND zip_crc32 = ? AND size = ?',
+                             plan.members[file_name]).fetchone()
+            if row:
+                blob_ids[file_name] = row[0]
+            else:
+                complete = False
+
+        new = db.execute('INSERT OR IGNORE INTO packages VALUES (?, ?, ?, ?, ?)',
+                         (package_sha256, plan.path.name, plan.size, json.dumps(plan.manifest), time.time()))
+        if new.rowcount:
+            stats.packages += 1
+        else:
+            stats.duplicate_packages += 1
+        if complete:
+            # Otherwise the next scan opens this file again
+            db.execute('INSERT OR REPLACE INTO package_files VALUES (?, ?, ?, ?)',
+                       (str(plan.path.resolve()), plan.size, plan.mtime_ns, package_sha256))
+        for name, bin_file, dat_file in plan.components:
+            db.execute('INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?, ?, ?)',
+                       (package_sha256, name, bin_file, blob_ids.get(bin_file), dat_file, blob_ids.get(dat_file)))
+
+        stats.members += len(plan.members)
+        stats.members_hashed += len(hashed)
+        stats.members_known += len(plan.known) + len(plan.batched)
+        db.commit()
+
+    def scan(self, paths: List[Path], jobs: Optional[int] = None, trust_zip_crc: bool = False) -> ScanStats:
+        """Index packages; only changed files are opened, and with trust_zip_crc only unseen .bin members are read"""
+        started = time.perf_counter()
+        stats = ScanStats()
+        plans, scheduled = [], set()
+        for path in self.find_packages(paths):
+            stats.files += 1
+            try:
+                plan = self._plan(path, trust_zip_crc, scheduled)
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+                print(f"Error: {path}: {e}")
+                stats.errors += 1
+                continue
+            if plan is None:
+                stats.unchanged += 1
+            else:
+                plans.append(plan)
+
+        if plans:
+            with ProcessPoolExecutor(jobs) as pool:
+                jobs_by_plan = [(plan, pool.submit(hash_package, str(plan.path), plan.todo)) for plan in plans]
+                for plan, job in jobs_by_plan:
+                    try:
+                        package_sha256, hashed = job.result()
+                    except (OSError, zipfile.BadZipFile) as e:
+                        print(f"Error: {plan.path}: {e}")
+                        stats.errors += 1
+                        continue
+                    self._store(plan, package_sha256, hashed, stats)
+                    print(f"  {plan.path.name}: {len(hashed)} members read, "
+                          f"{len(plan.known) + len(plan.batched)} already catalogued")
+
+        # New blobs, and blobs whose cached results predate the current analyzer versions
+        stats.analyses = self.update_analyses()
+        self.db.commit()
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Analyses
+    # -------------------------------------------------------------------------
+
+    def update_analyses(self) -> int:
+        """Run analyzers whose cached result is missing or from an older version; returns the count"""
+        runs = 0
+        for analyzer, (version, kind, function) in ANALYZERS.items():
+            rows = self.db.execute(
+                'SELECT b.sha256, b.head FROM blobs b LEFT JOIN analyses a '
+                'ON a.sha256 = b.sha256 AND a.analyzer = ? '
+                'WHERE b.kind = ? AND (a.version IS NULL OR a.version < ?)', (analyzer, kind, version)).fetchall()
+            for sha256, head in rows:
+                self.db.execute('INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?)',
+                                (sha256, analyzer, version, json.dumps(function(head))))
+                runs += 1
+        return runs
+
+    def analyses(self, sha256: str) -> Dict[str, Dict]:
+        """Cached analyzer results of one blob"""
+        rows = self.db.execute('SELECT analyzer, result FROM analyses WHERE sha256 = ?', (sha256,))
+        return {analyzer: json.loads(result) for analyzer, result in rows}
+
+    # -------------------------------------------------------------------------
+    # Signatures
+    # -------------------------------------------------------------------------
+
+    def verify(self, public_key: Tuple[int, int], jobs: Optional[int] = None) -> VerifyStats:
+        """Check the signatures of all .dat blobs not yet checked with this key"""
+        started = time.perf_counter()
+        stats = VerifyStats()
+        key_id = key_fingerprint(public_key)
+        # Only blobs whose whole content is in the head; the result is keyed by the hash of those bytes
+        todo = [head for (head,) in self.db.execute(
+            'SELECT b.head FROM blobs b LEFT JOIN signature_checks s '
+            'ON s.dat_sha256 = b.sha256 AND s.key_id = ? '
+            'WHERE b.kind = ? AND s.dat_sha256 IS NULL AND length(b.head) = b.size', (key_id, 'dat'))]
+        stats.cached = self.db.execute('SELECT COUNT(*) FROM signature_checks WHERE key_id = ?',
+                                       (key_id,)).fetchone()[0]
+
+        if len(todo) <= VERIFY_INLINE:
+            _init_verifier(public_key)
+            results = verify_dats(todo)
+        else:
+            chunks = [todo[i:i + VERIFY_CHUNK] for i in range(0, len(todo), VERIFY_CHUNK)]
+            with ProcessPoolExecutor(jobs, initializer=_init_verifier, initargs=(public_key,)) as pool:
+                results = [result for chunk in pool.map(verify_dats, chunks) for result in chunk]
+
+        self.db.executemany('INSERT OR REPLACE INTO signature_checks VALUES (?, ?, ?)',
+                            [(sha256, key_id, status) for sha256, status in results])
+        self.db.commit()
+        stats.checked = len(results)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def signature_report(self, public_key: Tuple[int, int], stats: VerifyStats, show_all: bool = False):
+        """Print components whose init packet is not validly signed or does not match the .bin"""
+        rows = self.db.execute(
+            'SELECT p.name, c.name, c.bin_sha256, s.status, a.result FROM components c '
+            'JOIN packages p ON p.sha256 = c.package '
+            'LEFT JOIN signature_checks s ON s.dat_sha256 = c.dat_sha256 AND s.key_id = ? '
+            'LEFT JOIN analyses a ON a.sha256 = c.dat_sha256 AND a.analyzer = ? '
+            'WHERE c.dat_sha256 IS NOT NULL ORDER BY p.added, c.name', (key_fingerprint(public_key), 'dat')).fetchall()
+        labels = {SIG_OK: 'signature OK', SIG_INVALID: 'signature INVALID', SIG_UNSIGNED: 'unsigned',
+                  SIG_NOT_CHECKED: 'signature not checked', SIG_UNDECODABLE: 'undecodable'}
+        for package, component, bin_sha256, status, result in rows:
+            status = status or SIG_NOT_CHECKED
+            dat = json.loads(result) if result else {}
+            hash_ok = dat.get('firmware_sha256') in (None, bin_sha256)
+            stats.valid += status == SIG_OK
+            stats.invalid += status == SIG_INVALID
+            stats.unsigned += status == SIG_UNSIGNED
+            stats.not_checked += status == SIG_NOT_CHECKED
+            stats.undecodable += status == SIG_UNDECODABLE
+            stats.hash_mismatches += not hash_ok
+            if show_all or status != SIG_OK or not hash_ok:
+                print(f"  {package:<40} {component:<24} {labels[status]}{'' if hash_ok else ', hash MISMATCH'}")
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def list_packages(self):
+        """Print every package with its components and how widely each blob is shared"""
+        packages = self.db.execute('SELECT sha256, name, size FROM packages ORDER BY added').fetchall()
+        for sha256, name, size in packages:
+            print(f"\n{name}  {sha256[:16]}  ({size} bytes)")
+            rows = self.db.execute(
+                'SELECT c.name, c.bin_sha256, b.size, '
+                '(SELECT COUNT(DISTINCT package) FROM components WHERE bin_sha256 = c.bin_sha256) '
+                'FROM components c LEFT JOIN blobs b ON b.sha256 = c.bin_sha256 '
+                'WHERE c.package = ? ORDER BY c.name', (sha256,)).fetchall()
+            for component, bin_sha256, bin_size, shared in rows:
+                note = f"  shared by {shared} packages" if shared > 1 else ''
+                print(f"  {component:<24} {(bin_sha256 or 'missing')[:16]}  {bin_size or 0:>10} bytes{note}")
+
+        blobs, blob_bytes = self.db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs').fetchone()
+        refs, ref_bytes = self.db.execute(
+            'SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM components c JOIN blobs b '
+            'ON b.sha256 IN (c.bin_sha256, c.dat_sha256)').fetchone()
+        print(f"\n{len(packages)} packages, {refs} component files ({ref_bytes} bytes), "
+              f"{blobs} unique ({blob_bytes} bytes)")
+
+    def show(self, prefix: str) -> bool:
+        """Print a package or blob selected by SHA-256 prefix"""
+        pattern = prefix.lower() + '%'
+        package = self.db.execute('SELECT sha256, name, size FROM packages WHERE sha256 LIKE ?',
+                                  (pattern,)).fetchone()
+        if package:
+            sha256, name, size = package
+            print(f"Package {name}\n  SHA256: {sha256}\n  Size:   {size} bytes")
+            paths = self.db.execute('SELECT path FROM package_files WHERE sha256 = ?', (sha256,)).fetchall()
+            for (path,) in paths:
+                print(f"  File:   {path}")
+            for component, bin_sha256, dat_sha256 in self.db.execute(
+                    'SELECT name, bin_sha256, dat_sha256 FROM components WHERE package = ? ORDER BY name',
+                    (sha256,)).fetchall():
+                print(f"\n  {component.upper()}")
+                for blob in (bin_sha256, dat_sha256):
+                    if blob:
+                        self._print_blob(blob, indent='    ')
+            return True
+
+        blob = self.db.execute('SELECT sha256 FROM blobs WHERE sha256 LIKE ?', (pattern,)).fetchone()
+        if blob:
+            self._print_blob(blob[0])
+            for (name,) in self.db.execute(
+                    'SELECT DISTINCT p.name FROM components c JOIN packages p ON p.sha256 = c.package '
+                    'WHERE ? IN (c.bin_sha256, c.dat_sha256)', (blob[0],)):
+                print(f"  In package: {name}")
+            return True
+
+        print(f"Nothing in {self.db_path} matches {prefix}")
+        return False
+
+    def _print_blob(self, sha256: str, indent: str = ''):
+        kind, size, md5, crc32c = self.db.execute(
+            'SELECT kind, size, md5, crc32c FROM blobs WHERE sha256 = ?', (sha256,)).fetchone()
+        print(f"{indent}{kind} {sha256}  {size} bytes  md5 {md5}  crc32c {crc32c}")
+        for analyzer, result in self.analyses(sha256).items():
+            print(f"{indent}  {analyzer}: {json.dumps(result)}")
+        for key_id, status in self.db.execute('SELECT key_id, status FROM signature_checks WHERE dat_sha256 = ?',
+                                              (sha256,)):
+            print(f"{indent}  signature with key {key_id}: {status}")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Content-addressed catalog of Even G2 firmware packages'
+    )
+    parser.add_argument(
+        '--db',
+        type=Path,
+        default=DEFAULT_DB,
+        help=f'Catalog database (default: {DEFAULT_DB})'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan = commands.add_parser('scan', help='Index packages (files or directories of .zip files)')
+    scan.add_argument('paths', type=Path, nargs='+')
+    scan.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+    scan.add_argument('--trust-zip-crc', action='store_true',
+                      help='Skip .bin members whose ZIP CRC-32 + size are already catalogued (forgeable)')
+
+    verify = commands.add_parser('verify', help='Check .dat signatures against a P-256 public key')
+    verify.add_argument('-k', '--key', type=Path, required=True,
+                        help='Public key (PEM, hex X||Y or dfu_public_key.c)')
+    verify.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+    verify.add_argument('--all', action='store_true', help='List every component, not only failures')
+
+    commands.add_parser('list', help='List packages and components')
+
+    show = commands.add_parser('show', help='Show a package or component by SHA-256 prefix')
+    show.add_argument('sha256')
+
+    args = parser.parse_args()
+
+    with FirmwareCatalog(args.db) as catalog:
+        if args.command == 'scan':
+            stats = catalog.scan(args.paths, args.jobs, args.trust_zip_crc)
+            print(f"\n{stats.files} files: {stats.unchanged} unchanged, {stats.packages} new packages, "
+                  f"{stats.duplicate_packages} duplicates, {stats.errors} errors")
+            print(f"{stats.members} members: {stats.members_hashed} read ({stats.bytes_hashed} bytes), "
+                  f"{stats.members_known} already catalogued; {stats.analyses} analyses run "
+                  f"in {stats.seconds:.2f} s")
+            if stats.errors:
+                sys.exit(1)
+        elif args.command == 'verify':
+            try:
+                public_key = load_public_key(args.key)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            stats = catalog.verify(public_key, args.jobs)
+            catalog.signature_report(public_key, stats, args.all)
+            print(f"\nKey {key_fingerprint(public_key)}: {stats.checked} init packets checked in {stats.seconds:.2f} s, "
+                  f"{stats.cached} cached")
+            print(f"Components: {stats.valid} signed OK, {stats.invalid} invalid, {stats.unsigned} unsigned, "
+                  f"{stats.not_checked} not checked, {stats.undecodable} undecodable, "
+                  f"{stats.hash_mismatches} hash mismatches")
+            if stats.invalid or stats.hash_mismatches:
+                sys.exit(1)
+        elif args.command == 'list':
+            catalog.list_packages()
+        elif args.command == 'show':
+            if not catalog.show(args.sha256):
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+G2 Protobuf Codec Generator
+
+Generates a dependency-free Python codec from proto/g2_protocol.proto:
+one encode_<message>() and decode_<message>() per message, plus a small
+__slots__ class per message. Tag bytes are precomputed into the generated
+source, single-byte varints take a fast path, and decoding dispatches on
+the raw tag without building intermediate dicts.
+
+Presence follows the captured traffic rather than proto3 defaults: a field
+is written whenever it is not None, so explicit zeros (e.g. "10 00",
+"6a 00") round-trip byte-for-byte.
+
+Usage:
+    python tools/protogen.py                      # regenerate examples/common/g2_proto.py
+    python tools/protogen.py -o /tmp/g2_proto.py
+    python tools/protogen.py --check              # fail if the committed codec is stale
+"""
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PROTO = ROOT / "proto" / "g2_protocol.proto"
+DEFAULT_OUTPUT = ROOT / "examples" / "common" / "g2_proto.py"
+
+VARINT_TYPES = {"uint32", "uint64", "int32", "int64", "bool", "enum"}
+SIGNED_TYPES = {"int32", "int64"}
+FIXED_TYPES = {               # type: (wire type, struct format)
+    "float": (5, "<f"),
+    "double": (1, "<d"),
+    "fixed32": (5, "<I"),
+    "sfixed32": (5, "<i"),
+    "fixed64": (1, "<Q"),
+    "sfixed64": (1, "<q"),
+}
+LENGTH_TYPES = {"string", "bytes"}
+
+
+@dataclass
+class Field:
+    name: str
+    type: str
+    number: int
+    repeated: bool = False
+    message: bool = False
+
+    @property
+    def wire_type(self) -> int:
+        if self.repeated and not self.message and self.type not in LENGTH_TYPES:
+            return 2  # packed
+        if self.type in VARINT_TYPES:
+            return 0
+        if self.type in FIXED_TYPES:
+            return FIXED_TYPES[self.type][0]
+        return 2
+
+    @property
+    def tag(self) -> bytes:
+        return encode_varint((self.number << 3) | self.wire_type)
+
+
+@dataclass
+class Message:
+    name: str
+    fields: List[Field] = field(default_factory=list)
+
+
+@dataclass
+class Schema:
+    messages: Dict[str, Message] = field(default_factory=dict)
+    enums: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode integer as protobuf varint."""
+    result = []
+    while value > 0x7F:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value & 0x7F)
+    return bytes(result)
+
+
+def snake_case(name: str) -> str:
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+BLOCK_RE = re.compile(r"\b(message|enum)\s+(\w+)\s*\{([^{}]*)\}", re.S)
+FIELD_RE = re.compile(r"^\s*(repeated\s+|optional\s+)?([\w.]+)\s+(\w+)\s*=\s*(\d+)\s*;")
+ENUM_VALUE_RE = re.compile(r"^\s*(\w+)\s*=\s*(-?\d+)\s*;")
+
+
+def parse_proto(text: str) -> Schema:
+    """Parse the proto3 subset used by g2_protocol.proto (flat messages and enums)."""
+    text = re.sub(r"//[^\n]*", "", text)
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    schema = Schema()
+
+    for kind, name, body in BLOCK_RE.findall(text):
+        statements = [s.strip() + ";" for s in body.split(";") if s.strip()]
+        if kind == "enum":
+            schema.enums[name] = {}
+            for statement in statements:
+                match = ENUM_VALUE_RE.match(statement)
+                if not match:
+                    raise ValueError(f"enum {name}: cannot parse {statement!r}")
+                schema.enums[name][match.group(1)] = int(match.group(2))
+            continue
+
+        message = Message(name)
+        numbers = set()
+        for statement in statements:
+            match = FIELD_RE.match(statement)
+            if not match:
+                raise ValueError(f"message {name}: cannot parse {statement!r}")
+            label, type_name, field_name, number = match.groups()
+            number = int(number)
+            if number in numbers:
+                raise ValueError(f"message {name}: field number {number} used twice")
+            numbers.add(number)
+            message.fields.append(Field(field_name, type_name, number,
+                                        repeated=(label or "").strip() == "repeated"))
+        schema.messages[name] = message
+
+    # Resolve type references
+    for message in schema.messages.values():
+        for f in message.fields:
+            if f.type in schema.messages:
+                f.message = True
+            elif f.type in schema.enums:
+                f.type = "enum"
+            elif f.type not in VARINT_TYPES | LENGTH_TYPES | set(FIXED_TYPES):
+                raise ValueError(f"{message.name}.{f.name}: unsupported type {f.type}")
+    return schema
+
+
+# =============================================================================
+# Code Generation
+# =============================================================================
+
+HEADER = '''"""
+G2 Protobuf Codec
+
+GENERATED by tools/protogen.py from proto/g2_protocol.proto - do not edit.
+Regenerate with: python tools/protogen.py
+
+    payload = encode_even_ai_message(command_id=ASK, magic_random=magic,
+                                     ask_info=encode_even_ai_text(0, 0, 0, "Hi"))
+    msg = decode_even_ai_message(payload)
+    msg.ask_info.text                               # "Hi"
+
+Fields set to None are omitted; every other value (including 0 and b"")
+is written, matching the frames the glasses send and expect. Nested
+message arguments to encode_*() are already-encoded bytes; Message.encode()
+handles nesting from objects.
+"""
+
+import struct
+
+'''
+
+RUNTIME = '''
+
+# =============================================================================
+# Runtime
+# =============================================================================
+
+class Message:
+    """Base for generated messages: slots, equality and repr."""
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__
+                           if getattr(self, name) not in (None, []))
+        return f"{type(self).__name__}({values})"
+
+
+def _varint(value: int) -> bytes:
+    if 0x80 <= value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    if value < 0:
+        value += 1 << 64
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _skip(data: bytes, pos: int, tag: int) -> int:
+    """Skip an unknown field."""
+    wire_type = tag & 0x07
+    if wire_type == 0:
+        return _read_varint(data, pos)[1]
+    if wire_type == 1:
+        return pos + 8
+    if wire_type == 2:
+        length, pos = _read_varint(data, pos)
+        return pos + length
+    if wire_type == 5:
+        return pos + 4
+    raise ValueError(f"Unsupported wire type {wire_type} (tag {tag:#x})")
+
+
+def _signed(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+'''
+
+
+class Writer:
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def __call__(self, indent: int, line: str = ""):
+        self.lines.append("    " * indent + line if line else "")
+
+
+def _emit_varint(w: Writer, indent: int, value: str, nonneg: bool):
+    guard = f"{value} < 0x80" if nonneg else f"0 <= {value} < 0x80"
+    w(indent, f"if {guard}:")
+    w(indent + 1, f"out.append({value})")
+    w(indent, "else:")
+    w(indent + 1, f"out += _varint({value})")
+
+
+def _emit_tag(w: Writer, indent: int, tag: bytes):
+    if len(tag) == 1:
+        w(indent, f"out.append(0x{tag[0]:02X})")
+    else:
+        w(indent, f"out += {tag!r}")
+
+
+def _emit_scalar(w: Writer, indent: int, f: Field, value: str):
+    """Append one non-repeated value (tag included) to out."""
+    _emit_tag(w, indent, f.tag)
+    if f.type == "bool":
+        w(indent, f"out.append(1 if {value} else 0)")
+    elif f.type in VARINT_TYPES:
+        _emit_varint(w, indent, value, nonneg=f.type.startswith("uint"))
+    elif f.type in FIXED_TYPES:
+        w(indent, f"out += _pack_{f.type}({value})")
+    else:
+        w(indent, f"size = len({value})")
+        _emit_varint(w, indent, "size", nonneg=True)
+        w(indent, f"out += {value}")
+
+
+def _gen_encoder(w: Writer, message: Message):
+    fn = f"encode_{snake_case(message.name)}"
+    params = ", ".join(f"{f.name}=None" for f in message.fields)
+    w(0, f"def {fn}({params}) -> bytes:")
+    w(1, f'"""Encode {message.name}."""')
+    w(1, "out = bytearray()")
+    for f in message.fields:
+        w(1, f"if {f.name} is not None:")
+        if f.type == "string":
+            w(2, f"if {f.name}.__class__ is str:")
+            w(3, f"{f.name} = {f.name}.encode('utf-8')")
+        if not f.repeated:
+            _emit_scalar(w, 2, f, f.name)
+        elif f.message or f.type in LENGTH_TYPES:
+            w(2, f"for item in {f.name}:")
+            if f.type == "string":
+                w(3, "if item.__class__ is str:")
+                w(4, "item = item.encode('utf-8')")
+            _emit_scalar(w, 3, f, "item")
+        else:
+            # Packed repeated scalars
+            w(2, "packed = bytearray()")
+            w(2, f"for item in {f.name}:")
+            if f.type in FIXED_TYPES:
+                w(3, f"packed += _pack_{f.type}(item)")
+            elif f.type == "bool":
+                w(3, "packed.append(1 if item else 0)")
+            else:
+                w(3, "packed += _varint(item)")
+            _emit_tag(w, 2, f.tag)
+            w(2, "size = len(packed)")
+            _emit_varint(w, 2, "size", nonneg=True)
+            w(2, "out += packed")
+    w(1, "return bytes(out)")
+    w(0)
+    w(0)
+
+
+def _emit_read_varint(w: Writer, indent: int, var: str):
+    w(indent, f"{var} = data[pos]")
+    w(indent, f"if {var} < 0x80:")
+    w(indent + 1, "pos += 1")
+    w(indent, "else:")
+    w(indent + 1, f"{var}, pos = _read_varint(data, pos)")
+
+
+def _emit_read_value(w: Writer, indent: int, f: Field, assign):
+    """Read one value of f at pos and pass the expression to assign(expr)."""
+    if f.type in VARINT_TYPES:
+        _emit_read_varint(w, indent, "value")
+        if f.type == "bool":
+            assign("value != 0")
+        elif f.type in SIGNED_TYPES:
+            assign("_signed(value)")
+        else:
+            assign("value")
+    elif f.type in FIXED_TYPES:
+        size = 4 if FIXED_TYPES[f.type][0] == 5 else 8
+        assign(f"_unpack_{f.type}(data, pos)[0]")
+        w(indent, f"pos += {size}")
+    else:
+        _emit_read_varint(w, indent, "length")
+        w(indent, "end = pos + length")
+        if f.message:
+            assign(f"decode_{snake_case(f.type)}(data[pos:end])")
+        elif f.type == "string":
+            assign("data[pos:end].decode('utf-8')")
+        else:
+            assign("data[pos:end]")
+        w(indent, "pos = end")
+
+
+def _gen_decoder(w: Writer, message: Message):
+    fn = f"decode_{snake_case(message.name)}"
+    w(0, f"def {fn}(data: bytes) -> {message.name}:")
+    w(1, f'"""Decode {message.name}. Unknown fields are skipped; truncated input raises ValueError."""')
+    w(1, "if data.__class__ is not bytes:")
+    w(2, "data = bytes(data)")
+    w(1, f"msg = {message.name}()")
+    w(1, "pos = 0")
+    w(1, "size = len(data)")
+    w(1, "try:")
+    w(2, "while pos < size:")
+    _emit_read_varint(w, 3, "tag")
+    keyword = "if"
+    for f in message.fields:
+        tags = [(f.number << 3) | f.wire_type]
+        # Accept unpacked repeated scalars too, as the protobuf spec requires
+        if f.repeated and f.wire_type == 2 and not f.message and f.type not in LENGTH_TYPES:
+            tags.append((f.number << 3) | (0 if f.type in VARINT_TYPES else FIXED_TYPES[f.type][0]))
+
+        w(3, f"{keyword} tag == 0x{tags[0]:02X}:")
+        keyword = "elif"
+        if not f.repeated:
+            _emit_read_value(w, 4, f, lambda expr, f=f: w(4, f"msg.{f.name} = {expr}"))
+        elif f.message or f.type in LENGTH_TYPES:
+            _emit_read_value(w, 4, f, lambda expr, f=f: w(4, f"msg.{f.name}.append({expr})"))
+        else:
+            _emit_read_varint(w, 4, "length")
+            w(4, "end = pos + length")
+            w(4, "while pos < end:")
+            _emit_read_value(w, 5, f, lambda expr, f=f: w(5, f"msg.{f.name}.append({expr})"))
+            if len(tags) > 1:
+                w(3, f"elif tag == 0x{tags[1]:02X}:")
+                _emit_read_value(w, 4, f, lambda expr, f=f: w(4, f"msg.{f.name}.append({expr})"))
+    if message.fields:
+        w(3, "else:")
+        w(4, "pos = _skip(data, pos, tag)")
+    else:
+        w(3, "pos = _skip(data, pos, tag)")
+    w(1, "except (IndexError, struct.error):")
+    w(2, "pos = size + 1")
+    w(1, "if pos > size:")
+    w(2, f'raise ValueError("Truncated {message.name}")')
+    w(1, "return msg")
+    w(0)
+    w(0)
+
+
+def _gen_class(w: Writer, message: Message):
+    names = [f.name for f in message.fields]
+    w(0, f"class {message.name}(Message):")
+    slots = ", ".join(repr(n) for n in names) + ("," if len(names) == 1 else "")
+    w(1, f"__slots__ = ({slots})")
+    w(0)
+    params = "".join(f", {n}=None" for n in names)
+    w(1, f"def __init__(self{params}):")
+    for f in message.fields:
+        if f.repeated:
+            w(2, f"self.{f.name} = [] if {f.name} is None else {f.name}")
+        else:
+            w(2, f"self.{f.name} = {f.name}")
+    if not names:
+        w(2, "pass")
+    w(0)
+    w(1, "def encode(self) -> bytes:")
+    args = []
+    for f in message.fields:
+        if not f.message:
+            args.append(f"self.{f.name}")
+        elif f.repeated:
+            args.append(f"[item.encode() for item in self.{f.name}]")
+        else:
+            args.append(f"None if self.{f.name} is None else self.{f.name}.encode()")
+    call = f"return encode_{snake_case(message.name)}("
+    line = call + ", ".join(args) + ")"
+    if len(line) <= 100:
+        w(2, line)
+    else:
+        w(2, call)
+        for arg in args:
+            w(3, arg + ",")
+        w(2, ")")
+    w(0)
+    w(0)
+
+
+def generate(schema: Schema) -> str:
+    w = Writer()
+    for name, values in schema.enums.items():
+        w(0, f"# {name}")
+        for key, value in values.items():
+            w(0, f"{key} = {value}")
+        w(0)
+
+    used = {f.type for m in schema.messages.values() for f in m.fields if f.type in FIXED_TYPES}
+    for type_name in sorted(used):
+        fmt = FIXED_TYPES[type_name][1]
+        w(0, f"_pack_{type_name} = struct.Struct({fmt!r}).pack")
+        w(0, f"_unpack_{type_name} = struct.Struct({fmt!r}).unpack_from")
+    w(0)
+
+    body = ["\n".join(w.lines).rstrip() + "\n", RUNTIME]
+    w.lines = []
+
+    w(0)
+    w(0, "# " + "=" * 77)
+    w(0, "# Messages")
+    w(0, "# " + "=" * 77)
+    w(0)
+    # Classes first: decoders reference them, encode() references encoders
+    for message in schema.messages.values():
+        _gen_class(w, message)
+    for message in schema.messages.values():
+        _gen_encoder(w, message)
+        _gen_decoder(w, message)
+
+    w(0, "# " + "=" * 77)
+    w(0, "# Schema (for introspection and the runtime comparison in bench_codec.py)")
+    w(0, "# " + "=" * 77)
+    w(0)
+    w(0, "SCHEMA = {")
+    for message in schema.messages.values():
+        w(1, f"{message.name!r}: (")
+        for f in message.fields:
+            w(2, f"({f.name!r}, {f.number}, {f.type!r}, {f.repeated}),")
+        w(1, "),")
+    w(0, "}")
+
+    return HEADER + body[0] + body[1] + "\n".join(w.lines).rstrip() + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the G2 protobuf codec')
+    parser.add_argument('proto', nargs='?', default=str(DEFAULT_PROTO), help='Input .proto file')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT), help='Output .py file')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if the output is out of date')
+    args = parser.parse_args()
+
+    schema = parse_proto(Path(args.proto).read_text())
+    code = generate(schema)
+    output = Path(args.output)
+
+    if args.check:
+        if not output.exists() or output.read_text() != code:
+            print(f"{output} is out of date; run: python tools/protogen.py")
+            sys.exit(1)
+        print(f"{output} is up to date")
+        return
+
+    output.write_text(code)
+    print(f"Wrote {output}: {len(schema.messages)} messages, {len(schema.enums)} enums")
+
+
+if __name__ == "__main__":
+    main()
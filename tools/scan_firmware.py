@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Even G2 Firmware Scanner
+
+Indexes a raw Cortex-M4 image (a component .bin, e.g. from
+extract_firmware.py -e) so it can be searched repeatedly without loading it
+into Ghidra:
+
+    - the whole image is memory-mapped and the nRF52840 vector table (16
+      system exceptions + 48 peripheral interrupts) is decoded
+    - ASCII and UTF-16LE strings are found with their offsets
+    - every 4-byte aligned little-endian word that points into the image is
+      recorded as a pointer candidate, sorted by target, so "what references
+      this address / string" is a binary search
+    - the load address is guessed from the reset vector and the number of
+      pointers that land exactly on string starts (override with --base)
+
+The index is saved next to the image (<image>.xref.npz) and reused while the
+image is unchanged, so lookups after the first run take milliseconds.
+
+Usage:
+    python tools/scan_firmware.py index application.bin            # build (or refresh) the index
+    python tools/scan_firmware.py vectors application.bin
+    python tools/scan_firmware.py strings application.bin --grep 0x0C
+    python tools/scan_firmware.py xref application.bin "service"   # strings containing it + references
+    python tools/scan_firmware.py xref application.bin --address 0x2D400
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import hashlib
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from extract_firmware import HASH_WINDOW
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.xref.npz'
+MIN_STRING = 4
+FLASH_SIZE = 0x100000                   # nRF52840: 1 MB flash at 0x00000000
+RAM_START, RAM_END = 0x20000000, 0x20040000
+PAGE = 0x1000                           # images are placed on flash page boundaries
+
+SYSTEM_VECTORS = [
+    'Initial SP', 'Reset', 'NMI', 'HardFault', 'MemManage', 'BusFault', 'UsageFault', None,
+    None, None, None, 'SVCall', 'DebugMon', None, 'PendSV', 'SysTick',
+]
+
+# nRF52840 product specification, instantiation table (IRQ number = peripheral ID)
+NRF52840_IRQS = [
+    'POWER_CLOCK', 'RADIO', 'UARTE0_UART0', 'SPIM0_SPIS0_TWIM0_TWIS0_SPI0_TWI0',
+    'SPIM1_SPIS1_TWIM1_TWIS1_SPI1_TWI1', 'NFCT', 'GPIOTE', 'SAADC',
+    'TIMER0', 'TIMER1', 'TIMER2', 'RTC0', 'TEMP', 'RNG', 'ECB', 'CCM_AAR',
+    'WDT', 'RTC1', 'QDEC', 'COMP_LPCOMP', 'SWI0_EGU0', 'SWI1_EGU1', 'SWI2_EGU2', 'SWI3_EGU3',
+    'SWI4_EGU4', 'SWI5_EGU5', 'TIMER3', 'TIMER4', 'PWM0', 'PDM', None, None,
+    'MWU', 'PWM1', 'PWM2', 'SPIM2_SPIS2_SPI2', 'RTC2', 'I2S', 'FPU', 'USBD',
+    'UARTE1', 'QSPI', 'CRYPTOCELL', None, None, 'PWM3', None, 'SPIM3',
+]
+
+VECTOR_NAMES = SYSTEM_VECTORS + NRF52840_IRQS
+
+
+def _runs(mask: np.ndarray, min_length: int):
+    """(starts, lengths) of runs of True at least min_length long"""
+    edges = np.diff(mask.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    keep = lengths >= min_length
+    return starts[keep], lengths[keep]
+
+
+def _printable(values: np.ndarray) -> np.ndarray:
+    return ((values >= 0x20) & (values < 0x7F)) | (values == 0x09) | (values == 0x0A) | (values == 0x0D)
+
+
+def find_strings(data: np.ndarray, min_length: int = MIN_STRING):
+    """Printable ASCII and UTF-16LE runs: (offsets, byte lengths, wide flags), by offset"""
+    offsets, lengths = _runs(_printable(data), min_length)
+    found = [(offsets, lengths, np.zeros(len(offsets), dtype=np.bool_))]
+
+    # UTF-16LE at both byte alignments: printable low byte, zero high byte
+    for align in (0, 1):
+        count = (len(data) - align) // 2
+        units = data[align:align + count * 2].view('<u2')
+        starts, chars = _runs(_printable(units), min_length)
+        found.append((starts * 2 + align, chars * 2, np.ones(len(starts), dtype=np.bool_)))
+
+    offsets = np.concatenate([f[0] for f in found]).astype(np.uint32)
+    order = np.argsort(offsets, kind='stable')
+    return (offsets[order], np.concatenate([f[1] for f in found]).astype(np.uint32)[order],
+            np.concatenate([f[2] for f in found])[order])
+
+
+def guess_base(words: np.ndarray, string_offsets: np.ndarray, size: int) -> Tuple[int, int]:
+    """Load address whose pointers hit the most string starts, and that count
+
+    Candidates are page-aligned bases that keep the reset handler inside the
+    image (or all of flash when there is no plausible reset vector).
+    """
+    reset = int(words[1]) & ~1 if len(words) > 1 else 0
+    if len(words) > 1 and words[1] & 1 and reset < FLASH_SIZE:
+        first, last = max(0, reset - size + 1), reset
+    else:
+        first, last = 0, FLASH_SIZE - 1
+    targets = np.unique(words)
+    best, hits = 0, -1
+    for base in range(first // PAGE * PAGE, last + 1, PAGE):
+        index = np.searchsorted(targets, string_offsets + base)
+        index[index == len(targets)] = 0
+        count = int(np.count_nonzero(targets[index] == string_offsets + base))
+        if count > hits:
+            best, hits = base, count
+    return best, hits
+
+
+@dataclass
+class Vector:
+    index: int
+    name: str
+    value: int
+    status: str
+
+    @property
+    def offset(self) -> int:
+        return self.index * 4
+
+
+class FirmwareIndex:
+    """Vector table, strings and pointer candidates of one image, persisted as .npz"""
+
+    def __init__(self, path: Path, image, meta: Dict, arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.image = image
+        self.meta = meta
+        self.base = meta['base']
+        self.size = meta['size']
+        self.words = arrays['vectors']
+        self.str_offset = arrays['str_offset']
+        self.str_length = arrays['str_length']
+        self.str_wide = arrays['str_wide']
+        self.ptr_value = arrays['ptr_value']
+        self.ptr_site = arrays['ptr_site']
+        self.loaded = False
+
+    # -------------------------------------------------------------------------
+    # Building and loading
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _map(path: Path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def build(cls, path: Path, base: Optional[int] = None, min_length: int = MIN_STRING) -> 'FirmwareIndex':
+        started = time.perf_counter()
+        image = cls._map(path)
+        data = np.frombuffer(image, dtype=np.uint8)
+        size = len(data)
+        words = data[:size // 4 * 4].view('<u4')
+
+        str_offset, str_length, str_wide = find_strings(data, min_length)
+        hits = None
+        if base is None:
+            base, hits = guess_base(words, str_offset, size)
+
+        # Aligned words pointing into the image, sorted by target
+        sites = np.flatnonzero((words >= base) & (words < base + size))
+        values = words[sites]
+        order = np.argsort(values, kind='stable')
+
+        digest = hashlib.sha256()
+        for start in range(0, size, HASH_WINDOW):
+            digest.update(image[start:start + HASH_WINDOW])
+        stat = path.stat()
+        meta = {
+            'version': INDEX_VERSION,
+            'sha256': digest.hexdigest(),
+            'size': size,
+            'mtime_ns': stat.st_mtime_ns,
+            'base': base,
+            'base_hits': hits,
+            'min_length': min_length,
+            'seconds': time.perf_counter() - started,
+        }
+        arrays = {
+            'vectors': words[:len(VECTOR_NAMES)].copy(),
+            'str_offset': str_offset,
+            'str_length': str_length,
+            'str_wide': str_wide,
+            'ptr_value': values[order],
+            'ptr_site': (sites[order] * 4).astype(np.uint32),
+        }
+        return cls(path, image, meta, arrays)
+
+    def save(self, index_path: Path):
+        arrays = {
+            'vectors': self.words,
+            'str_offset': self.str_offset,
+            'str_length': self.str_length,
+            'str_wide': self.str_wide,
+            'ptr_value': self.ptr_value,
+            'ptr_site': self.ptr_site,
+        }
+        with open(index_path, 'wb') as f:
+            np.savez(f, meta=np.array(json.dumps(self.meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: Path, index_path: Path) -> Optional['FirmwareIndex']:
+        """The saved index, if it is for this version and the image is unchanged"""
+        try:
+            with np.load(index_path) as saved:
+                meta = json.loads(str(saved['meta']))
+                arrays = {name: saved[name] for name in saved.files if name != 'meta'}
+        except (OSError, ValueError, KeyError):
+            return None
+        stat = path.stat()
+        if meta.get('version') != INDEX_VERSION or meta['size'] != stat.st_size \
+                or meta['mtime_ns'] != stat.st_mtime_ns:
+            return None
+        return cls(path, cls._map(path), meta, arrays)
+
+    @classmethod
+    def open(cls, path: Path, index_path: Optional[Path] = None, base: Optional[int] = None,
+             min_length: int = MIN_STRING, rebuild: bool = False) -> 'FirmwareIndex':
+        """Load the saved index or build and save a new one"""
+        index_path = index_path or path.with_name(path.name + INDEX_SUFFIX)
+        index = None if rebuild else cls.load(path, index_path)
+        if index and (base is None or index.base == base) and index.meta['min_length'] == min_length:
+            index.loaded = True
+            return index
+        index = cls.build(path, base, min_length)
+        index.save(index_path)
+        return index
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def vectors(self) -> List[Vector]:
+        """The vector table, with the shared default handler marked"""
+        values = self.words.tolist()
+        handlers = [value for value in values[len(SYSTEM_VECTORS):] if value & 1]
+        default = max(set(handlers), key=handlers.count) if handlers else None
+        if default is not None and handlers.count(default) < 2:
+            default = None
+
+        table = []
+        for i, value in enumerate(values):
+            name = VECTOR_NAMES[i] or 'Reserved'
+            if i == 0:
+                status = 'RAM' if RAM_START <= value <= RAM_END else 'not in RAM'
+            elif value == 0:
+                status = 'unused'
+            elif not value & 1:
+                status = 'not Thumb'
+            elif not self.base <= value & ~1 < self.base + self.size:
+                status = 'outside image'
+            else:
+                status = 'default handler' if value == default else 'handler'
+            table.append(Vector(i, name, value, status))
+        return table
+
+    def string(self, i: int) -> str:
+        offset, length = int(self.str_offset[i]), int(self.str_length[i])
+        raw = self.image[offset:offset + length]
+        return raw.decode('utf-16-le' if self.str_wide[i] else 'ascii')
+
+    def string_containing(self, offset: int) -> Optional[int]:
+        i = int(np.searchsorted(self.str_offset, offset, side='right')) - 1
+        if i >= 0 and offset < self.str_offset[i] + self.str_length[i]:
+            return i
+        return None
+
+    def find_strings(self, text: str, ignore_case: bool = False) -> List[int]:
+        """Indices of strings containing text (ASCII or UTF-16LE)"""
+        flags = re.IGNORECASE if ignore_case else 0
+        found = set()
+        for encoding in ('ascii', 'utf-16-le'):
+            try:
+                pattern = re.compile(re.escape(text.encode(encoding)), flags)
+            except UnicodeEncodeError:
+                continue
+            for match in pattern.finditer(self.image):
+                i = self.string_containing(match.start())
+                if i is not None and bool(self.str_wide[i]) == (encoding != 'ascii'):
+                    found.add(i)
+        return sorted(found)
+
+    def xrefs(self, address: int, end: Optional[int] = None) -> np.ndarray:
+        """File offsets of the pointer candidates targeting [address, end)"""
+        end = address + 1 if end is None else end
+        first, last = np.searchsorted(self.ptr_value, [address, end])
+        return np.sort(self.ptr_site[first:last])
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def _preview(text: str, width: int = 60) -> str:
+    text = text.encode('unicode_escape').decode('ascii')
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def print_index(index: FirmwareIndex):
+    meta = index.meta
+    how = 'loaded' if index.loaded else f"built in {meta['seconds']:.2f} s"
+    print(f"{index.path}: {index.size:,} bytes, SHA-256 {meta['sha256'][:16]}, index {how}")
+    guessed = '' if meta['base_hits'] is None else f" (guessed: {meta['base_hits']} pointers to string starts)"
+    print(f"  Base address: 0x{index.base:08X}{guessed}")
+    print(f"  Strings: {len(index.str_offset):,} ({int(index.str_wide.sum()):,} UTF-16), "
+          f"pointer candidates: {len(index.ptr_value):,}")
+
+
+def print_vectors(index: FirmwareIndex):
+    print(f"{'#':>3} {'offset':>6}  {'name':<34} {'value':>10}  status")
+    for vector in index.vectors():
+        print(f"{vector.index:>3} 0x{vector.offset:04X}  {vector.name:<34} 0x{vector.value:08X}  {vector.status}")
+
+
+def print_strings(index: FirmwareIndex, grep: Optional[str], ignore_case: bool, limit: int):
+    selected = index.find_strings(grep, ignore_case) if grep else range(len(index.str_offset))
+    print(f"{'offset':>10} {'address':>10} {'enc':<5} {'xrefs':>5}  text")
+    for count, i in enumerate(selected):
+        if count == limit:
+            print(f"... {len(selected) - limit} more")
+            break
+        offset = int(index.str_offset[i])
+        refs = len(index.xrefs(index.base + offset))
+        encoding = 'utf16' if index.str_wide[i] else 'ascii'
+        print(f"0x{offset:08X} 0x{index.base + offset:08X} {encoding:<5} {refs:>5}  {_preview(index.string(i))}")
+
+
+def print_sites(index: FirmwareIndex, sites: np.ndarray, indent: str = '    '):
+    for site in sites.tolist():
+        print(f"{indent}from 0x{site:08X} (address 0x{index.base + site:08X})")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Index and search a Cortex-M4 firmware image (vector table, strings, pointer xrefs)'
+    )
+    parser.add_argument(
+        '--index',
+        type=Path,
+        help=f'Index file (default: <image>{INDEX_SUFFIX})'
+    )
+    parser.add_argument(
+        '--base',
+        type=lambda value: int(value, 0),
+        help='Load address of the image (default: guessed)'
+    )
+    parser.add_argument(
+        '--min-length',
+        type=int,
+        default=MIN_STRING,
+        help=f'Shortest string in characters (default: {MIN_STRING})'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    index = commands.add_parser('index', help='Build or refresh the index and print a summary')
+    index.add_argument('image', type=Path)
+    index.add_argument('-f', '--force', action='store_true', help='Rebuild even if the image is unchanged')
+
+    vectors = commands.add_parser('vectors', help='Decode the vector table')
+    vectors.add_argument('image', type=Path)
+
+    strings = commands.add_parser('strings', help='List strings with offsets and reference counts')
+    strings.add_argument('image', type=Path)
+    strings.add_argument('--grep', help='Only strings containing this text')
+    strings.add_argument('-i', '--ignore-case', action='store_true')
+    strings.add_argument('-n', '--limit', type=int, default=200, help='Rows to print (default: 200)')
+
+    xref = commands.add_parser('xref', help='Where a string or address is referenced')
+    xref.add_argument('image', type=Path)
+    xref.add_argument('text', nargs='?', help='Text contained in the strings to look up')
+    xref.add_argument('--address', type=lambda value: int(value, 0), help='Target address instead of text')
+    xref.add_argument('-i', '--ignore-case', action='store_true')
+
+    args = parser.parse_args()
+    if args.command == 'xref' and (args.text is None) == (args.address is None):
+        parser.error('xref needs either text or --address')
+
+    started = time.perf_counter()
+    try:
+        index = FirmwareIndex.open(args.image, args.index, args.base, args.min_length,
+                                   rebuild=getattr(args, 'force', False))
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.command == 'index':
+        print_index(index)
+    elif args.command == 'vectors':
+        print_vectors(index)
+    elif args.command == 'strings':
+        print_strings(index, args.grep, args.ignore_case, args.limit)
+    elif args.address is not None:
+        sites = index.xrefs(args.address)
+        print(f"0x{args.address:08X}: {len(sites)} references")
+        print_sites(index, sites)
+    else:
+        found = index.find_strings(args.text, args.ignore_case)
+        if not found:
+            print(f"No strings containing {args.text!r}")
+        for i in found:
+            offset = int(index.str_offset[i])
+            sites = index.xrefs(index.base + offset)
+            print(f"0x{index.base + offset:08X} {_preview(index.string(i))!r}: {len(sites)} references")
+            print_sites(index, sites)
+    print(f"\n({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()